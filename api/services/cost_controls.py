@@ -1,14 +1,26 @@
+import hashlib
 import logging
 import os
 import threading
 import time
+import weakref
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Any, Awaitable, Protocol, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 LOCAL_QUOTA_MAX_KEYS = max(1, int(os.getenv("ARCLI_LOCAL_QUOTA_MAX_KEYS", "10000")))
 REDIS_MAX_CONNECTIONS = max(1, int(os.getenv("ARCLI_QUOTA_REDIS_MAX_CONNECTIONS", "4")))
+# Threads wait this long for a pooled connection before the caller falls back
+# to its process-local path.
+REDIS_POOL_TIMEOUT_SECONDS = max(0.1, float(os.getenv("ARCLI_QUOTA_REDIS_POOL_TIMEOUT_SECONDS", "2")))
+DEFAULT_PROVIDER_SLOT_LEASE_SIZE = 4
+MAX_PROVIDER_SLOT_LEASE_SIZE = 16
+# A leased slot may be taken this fraction of an interval late; older slots
+# are discarded rather than spent next to the following one.
+LEASED_SLOT_GRACE_FRACTION = 0.25
 
 
 class RedisLike(Protocol):
@@ -27,6 +39,30 @@ class UsageDecision:
     rejection_reason: str | None = None
 
 
+@dataclass(frozen=True)
+class QuotaReservation:
+    """Units granted together from one tenant quota window.
+
+    ``granted`` may be lower than ``requested`` when the window is nearly
+    spent; callers decide whether a partial grant is useful and hand unused
+    units back with :meth:`TenantQuotaGuard.refund`.
+    """
+
+    tenant_id: str
+    counter_name: str
+    requested: int
+    granted: int
+    current_count: int
+    limit: int
+    window_seconds: int
+    key: str
+    rejection_reason: str | None = None
+
+    @property
+    def allowed(self) -> bool:
+        return self.granted >= self.requested
+
+
 @dataclass(frozen=True)
 class ProviderRateLimitDecision:
     """Result of acquiring one shared provider request slot."""
@@ -39,6 +75,19 @@ class ProviderRateLimitDecision:
     retry_after_seconds: float = 0.0
 
 
+@dataclass(frozen=True)
+class RedisPoolStats:
+    """Point-in-time view of the shared cost-control Redis pool."""
+
+    configured: bool
+    max_connections: int
+    created_connections: int
+    in_use_connections: int
+    idle_connections: int
+    clients_created: int
+    script_loads: int
+
+
 @dataclass(frozen=True)
 class ProviderPacingReservation:
     """A request slot reserved from the provider-wide pacing queue.
@@ -84,6 +133,126 @@ return {1, wait_ms, math.ceil(wait_ms / interval_ms)}
 """
 
 
+@dataclass(frozen=True)
+class _PacingRequest:
+    """Normalized inputs shared by the sync, async and local pacing paths."""
+
+    key: str
+    provider: str
+    limit: int
+    window_seconds: int
+    interval_seconds: float
+    interval_ms: int
+
+    def redis_arguments(self, *, allow_wait: bool) -> tuple[object, ...]:
+        return (
+            self.key,
+            self.interval_ms,
+            self.window_seconds * 1000,
+            1 if allow_wait else 0,
+        )
+
+    def memory_arguments(self, *, allow_wait: bool) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "provider": self.provider,
+            "limit": self.limit,
+            "window_seconds": self.window_seconds,
+            "interval_seconds": self.interval_seconds,
+            "allow_wait": allow_wait,
+        }
+
+    def reservation_from_redis(self, result: object) -> ProviderPacingReservation:
+        if not isinstance(result, (list, tuple)) or len(result) < 3:
+            raise RuntimeError("Redis returned an invalid provider pacing reservation.")
+        allowed, wait_ms, queued_requests = (int(result[0]), int(result[1]), int(result[2]))
+        return ProviderPacingReservation(
+            allowed=bool(allowed),
+            provider=self.provider,
+            limit=self.limit,
+            window_seconds=self.window_seconds,
+            wait_seconds=max(0.0, wait_ms / 1000),
+            queued_requests=max(0, queued_requests),
+        )
+
+
+# Leasing reserves a block of consecutive paced slots in one call.  The block
+# sits in the same provider queue as single reservations, so the shared rate
+# cap holds no matter how the slots are later spent.
+_LEASE_PACED_SLOTS_LUA = """
+local redis_time = redis.call('TIME')
+local now_ms = tonumber(redis_time[1]) * 1000 + math.floor(tonumber(redis_time[2]) / 1000)
+local next_ms = tonumber(redis.call('GET', KEYS[1]) or '0')
+local interval_ms = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local count = tonumber(ARGV[3])
+
+local scheduled_ms = math.max(now_ms, next_ms)
+local lease_end_ms = scheduled_ms + interval_ms * count
+local ttl_ms = math.max(window_ms * 2, lease_end_ms - now_ms + window_ms)
+redis.call('PSETEX', KEYS[1], ttl_ms, tostring(lease_end_ms))
+return {scheduled_ms - now_ms, scheduled_ms, lease_end_ms}
+"""
+
+# Unused leased slots can only be handed back while nobody has queued behind
+# them; otherwise they are simply forfeited, which is always safe.
+_RELEASE_PACED_SLOTS_LUA = """
+local next_ms = tonumber(redis.call('GET', KEYS[1]) or '0')
+if next_ms ~= tonumber(ARGV[1]) then
+    return 0
+end
+local ttl_ms = redis.call('PTTL', KEYS[1])
+if ttl_ms <= 0 then
+    return 0
+end
+redis.call('PSETEX', KEYS[1], ttl_ms, ARGV[2])
+return 1
+"""
+
+# Grants as many of the requested units as still fit under the limit and
+# counts only those, so a large batch cannot push the window past its ceiling.
+_RESERVE_QUOTA_UNITS_LUA = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local limit = tonumber(ARGV[1])
+local requested = tonumber(ARGV[2])
+local granted = math.min(requested, math.max(0, limit - current))
+if granted > 0 then
+    current = redis.call('INCRBY', KEYS[1], granted)
+    if redis.call('TTL', KEYS[1]) < 0 then
+        redis.call('EXPIRE', KEYS[1], tonumber(ARGV[3]))
+    end
+end
+return {granted, current}
+"""
+
+# Refunds never create a key (the window may already have rolled over) and
+# never take a counter below zero.
+_REFUND_QUOTA_UNITS_LUA = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if current <= 0 then
+    return 0
+end
+return redis.call('DECRBY', KEYS[1], math.min(current, tonumber(ARGV[1])))
+"""
+
+
+@dataclass(frozen=True)
+class _SlotBlock:
+    """Consecutive leased slots, timed on the clock of the backend that issued them.
+
+    Redis blocks use server milliseconds and process-local blocks use
+    ``time.monotonic`` seconds; ``wait_seconds`` places the first slot on
+    the local clock either way.
+    """
+
+    backend: str
+    start: float
+    end: float
+    step: float
+    count: int
+    wait_seconds: float
+
+
 class ProviderRateLimiter:
     """Bound outbound provider request rates across all worker instances.
 
@@ -97,8 +266,14 @@ class ProviderRateLimiter:
     _memory_counts: dict[str, tuple[int, float]] = {}
     _memory_next_allowed_at: dict[str, float] = {}
 
-    def __init__(self, redis_client: RedisLike | None = None) -> None:
+    def __init__(
+        self,
+        redis_client: RedisLike | None = None,
+        *,
+        async_redis_client: Any | None = None,
+    ) -> None:
         self.redis_client = redis_client
+        self.async_redis_client = async_redis_client
 
     def acquire(
         self,
@@ -184,7 +359,7 @@ class ProviderRateLimiter:
     ) -> None:
         import asyncio
 
-        reservation = self.reserve_paced_slot(
+        reservation = await self.reserve_paced_slot_async(
             provider=provider,
             limit=limit,
             window_seconds=window_seconds,
@@ -238,106 +413,118 @@ class ProviderRateLimiter:
             allow_wait=False,
         )
 
-    def _reserve_paced_slot(
+    async def reserve_paced_slot_async(
         self,
         *,
         provider: str,
         limit: int,
-        window_seconds: int,
-        allow_wait: bool,
+        window_seconds: int = 60,
     ) -> ProviderPacingReservation:
-        safe_provider = TenantQuotaGuard._safe_counter_name(provider)
+        """Reserve a paced slot without blocking the running event loop.
+
+        The async connectors share one event loop per ingestion job; a
+        synchronous Redis round trip here would stall every other coroutine
+        in that job while it waited on the network.
+        """
+        import asyncio
+
+        pacing = self._pacing(provider=provider, limit=limit, window_seconds=window_seconds)
+        if self.async_redis_client is None and self.redis_client is not None:
+            # An injected synchronous client keeps its semantics, off-loop.
+            return await asyncio.to_thread(
+                self._reserve_paced_slot,
+                provider=provider,
+                limit=limit,
+                window_seconds=window_seconds,
+                allow_wait=True,
+            )
+        client = self.async_redis_client or shared_async_redis_client.get()
+        if client is None:
+            return self._reserve_paced_slot_memory(**pacing.memory_arguments(allow_wait=True))
+
+        try:
+            result = await shared_async_redis_client.evalsha(
+                client,
+                _RESERVE_PACED_SLOT_LUA,
+                1,
+                *pacing.redis_arguments(allow_wait=True),
+            )
+            return pacing.reservation_from_redis(result)
+        except Exception as exc:
+            logger.warning(
+                "provider_pacing_reservation_failed provider=%s backend=%s error_type=%s error=%s",
+                pacing.provider,
+                "redis_async",
+                exc.__class__.__name__,
+                exc,
+            )
+            return self._reserve_paced_slot_memory(**pacing.memory_arguments(allow_wait=True))
+
+    @staticmethod
+    def _pacing(*, provider: str, limit: int, window_seconds: int) -> _PacingRequest:
         safe_limit = max(1, int(limit))
         safe_window_seconds = max(1, int(window_seconds))
         # One additional millisecond keeps an inclusive rolling window safely
         # below the configured ceiling (for example, 20 requests never land at
         # both 0s and exactly 60s).
         interval_seconds = (safe_window_seconds + 0.001) / safe_limit
-        interval_ms = max(1, int(interval_seconds * 1000 + 0.999))
-        key = f"arcli:pace:{safe_provider}"
+        safe_provider = TenantQuotaGuard._safe_counter_name(provider)
+        return _PacingRequest(
+            key=f"arcli:pace:{safe_provider}",
+            provider=safe_provider,
+            limit=safe_limit,
+            window_seconds=safe_window_seconds,
+            interval_seconds=interval_seconds,
+            interval_ms=max(1, int(interval_seconds * 1000 + 0.999)),
+        )
+
+    def _reserve_paced_slot(
+        self,
+        *,
+        provider: str,
+        limit: int,
+        window_seconds: int,
+        allow_wait: bool,
+    ) -> ProviderPacingReservation:
+        pacing = self._pacing(provider=provider, limit=limit, window_seconds=window_seconds)
 
         # A process-local paced queue is the normal development/test path.
         # Do not emit an error for intentionally running without Redis.
         if self.redis_client is None and not os.getenv("REDIS_URL"):
-            return self._reserve_paced_slot_memory(
-                key=key,
-                provider=safe_provider,
-                limit=safe_limit,
-                window_seconds=safe_window_seconds,
-                interval_seconds=interval_seconds,
-                allow_wait=allow_wait,
-            )
+            return self._reserve_paced_slot_memory(**pacing.memory_arguments(allow_wait=allow_wait))
 
         try:
-            reservation = self._reserve_paced_slot_redis(
-                key=key,
-                provider=safe_provider,
-                limit=safe_limit,
-                window_seconds=safe_window_seconds,
-                interval_ms=interval_ms,
-                allow_wait=allow_wait,
-            )
+            reservation = self._reserve_paced_slot_redis(pacing, allow_wait=allow_wait)
         except Exception as exc:
             logger.warning(
                 "provider_pacing_reservation_failed provider=%s backend=%s error_type=%s error=%s",
-                safe_provider,
+                pacing.provider,
                 "redis" if self.redis_client or os.getenv("REDIS_URL") else "memory",
                 exc.__class__.__name__,
                 exc,
             )
             reservation = self._reserve_paced_slot_memory(
-                key=key,
-                provider=safe_provider,
-                limit=safe_limit,
-                window_seconds=safe_window_seconds,
-                interval_seconds=interval_seconds,
-                allow_wait=allow_wait,
+                **pacing.memory_arguments(allow_wait=allow_wait)
             )
         return reservation
 
     def _reserve_paced_slot_redis(
         self,
+        pacing: _PacingRequest,
         *,
-        key: str,
-        provider: str,
-        limit: int,
-        window_seconds: int,
-        interval_ms: int,
         allow_wait: bool,
     ) -> ProviderPacingReservation:
-        client = self.redis_client
-        owns_client = client is None
-        if client is None:
-            client = _redis_client_from_env()
+        client = self.redis_client or shared_redis_client.get()
         if client is None:
             raise RuntimeError("Redis is not configured for provider pacing.")
 
-        try:
-            evaluate = getattr(client, "eval", None)
-            if not callable(evaluate):
-                raise RuntimeError("Redis client does not support atomic script evaluation.")
-            result = evaluate(
-                _RESERVE_PACED_SLOT_LUA,
-                1,
-                key,
-                interval_ms,
-                window_seconds * 1000,
-                1 if allow_wait else 0,
-            )
-            if not isinstance(result, (list, tuple)) or len(result) < 3:
-                raise RuntimeError("Redis returned an invalid provider pacing reservation.")
-            allowed, wait_ms, queued_requests = (int(result[0]), int(result[1]), int(result[2]))
-            return ProviderPacingReservation(
-                allowed=bool(allowed),
-                provider=provider,
-                limit=limit,
-                window_seconds=window_seconds,
-                wait_seconds=max(0.0, wait_ms / 1000),
-                queued_requests=max(0, queued_requests),
-            )
-        finally:
-            if owns_client:
-                _close_redis_client(client)
+        result = shared_redis_client.evalsha(
+            client,
+            _RESERVE_PACED_SLOT_LUA,
+            1,
+            *pacing.redis_arguments(allow_wait=allow_wait),
+        )
+        return pacing.reservation_from_redis(result)
 
     @classmethod
     def _reserve_paced_slot_memory(
@@ -384,22 +571,176 @@ class ProviderRateLimiter:
                 queued_requests=max(0, int(wait_seconds / interval_seconds + 0.999)),
             )
 
-    def _increment(self, key: str, window_seconds: int) -> int:
-        client = self.redis_client
-        owns_client = client is None
+    def lease(
+        self,
+        *,
+        provider: str,
+        limit: int,
+        window_seconds: int = 60,
+        size: int | None = None,
+        expected_requests: int | None = None,
+    ) -> "ProviderSlotLease":
+        """Return a lease that reserves ``size`` paced slots per round trip.
+
+        ``expected_requests`` caps the block for a caller that knows how many
+        requests it can make, so a short search does not hold slots it will
+        only hand back.
+        """
+        return ProviderSlotLease(
+            self,
+            provider=provider,
+            limit=limit,
+            window_seconds=window_seconds,
+            size=size,
+            expected_requests=expected_requests,
+        )
+
+    def _lease_slots(self, pacing: _PacingRequest, count: int) -> _SlotBlock:
+        client = self.redis_client or shared_redis_client.get()
         if client is None:
-            client = _redis_client_from_env()
+            return self._lease_slots_memory(pacing, count)
+        try:
+            result = shared_redis_client.evalsha(
+                client,
+                _LEASE_PACED_SLOTS_LUA,
+                1,
+                pacing.key,
+                pacing.interval_ms,
+                pacing.window_seconds * 1000,
+                count,
+            )
+            return self._slot_block_from_redis(pacing, count, result)
+        except Exception as exc:
+            self._log_lease_failure(pacing, "redis", exc)
+            return self._lease_slots_memory(pacing, count)
+
+    async def _lease_slots_async(self, pacing: _PacingRequest, count: int) -> _SlotBlock:
+        import asyncio
+
+        if self.async_redis_client is None and self.redis_client is not None:
+            return await asyncio.to_thread(self._lease_slots, pacing, count)
+        client = self.async_redis_client or shared_async_redis_client.get()
         if client is None:
-            return self._increment_memory(key, window_seconds)
+            return self._lease_slots_memory(pacing, count)
+        try:
+            result = await shared_async_redis_client.evalsha(
+                client,
+                _LEASE_PACED_SLOTS_LUA,
+                1,
+                pacing.key,
+                pacing.interval_ms,
+                pacing.window_seconds * 1000,
+                count,
+            )
+            return self._slot_block_from_redis(pacing, count, result)
+        except Exception as exc:
+            self._log_lease_failure(pacing, "redis_async", exc)
+            return self._lease_slots_memory(pacing, count)
 
+    def _release_slots(self, pacing: _PacingRequest, block: _SlotBlock, used: int) -> None:
+        if block.backend == "memory":
+            self._release_slots_memory(pacing, block, used)
+            return
+        client = self.redis_client or shared_redis_client.get()
+        if client is None:
+            return
         try:
-            current_count = int(client.incr(key))
-            if current_count == 1:
-                client.expire(key, window_seconds)
-            return current_count
-        finally:
-            if owns_client:
-                _close_redis_client(client)
+            shared_redis_client.evalsha(
+                client,
+                _RELEASE_PACED_SLOTS_LUA,
+                1,
+                pacing.key,
+                int(block.end),
+                int(block.start + used * block.step),
+            )
+        except Exception as exc:
+            self._log_lease_failure(pacing, "redis", exc)
+
+    async def _release_slots_async(
+        self,
+        pacing: _PacingRequest,
+        block: _SlotBlock,
+        used: int,
+    ) -> None:
+        import asyncio
+
+        if block.backend == "memory":
+            self._release_slots_memory(pacing, block, used)
+            return
+        if self.async_redis_client is None and self.redis_client is not None:
+            await asyncio.to_thread(self._release_slots, pacing, block, used)
+            return
+        client = self.async_redis_client or shared_async_redis_client.get()
+        if client is None:
+            return
+        try:
+            await shared_async_redis_client.evalsha(
+                client,
+                _RELEASE_PACED_SLOTS_LUA,
+                1,
+                pacing.key,
+                int(block.end),
+                int(block.start + used * block.step),
+            )
+        except Exception as exc:
+            self._log_lease_failure(pacing, "redis_async", exc)
+
+    @staticmethod
+    def _slot_block_from_redis(pacing: _PacingRequest, count: int, result: object) -> _SlotBlock:
+        if not isinstance(result, (list, tuple)) or len(result) < 3:
+            raise RuntimeError("Redis returned an invalid provider slot lease.")
+        wait_ms, start_ms, end_ms = (int(result[0]), int(result[1]), int(result[2]))
+        return _SlotBlock(
+            backend="redis",
+            start=start_ms,
+            end=end_ms,
+            step=pacing.interval_ms,
+            count=count,
+            wait_seconds=max(0.0, wait_ms / 1000),
+        )
+
+    @staticmethod
+    def _log_lease_failure(pacing: _PacingRequest, backend: str, error: Exception) -> None:
+        logger.warning(
+            "provider_slot_lease_failed provider=%s backend=%s error_type=%s error=%s",
+            pacing.provider,
+            backend,
+            error.__class__.__name__,
+            error,
+        )
+
+    @classmethod
+    def _lease_slots_memory(cls, pacing: _PacingRequest, count: int) -> _SlotBlock:
+        now = time.monotonic()
+        with cls._memory_lock:
+            next_allowed_at = cls._memory_next_allowed_at.get(pacing.key, now)
+            scheduled_at = max(now, next_allowed_at)
+            end = scheduled_at + count * pacing.interval_seconds
+            cls._memory_next_allowed_at[pacing.key] = end
+        return _SlotBlock(
+            backend="memory",
+            start=scheduled_at,
+            end=end,
+            step=pacing.interval_seconds,
+            count=count,
+            wait_seconds=scheduled_at - now,
+        )
+
+    @classmethod
+    def _release_slots_memory(cls, pacing: _PacingRequest, block: _SlotBlock, used: int) -> None:
+        with cls._memory_lock:
+            if cls._memory_next_allowed_at.get(pacing.key) == block.end:
+                cls._memory_next_allowed_at[pacing.key] = block.start + used * block.step
+
+    def _increment(self, key: str, window_seconds: int) -> int:
+        client = self.redis_client or shared_redis_client.get()
+        if client is None:
+            return self._increment_memory(key, window_seconds)
+
+        current_count = int(client.incr(key))
+        if current_count == 1:
+            client.expire(key, window_seconds)
+        return current_count
 
     @classmethod
     def _increment_memory(cls, key: str, window_seconds: int) -> int:
@@ -426,6 +767,118 @@ class ProviderRateLimiter:
             return current_count
 
 
+class ProviderSlotLease:
+    """Spend a block of leased provider slots locally.
+
+    Each refill reserves up to ``size`` consecutive evenly-spaced slots in
+    one atomic call (``ARCLI_PROVIDER_SLOT_LEASE_SIZE`` by default), so a
+    multi-page search pays one limiter round trip per block rather than per
+    request.  A slot that has already slipped into the past is discarded
+    instead of spent late, so leased requests can never bunch together.
+    Closing the lease returns the unused tail when no other worker has
+    queued behind it.  ``wait_for_slot`` and ``wait_for_slot_async`` accept
+    the limiter's arguments, so a lease can stand in for the limiter.
+    """
+
+    def __init__(
+        self,
+        limiter: ProviderRateLimiter,
+        *,
+        provider: str,
+        limit: int,
+        window_seconds: int = 60,
+        size: int | None = None,
+        expected_requests: int | None = None,
+    ) -> None:
+        self._limiter = limiter
+        self._pacing = ProviderRateLimiter._pacing(
+            provider=provider,
+            limit=limit,
+            window_seconds=window_seconds,
+        )
+        configured = size if size is not None else env_int(
+            "ARCLI_PROVIDER_SLOT_LEASE_SIZE",
+            DEFAULT_PROVIDER_SLOT_LEASE_SIZE,
+        )
+        self._size = max(
+            1,
+            min(
+                MAX_PROVIDER_SLOT_LEASE_SIZE,
+                self._pacing.limit,
+                int(configured),
+                expected_requests or MAX_PROVIDER_SLOT_LEASE_SIZE,
+            ),
+        )
+        self._block: _SlotBlock | None = None
+        self._local_start = 0.0
+        self._used = 0
+
+    def wait_for_slot(self, **_limiter_arguments: object) -> None:
+        delay = self._take_slot()
+        if delay is None:
+            self._refill(self._limiter._lease_slots(self._pacing, self._size))
+            delay = self._take_slot()
+        if delay:
+            time.sleep(delay)
+
+    async def wait_for_slot_async(self, **_limiter_arguments: object) -> None:
+        import asyncio
+
+        delay = self._take_slot()
+        if delay is None:
+            self._refill(await self._limiter._lease_slots_async(self._pacing, self._size))
+            delay = self._take_slot()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        block, used = self._detach()
+        if block is not None:
+            self._limiter._release_slots(self._pacing, block, used)
+
+    async def aclose(self) -> None:
+        block, used = self._detach()
+        if block is not None:
+            await self._limiter._release_slots_async(self._pacing, block, used)
+
+    def __enter__(self) -> "ProviderSlotLease":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "ProviderSlotLease":
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.aclose()
+
+    def _refill(self, block: _SlotBlock) -> None:
+        self._block = block
+        self._local_start = time.monotonic() + block.wait_seconds
+        self._used = 0
+
+    def _take_slot(self) -> float | None:
+        """Return the wait for the next usable slot, or ``None`` when spent."""
+        block = self._block
+        if block is None:
+            return None
+        interval = self._pacing.interval_seconds
+        now = time.monotonic()
+        while self._used < block.count:
+            slot_at = self._local_start + self._used * interval
+            self._used += 1
+            if slot_at >= now - interval * LEASED_SLOT_GRACE_FRACTION:
+                return max(0.0, slot_at - now)
+        return None
+
+    def _detach(self) -> tuple[_SlotBlock | None, int]:
+        block, self._block = self._block, None
+        if block is None or self._used >= block.count:
+            return None, 0
+        return block, self._used
+
+
 # One limiter per process; Redis makes the production counter shared across
 # all worker processes and worker instances.
 provider_rate_limiter = ProviderRateLimiter()
@@ -458,7 +911,7 @@ class TenantQuotaGuard:
         safe_counter_name = self._safe_counter_name(counter_name)
         safe_limit = max(1, int(limit))
         safe_window_seconds = max(1, int(window_seconds))
-        key = f"arcli:quota:{safe_tenant_id}:{safe_counter_name}:{int(time.time() // safe_window_seconds)}"
+        key = self._window_key(safe_tenant_id, safe_counter_name, safe_window_seconds)
 
         try:
             current_count = self._increment(
@@ -505,6 +958,174 @@ class TenantQuotaGuard:
 
         return decision
 
+    def reserve_many(
+        self,
+        *,
+        tenant_id: str | None,
+        counter_name: str,
+        limit: int,
+        window_seconds: int,
+        units: int,
+    ) -> QuotaReservation:
+        """Reserve ``units`` from one quota window in a single round trip.
+
+        Batch callers previously paid one ``INCR`` per item.  The grant is
+        atomic, may be partial, and shares its counter key with
+        :meth:`check_and_increment`, so both styles draw from one budget.
+        """
+        safe_tenant_id = self._safe_tenant_id(tenant_id)
+        safe_counter_name = self._safe_counter_name(counter_name)
+        safe_limit = max(1, int(limit))
+        safe_window_seconds = max(1, int(window_seconds))
+        requested = max(0, int(units))
+        key = self._window_key(safe_tenant_id, safe_counter_name, safe_window_seconds)
+
+        if requested == 0:
+            granted, current_count = 0, 0
+        else:
+            try:
+                granted, current_count = self._reserve_units(
+                    key,
+                    safe_window_seconds,
+                    limit=safe_limit,
+                    units=requested,
+                )
+            except Exception as exc:
+                logger.warning(
+                    "tenant_quota_counter_failed tenant_id=%s counter_name=%s backend=%s error_type=%s error=%s",
+                    safe_tenant_id,
+                    safe_counter_name,
+                    "redis" if self.redis_client else "memory",
+                    exc.__class__.__name__,
+                    exc,
+                )
+                granted, current_count = self._reserve_units_memory(
+                    key,
+                    safe_window_seconds,
+                    limit=safe_limit,
+                    units=requested,
+                )
+
+        reservation = QuotaReservation(
+            tenant_id=safe_tenant_id,
+            counter_name=safe_counter_name,
+            requested=requested,
+            granted=granted,
+            current_count=current_count,
+            limit=safe_limit,
+            window_seconds=safe_window_seconds,
+            key=key,
+            rejection_reason=None if granted >= requested else "tenant_quota_exceeded",
+        )
+        if not reservation.allowed:
+            logger.warning(
+                "tenant_quota_exceeded tenant_id=%s counter_name=%s current_count=%s limit=%s window_seconds=%s rejection_reason=%s requested=%s granted=%s",
+                reservation.tenant_id,
+                reservation.counter_name,
+                reservation.current_count,
+                reservation.limit,
+                reservation.window_seconds,
+                reservation.rejection_reason,
+                reservation.requested,
+                reservation.granted,
+            )
+        return reservation
+
+    def refund(self, reservation: QuotaReservation, units: int) -> None:
+        """Return units a caller reserved but did not consume."""
+        refunded = min(max(0, int(units)), reservation.granted)
+        if refunded <= 0:
+            return
+        try:
+            client = self.redis_client or shared_redis_client.get()
+            if client is None:
+                self._refund_memory(reservation.key, refunded)
+                return
+            shared_redis_client.evalsha(client, _REFUND_QUOTA_UNITS_LUA, 1, reservation.key, refunded)
+        except Exception as exc:
+            logger.warning(
+                "tenant_quota_refund_failed tenant_id=%s counter_name=%s units=%s error_type=%s error=%s",
+                reservation.tenant_id,
+                reservation.counter_name,
+                refunded,
+                exc.__class__.__name__,
+                exc,
+            )
+            self._refund_memory(reservation.key, refunded)
+
+    @staticmethod
+    def _window_key(tenant_id: str, counter_name: str, window_seconds: int) -> str:
+        return f"arcli:quota:{tenant_id}:{counter_name}:{int(time.time() // window_seconds)}"
+
+    def _reserve_units(
+        self,
+        key: str,
+        window_seconds: int,
+        *,
+        limit: int,
+        units: int,
+    ) -> tuple[int, int]:
+        client = self.redis_client or shared_redis_client.get()
+        if client is None:
+            return self._reserve_units_memory(key, window_seconds, limit=limit, units=units)
+
+        result = shared_redis_client.evalsha(
+            client,
+            _RESERVE_QUOTA_UNITS_LUA,
+            1,
+            key,
+            limit,
+            units,
+            window_seconds,
+        )
+        if not isinstance(result, (list, tuple)) or len(result) < 2:
+            raise RuntimeError("Redis returned an invalid quota reservation.")
+        return int(result[0]), int(result[1])
+
+    @classmethod
+    def _reserve_units_memory(
+        cls,
+        key: str,
+        window_seconds: int,
+        *,
+        limit: int,
+        units: int,
+    ) -> tuple[int, int]:
+        now = time.monotonic()
+        with cls._memory_lock:
+            cls._expire_memory_counts(now)
+            existing = cls._memory_counts.get(key)
+            if existing is None and len(cls._memory_counts) >= LOCAL_QUOTA_MAX_KEYS:
+                logger.error(
+                    "tenant_quota_memory_capacity_reached max_keys=%s",
+                    LOCAL_QUOTA_MAX_KEYS,
+                )
+                return 0, limit + 1
+
+            current_count, expires_at = existing or (0, now + window_seconds)
+            granted = min(units, max(0, limit - current_count))
+            if granted:
+                current_count += granted
+                cls._memory_counts[key] = (current_count, expires_at)
+            return granted, current_count
+
+    @classmethod
+    def _refund_memory(cls, key: str, units: int) -> None:
+        with cls._memory_lock:
+            existing = cls._memory_counts.get(key)
+            if existing is not None:
+                cls._memory_counts[key] = (max(0, existing[0] - units), existing[1])
+
+    @classmethod
+    def _expire_memory_counts(cls, now: float) -> None:
+        expired_keys = [
+            old_key
+            for old_key, (_, old_expires_at) in cls._memory_counts.items()
+            if old_expires_at <= now
+        ]
+        for old_key in expired_keys:
+            del cls._memory_counts[old_key]
+
     def _increment(
         self,
         key: str,
@@ -512,10 +1133,7 @@ class TenantQuotaGuard:
         *,
         reject_count: int,
     ) -> int:
-        client = self.redis_client
-        owns_client = client is None
-        if client is None:
-            client = _redis_client_from_env()
+        client = self.redis_client or shared_redis_client.get()
         if client is None:
             return self._increment_memory(
                 key,
@@ -523,14 +1141,10 @@ class TenantQuotaGuard:
                 reject_count=reject_count,
             )
 
-        try:
-            current_count = int(client.incr(key))
-            if current_count == 1:
-                client.expire(key, window_seconds)
-            return current_count
-        finally:
-            if owns_client:
-                _close_redis_client(client)
+        current_count = int(client.incr(key))
+        if current_count == 1:
+            client.expire(key, window_seconds)
+        return current_count
 
     @classmethod
     def _increment_memory(
@@ -543,14 +1157,7 @@ class TenantQuotaGuard:
         now = time.monotonic()
         expires_at = now + window_seconds
         with cls._memory_lock:
-            expired_keys = [
-                old_key
-                for old_key, (_, old_expires_at) in cls._memory_counts.items()
-                if old_expires_at <= now
-            ]
-            for old_key in expired_keys:
-                del cls._memory_counts[old_key]
-
+            cls._expire_memory_counts(now)
             existing = cls._memory_counts.get(key)
             if existing is None and len(cls._memory_counts) >= LOCAL_QUOTA_MAX_KEYS:
                 logger.error(
@@ -580,27 +1187,37 @@ class TenantQuotaGuard:
 
 
 def _redis_client_from_env() -> RedisLike | None:
-    """Create a bounded quota client for one counter operation.
+    """Create a bounded control-path client backed by a blocking pool.
 
-    A quota check is small and infrequent relative to an LLM request.  Closing
-    this short-lived client prevents idle workers from retaining an additional
-    Redis pool between jobs.
+    A blocking pool makes a thread wait briefly for a free connection instead
+    of failing with ``Too many connections`` when every worker thread checks a
+    quota at once.  Callers normally reach this through
+    ``shared_redis_client`` rather than building a client per operation.
     """
     redis_url = os.getenv("REDIS_URL")
     if not redis_url:
         return None
+    if os.getenv("ARCLI_PUBLIC_SOURCE_QUERY_CACHE_REDIS_MAX_CONNECTIONS"):
+        # Query claims share this pool since it replaced their own client.
+        logger.warning(
+            "deprecated_env_ignored name=%s replacement=%s",
+            "ARCLI_PUBLIC_SOURCE_QUERY_CACHE_REDIS_MAX_CONNECTIONS",
+            "ARCLI_QUOTA_REDIS_MAX_CONNECTIONS",
+        )
 
     try:
         import redis
 
-        return redis.Redis.from_url(
+        pool = redis.BlockingConnectionPool.from_url(
             redis_url,
             decode_responses=True,
             max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT_SECONDS,
             socket_connect_timeout=2,
             socket_timeout=2,
             health_check_interval=30,
         )
+        return redis.Redis(connection_pool=pool)
     except Exception as exc:
         logger.warning(
             "tenant_quota_redis_unavailable redis_url_configured=%s error_type=%s error=%s",
@@ -622,6 +1239,240 @@ def _close_redis_client(client: RedisLike) -> None:
             disconnect()
 
 
+def _is_noscript_error(error: Exception) -> bool:
+    return type(error).__name__ == "NoScriptError" or str(error).startswith("NOSCRIPT")
+
+
+class SharedRedisClient:
+    """One pooled Redis client per worker process for short control operations.
+
+    Quota counters, provider pacing, source-query claims and the shared cache
+    tiers each issue one small command or script.  Opening and tearing down a
+    client around every call paid a TCP (and usually TLS) handshake per
+    command; this client is created on first use and shared by every thread.
+    It is rebuilt when ``REDIS_URL`` changes or the process forks.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._client: RedisLike | None = None
+        self._identity: tuple[str, int] | None = None
+        self._script_shas: dict[str, str] = {}
+        self._clients_created = 0
+        self._script_loads = 0
+
+    def get(self) -> RedisLike | None:
+        redis_url = os.getenv("REDIS_URL", "").strip()
+        if not redis_url:
+            return None
+
+        identity = (redis_url, os.getpid())
+        with self._lock:
+            if self._client is not None and self._identity == identity:
+                return self._client
+            stale_client, stale_identity = self._client, self._identity
+            client = _redis_client_from_env()
+            self._client = client
+            self._identity = identity if client is not None else None
+            if client is not None:
+                self._clients_created += 1
+
+        # A forked child must not disconnect sockets its parent still owns.
+        if stale_client is not None and stale_identity and stale_identity[1] == identity[1]:
+            try:
+                _close_redis_client(stale_client)
+            except Exception:
+                pass
+        return client
+
+    def evalsha(self, client: RedisLike, script: str, numkeys: int, *args: object) -> object:
+        """Run ``script`` by SHA1, sending its body only after ``NOSCRIPT``.
+
+        ``EVAL`` both runs and caches the script on the server, so the body
+        crosses the network once per Redis restart rather than once per call.
+        """
+        evaluate_sha = getattr(client, "evalsha", None)
+        evaluate = getattr(client, "eval", None)
+        if not callable(evaluate):
+            raise RuntimeError("Redis client does not support atomic script evaluation.")
+        if not callable(evaluate_sha):
+            return evaluate(script, numkeys, *args)
+
+        try:
+            return evaluate_sha(self._script_sha(script), numkeys, *args)
+        except Exception as exc:
+            if not _is_noscript_error(exc):
+                raise
+        with self._lock:
+            self._script_loads += 1
+        return evaluate(script, numkeys, *args)
+
+    def stats(self) -> RedisPoolStats:
+        with self._lock:
+            client = self._client
+            clients_created = self._clients_created
+            script_loads = self._script_loads
+
+        pool = getattr(client, "connection_pool", None)
+        created: list[object] = []
+        idle: list[object] = []
+        if pool is not None:
+            # ``BlockingConnectionPool`` tracks every connection it created
+            # and queues idle ones; the plain pool keeps explicit lists.
+            created = list(getattr(pool, "_connections", None) or ())
+            queue = getattr(getattr(pool, "pool", None), "queue", None)
+            if queue is not None:
+                idle = [connection for connection in list(queue) if connection]
+            else:
+                idle = list(getattr(pool, "_available_connections", None) or ())
+                created = idle + list(getattr(pool, "_in_use_connections", None) or ())
+
+        return RedisPoolStats(
+            configured=client is not None,
+            max_connections=int(getattr(pool, "max_connections", 0) or 0),
+            created_connections=len(created),
+            in_use_connections=max(0, len(created) - len(idle)),
+            idle_connections=len(idle),
+            clients_created=clients_created,
+            script_loads=script_loads,
+        )
+
+    def reset(self) -> None:
+        """Close the pool; the next ``get`` builds a fresh client."""
+        with self._lock:
+            client, self._client, self._identity = self._client, None, None
+        if client is not None:
+            _close_redis_client(client)
+
+    def _script_sha(self, script: str) -> str:
+        sha = self._script_shas.get(script)
+        if sha is None:
+            sha = hashlib.sha1(script.encode("utf-8")).hexdigest()
+            self._script_shas[script] = sha
+        return sha
+
+
+shared_redis_client = SharedRedisClient()
+
+
+def _async_redis_client_from_env() -> Any | None:
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        return None
+
+    try:
+        import redis.asyncio as redis_asyncio
+
+        pool = redis_asyncio.BlockingConnectionPool.from_url(
+            redis_url,
+            decode_responses=True,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT_SECONDS,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+            health_check_interval=30,
+        )
+        return redis_asyncio.Redis(connection_pool=pool)
+    except Exception as exc:
+        logger.warning(
+            "provider_pacing_async_redis_unavailable redis_url_configured=%s error_type=%s error=%s",
+            True,
+            exc.__class__.__name__,
+            exc,
+        )
+        return None
+
+
+class SharedAsyncRedisClient:
+    """``redis.asyncio`` counterpart of ``SharedRedisClient`` for the connectors.
+
+    Asyncio connections belong to the loop that opened them, and ingestion
+    runs each job under its own ``asyncio.run``.  Clients are therefore kept
+    per running loop.  A cached client references its loop, so the entry
+    never expires on its own: jobs run their coroutine through ``scoped``,
+    which closes the loop's client before ``asyncio.run`` closes the loop.
+    Entries whose loop was closed without that are dropped on the next
+    ``get`` so they can at least be garbage collected.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: weakref.WeakKeyDictionary[Any, tuple[tuple[str, int], Any]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._script_shas: dict[str, str] = {}
+        self._script_loads = 0
+
+    def get(self) -> Any | None:
+        import asyncio
+
+        redis_url = os.getenv("REDIS_URL", "").strip()
+        if not redis_url:
+            return None
+
+        loop = asyncio.get_running_loop()
+        identity = (redis_url, os.getpid())
+        with self._lock:
+            for closed_loop in [known for known in self._clients if known.is_closed()]:
+                self._clients.pop(closed_loop, None)
+                logger.warning("async_redis_client_abandoned reason=%s", "loop_closed")
+            cached = self._clients.get(loop)
+            if cached is not None and cached[0] == identity:
+                return cached[1]
+            client = _async_redis_client_from_env()
+            if client is not None:
+                self._clients[loop] = (identity, client)
+            return client
+
+    async def evalsha(self, client: Any, script: str, numkeys: int, *args: object) -> object:
+        """Async form of ``SharedRedisClient.evalsha``."""
+        if not callable(getattr(client, "evalsha", None)):
+            return await client.eval(script, numkeys, *args)
+
+        sha = self._script_shas.get(script)
+        if sha is None:
+            sha = hashlib.sha1(script.encode("utf-8")).hexdigest()
+            self._script_shas[script] = sha
+        try:
+            return await client.evalsha(sha, numkeys, *args)
+        except Exception as exc:
+            if not _is_noscript_error(exc):
+                raise
+        with self._lock:
+            self._script_loads += 1
+        return await client.eval(script, numkeys, *args)
+
+    async def aclose(self) -> None:
+        """Close the client bound to the running loop, if any."""
+        import asyncio
+
+        with self._lock:
+            cached = self._clients.pop(asyncio.get_running_loop(), None)
+        if cached is not None:
+            await cached[1].aclose()
+
+    async def scoped(self, awaitable: Awaitable[T]) -> T:
+        """Await ``awaitable``, then close the running loop's client.
+
+        Wrap each job's top-level coroutine, as in
+        ``asyncio.run(shared_async_redis_client.scoped(job()))``.
+        """
+        try:
+            return await awaitable
+        finally:
+            try:
+                await self.aclose()
+            except Exception as exc:
+                logger.warning(
+                    "async_redis_client_close_failed error_type=%s error=%s",
+                    exc.__class__.__name__,
+                    exc,
+                )
+
+
+shared_async_redis_client = SharedAsyncRedisClient()
+
+
 def env_int(name: str, default: int) -> int:
     raw_value = os.getenv(name)
     if raw_value is None:
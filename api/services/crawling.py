@@ -16,7 +16,13 @@ from pydantic import ValidationError
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Connection, Engine
 
-from api.services.cost_controls import env_int, provider_rate_limiter
+from api.services.cost_controls import (
+    env_int,
+    provider_rate_limiter,
+    shared_async_redis_client,
+)
+from api.services.schema_cache import table_columns
+from api.services.text_signals import SIGNAL_BOILERPLATE, has_text_signal
 
 logger = logging.getLogger(__name__)
 
@@ -1141,24 +1147,10 @@ def _service_profile_payload(
 
 
 def _service_profile_columns(conn: Connection) -> dict[str, dict[str, str]]:
-    rows = conn.execute(
-        text(
-            """
-            SELECT column_name, data_type, udt_name
-              FROM information_schema.columns
-             WHERE table_schema = 'public'
-               AND table_name = 'service_profiles'
-            """
-        )
-    ).mappings()
-
     return {
-        str(row["column_name"]): {
-            "data_type": str(row["data_type"]),
-            "udt_name": str(row["udt_name"]),
-        }
-        for row in rows
-        if str(row["column_name"]) in SERVICE_PROFILE_COLUMNS or row["column_name"] == "id"
+        column_name: column
+        for column_name, column in table_columns(conn, "service_profiles").items()
+        if column_name in SERVICE_PROFILE_COLUMNS or column_name == "id"
     }
 
 
@@ -1660,22 +1652,6 @@ class WebsiteCrawler:
         r"(?:use-cases|usecases|solutions|customers)",
     )
 
-    BOILERPLATE_PHRASES = (
-        "skip to content",
-        "accept cookies",
-        "cookie settings",
-        "privacy policy",
-        "terms of service",
-        "terms & conditions",
-        "all rights reserved",
-        "copyright",
-        "sign in",
-        "log in",
-        "login",
-        "menu",
-        "navigation",
-    )
-
     def __init__(
         self,
         api_key: str | None = None,
@@ -2089,7 +2065,7 @@ class WebsiteCrawler:
                 continue
 
             lowered = line.lower()
-            if len(line) <= 90 and any(phrase in lowered for phrase in self.BOILERPLATE_PHRASES):
+            if len(line) <= 90 and has_text_signal(lowered, SIGNAL_BOILERPLATE):
                 continue
 
             normalized_short = re.sub(r"\s+", " ", lowered)
@@ -2183,11 +2159,13 @@ def generate_workspace_brain_profile(
         _remaining_deadline_seconds(deadline, minimum=20),
     )
     markdown = asyncio.run(
-        _crawl_with_deadline(
-            normalized_url,
-            tenant_id=tenant_id,
-            crawl_job_id=generation_id,
-            timeout_seconds=crawl_timeout_seconds,
+        shared_async_redis_client.scoped(
+            _crawl_with_deadline(
+                normalized_url,
+                tenant_id=tenant_id,
+                crawl_job_id=generation_id,
+                timeout_seconds=crawl_timeout_seconds,
+            )
         )
     )
     markdown = _cap_markdown_payload(
@@ -2436,11 +2414,13 @@ def process_crawl_job(
             _remaining_deadline_seconds(deadline, minimum=20),
         )
         markdown = asyncio.run(
-            _crawl_with_deadline(
-                normalized_url,
-                tenant_id=tenant_id,
-                crawl_job_id=crawl_job_id,
-                timeout_seconds=crawl_timeout_seconds,
+            shared_async_redis_client.scoped(
+                _crawl_with_deadline(
+                    normalized_url,
+                    tenant_id=tenant_id,
+                    crawl_job_id=crawl_job_id,
+                    timeout_seconds=crawl_timeout_seconds,
+                )
             )
         )
         markdown = _cap_markdown_payload(
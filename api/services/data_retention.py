@@ -0,0 +1,37 @@
+"""Retention window for public-source content.
+
+``api.services.social.data_governance`` enforces the window on stored rows;
+core services that keep derived copies of public content, such as the
+verifier's Redis verdict cache, bound their lifetimes by the same setting
+without depending on the social package.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PUBLIC_DATA_RETENTION_DAYS = 30
+_MIN_PUBLIC_DATA_RETENTION_DAYS = 7
+_MAX_PUBLIC_DATA_RETENTION_DAYS = 90
+
+
+def public_data_retention_days() -> int:
+    """Return a bounded retention window; malformed values never extend it."""
+
+    raw_value = os.getenv(
+        "ARCLI_PUBLIC_DATA_RETENTION_DAYS",
+        str(DEFAULT_PUBLIC_DATA_RETENTION_DAYS),
+    )
+    try:
+        value = int(raw_value)
+    except (TypeError, ValueError):
+        logger.warning(
+            "public_data_retention_days_invalid value=%s fallback_days=%s",
+            raw_value,
+            DEFAULT_PUBLIC_DATA_RETENTION_DAYS,
+        )
+        return DEFAULT_PUBLIC_DATA_RETENTION_DAYS
+    return max(_MIN_PUBLIC_DATA_RETENTION_DAYS, min(_MAX_PUBLIC_DATA_RETENTION_DAYS, value))
@@ -0,0 +1,402 @@
+"""Content-addressed embedding cache shared by every embedding caller.
+
+An embedding is a pure function of the model and the normalized input text, so
+one vector can serve every tenant, profile, watchlist and public post that
+embeds identical text (a re-posted comment, a duplicated profile, a watchlist
+copied from its base profile).  Entries are keyed by ``(model, text_sha256)``
+and never by tenant, which is why the cache stores only hashes and vectors and
+never the text itself.
+
+Lookups go through three tiers, cheapest first:
+
+1. an in-process LRU, bounded by ``ARCLI_EMBEDDING_CACHE_MAX_ENTRIES``;
+2. Redis when ``REDIS_URL`` is configured, with a TTL;
+3. ``public.embedding_cache`` when a database URL is configured and
+   ``scripts/embedding_cache_contract.sql`` has been applied.
+
+A hit in a lower tier is copied into the tiers above it.  Shared tiers are an
+optimization only: any Redis or database failure is logged, opens a short
+cooldown, and is treated as a miss so that embedding still proceeds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Mapping, Sequence
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from api.services.cost_controls import (
+    env_int,
+    shared_redis_client,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES = 512
+DEFAULT_EMBEDDING_CACHE_REDIS_TTL_SECONDS = 7 * 86_400
+EMBEDDING_CACHE_REDIS_PREFIX = "arcli:embedding_cache:v1"
+
+_MISSING_SCHEMA_COOLDOWN_SECONDS = 300.0
+_FAILURE_COOLDOWN_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class EmbeddingCacheStats:
+    memory_hits: int
+    redis_hits: int
+    database_hits: int
+    misses: int
+    entries: int
+
+
+def embedding_text_sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def _cache_enabled() -> bool:
+    value = os.getenv("ARCLI_EMBEDDING_CACHE_ENABLED", "true").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def _valid_embedding(value: Any) -> list[float] | None:
+    if not isinstance(value, list) or not value:
+        return None
+    try:
+        embedding = [float(item) for item in value]
+    except (TypeError, ValueError):
+        return None
+    if not all(math.isfinite(item) for item in embedding):
+        return None
+    return embedding
+
+
+def _database_url() -> str:
+    return (
+        os.getenv("DATABASE_URL")
+        or os.getenv("SUPABASE_DB_URL")
+        or os.getenv("POSTGRES_URL")
+        or ""
+    ).strip()
+
+
+@lru_cache(maxsize=1)
+def _database_engine() -> Engine:
+    """Create a small pool for cache reads and writes beside the job's pool."""
+    database_url = _database_url()
+    if not database_url:
+        raise RuntimeError("No database URL is configured for the embedding cache.")
+    if database_url.startswith("postgres://"):
+        database_url = database_url.replace("postgres://", "postgresql://", 1)
+
+    engine_options: dict[str, Any] = {
+        "pool_pre_ping": True,
+        "pool_size": 1,
+        "max_overflow": 1,
+        "pool_timeout": 1,
+        "pool_recycle": 300,
+    }
+    if database_url.startswith("postgresql"):
+        engine_options["connect_args"] = {"connect_timeout": 3}
+    return create_engine(database_url, **engine_options)
+
+
+def _is_missing_schema_error(error: BaseException) -> bool:
+    original = getattr(error, "orig", error)
+    sqlstate = getattr(original, "pgcode", None) or getattr(original, "sqlstate", None)
+    if sqlstate in {"3F000", "42P01", "42703"}:
+        return True
+    message = str(original).lower()
+    return "embedding_cache" in message or "does not exist" in message
+
+
+class ContentEmbeddingCache:
+    """Tiered ``(model, text_sha256) -> embedding`` cache.
+
+    Vectors are held in the LRU as ``array('d')`` rather than lists of Python
+    floats, which keeps a 1536-dimension entry at about 12 KB.  Redis and
+    database clients can be injected; by default they come from the
+    environment and are skipped when it does not configure them.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        redis_client: Any | None = None,
+        engine: Engine | None = None,
+        use_redis: bool = True,
+        use_database: bool = True,
+    ) -> None:
+        self._max_entries = max_entries
+        self._redis_client = redis_client
+        self._engine = engine
+        self._use_redis = use_redis
+        self._use_database = use_database
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], array] = OrderedDict()
+        self._unavailable_until: dict[str, float] = {}
+        self._memory_hits = 0
+        self._redis_hits = 0
+        self._database_hits = 0
+        self._misses = 0
+
+    def _resolved_max_entries(self) -> int:
+        if self._max_entries is not None:
+            return max(0, self._max_entries)
+        return env_int(
+            "ARCLI_EMBEDDING_CACHE_MAX_ENTRIES",
+            DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES,
+        )
+
+    def get_many(
+        self,
+        model: str,
+        text_sha256s: Sequence[str],
+    ) -> dict[str, list[float]]:
+        """Return cached embeddings for any of ``text_sha256s``."""
+        wanted = list(dict.fromkeys(text_sha256s))
+        if not wanted or not _cache_enabled():
+            return {}
+
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for text_sha256 in wanted:
+                cached = self._entries.get((model, text_sha256))
+                if cached is not None:
+                    self._entries.move_to_end((model, text_sha256))
+                    found[text_sha256] = cached.tolist()
+            self._memory_hits += len(found)
+
+        missing = [text_sha256 for text_sha256 in wanted if text_sha256 not in found]
+        redis_found: dict[str, list[float]] = {}
+        if missing:
+            redis_found = self._redis_get_many(model, missing)
+            if redis_found:
+                found.update(redis_found)
+                self._remember(model, redis_found)
+                missing = [item for item in missing if item not in redis_found]
+
+        database_found: dict[str, list[float]] = {}
+        if missing:
+            database_found = self._database_get_many(model, missing)
+            if database_found:
+                found.update(database_found)
+                self._remember(model, database_found)
+                self._redis_put_many(model, database_found)
+
+        with self._lock:
+            self._redis_hits += len(redis_found)
+            self._database_hits += len(database_found)
+            self._misses += len(wanted) - len(found)
+        return found
+
+    def put_many(self, model: str, embeddings: Mapping[str, Sequence[float]]) -> None:
+        """Store freshly generated embeddings in every available tier."""
+        if not _cache_enabled():
+            return
+        valid = {
+            text_sha256: embedding
+            for text_sha256, raw_embedding in embeddings.items()
+            if (embedding := _valid_embedding(list(raw_embedding))) is not None
+        }
+        if not valid:
+            return
+        self._remember(model, valid)
+        self._redis_put_many(model, valid)
+        self._database_put_many(model, valid)
+
+    def invalidate(self) -> None:
+        """Forget the in-process tier; shared tiers expire on their own."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> EmbeddingCacheStats:
+        with self._lock:
+            return EmbeddingCacheStats(
+                memory_hits=self._memory_hits,
+                redis_hits=self._redis_hits,
+                database_hits=self._database_hits,
+                misses=self._misses,
+                entries=len(self._entries),
+            )
+
+    def _remember(self, model: str, embeddings: Mapping[str, list[float]]) -> None:
+        max_entries = self._resolved_max_entries()
+        if max_entries <= 0:
+            return
+        with self._lock:
+            for text_sha256, embedding in embeddings.items():
+                self._entries[(model, text_sha256)] = array("d", embedding)
+                self._entries.move_to_end((model, text_sha256))
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def _tier_available(self, tier: str) -> bool:
+        with self._lock:
+            return time.monotonic() >= self._unavailable_until.get(tier, 0.0)
+
+    def _record_tier_failure(self, tier: str, operation: str, error: Exception) -> None:
+        schema_missing = tier == "database" and _is_missing_schema_error(error)
+        cooldown = (
+            _MISSING_SCHEMA_COOLDOWN_SECONDS if schema_missing else _FAILURE_COOLDOWN_SECONDS
+        )
+        with self._lock:
+            self._unavailable_until[tier] = time.monotonic() + cooldown
+        logger.warning(
+            "embedding_cache_tier_skipped tier=%s operation=%s reason=%s error_type=%s retry_after_seconds=%s",
+            tier,
+            operation,
+            "schema_unavailable" if schema_missing else "storage_unavailable",
+            type(error).__name__,
+            int(cooldown),
+        )
+
+    @staticmethod
+    def _redis_key(model: str, text_sha256: str) -> str:
+        return f"{EMBEDDING_CACHE_REDIS_PREFIX}:{model}:{text_sha256}"
+
+    def _redis_tier_client(self) -> Any | None:
+        if not self._use_redis or not self._tier_available("redis"):
+            return None
+        if self._redis_client is not None:
+            return self._redis_client
+        return shared_redis_client.get()
+
+    def _redis_get_many(self, model: str, text_sha256s: list[str]) -> dict[str, list[float]]:
+        client = self._redis_tier_client()
+        if client is None:
+            return {}
+        try:
+            values = client.mget([self._redis_key(model, item) for item in text_sha256s])
+        except Exception as exc:
+            self._record_tier_failure("redis", "read", exc)
+            return {}
+
+        found: dict[str, list[float]] = {}
+        for text_sha256, raw_value in zip(text_sha256s, values or ()):
+            if not raw_value:
+                continue
+            try:
+                embedding = _valid_embedding(json.loads(raw_value))
+            except (TypeError, ValueError):
+                embedding = None
+            if embedding is not None:
+                found[text_sha256] = embedding
+        return found
+
+    def _redis_put_many(self, model: str, embeddings: Mapping[str, list[float]]) -> None:
+        client = self._redis_tier_client()
+        if client is None:
+            return
+        ttl_seconds = env_int(
+            "ARCLI_EMBEDDING_CACHE_REDIS_TTL_SECONDS",
+            DEFAULT_EMBEDDING_CACHE_REDIS_TTL_SECONDS,
+        )
+        try:
+            pipeline = client.pipeline(transaction=False)
+            for text_sha256, embedding in embeddings.items():
+                pipeline.set(
+                    self._redis_key(model, text_sha256),
+                    json.dumps(embedding, separators=(",", ":")),
+                    ex=ttl_seconds,
+                )
+            pipeline.execute()
+        except Exception as exc:
+            self._record_tier_failure("redis", "write", exc)
+
+    def _database(self) -> Engine | None:
+        if not self._use_database or not self._tier_available("database"):
+            return None
+        if self._engine is not None:
+            return self._engine
+        if not _database_url():
+            return None
+        return _database_engine()
+
+    def _database_get_many(
+        self,
+        model: str,
+        text_sha256s: list[str],
+    ) -> dict[str, list[float]]:
+        engine = self._database()
+        if engine is None:
+            return {}
+        try:
+            with engine.begin() as conn:
+                rows = conn.execute(
+                    text(
+                        """
+                        SELECT text_sha256, embedding
+                          FROM public.embedding_cache
+                         WHERE model = :model
+                           AND text_sha256 = ANY(:text_sha256s)
+                        """
+                    ),
+                    {"model": model, "text_sha256s": text_sha256s},
+                ).mappings().all()
+        except Exception as exc:
+            self._record_tier_failure("database", "read", exc)
+            return {}
+
+        found: dict[str, list[float]] = {}
+        for row in rows:
+            raw_embedding = row["embedding"]
+            if isinstance(raw_embedding, str):
+                try:
+                    raw_embedding = json.loads(raw_embedding)
+                except ValueError:
+                    continue
+            embedding = _valid_embedding(raw_embedding)
+            if embedding is not None:
+                found[str(row["text_sha256"])] = embedding
+        return found
+
+    def _database_put_many(self, model: str, embeddings: Mapping[str, list[float]]) -> None:
+        engine = self._database()
+        if engine is None:
+            return
+        values_sql: list[str] = []
+        params: dict[str, Any] = {"model": model}
+        for index, (text_sha256, embedding) in enumerate(embeddings.items()):
+            values_sql.append(
+                f"(:model, :text_sha256_{index}, CAST(:embedding_{index} AS jsonb), "
+                f":dimensions_{index})"
+            )
+            params[f"text_sha256_{index}"] = text_sha256
+            params[f"embedding_{index}"] = json.dumps(embedding, separators=(",", ":"))
+            params[f"dimensions_{index}"] = len(embedding)
+        try:
+            with engine.begin() as conn:
+                conn.execute(
+                    text(
+                        f"""
+                        INSERT INTO public.embedding_cache (
+                            model,
+                            text_sha256,
+                            embedding,
+                            dimensions
+                        )
+                        VALUES {", ".join(values_sql)}
+                        ON CONFLICT (model, text_sha256) DO NOTHING
+                        """
+                    ),
+                    params,
+                )
+        except Exception as exc:
+            self._record_tier_failure("database", "write", exc)
+
+
+# One cache per process; Redis and Postgres share it across workers.
+content_embedding_cache = ContentEmbeddingCache()
@@ -3,6 +3,10 @@ import json
 import math
 import os
 import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from functools import lru_cache
 from typing import Any, Sequence
@@ -20,8 +24,19 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
-from api.services.cost_controls import TenantQuotaGuard, env_int, provider_rate_limiter
+from api.services.cost_controls import (
+    QuotaReservation,
+    TenantQuotaGuard,
+    env_int,
+    provider_rate_limiter,
+)
+from api.services.embedding_cache import (
+    ContentEmbeddingCache,
+    content_embedding_cache,
+    embedding_text_sha256,
+)
 from api.services.openai_lifecycle import OpenAIClientOwner
+from api.services.schema_cache import table_columns
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +50,10 @@ EMBEDDING_QUOTA_DEFAULT_LIMIT = 20_000
 EMBEDDING_QUOTA_DEFAULT_WINDOW_SECONDS = 86_400
 DEFAULT_EMBEDDING_JOB_STALE_SECONDS = 600
 DEFAULT_EMBEDDING_JOB_TIME_LIMIT_MS = 90_000
+# OpenAI rejects an embeddings request whose inputs total more than this.
+MAX_EMBEDDING_REQUEST_TOKENS = 300_000
+DEFAULT_EMBEDDING_MAX_IN_FLIGHT_BATCHES = 4
+DEFAULT_EMBEDDING_NORMALIZATION_CACHE_MAX_ENTRIES = 4_096
 
 
 @lru_cache(maxsize=8)
@@ -66,6 +85,76 @@ def _embedding_input_token_limit() -> int:
     return min(MAX_EMBEDDING_INPUT_TOKENS, max(16, configured))
 
 
+@dataclass(frozen=True)
+class NormalizedEmbeddingText:
+    """Provider-safe embedding input and its token count.
+
+    ``token_count`` is exact for documents that needed tokenizing.  Short
+    documents, and every document when tiktoken is unavailable, report their
+    UTF-8 byte length, which is never lower than the token count.
+    """
+
+    text: str
+    token_count: int
+
+
+_normalized_embedding_lock = threading.Lock()
+_normalized_embedding_inputs: OrderedDict[
+    tuple[str, int, str], NormalizedEmbeddingText
+] = OrderedDict()
+
+
+def _normalization_cache_max_entries() -> int:
+    return env_int(
+        "ARCLI_EMBEDDING_NORMALIZATION_CACHE_MAX_ENTRIES",
+        DEFAULT_EMBEDDING_NORMALIZATION_CACHE_MAX_ENTRIES,
+    )
+
+
+def clear_normalized_embedding_inputs() -> None:
+    with _normalized_embedding_lock:
+        _normalized_embedding_inputs.clear()
+
+
+def normalized_embedding_input(
+    text: str,
+    *,
+    model: str = EMBEDDING_MODEL,
+) -> NormalizedEmbeddingText:
+    """Memoized :func:`normalize_embedding_text` that also returns tokens.
+
+    The same post is normalized by matching, prewarm, rematch, watchlist and
+    request validation code.  Results are keyed by the raw text hash, and the
+    normalized text is stored under its own hash too, so validating an
+    already-normalized input never tokenizes it again.
+    """
+    if not text:
+        return NormalizedEmbeddingText(text=text, token_count=0)
+
+    token_limit = _embedding_input_token_limit()
+    key = (model, token_limit, hashlib.sha256(text.encode("utf-8")).hexdigest())
+    with _normalized_embedding_lock:
+        cached = _normalized_embedding_inputs.get(key)
+        if cached is not None:
+            _normalized_embedding_inputs.move_to_end(key)
+            return cached
+
+    normalized = _normalize_embedding_input(text, model=model, token_limit=token_limit)
+    max_entries = _normalization_cache_max_entries()
+    with _normalized_embedding_lock:
+        _normalized_embedding_inputs[key] = normalized
+        if normalized.text != text:
+            normalized_key = (
+                model,
+                token_limit,
+                hashlib.sha256(normalized.text.encode("utf-8")).hexdigest(),
+            )
+            _normalized_embedding_inputs[normalized_key] = normalized
+        while len(_normalized_embedding_inputs) > max_entries:
+            _normalized_embedding_inputs.popitem(last=False)
+    return normalized
+
+
 def normalize_embedding_text(text: str, *, model: str = EMBEDDING_MODEL) -> str:
     """Bound an embedding document without splitting Unicode or API tokens.
 
@@ -74,22 +163,27 @@ def normalize_embedding_text(text: str, *, model: str = EMBEDDING_MODEL) -> str:
     logs, for which a character cap is not a token cap.  Tokenize only on the
     active embedding path to keep the idle Dramatiq worker lightweight.
     """
-    if not text:
-        return text
+    return normalized_embedding_input(text, model=model).text
 
-    token_limit = _embedding_input_token_limit()
+
+def _normalize_embedding_input(
+    text: str,
+    *,
+    model: str,
+    token_limit: int,
+) -> NormalizedEmbeddingText:
     safe_token_limit = max(1, token_limit - EMBEDDING_INPUT_TOKEN_SAFETY_MARGIN)
     encoded = text.encode("utf-8")
     # Token count cannot exceed UTF-8 byte count. Avoid loading a tokenizer at
     # all for the overwhelmingly common short document.
     if len(encoded) <= safe_token_limit:
-        return text
+        return NormalizedEmbeddingText(text=text, token_count=len(encoded))
 
     tokenizer = _embedding_tokenizer(model)
     if tokenizer is not None:
         token_ids = tokenizer.encode(text, disallowed_special=())
         if len(token_ids) <= safe_token_limit:
-            return text
+            return NormalizedEmbeddingText(text=text, token_count=len(token_ids))
 
         bounded = tokenizer.decode(token_ids[:safe_token_limit]).rstrip()
         logger.info(
@@ -98,7 +192,10 @@ def normalize_embedding_text(text: str, *, model: str = EMBEDDING_MODEL) -> str:
             len(token_ids),
             safe_token_limit,
         )
-        return bounded
+        return NormalizedEmbeddingText(
+            text=bounded,
+            token_count=len(tokenizer.encode(bounded, disallowed_special=())),
+        )
 
     # A tokenizer dependency failure must not turn one long public post into
     # a permanently failing batch. Every token represents at least one UTF-8
@@ -110,7 +207,48 @@ def normalize_embedding_text(text: str, *, model: str = EMBEDDING_MODEL) -> str:
         len(encoded),
         len(bounded.encode("utf-8")),
     )
-    return bounded or text[0]
+    bounded = bounded or text[0]
+    return NormalizedEmbeddingText(text=bounded, token_count=len(bounded.encode("utf-8")))
+
+
+def _embedding_request_token_limit() -> int:
+    configured = env_int(
+        "ARCLI_OPENAI_EMBEDDING_BATCH_MAX_TOKENS",
+        MAX_EMBEDDING_REQUEST_TOKENS,
+    )
+    return min(MAX_EMBEDDING_REQUEST_TOKENS, max(1, configured))
+
+
+def _embedding_batch_size() -> int:
+    requested_batch_size = env_int("ARCLI_OPENAI_EMBEDDING_BATCH_SIZE", 32)
+    return min(2_048, max(1, requested_batch_size))
+
+
+def _token_budget_batches(
+    token_counts: Sequence[int],
+    *,
+    max_inputs: int,
+    max_tokens: int,
+) -> list[list[int]]:
+    """Split input positions into provider requests bounded by count and tokens.
+
+    Inputs keep their order.  A single input above ``max_tokens`` still gets a
+    request of its own; per-input limits are enforced by normalization.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for index, token_count in enumerate(token_counts):
+        if current and (
+            len(current) >= max_inputs or current_tokens + token_count > max_tokens
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += token_count
+    if current:
+        batches.append(current)
+    return batches
 
 
 class EmbeddingRequest(BaseModel):
@@ -156,6 +294,27 @@ class EmbeddingResponse(BaseModel):
         return value
 
 
+@dataclass
+class _EmbeddingPlan:
+    """Cache hits, de-duplicated provider inputs and quotas for one request."""
+
+    payloads: list[EmbeddingRequest]
+    source_post_ids: list[str | None]
+    responses: list[EmbeddingResponse | None]
+    pending_by_key: dict[tuple[str, str], list[int]] = field(default_factory=dict)
+    quota: QuotaReservation | None = None
+    recorded_keys: set[tuple[str, str]] = field(default_factory=set)
+
+    def pending_keys_by_model(self) -> dict[str, list[tuple[str, str]]]:
+        keys_by_model: dict[str, list[tuple[str, str]]] = {}
+        for key in self.pending_by_key:
+            keys_by_model.setdefault(key[0], []).append(key)
+        return keys_by_model
+
+    def text_for(self, key: tuple[str, str]) -> str:
+        return self.payloads[self.pending_by_key[key][0]].text
+
+
 def _is_retryable_openai_error(exception: BaseException) -> bool:
     status_code = getattr(exception, "status_code", None)
     if status_code in {408, 409, 429, 500, 502, 503, 504}:
@@ -193,6 +352,7 @@ class EmbeddingService(OpenAIClientOwner):
         model: str = EMBEDDING_MODEL,
         timeout_seconds: float = 30.0,
         quota_guard: TenantQuotaGuard | None = None,
+        embedding_cache: ContentEmbeddingCache | None = None,
     ) -> None:
         self.client = client
         self._owns_client = False
@@ -200,6 +360,7 @@ class EmbeddingService(OpenAIClientOwner):
         self.model = model
         self.timeout_seconds = timeout_seconds
         self.quota_guard = quota_guard or TenantQuotaGuard()
+        self.embedding_cache = embedding_cache or content_embedding_cache
 
     def embed_text(
         self,
@@ -215,6 +376,23 @@ class EmbeddingService(OpenAIClientOwner):
             if isinstance(request, EmbeddingRequest)
             else EmbeddingRequest(text=request, model=self.model)
         )
+        text_sha256 = embedding_text_sha256(payload.text)
+        cached = self.embedding_cache.get_many(payload.model, [text_sha256])
+        if text_sha256 in cached:
+            logger.debug(
+                "embedding_cache_hit tenant_id=%s service_profile_id=%s source_post_id=%s purpose=%s model=%s",
+                tenant_id,
+                service_profile_id,
+                source_post_id,
+                purpose,
+                payload.model,
+            )
+            return EmbeddingResponse(
+                model=payload.model,
+                embedding=cached[text_sha256],
+                dimensions=len(cached[text_sha256]),
+            )
+
         quota = self.quota_guard.check_and_increment(
             tenant_id=tenant_id,
             counter_name=EMBEDDING_QUOTA_COUNTER,
@@ -244,6 +422,7 @@ class EmbeddingService(OpenAIClientOwner):
             embedding=embedding,
             dimensions=len(embedding),
         )
+        self.embedding_cache.put_many(payload.model, {text_sha256: embedding})
         logger.debug(
             "embedding_generated tenant_id=%s service_profile_id=%s source_post_id=%s purpose=%s model=%s dimensions=%s input_chars=%s current_count=%s limit=%s",
             quota.tenant_id,
@@ -269,20 +448,130 @@ class EmbeddingService(OpenAIClientOwner):
     ) -> list[EmbeddingResponse]:
         """Embed a bounded collection with one provider request per batch.
 
-        OpenAI's embeddings endpoint accepts an array of inputs.  Keeping the
-        quota decision per document preserves Arcli's existing usage policy,
-        while batching removes needless network round trips for public-post
-        matching.
+        OpenAI's embeddings endpoint accepts an array of inputs.  Quota is
+        still counted per document, but reserved for the whole collection in
+        one ``reserve_many`` call and refunded for any input whose provider
+        batch fails; batching removes needless network round trips for
+        public-post matching.  Requests are packed up to ``ARCLI_OPENAI_EMBEDDING_BATCH_SIZE``
+        inputs and ``ARCLI_OPENAI_EMBEDDING_BATCH_MAX_TOKENS`` tokens, using the
+        memoized counts from :func:`normalized_embedding_input`.  Up to
+        ``ARCLI_OPENAI_EMBEDDING_MAX_IN_FLIGHT`` batches (at most 16) run
+        concurrently on worker threads, and each still waits for its own
+        shared provider pacing slot, so the Redis request budget is unchanged.
+        Texts already in the content-addressed embedding cache, and repeats of
+        a text within the collection, spend no quota or provider request.
         """
+        plan = self._plan_embeddings(
+            requests,
+            tenant_id=tenant_id,
+            service_profile_id=service_profile_id,
+            source_post_ids=source_post_ids,
+            purpose=purpose,
+        )
+        batches = self._provider_batches(plan)
+        if not batches:
+            return self._planned_responses(plan)
+
+        # Build the client on the calling thread so it stays registered for
+        # this actor's cleanup, then share it with the dispatch threads.
+        self._get_client()
+        max_in_flight = min(
+            16,
+            max(
+                1,
+                env_int(
+                    "ARCLI_OPENAI_EMBEDDING_MAX_IN_FLIGHT",
+                    DEFAULT_EMBEDDING_MAX_IN_FLIGHT_BATCHES,
+                ),
+            ),
+        )
+        logger.debug(
+            "embedding_batches_dispatched purpose=%s inputs=%s batches=%s max_in_flight=%s",
+            purpose,
+            len(plan.pending_by_key),
+            len(batches),
+            max_in_flight,
+        )
+        failures: list[BaseException] = []
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_in_flight, len(batches)),
+            thread_name_prefix="arcli-embedding",
+        )
+        try:
+            futures = {
+                executor.submit(
+                    self._create_embeddings,
+                    [plan.text_for(key) for key in batch_keys],
+                    model,
+                ): (model, batch_keys)
+                for model, batch_keys in batches
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                model, batch_keys = futures[future]
+                try:
+                    self._record_embedding_batch(
+                        plan,
+                        model,
+                        batch_keys,
+                        future.result(),
+                        service_profile_id=service_profile_id,
+                        purpose=purpose,
+                    )
+                except Exception as exc:
+                    # Batches that have not started yet are not sent.
+                    for pending in futures:
+                        pending.cancel()
+                    failures.append(exc)
+        except BaseException as exc:
+            # The actor time limit is raised on this thread mid-wait.
+            failures.insert(0, exc)
+        finally:
+            # Let every started batch settle before refunding, so a failure
+            # cannot refund units that a still-running batch goes on to spend.
+            executor.shutdown(wait=True, cancel_futures=True)
+        if failures:
+            self._refund_unrecorded(plan)
+            raise failures[0]
+        return self._planned_responses(plan)
+
+    @staticmethod
+    def _provider_batches(
+        plan: _EmbeddingPlan,
+    ) -> list[tuple[str, list[tuple[str, str]]]]:
+        """Pack pending inputs into requests by count and by token budget."""
+        batch_size = _embedding_batch_size()
+        max_tokens = _embedding_request_token_limit()
+        batches: list[tuple[str, list[tuple[str, str]]]] = []
+        for model, keys in plan.pending_keys_by_model().items():
+            token_counts = [
+                normalized_embedding_input(plan.text_for(key), model=model).token_count
+                for key in keys
+            ]
+            for batch in _token_budget_batches(
+                token_counts,
+                max_inputs=batch_size,
+                max_tokens=max_tokens,
+            ):
+                batches.append((model, [keys[index] for index in batch]))
+        return batches
+
+    def _plan_embeddings(
+        self,
+        requests: Sequence[EmbeddingRequest] | Sequence[str],
+        *,
+        tenant_id: str | None,
+        service_profile_id: str | None,
+        source_post_ids: Sequence[str | None] | None,
+        purpose: str,
+    ) -> _EmbeddingPlan:
         payloads = [
             request
             if isinstance(request, EmbeddingRequest)
             else EmbeddingRequest(text=request, model=self.model)
             for request in requests
         ]
-        if not payloads:
-            return []
-
         normalized_source_post_ids = list(source_post_ids or ())
         if source_post_ids is not None and len(normalized_source_post_ids) != len(
             payloads
@@ -291,75 +580,141 @@ class EmbeddingService(OpenAIClientOwner):
         if not normalized_source_post_ids:
             normalized_source_post_ids = [None] * len(payloads)
 
-        quotas = []
-        for payload, source_post_id in zip(payloads, normalized_source_post_ids):
-            quota = self.quota_guard.check_and_increment(
-                tenant_id=tenant_id,
-                counter_name=EMBEDDING_QUOTA_COUNTER,
-                limit=env_int(
-                    "ARCLI_AI_DAILY_EMBEDDING_LIMIT",
-                    EMBEDDING_QUOTA_DEFAULT_LIMIT,
-                ),
-                window_seconds=env_int(
-                    "ARCLI_AI_DAILY_EMBEDDING_WINDOW_SECONDS",
-                    EMBEDDING_QUOTA_DEFAULT_WINDOW_SECONDS,
-                ),
-            )
-            if not quota.allowed:
-                logger.warning(
-                    "embedding_skipped tenant_id=%s service_profile_id=%s source_post_id=%s purpose=%s rejection_reason=%s current_count=%s limit=%s window_seconds=%s",
-                    quota.tenant_id,
-                    service_profile_id,
-                    source_post_id,
-                    purpose,
-                    quota.rejection_reason,
-                    quota.current_count,
-                    quota.limit,
-                    quota.window_seconds,
-                )
-                raise RuntimeError("Embedding quota exceeded for tenant.")
-            quotas.append(quota)
+        plan = _EmbeddingPlan(
+            payloads=payloads,
+            source_post_ids=normalized_source_post_ids,
+            responses=[None] * len(payloads),
+        )
+        if not payloads:
+            return plan
 
-        requested_batch_size = env_int("ARCLI_OPENAI_EMBEDDING_BATCH_SIZE", 32)
-        batch_size = min(2_048, max(1, requested_batch_size))
-        responses: list[EmbeddingResponse | None] = [None] * len(payloads)
+        text_sha256s = [embedding_text_sha256(payload.text) for payload in payloads]
         indexes_by_model: dict[str, list[int]] = {}
         for index, payload in enumerate(payloads):
             indexes_by_model.setdefault(payload.model, []).append(index)
 
+        # One provider input per distinct uncached (model, text) pair; every
+        # request index that shares it receives the same vector.
         for model, indexes in indexes_by_model.items():
-            for start in range(0, len(indexes), batch_size):
-                batch_indexes = indexes[start : start + batch_size]
-                embeddings = self._create_embeddings(
-                    [payloads[index].text for index in batch_indexes],
-                    model,
-                )
-                if len(embeddings) != len(batch_indexes):
-                    raise RuntimeError("OpenAI returned an incomplete embedding batch.")
-                for index, embedding in zip(batch_indexes, embeddings):
-                    result = EmbeddingResponse(
+            cached = self.embedding_cache.get_many(
+                model,
+                [text_sha256s[index] for index in indexes],
+            )
+            for index in indexes:
+                embedding = cached.get(text_sha256s[index])
+                if embedding is not None:
+                    plan.responses[index] = EmbeddingResponse(
                         model=model,
                         embedding=embedding,
                         dimensions=len(embedding),
                     )
-                    responses[index] = result
-                    quota = quotas[index]
-                    logger.debug(
-                        "embedding_generated tenant_id=%s service_profile_id=%s source_post_id=%s purpose=%s model=%s dimensions=%s input_chars=%s current_count=%s limit=%s",
-                        quota.tenant_id,
-                        service_profile_id,
-                        normalized_source_post_ids[index],
-                        purpose,
-                        result.model,
-                        result.dimensions,
-                        len(payloads[index].text),
-                        quota.current_count,
-                        quota.limit,
-                    )
+                    continue
+                plan.pending_by_key.setdefault((model, text_sha256s[index]), []).append(
+                    index
+                )
 
-        if any(response is None for response in responses):
+        cache_hits = len(payloads) - sum(
+            len(indexes) for indexes in plan.pending_by_key.values()
+        )
+        if cache_hits:
+            logger.debug(
+                "embedding_cache_hits tenant_id=%s service_profile_id=%s purpose=%s hits=%s requested=%s",
+                tenant_id,
+                service_profile_id,
+                purpose,
+                cache_hits,
+                len(payloads),
+            )
+
+        if not plan.pending_by_key:
+            return plan
+
+        quota = self.quota_guard.reserve_many(
+            tenant_id=tenant_id,
+            counter_name=EMBEDDING_QUOTA_COUNTER,
+            limit=env_int(
+                "ARCLI_AI_DAILY_EMBEDDING_LIMIT",
+                EMBEDDING_QUOTA_DEFAULT_LIMIT,
+            ),
+            window_seconds=env_int(
+                "ARCLI_AI_DAILY_EMBEDDING_WINDOW_SECONDS",
+                EMBEDDING_QUOTA_DEFAULT_WINDOW_SECONDS,
+            ),
+            units=len(plan.pending_by_key),
+        )
+        if not quota.allowed:
+            # The collection is embedded all-or-nothing; hand back a partial
+            # grant so it stays available to the next request.
+            self.quota_guard.refund(quota, quota.granted)
+            logger.warning(
+                "embedding_skipped tenant_id=%s service_profile_id=%s purpose=%s rejection_reason=%s requested=%s granted=%s current_count=%s limit=%s window_seconds=%s",
+                quota.tenant_id,
+                service_profile_id,
+                purpose,
+                quota.rejection_reason,
+                quota.requested,
+                quota.granted,
+                quota.current_count,
+                quota.limit,
+                quota.window_seconds,
+            )
+            raise RuntimeError("Embedding quota exceeded for tenant.")
+        plan.quota = quota
+        return plan
+
+    def _refund_unrecorded(self, plan: _EmbeddingPlan) -> None:
+        """Return quota for inputs whose provider batch never completed."""
+        if plan.quota is None:
+            return
+        self.quota_guard.refund(
+            plan.quota,
+            len(plan.pending_by_key) - len(plan.recorded_keys),
+        )
+
+    def _record_embedding_batch(
+        self,
+        plan: _EmbeddingPlan,
+        model: str,
+        batch_keys: Sequence[tuple[str, str]],
+        embeddings: Sequence[list[float]],
+        *,
+        service_profile_id: str | None,
+        purpose: str,
+    ) -> None:
+        if len(embeddings) != len(batch_keys):
+            raise RuntimeError("OpenAI returned an incomplete embedding batch.")
+        quota = plan.quota
+        for key, embedding in zip(batch_keys, embeddings):
+            plan.recorded_keys.add(key)
+            for index in plan.pending_by_key[key]:
+                result = EmbeddingResponse(
+                    model=model,
+                    embedding=embedding,
+                    dimensions=len(embedding),
+                )
+                plan.responses[index] = result
+                logger.debug(
+                    "embedding_generated tenant_id=%s service_profile_id=%s source_post_id=%s purpose=%s model=%s dimensions=%s input_chars=%s current_count=%s limit=%s",
+                    quota.tenant_id,
+                    service_profile_id,
+                    plan.source_post_ids[index],
+                    purpose,
+                    result.model,
+                    result.dimensions,
+                    len(plan.payloads[index].text),
+                    quota.current_count,
+                    quota.limit,
+                )
+        self.embedding_cache.put_many(
+            model,
+            {key[1]: embedding for key, embedding in zip(batch_keys, embeddings)},
+        )
+
+    @staticmethod
+    def _planned_responses(plan: _EmbeddingPlan) -> list[EmbeddingResponse]:
+        if any(response is None for response in plan.responses):
             raise RuntimeError("OpenAI embedding batch did not return every requested input.")
-        return [response for response in responses if response is not None]
+        return [response for response in plan.responses if response is not None]
 
     @retry(
         retry=retry_if_exception(_is_retryable_openai_error),
@@ -545,24 +900,10 @@ def _database_engine() -> Engine:
 
 
 def _service_profile_columns(conn: Connection) -> dict[str, dict[str, str]]:
-    rows = conn.execute(
-        text(
-            """
-            SELECT column_name, data_type, udt_name
-              FROM information_schema.columns
-             WHERE table_schema = 'public'
-               AND table_name = 'service_profiles'
-            """
-        )
-    ).mappings()
-
     return {
-        str(row["column_name"]): {
-            "data_type": str(row["data_type"]),
-            "udt_name": str(row["udt_name"]),
-        }
-        for row in rows
-        if str(row["column_name"]) in SERVICE_PROFILE_EMBEDDING_COLUMNS
+        column_name: column
+        for column_name, column in table_columns(conn, "service_profiles").items()
+        if column_name in SERVICE_PROFILE_EMBEDDING_COLUMNS
     }
 
 
@@ -1131,25 +1472,7 @@ def _table_columns(
     conn: Connection,
     table_name: str,
 ) -> dict[str, dict[str, str]]:
-    rows = conn.execute(
-        text(
-            """
-            SELECT column_name, data_type, udt_name
-              FROM information_schema.columns
-             WHERE table_schema = 'public'
-               AND table_name = :table_name
-            """
-        ),
-        {"table_name": table_name},
-    ).mappings()
-
-    return {
-        str(row["column_name"]): {
-            "data_type": str(row["data_type"]),
-            "udt_name": str(row["udt_name"]),
-        }
-        for row in rows
-    }
+    return table_columns(conn, table_name)
 
 
 def _persist_service_profile_embedding_record(
@@ -11,6 +11,7 @@ from urllib.parse import urlsplit
 import httpx
 from pydantic import ValidationError
 
+from api.services.cost_controls import ProviderSlotLease, provider_rate_limiter
 from api.services.integrations.public_source import (
     PublicSourcePost,
     clip_text,
@@ -144,17 +145,25 @@ class GitHubIssuesConnector:
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
 
-        async with httpx.AsyncClient(
-            headers=headers,
-            timeout=httpx.Timeout(self.timeout_seconds),
-            follow_redirects=True,
-        ) as client:
+        async with (
+            httpx.AsyncClient(
+                headers=headers,
+                timeout=httpx.Timeout(self.timeout_seconds),
+                follow_redirects=True,
+            ) as client,
+            provider_rate_limiter.lease(
+                provider="github-issue-search",
+                limit=self.requests_per_minute,
+                expected_requests=page_cap,
+            ) as pacer,
+        ):
             for page in range(1, page_cap + 1):
                 payload = await self._fetch_page(
                     client,
                     search_query=search_query,
                     page=page,
                     page_size=min(100, target_limit - len(posts)),
+                    pacer=pacer,
                 )
                 hits = payload.get("items")
                 if not isinstance(hits, list) or not hits:
@@ -181,6 +190,7 @@ class GitHubIssuesConnector:
         search_query: str,
         page: int,
         page_size: int,
+        pacer: ProviderSlotLease | None = None,
     ) -> dict[str, Any]:
         return await fetch_json_with_retry(
             client=client,
@@ -197,6 +207,7 @@ class GitHubIssuesConnector:
             max_attempts=self.max_attempts,
             log_event="github_issue_search",
             page=page,
+            pacer=pacer,
         )
 
     @staticmethod
@@ -14,17 +14,14 @@ from typing import Any, Literal
 import httpx
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
-from api.services.cost_controls import env_int, provider_rate_limiter
+from api.services.cost_controls import ProviderSlotLease, env_int, provider_rate_limiter
+from api.services.text_signals import SIGNAL_HACKERNEWS_SPAM, has_text_signal
 
 logger = logging.getLogger(__name__)
 
 
 ALGOLIA_HN_SEARCH_BY_DATE_URL = "https://hn.algolia.com/api/v1/search_by_date"
 _BLOCK_TAGS = frozenset({"br", "div", "p", "li", "blockquote", "pre"})
-_SPAM_PATTERN = re.compile(
-    r"\b(?:buy\s+now|casino|crypto\s+giveaway|viagra)\b",
-    re.IGNORECASE,
-)
 
 
 class SourcePost(BaseModel):
@@ -151,11 +148,18 @@ class HackerNewsConnector:
             ),
         }
         timeout = httpx.Timeout(self.timeout_seconds)
-        async with httpx.AsyncClient(
-            headers=headers,
-            timeout=timeout,
-            follow_redirects=True,
-        ) as client:
+        async with (
+            httpx.AsyncClient(
+                headers=headers,
+                timeout=timeout,
+                follow_redirects=True,
+            ) as client,
+            provider_rate_limiter.lease(
+                provider="hn-algolia",
+                limit=env_int("ARCLI_HN_REQUESTS_PER_MINUTE", 60),
+                expected_requests=-(-target_limit // page_size),
+            ) as pacer,
+        ):
             while len(posts) < target_limit:
                 payload = await self._fetch_page(
                     client,
@@ -163,6 +167,7 @@ class HackerNewsConnector:
                     since_timestamp=since_timestamp,
                     page=page,
                     page_size=min(page_size, target_limit - len(posts)),
+                    pacer=pacer,
                 )
                 hits = payload.get("hits")
                 if not isinstance(hits, list) or not hits:
@@ -196,6 +201,7 @@ class HackerNewsConnector:
         since_timestamp: int,
         page: int,
         page_size: int,
+        pacer: ProviderSlotLease | None = None,
     ) -> dict[str, Any]:
         params = {
             "query": query,
@@ -208,7 +214,7 @@ class HackerNewsConnector:
 
         for attempt in range(1, self.max_attempts + 1):
             try:
-                await provider_rate_limiter.wait_for_slot_async(
+                await (pacer or provider_rate_limiter).wait_for_slot_async(
                     provider="hn-algolia",
                     limit=env_int("ARCLI_HN_REQUESTS_PER_MINUTE", 60),
                 )
@@ -275,7 +281,7 @@ class HackerNewsConnector:
         if (
             not source_post_id
             or len(body) < 2
-            or _SPAM_PATTERN.search(body)
+            or has_text_signal(body, SIGNAL_HACKERNEWS_SPAM)
         ):
             return None
 
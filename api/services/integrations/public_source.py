@@ -15,16 +15,17 @@ from urllib.parse import urlsplit, urlunsplit
 import httpx
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from api.services.cost_controls import env_int, provider_rate_limiter
+from api.services.cost_controls import (
+    ProviderSlotLease,
+    env_int,
+    provider_rate_limiter,
+)
+from api.services.text_signals import SIGNAL_PUBLIC_SOURCE_SPAM, has_text_signal
 
 logger = logging.getLogger(__name__)
 
 
 _BLOCK_TAGS = frozenset({"br", "div", "p", "li", "blockquote", "pre"})
-_SPAM_PATTERN = re.compile(
-    r"\b(?:buy\s+now|casino|crypto\s+giveaway|free\s+followers|viagra)\b",
-    re.IGNORECASE,
-)
 
 # Public source APIs generally treat consecutive query words as an AND or an
 # exact phrase.  A full buyer-language sentence makes a good matching brief,
@@ -246,7 +247,7 @@ def safe_http_url(value: object) -> str:
 
 
 def is_probable_spam(value: str) -> bool:
-    return bool(_SPAM_PATTERN.search(value))
+    return has_text_signal(value, SIGNAL_PUBLIC_SOURCE_SPAM)
 
 
 def response_retry_after_seconds(response: httpx.Response) -> float | None:
@@ -269,17 +270,20 @@ async def fetch_json_with_retry(
     max_attempts: int,
     log_event: str,
     page: int | str,
+    pacer: ProviderSlotLease | None = None,
 ) -> dict[str, Any]:
     """Fetch one JSON page, retrying only timeouts and transient HTTP failures.
 
-    The shared Redis-backed limiter coordinates independent worker processes.
-    Queries and headers are intentionally omitted from logs because either can
-    contain customer-specific language or credentials.
+    The shared Redis-backed limiter coordinates independent worker processes;
+    a multi-page search may pass a ``ProviderSlotLease`` as ``pacer`` to
+    spend slots it already reserved.  Queries and headers are intentionally
+    omitted from logs because either can contain customer-specific language
+    or credentials.
     """
     last_error: httpx.TimeoutException | httpx.HTTPStatusError | None = None
     for attempt in range(1, max(1, max_attempts) + 1):
         try:
-            await provider_rate_limiter.wait_for_slot_async(
+            await (pacer or provider_rate_limiter).wait_for_slot_async(
                 provider=provider,
                 limit=max(1, requests_per_minute),
             )
@@ -11,6 +11,7 @@ from typing import Any, Literal
 import httpx
 from pydantic import ValidationError
 
+from api.services.cost_controls import ProviderSlotLease, provider_rate_limiter
 from api.services.integrations.public_source import (
     PublicSourcePost,
     clip_text,
@@ -128,11 +129,18 @@ class StackExchangeConnector:
             ),
         }
 
-        async with httpx.AsyncClient(
-            headers=headers,
-            timeout=httpx.Timeout(self.timeout_seconds),
-            follow_redirects=True,
-        ) as client:
+        async with (
+            httpx.AsyncClient(
+                headers=headers,
+                timeout=httpx.Timeout(self.timeout_seconds),
+                follow_redirects=True,
+            ) as client,
+            provider_rate_limiter.lease(
+                provider="stackexchange-advanced-search",
+                limit=self.requests_per_minute,
+                expected_requests=page_cap,
+            ) as pacer,
+        ):
             while len(posts) < target_limit and page <= page_cap:
                 payload = await self._fetch_page(
                     client,
@@ -140,6 +148,7 @@ class StackExchangeConnector:
                     since_timestamp=since_timestamp,
                     page=page,
                     page_size=min(100, target_limit - len(posts)),
+                    pacer=pacer,
                 )
                 hits = payload.get("items")
                 if not isinstance(hits, list) or not hits:
@@ -195,6 +204,7 @@ class StackExchangeConnector:
         since_timestamp: int,
         page: int,
         page_size: int,
+        pacer: ProviderSlotLease | None = None,
     ) -> dict[str, Any]:
         params = {
             "site": self.site,
@@ -217,6 +227,7 @@ class StackExchangeConnector:
             max_attempts=max(1, self.max_attempts),
             log_event="stackexchange_search",
             page=page,
+            pacer=pacer,
         )
 
     def _inter_page_wait_seconds(self, payload: dict[str, Any]) -> float:
@@ -14,6 +14,7 @@ import httpx
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from api.services.cost_controls import env_int, provider_rate_limiter
+from api.services.text_signals import SIGNAL_X_SPAM, has_text_signal
 
 logger = logging.getLogger(__name__)
 
@@ -23,10 +24,6 @@ X_RECENT_SEARCH_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
 # A request at exactly seven days old can be rejected by the time X receives
 # it. Preserve two minutes of slack for queue and network latency.
 X_RECENT_SEARCH_SAFETY_BUFFER_SECONDS = 120
-_SPAM_PATTERN = re.compile(
-    r"\b(?:airdrop|casino|crypto\s+giveaway|free\s+followers|viagra)\b",
-    re.IGNORECASE,
-)
 
 
 class SourcePost(BaseModel):
@@ -320,7 +317,7 @@ class XConnector:
         if (
             not source_post_id
             or len(body) < 2
-            or _SPAM_PATTERN.search(body)
+            or has_text_signal(body, SIGNAL_X_SPAM)
             or not posted_at
             or int(posted_at.timestamp()) < since_timestamp
         ):
@@ -2,9 +2,11 @@ import logging
 import math
 from typing import Callable, Literal, Sequence
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from api.services.cost_controls import env_float, env_int
+from api.services.text_signals import OBVIOUS_SPAM_MARKERS, SIGNAL_OBVIOUS_SPAM, has_text_signal
 
 logger = logging.getLogger(__name__)
 
@@ -21,13 +23,6 @@ REJECTION_EMPTY_TEXT = "empty_or_too_short_text"
 REJECTION_SPAM_SIGNAL = "cheap_filter_spam_signal"
 REJECTION_INSUFFICIENT_SIMILARITY = "insufficient_similarity_score"
 
-OBVIOUS_SPAM_MARKERS = (
-    "limited offer",
-    "buy followers",
-    "verified emails",
-    "crypto giveaway",
-    "guaranteed leads",
-)
 
 
 class PostEmbedding(BaseModel):
@@ -99,6 +94,86 @@ def cosine_similarity(left: Sequence[float], right: Sequence[float]) -> float:
     return dot_product / math.sqrt(left_norm_squared * right_norm_squared)
 
 
+def normalized_embedding_vector(embedding: Sequence[float]) -> np.ndarray:
+    """Return one embedding as a unit-length float32 vector.
+
+    A zero vector stays zero, which scores 0.0 against every row exactly like
+    :func:`cosine_similarity`.
+    """
+    values = np.asarray(embedding, dtype=np.float64)
+    if values.ndim != 1:
+        raise ValueError("Embedding must be a flat sequence of floats")
+    if values.size == 0:
+        raise ValueError("Embeddings must not be empty")
+    if not np.isfinite(values).all():
+        raise ValueError("Embedding values must be finite")
+
+    norm = float(np.linalg.norm(values))
+    if norm > 0.0:
+        values = values / norm
+    return np.ascontiguousarray(values, dtype=np.float32)
+
+
+def normalized_embedding_matrix(embeddings: Sequence[Sequence[float]]) -> np.ndarray:
+    """Stack embeddings into one contiguous, row-normalized float32 matrix.
+
+    Norms are taken in float64 before the float32 downcast so large raw
+    magnitudes cannot overflow. Zero rows stay zero.
+    """
+    if not embeddings:
+        raise ValueError("Embeddings must not be empty")
+
+    dimensions = {len(embedding) for embedding in embeddings}
+    if len(dimensions) != 1:
+        raise ValueError(
+            f"Embedding dimensions must match: found={sorted(dimensions)}"
+        )
+    if 0 in dimensions:
+        raise ValueError("Embeddings must not be empty")
+
+    values = np.asarray(embeddings, dtype=np.float64)
+    if not np.isfinite(values).all():
+        raise ValueError("Embedding values must be finite")
+
+    norms = np.linalg.norm(values, axis=1)
+    nonzero = norms > 0.0
+    values[nonzero] /= norms[nonzero, np.newaxis]
+    return np.ascontiguousarray(values, dtype=np.float32)
+
+
+def similarity_scores(matrix: np.ndarray, vector: np.ndarray) -> np.ndarray:
+    """Score every normalized row against one normalized vector in one product.
+
+    float32 rounding can land a hair outside ``[-1, 1]``; scores are clipped
+    so they always fit ``CandidateMatch`` and ``MatchRejection`` bounds.
+    """
+    return np.clip(matrix @ vector, -1.0, 1.0)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return positions of the ``k`` best scores, best first.
+
+    ``argpartition`` avoids a full sort for large batches. Ties are broken by
+    input position, matching the stable sort this replaces, including ties
+    that straddle the cut-off.
+    """
+    size = int(scores.shape[0])
+    if size == 0 or k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    if size > k:
+        partitioned = np.argpartition(-scores, k - 1)[:k]
+        boundary = scores[partitioned].min()
+        above = np.flatnonzero(scores > boundary)
+        ties = np.flatnonzero(scores == boundary)[: k - above.size]
+        selected = np.concatenate((above, ties))
+    else:
+        selected = np.arange(size, dtype=np.intp)
+
+    order = np.lexsort((selected, -scores[selected]))
+    return selected[order]
+
+
 def _tenant_id(tenant_id: str | None) -> str:
     return tenant_id.strip() if tenant_id and tenant_id.strip() else "unknown"
 
@@ -128,9 +203,8 @@ def cheap_filter_rejection_reason(text: str) -> str | None:
     if len(normalized) < env_int("ARCLI_MATCHING_MIN_POST_CHARS", 20):
         return REJECTION_EMPTY_TEXT
 
-    for marker in OBVIOUS_SPAM_MARKERS:
-        if marker in normalized:
-            return REJECTION_SPAM_SIGNAL
+    if has_text_signal(normalized, SIGNAL_OBVIOUS_SPAM):
+        return REJECTION_SPAM_SIGNAL
 
     return None
 
@@ -262,11 +336,35 @@ def find_candidate_matches(
     resolved_threshold = _similarity_threshold(threshold)
     resolved_max_candidates = _max_candidates(max_candidates)
 
-    candidates: list[CandidateMatch] = []
+    cheap_rejection_reasons = [
+        cheap_filter_rejection_reason(post_embedding.text)
+        for post_embedding in post_embeddings
+    ]
+    scored_positions = [
+        position
+        for position, reason in enumerate(cheap_rejection_reasons)
+        if reason is None
+    ]
+    scores = np.zeros(len(post_embeddings), dtype=np.float32)
+    if scored_positions:
+        post_matrix = normalized_embedding_matrix(
+            [post_embeddings[position].embedding for position in scored_positions]
+        )
+        profile_vector = normalized_embedding_vector(profile_embedding)
+        if profile_vector.shape[0] != post_matrix.shape[1]:
+            raise ValueError(
+                "Embedding dimensions must match: "
+                f"left={profile_vector.shape[0]} right={post_matrix.shape[1]}"
+            )
+        scores[scored_positions] = similarity_scores(post_matrix, profile_vector)
+
+    # Rejections are emitted in input order, exactly as the per-post loop did,
+    # so persistence callbacks observe the same sequence.
+    admitted_positions: list[int] = []
     cheap_filter_rejections = 0
     similarity_rejections = 0
-    for post_embedding in post_embeddings:
-        cheap_rejection_reason = cheap_filter_rejection_reason(post_embedding.text)
+    for position, post_embedding in enumerate(post_embeddings):
+        cheap_rejection_reason = cheap_rejection_reasons[position]
         if cheap_rejection_reason:
             cheap_filter_rejections += 1
             _emit_rejection(
@@ -279,7 +377,7 @@ def find_candidate_matches(
             )
             continue
 
-        score = cosine_similarity(profile_embedding, post_embedding.embedding)
+        score = float(scores[position])
         if score < resolved_threshold:
             similarity_rejections += 1
             _emit_rejection(
@@ -294,19 +392,24 @@ def find_candidate_matches(
             )
             continue
 
-        candidates.append(
-            CandidateMatch(
-                post_id=post_embedding.post_id,
-                source=post_embedding.source,
-                text=post_embedding.text,
-                score=score,
-                url=post_embedding.url,
-                metadata=post_embedding.metadata,
-            )
-        )
+        admitted_positions.append(position)
 
-    candidates.sort(key=lambda candidate: candidate.score, reverse=True)
-    candidates = candidates[:resolved_max_candidates]
+    candidates: list[CandidateMatch] = []
+    if admitted_positions:
+        admitted = np.asarray(admitted_positions, dtype=np.intp)
+        selected = top_k_indices(scores[admitted], resolved_max_candidates)
+        for position in admitted[selected]:
+            post_embedding = post_embeddings[int(position)]
+            candidates.append(
+                CandidateMatch(
+                    post_id=post_embedding.post_id,
+                    source=post_embedding.source,
+                    text=post_embedding.text,
+                    score=float(scores[position]),
+                    url=post_embedding.url,
+                    metadata=post_embedding.metadata,
+                )
+            )
 
     logger.debug(
         "candidate_matching_completed tenant_id=%s service_profile_id=%s posts=%s candidates=%s threshold=%.3f max_candidates=%s cheap_filter_rejections=%s similarity_rejections=%s",
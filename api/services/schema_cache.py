@@ -0,0 +1,194 @@
+"""Process-wide cache for ``information_schema`` column metadata.
+
+Several deployment generations of ``source_posts``, ``lead_matches`` and
+``service_profiles`` are still supported, so storage helpers introspect the
+live columns before building SQL.  The schema only changes through reviewed
+migrations, while the helpers run per row, so one catalog query per table and
+engine is reused for a short TTL.  Whether a table is partitioned is cached
+the same way, so writers follow a layout conversion without a deploy.  Call
+:func:`invalidate_table_columns` after applying a migration in-process; other
+workers pick it up when the TTL ends.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from api.services.cost_controls import env_float
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_CACHE_TTL_SECONDS = 300.0
+
+ColumnMap = dict[str, dict[str, str]]
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SchemaCacheStats:
+    hits: int
+    misses: int
+    entries: int
+
+
+def _query_table_columns(conn: Connection, table_name: str) -> ColumnMap:
+    rows = conn.execute(
+        text(
+            """
+            SELECT column_name, data_type, udt_name, udt_schema
+              FROM information_schema.columns
+             WHERE table_schema = 'public'
+               AND table_name = :table_name
+            """
+        ),
+        {"table_name": table_name},
+    ).mappings()
+
+    return {
+        str(row["column_name"]): {
+            "data_type": str(row["data_type"]),
+            "udt_name": str(row["udt_name"]),
+            "udt_schema": str(row["udt_schema"]),
+        }
+        for row in rows
+    }
+
+
+def _query_table_partitioned(conn: Connection | Engine, table_name: str) -> bool:
+    if isinstance(conn, Engine):
+        with conn.connect() as connection:
+            return _query_table_partitioned(connection, table_name)
+    return bool(
+        conn.execute(
+            text(
+                """
+                SELECT EXISTS (
+                    SELECT 1
+                      FROM pg_partitioned_table
+                     WHERE partrelid = to_regclass(format('public.%I', :table_name))
+                )
+                """
+            ),
+            {"table_name": table_name},
+        ).scalar()
+    )
+
+
+class SchemaColumnCache:
+    """Cache column metadata and layout per database engine and table with a TTL.
+
+    Entries are keyed by the connection's engine, so two databases in one
+    process never share metadata.  Connections without an engine (test
+    doubles, raw DBAPI wrappers) are always queried directly.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: weakref.WeakKeyDictionary[
+            Any, dict[tuple[str, str], tuple[float, Any]]
+        ] = weakref.WeakKeyDictionary()
+        self._hits = 0
+        self._misses = 0
+
+    def _resolved_ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return max(0.0, self._ttl_seconds)
+        return max(
+            0.0,
+            env_float("ARCLI_SCHEMA_CACHE_TTL_SECONDS", DEFAULT_SCHEMA_CACHE_TTL_SECONDS),
+        )
+
+    def columns(self, conn: Connection, table_name: str) -> ColumnMap:
+        return dict(self._lookup(conn, "columns", table_name, _query_table_columns))
+
+    def is_partitioned(self, conn: Connection | Engine, table_name: str) -> bool:
+        """Whether ``public.<table_name>`` is a partitioned table.
+
+        ``conn`` may be an engine; a connection is only checked out on a miss.
+        """
+        return self._lookup(conn, "partitioned", table_name, _query_table_partitioned)
+
+    def _lookup(
+        self,
+        conn: Any,
+        kind: str,
+        table_name: str,
+        query: Callable[[Any, str], T],
+    ) -> T:
+        engine = getattr(conn, "engine", None)
+        if engine is None:
+            return query(conn, table_name)
+        try:
+            weakref.ref(engine)
+        except TypeError:
+            # Engines that cannot be weakly referenced are not cached.
+            return query(conn, table_name)
+
+        key = (kind, table_name)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(engine, {}).get(key)
+            if cached is not None and cached[0] > now:
+                self._hits += 1
+                return cached[1]
+            self._misses += 1
+            hits, misses = self._hits, self._misses
+
+        value = query(conn, table_name)
+        ttl_seconds = self._resolved_ttl_seconds()
+        if ttl_seconds > 0:
+            with self._lock:
+                self._entries.setdefault(engine, {})[key] = (now + ttl_seconds, value)
+
+        logger.debug(
+            "schema_cache_miss kind=%s table=%s hits=%s misses=%s",
+            kind,
+            table_name,
+            hits,
+            misses,
+        )
+        return value
+
+    def invalidate(self, table_name: str | None = None) -> None:
+        """Forget one table, or every table, for all engines."""
+        with self._lock:
+            if table_name is None:
+                self._entries.clear()
+                return
+            for tables in self._entries.values():
+                for key in [key for key in tables if key[1] == table_name]:
+                    tables.pop(key, None)
+
+    def stats(self) -> SchemaCacheStats:
+        with self._lock:
+            return SchemaCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=sum(len(tables) for tables in self._entries.values()),
+            )
+
+
+schema_column_cache = SchemaColumnCache()
+
+
+def table_columns(conn: Connection, table_name: str) -> ColumnMap:
+    """Return ``public.<table_name>`` column metadata from the shared cache."""
+    return schema_column_cache.columns(conn, table_name)
+
+
+def invalidate_table_columns(table_name: str | None = None) -> None:
+    schema_column_cache.invalidate(table_name)
+
+
+def table_is_partitioned(conn: Connection | Engine, table_name: str) -> bool:
+    """Return whether ``public.<table_name>`` is partitioned, from the shared cache."""
+    return schema_column_cache.is_partitioned(conn, table_name)
@@ -9,8 +9,11 @@ import os
 import re
 import json
 import hashlib
+import threading
+from collections import OrderedDict
 from uuid import uuid4
 from contextlib import contextmanager
+from functools import lru_cache
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Iterator, Sequence, TypeVar
@@ -19,7 +22,12 @@ from urllib.parse import quote
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
 
-from api.services.cost_controls import TenantQuotaGuard, env_float, env_int
+from api.services.cost_controls import (
+    TenantQuotaGuard,
+    env_float,
+    env_int,
+    shared_async_redis_client,
+)
 from api.services.client_lifecycle import managed_network_client
 from api.services.embeddings import (
     EmbeddingService,
@@ -341,6 +349,76 @@ def _discovery_query_tokens(value: str) -> set[str]:
     }
 
 
+@lru_cache(maxsize=4_096)
+def _discovery_phrase_tokens(phrase: str) -> frozenset[str]:
+    return frozenset(_discovery_query_tokens(phrase))
+
+
+_QUESTION_CONTEXT_PATTERN = re.compile(r"\b(?:what|which|anyone|recommend)\b")
+_POST_FEATURES_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True)
+class PostFeatures:
+    """Query-independent facts the discovery plausibility guard reads.
+
+    A post is normalized, tokenized and scanned for buyer/publisher context
+    once; each discovery query then only tokenizes its own short phrase.
+    """
+
+    text: str
+    tokens: frozenset[str]
+    has_request_context: bool
+    has_first_person_context: bool
+    has_publisher_context: bool
+    has_question_context: bool
+
+
+_post_features_lock = threading.Lock()
+_post_features_cache: OrderedDict[tuple[str, str], PostFeatures] = OrderedDict()
+
+
+def post_features(post: Any) -> PostFeatures:
+    """Return the memoized :class:`PostFeatures` for a connector or corpus post."""
+    title_value = str(getattr(post, "title", "") or "")
+    # Connector records expose ``body`` while the global-corpus matching path
+    # deliberately converts database rows to ``SocialPost``, whose equivalent
+    # field is named ``text``. Keep the relevance guard shape-compatible with
+    # both paths so a cached post cannot crash a worker before verification.
+    body_value = str(
+        getattr(post, "body", None)
+        or getattr(post, "text", "")
+        or ""
+    )
+    # Keyed by content rather than post id, so an edited post is never served
+    # stale features.  The strings are the post's own objects, whose hashes
+    # Python caches after the first lookup.
+    key = (title_value, body_value)
+    with _post_features_lock:
+        cached = _post_features_cache.get(key)
+        if cached is not None:
+            _post_features_cache.move_to_end(key)
+            return cached
+
+    text_value = _normalize_space(
+        " ".join(part for part in (title_value, body_value) if part)
+    ).casefold()
+    features = PostFeatures(
+        text=text_value,
+        tokens=frozenset(_discovery_query_tokens(text_value)),
+        has_request_context=bool(_BUYER_REQUEST_CONTEXT_PATTERN.search(text_value)),
+        has_first_person_context=bool(_BUYER_FIRST_PERSON_PATTERN.search(text_value)),
+        has_publisher_context=bool(_PUBLISHER_CONTEXT_PATTERN.search(text_value)),
+        has_question_context=bool(_QUESTION_CONTEXT_PATTERN.search(text_value)),
+    )
+    with _post_features_lock:
+        _post_features_cache[key] = features
+        _post_features_cache.move_to_end(key)
+        while len(_post_features_cache) > _POST_FEATURES_CACHE_SIZE:
+            _post_features_cache.popitem(last=False)
+    return features
+
+
 def _discovery_query_overlap_fraction() -> float:
     """Return the configurable lexical-recall guard for public source hits."""
 
@@ -356,6 +434,7 @@ def _source_post_is_plausible_for_discovery_query(
     query: str,
     *,
     query_type: str | None = None,
+    features: PostFeatures | None = None,
 ) -> bool:
     """Identify a credible buyer-language signal instead of a loose API hit.
 
@@ -364,30 +443,20 @@ def _source_post_is_plausible_for_discovery_query(
     however, require both concrete phrase coverage and evidence that someone
     is describing a need rather than publishing a tutorial, launch, or product
     critique.  That prevents broad search APIs from suppressing the one
-    permitted X fallback with unrelated results.
+    permitted X fallback with unrelated results.  Callers checking one post
+    against many queries may pass its precomputed ``features``.
     """
     phrase = _normalize_space(query).casefold()
-    title_value = str(getattr(post, "title", "") or "")
-    # Connector records expose ``body`` while the global-corpus matching path
-    # deliberately converts database rows to ``SocialPost``, whose equivalent
-    # field is named ``text``. Keep the relevance guard shape-compatible with
-    # both paths so a cached post cannot crash a worker before verification.
-    body_value = str(
-        getattr(post, "body", None)
-        or getattr(post, "text", "")
-        or ""
-    )
-    text_value = _normalize_space(
-        " ".join(part for part in (title_value, body_value) if part)
-    ).casefold()
+    if features is None:
+        features = post_features(post)
+    text_value = features.text
     if not phrase or not text_value:
         return False
 
-    query_tokens = _discovery_query_tokens(phrase)
+    query_tokens = _discovery_phrase_tokens(phrase)
     if not query_tokens:
         return False
-    text_tokens = _discovery_query_tokens(text_value)
-    overlap = len(query_tokens.intersection(text_tokens))
+    overlap = len(query_tokens.intersection(features.tokens))
     # Search providers regularly return buyer-authored paraphrases rather than
     # a copy of the query.  This is a recall guard, not the qualification
     # decision, so use a modest, configurable overlap and leave the embedding
@@ -396,12 +465,13 @@ def _source_post_is_plausible_for_discovery_query(
         1,
         math.ceil(len(query_tokens) * _discovery_query_overlap_fraction()),
     )
-    if phrase not in text_value and overlap < required_overlap:
+    # The substring scan is O(post length); run it only when overlap falls short.
+    if overlap < required_overlap and phrase not in text_value:
         return False
 
-    has_request_context = bool(_BUYER_REQUEST_CONTEXT_PATTERN.search(text_value))
-    has_first_person_context = bool(_BUYER_FIRST_PERSON_PATTERN.search(text_value))
-    if _PUBLISHER_CONTEXT_PATTERN.search(text_value) and not has_first_person_context:
+    has_request_context = features.has_request_context
+    has_first_person_context = features.has_first_person_context
+    if features.has_publisher_context and not has_first_person_context:
         return False
 
     # A recommendation or category search should ideally look like someone
@@ -418,8 +488,7 @@ def _source_post_is_plausible_for_discovery_query(
         if not strict_buyer_context:
             return has_request_context or has_first_person_context
         return (has_request_context or has_first_person_context) and (
-            has_first_person_context
-            or bool(re.search(r"\b(?:what|which|anyone|recommend)\b", text_value))
+            has_first_person_context or features.has_question_context
         )
     return has_request_context or has_first_person_context
 
@@ -477,10 +546,12 @@ def ingest_hn_posts(
     )
     connector = HackerNewsConnector()
     posts = asyncio.run(
-        connector.fetch_recent_posts(
-            query.strip(),
-            since_timestamp=since_timestamp,
-            limit=posts_per_query or DEFAULT_INITIAL_PUBLIC_SOURCE_POSTS_PER_QUERY,
+        shared_async_redis_client.scoped(
+            connector.fetch_recent_posts(
+                query.strip(),
+                since_timestamp=since_timestamp,
+                limit=posts_per_query or DEFAULT_INITIAL_PUBLIC_SOURCE_POSTS_PER_QUERY,
+            )
         )
     )
     if not posts:
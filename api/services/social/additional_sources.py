@@ -19,7 +19,12 @@ from urllib.parse import quote
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
 
-from api.services.cost_controls import TenantQuotaGuard, env_float, env_int
+from api.services.cost_controls import (
+    TenantQuotaGuard,
+    env_float,
+    env_int,
+    shared_async_redis_client,
+)
 from api.services.client_lifecycle import managed_network_client
 from api.services.embeddings import (
     EmbeddingService,
@@ -88,9 +93,11 @@ def ingest_x_posts(
     if max_pages is not None:
         fetch_kwargs["max_pages"] = max_pages
     posts = asyncio.run(
-        XConnector().fetch_recent_posts(
-            query.strip(),
-            **fetch_kwargs,
+        shared_async_redis_client.scoped(
+            XConnector().fetch_recent_posts(
+                query.strip(),
+                **fetch_kwargs,
+            )
         )
     )
     if not posts:
@@ -335,11 +342,13 @@ def ingest_additional_public_source_posts(
         query=normalized_query,
     )
     posts: list[PublicSourcePost] = asyncio.run(
-        connector.fetch_recent_posts(
-            normalized_query,
-            since_timestamp=since_timestamp,
-            limit=posts_per_query or DEFAULT_INITIAL_PUBLIC_SOURCE_POSTS_PER_QUERY,
-            max_pages=_additional_public_source_max_pages(),
+        shared_async_redis_client.scoped(
+            connector.fetch_recent_posts(
+                normalized_query,
+                since_timestamp=since_timestamp,
+                limit=posts_per_query or DEFAULT_INITIAL_PUBLIC_SOURCE_POSTS_PER_QUERY,
+                max_pages=_additional_public_source_max_pages(),
+            )
         )
     )
     if not posts:
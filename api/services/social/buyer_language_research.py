@@ -17,7 +17,7 @@ import json
 import logging
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Iterable, Sequence
 from urllib.parse import urlparse
@@ -190,7 +190,7 @@ def _research_corpus_limit() -> int:
         "ARCLI_BUYER_LANGUAGE_RESEARCH_CORPUS_LIMIT",
         DEFAULT_BUYER_LANGUAGE_RESEARCH_CORPUS_LIMIT,
         minimum=1,
-        maximum=500,
+        maximum=5_000,
     )
 
 
@@ -838,55 +838,94 @@ def _excerpt_around(text_value: str, start: int, end: int) -> str:
     return excerpt[truncated_start:truncated_end].strip()
 
 
-def _best_token_overlap_excerpt(
-    text_value: str,
-    query_tokens: set[str],
-) -> tuple[str, set[str]]:
-    sentences = re.split(r"(?<=[.!?])\s+|\n+", text_value)
-    best_sentence = ""
-    best_overlap: set[str] = set()
-    for sentence in sentences:
-        normalized_sentence = _normalize_space(sentence)
-        if not normalized_sentence:
-            continue
-        overlap = query_tokens.intersection(_query_tokens(normalized_sentence))
-        if len(overlap) > len(best_overlap):
-            best_sentence = normalized_sentence
-            best_overlap = overlap
-    if not best_sentence:
-        return "", set()
-    return best_sentence[:_MAX_EXCERPT_CHARS].strip(), best_overlap
+@dataclass
+class _ResearchRow:
+    """One source row normalized once for every research query.
 
+    The casefolded text serves exact phrase lookups; sentences are split and
+    tokenized only when some query falls back to token overlap, and then
+    indexed by token so each query counts overlaps without rescanning.
+    """
 
-def _direct_evidence_match(
-    source_text: str,
-    phrase: str,
-) -> tuple[str, str, set[str]] | None:
-    """Return only direct source wording; this is not an LLM inference."""
+    row: dict[str, Any]
+    source: str
+    source_post_id: str | None
+    title: str | None
+    source_text: str
+    folded_text: str
+    _sentences: list[tuple[str, frozenset[str]]] | None = None
+    _sentence_ids_by_token: dict[str, list[int]] | None = None
+    _stored_source_text: dict[str, str] = field(default_factory=dict)
 
-    normalized_phrase = _compact_public_search_term(phrase)
-    normalized_text = _normalize_space(source_text)
-    if not normalized_phrase or not normalized_text:
-        return None
-    phrase_index = normalized_text.casefold().find(normalized_phrase.casefold())
-    if phrase_index >= 0:
-        return (
-            "exact_phrase",
-            _excerpt_around(
-                normalized_text,
-                phrase_index,
-                phrase_index + len(normalized_phrase),
-            ),
-            _query_tokens(normalized_phrase),
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> "_ResearchRow | None":
+        source = _text_value(row.get("source"), maximum=120)
+        title = _text_value(row.get("title"), maximum=_MAX_TITLE_CHARS) or None
+        body = _text_value(row.get("body") or row.get("text"), maximum=100_000)
+        source_text = _normalize_space(
+            "\n\n".join(part for part in (title or "", body) if part)
+        )
+        if not source or not source_text:
+            return None
+        return cls(
+            row=row,
+            source=source,
+            source_post_id=_text_value(row.get("source_post_id"), maximum=512) or None,
+            title=title,
+            source_text=source_text,
+            folded_text=source_text.casefold(),
         )
 
-    tokens = _query_tokens(normalized_phrase)
-    if not tokens:
-        return None
-    excerpt, overlap = _best_token_overlap_excerpt(normalized_text, tokens)
-    if len(overlap) < _required_token_overlap(len(tokens)):
-        return None
-    return "token_overlap", excerpt, overlap
+    def direct_match(
+        self,
+        phrase: str,
+        phrase_tokens: set[str],
+    ) -> tuple[str, str, set[str]] | None:
+        """Return only direct source wording; this is not an LLM inference."""
+        phrase_index = self.folded_text.find(phrase.casefold())
+        if phrase_index >= 0:
+            return (
+                "exact_phrase",
+                _excerpt_around(self.source_text, phrase_index, phrase_index + len(phrase)),
+                set(phrase_tokens),
+            )
+        if not phrase_tokens:
+            return None
+        excerpt, overlap = self._best_token_overlap_excerpt(phrase_tokens)
+        if len(overlap) < _required_token_overlap(len(phrase_tokens)):
+            return None
+        return "token_overlap", excerpt, overlap
+
+    def stored_source_text(self, excerpt: str) -> str:
+        stored = self._stored_source_text.get(excerpt)
+        if stored is None:
+            stored = _source_text_for_evidence(self.source_text, excerpt)
+            self._stored_source_text[excerpt] = stored
+        return stored
+
+    def _best_token_overlap_excerpt(self, query_tokens: set[str]) -> tuple[str, set[str]]:
+        if self._sentences is None:
+            self._sentences = []
+            self._sentence_ids_by_token = {}
+            for sentence in re.split(r"(?<=[.!?])\s+|\n+", self.source_text):
+                normalized_sentence = _normalize_space(sentence)
+                if not normalized_sentence:
+                    continue
+                tokens = frozenset(_query_tokens(normalized_sentence))
+                for token in tokens:
+                    self._sentence_ids_by_token.setdefault(token, []).append(len(self._sentences))
+                self._sentences.append((normalized_sentence, tokens))
+        overlap_counts: dict[int, int] = {}
+        for token in query_tokens:
+            for sentence_id in self._sentence_ids_by_token.get(token, ()):
+                overlap_counts[sentence_id] = overlap_counts.get(sentence_id, 0) + 1
+        if not overlap_counts:
+            return "", set()
+        # The earliest sentence with the largest overlap, as a forward scan
+        # keeping only strict improvements would choose.
+        best_id = min(overlap_counts, key=lambda sentence_id: (-overlap_counts[sentence_id], sentence_id))
+        best_sentence, sentence_tokens = self._sentences[best_id]
+        return best_sentence[:_MAX_EXCERPT_CHARS].strip(), query_tokens.intersection(sentence_tokens)
 
 
 def _has_negative_keyword(source_text: str, negative_keywords: Sequence[str]) -> bool:
@@ -955,6 +994,13 @@ def build_buyer_language_evidence(
 
     evidence_limit = limit if limit is not None else _research_evidence_limit()
     evidence_limit = max(1, min(100, evidence_limit))
+    # Every row is normalized and screened once, not once per query.
+    research_rows = [
+        research_row
+        for row in source_rows
+        if (research_row := _ResearchRow.from_row(row)) is not None
+        and not _has_negative_keyword(research_row.source_text, negative_keywords)
+    ]
     candidates: list[BuyerLanguageEvidence] = []
     seen_keys: set[str] = set()
     for query in queries:
@@ -963,31 +1009,25 @@ def build_buyer_language_evidence(
         phrase = _compact_public_search_term(query.phrase)[:512]
         if not phrase:
             continue
-        for row in source_rows:
-            source = _text_value(row.get("source"), maximum=120)
-            source_post_id = _text_value(row.get("source_post_id"), maximum=512) or None
-            title = _text_value(row.get("title"), maximum=_MAX_TITLE_CHARS) or None
-            body = _text_value(row.get("body") or row.get("text"), maximum=100_000)
-            raw_source_text = _normalize_space(
-                "\n\n".join(part for part in (title or "", body) if part)
-            )
-            if not source or not raw_source_text:
-                continue
-            if _has_negative_keyword(raw_source_text, negative_keywords):
-                continue
-            direct_match = _direct_evidence_match(raw_source_text, phrase)
+        match_phrase = _compact_public_search_term(phrase)
+        if not match_phrase:
+            continue
+        match_tokens = _query_tokens(match_phrase)
+        query_tokens = _query_tokens(phrase)
+        for research_row in research_rows:
+            direct_match = research_row.direct_match(match_phrase, match_tokens)
             if not direct_match:
                 continue
             match_method, excerpt, matched_tokens = direct_match
-            stored_source_text = _source_text_for_evidence(raw_source_text, excerpt)
+            stored_source_text = research_row.stored_source_text(excerpt)
             # The excerpt must remain source-grounded after the retention cap.
             if excerpt.casefold() not in stored_source_text.casefold():
                 continue
             evidence_key = _evidence_key(
                 tenant_id=tenant_id,
                 service_profile_id=service_profile_id,
-                source=source,
-                source_post_id=source_post_id,
+                source=research_row.source,
+                source_post_id=research_row.source_post_id,
                 source_text=stored_source_text,
                 query_type=query.query_type,
                 query_phrase=phrase,
@@ -995,15 +1035,15 @@ def build_buyer_language_evidence(
             if evidence_key in seen_keys:
                 continue
             seen_keys.add(evidence_key)
-            query_tokens = _query_tokens(phrase)
+            row = research_row.row
             candidates.append(
                 BuyerLanguageEvidence(
-                    source=source,
-                    source_post_id=source_post_id,
+                    source=research_row.source,
+                    source_post_id=research_row.source_post_id,
                     source_url=_safe_http_url(row.get("source_url") or row.get("url")),
                     query_type=query.query_type,
                     query_phrase=phrase,
-                    title=title,
+                    title=research_row.title,
                     source_text=stored_source_text,
                     evidence_excerpt=excerpt,
                     observed_at=row.get("observed_at") or row.get("posted_at") or row.get("published_at"),
@@ -10,22 +10,40 @@ from __future__ import annotations
 import logging
 import os
 import re
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Sequence
+from datetime import datetime
+from typing import Any, Iterable, Mapping, Sequence
 
 from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 
+from api.services.cost_controls import env_int
+from api.services.data_retention import public_data_retention_days
 from api.services.embeddings import _database_engine
+from api.services.schema_cache import table_columns, table_is_partitioned
 
 logger = logging.getLogger(__name__)
 
 
-DEFAULT_PUBLIC_DATA_RETENTION_DAYS = 30
-_MIN_PUBLIC_DATA_RETENTION_DAYS = 7
-_MAX_PUBLIC_DATA_RETENTION_DAYS = 90
 DEFAULT_PRIVACY_REQUEST_RETENTION_DAYS = 90
 _MIN_PRIVACY_REQUEST_RETENTION_DAYS = 30
 _MAX_PRIVACY_REQUEST_RETENTION_DAYS = 365
+DEFAULT_PUBLIC_DATA_RETENTION_BATCH_SIZE = 1_000
+DEFAULT_PUBLIC_DATA_RETENTION_JOB_TIME_LIMIT_MS = 300_000
+# Stop taking new chunks with this share of the actor time limit spent, so
+# the chunk in flight commits before the worker interrupts the job.
+_PUBLIC_DATA_RETENTION_TIME_BUDGET_FRACTION = 0.8
+_PUBLIC_DATA_RETENTION_LOCK_ID = 941_728_311
+DEFAULT_SOURCE_POSTS_PARTITION_GRANULARITY = "day"
+_SOURCE_POSTS_PARTITION_GRANULARITIES = frozenset({"day", "week"})
+_SOURCE_POSTS_PARTITIONS_AHEAD = 7
+_SOURCE_POSTS_DDL_LOCK_TIMEOUT_MS = 2_000
+DEFAULT_REMOVAL_SUPPRESSION_FULL_REFRESH_SECONDS = 3_600
+# A removal committed after a later-stamped one is still read by the next
+# delta, because each delta re-reads this much history before its watermark.
+_REMOVAL_SUPPRESSION_DELTA_OVERLAP_SECONDS = 300
 _SUPPORTED_PUBLIC_SOURCES = frozenset(
     {"hackernews", "bluesky", "stackexchange", "github", "lemmy", "twitter"}
 )
@@ -55,32 +73,34 @@ _PHONE_PATTERN = re.compile(
 
 @dataclass(frozen=True)
 class PublicDataMaintenanceResult:
-    """Counts from one idempotent retention pass."""
+    """Counts from one idempotent, possibly time-boxed retention pass."""
 
     skipped: bool = False
     lead_matches_deleted: int = 0
     source_posts_deleted: int = 0
     discovery_evidence_deleted: int = 0
+    embedding_cache_deleted: int = 0
     removal_requests_anonymized: int = 0
-
-
-def public_data_retention_days() -> int:
-    """Return a bounded retention window; malformed values never extend it."""
-
-    raw_value = os.getenv(
-        "ARCLI_PUBLIC_DATA_RETENTION_DAYS",
-        str(DEFAULT_PUBLIC_DATA_RETENTION_DAYS),
-    )
-    try:
-        value = int(raw_value)
-    except (TypeError, ValueError):
-        logger.warning(
-            "public_data_retention_days_invalid value=%s fallback_days=%s",
-            raw_value,
-            DEFAULT_PUBLIC_DATA_RETENTION_DAYS,
+    partitions_dropped: int = 0
+    batches: int = 0
+    elapsed_ms: int = 0
+    # True when the time budget ran out first; the next run picks up the rest.
+    backlog_remaining: bool = False
+
+    @property
+    def rows_deleted(self) -> int:
+        return (
+            self.lead_matches_deleted
+            + self.source_posts_deleted
+            + self.discovery_evidence_deleted
+            + self.embedding_cache_deleted
         )
-        return DEFAULT_PUBLIC_DATA_RETENTION_DAYS
-    return max(_MIN_PUBLIC_DATA_RETENTION_DAYS, min(_MAX_PUBLIC_DATA_RETENTION_DAYS, value))
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_ms <= 0:
+            return 0.0
+        return round(self.rows_deleted * 1000 / self.elapsed_ms, 1)
 
 
 def privacy_request_retention_days() -> int:
@@ -100,6 +120,20 @@ def privacy_request_retention_days() -> int:
     )
 
 
+def public_data_retention_batch_size() -> int:
+    return env_int("ARCLI_PUBLIC_DATA_RETENTION_BATCH_SIZE", DEFAULT_PUBLIC_DATA_RETENTION_BATCH_SIZE)
+
+
+def public_data_retention_time_budget_seconds() -> float:
+    """Return the share of the retention actor's time limit one pass may use."""
+
+    time_limit_ms = env_int(
+        "ARCLI_PUBLIC_DATA_RETENTION_JOB_TIME_LIMIT_MS",
+        DEFAULT_PUBLIC_DATA_RETENTION_JOB_TIME_LIMIT_MS,
+    )
+    return time_limit_ms / 1000 * _PUBLIC_DATA_RETENTION_TIME_BUDGET_FRACTION
+
+
 def allowed_public_sources() -> frozenset[str]:
     """Return the deployment-approved public providers, never arbitrary hosts."""
 
@@ -189,6 +223,167 @@ def _governance_schema_enforced() -> bool:
     }
 
 
+class RemovalSuppressionIndex:
+    """Per-process hash index of completed removal requests.
+
+    Each suppression identity is a ``(source, value)`` key in one of three
+    sets, so screening a post is three set lookups regardless of how many
+    requests have been completed.  The first use loads every completed
+    request; later uses read only requests whose ``updated_at`` moved past
+    the watermark.  A request that stops being completed is only forgotten by
+    the periodic full reload, so a stale index errs toward suppression.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._post_ids: set[tuple[str, str]] = set()
+        self._author_handles: set[tuple[str, str]] = set()
+        self._source_urls: set[tuple[str, str]] = set()
+        self._synced_through: datetime | None = None
+        self._loaded_at: float | None = None
+        self.version = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._post_ids) + len(self._author_handles) + len(self._source_urls)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def refresh(self, conn: Any) -> None:
+        """Apply completed requests changed since the last refresh."""
+
+        full_refresh_seconds = env_int(
+            "ARCLI_REMOVAL_SUPPRESSION_FULL_REFRESH_SECONDS",
+            DEFAULT_REMOVAL_SUPPRESSION_FULL_REFRESH_SECONDS,
+        )
+        with self._lock:
+            reload_all = (
+                self._loaded_at is None
+                or self._synced_through is None
+                or time.monotonic() - self._loaded_at >= full_refresh_seconds
+            )
+            since = None if reload_all else self._synced_through
+        if reload_all:
+            rows = conn.execute(
+                text(
+                    """
+                    SELECT source, source_post_id, author_handle, source_url, updated_at
+                      FROM public.public_data_removal_requests
+                     WHERE status = 'completed'
+                    """
+                ),
+                {},
+            ).mappings()
+        else:
+            rows = conn.execute(
+                text(
+                    """
+                    SELECT source, source_post_id, author_handle, source_url, updated_at
+                      FROM public.public_data_removal_requests
+                     WHERE status = 'completed'
+                       AND updated_at >= CAST(:since AS timestamptz)
+                           - (:overlap_seconds * INTERVAL '1 second')
+                    """
+                ),
+                {
+                    "since": since,
+                    "overlap_seconds": _REMOVAL_SUPPRESSION_DELTA_OVERLAP_SECONDS,
+                },
+            ).mappings()
+        self._apply([dict(row) for row in rows], replace=reload_all)
+
+    def _apply(self, rows: Iterable[Mapping[str, Any]], *, replace: bool) -> None:
+        post_ids: set[tuple[str, str]] = set()
+        author_handles: set[tuple[str, str]] = set()
+        source_urls: set[tuple[str, str]] = set()
+        synced_through: datetime | None = None
+        for row in rows:
+            source = str(row.get("source") or "").strip().casefold()
+            if not source:
+                continue
+            if row.get("source_post_id"):
+                post_ids.add((source, str(row["source_post_id"])))
+            if row.get("author_handle"):
+                author_handles.add((source, str(row["author_handle"]).casefold()))
+            if row.get("source_url"):
+                source_urls.add((source, str(row["source_url"])))
+            updated_at = row.get("updated_at")
+            if isinstance(updated_at, datetime) and (
+                synced_through is None or updated_at > synced_through
+            ):
+                synced_through = updated_at
+
+        with self._lock:
+            if replace:
+                self._post_ids = post_ids
+                self._author_handles = author_handles
+                self._source_urls = source_urls
+                self._loaded_at = time.monotonic()
+                # With no stamped rows there is no watermark, so the next
+                # refresh reloads the (small) table again.
+                self._synced_through = synced_through
+                self.version += 1
+            elif post_ids or author_handles or source_urls:
+                self._post_ids |= post_ids
+                self._author_handles |= author_handles
+                self._source_urls |= source_urls
+                self.version += 1
+            if (
+                not replace
+                and synced_through is not None
+                and (self._synced_through is None or synced_through > self._synced_through)
+            ):
+                self._synced_through = synced_through
+
+    def suppresses(
+        self,
+        *,
+        source: str,
+        source_post_id: str,
+        author_handle: str,
+        source_url: str,
+    ) -> bool:
+        with self._lock:
+            return (
+                (source, source_post_id) in self._post_ids
+                or (bool(author_handle) and (source, author_handle.casefold()) in self._author_handles)
+                or (bool(source_url) and (source, source_url) in self._source_urls)
+            )
+
+
+removal_suppression_index = RemovalSuppressionIndex()
+
+
+def source_posts_partitioned(conn: Any | None = None) -> bool:
+    """Whether ``source_posts_time_partitions.sql`` has been applied.
+
+    Its unique keys include ``posted_at``, so writers need the matching
+    ON CONFLICT target and corpus readers can bound scans by ``posted_at``.
+    The layout is read from ``pg_partitioned_table`` through the schema
+    cache; without ``conn`` the shared engine is used.
+    """
+
+    return table_is_partitioned(conn if conn is not None else _database_engine(), "source_posts")
+
+
+def source_posts_partition_granularity() -> str:
+    value = (
+        os.getenv("ARCLI_SOURCE_POSTS_PARTITION_GRANULARITY", DEFAULT_SOURCE_POSTS_PARTITION_GRANULARITY)
+        .strip()
+        .casefold()
+    )
+    if value not in _SOURCE_POSTS_PARTITION_GRANULARITIES:
+        logger.warning(
+            "source_posts_partition_granularity_invalid value=%s fallback=%s",
+            value,
+            DEFAULT_SOURCE_POSTS_PARTITION_GRANULARITY,
+        )
+        return DEFAULT_SOURCE_POSTS_PARTITION_GRANULARITY
+    return value
+
+
 def filter_approved_removals(posts: Sequence[Any]) -> list[Any]:
     """Never re-collect content from a completed, verified removal request.
 
@@ -220,43 +415,14 @@ def filter_approved_removals(posts: Sequence[Any]) -> list[Any]:
     if not candidates:
         return []
 
-    sources = sorted({identity["source"] for _, identity in candidates})
+    # The index, not this batch, absorbs the cost of a large request backlog;
+    # the delta read still runs every batch so a new removal applies at once.
     with _database_engine().connect() as conn:
-        rows = conn.execute(
-            text(
-                """
-                SELECT source, source_post_id, author_handle, source_url
-                  FROM public.public_data_removal_requests
-                 WHERE status = 'completed'
-                   AND source = ANY(:sources)
-                """
-            ),
-            {"sources": sources},
-        ).mappings()
-        suppressions = [dict(row) for row in rows]
+        removal_suppression_index.refresh(conn)
 
     kept: list[Any] = []
     for post, identity in candidates:
-        suppressed = any(
-            suppression["source"] == identity["source"]
-            and (
-                (
-                    suppression.get("source_post_id")
-                    and suppression["source_post_id"] == identity["source_post_id"]
-                )
-                or (
-                    suppression.get("author_handle")
-                    and identity["author_handle"]
-                    and str(suppression["author_handle"]).casefold()
-                    == identity["author_handle"].casefold()
-                )
-                or (
-                    suppression.get("source_url")
-                    and suppression["source_url"] == identity["source_url"]
-                )
-            )
-            for suppression in suppressions
-        )
+        suppressed = removal_suppression_index.suppresses(**identity)
         if suppressed:
             logger.info(
                 "public_source_post_excluded source=%s reason=completed_removal_request",
@@ -267,63 +433,340 @@ def filter_approved_removals(posts: Sequence[Any]) -> list[Any]:
     return kept
 
 
-def run_public_data_retention() -> PublicDataMaintenanceResult:
-    """Delete expired raw public content and every tenant lead snapshot of it."""
+# Expired rows are visited oldest first on (retention age, id), which the
+# retention indexes serve.  Each run starts again from the oldest row left,
+# which is exactly where an interrupted run stopped.
+_EXPIRED_SOURCE_POSTS_SQL = """
+    SELECT id, COALESCE(posted_at, created_at) AS retention_age
+      FROM public.source_posts
+     WHERE tenant_id IS NULL
+       AND source_post_id IS NOT NULL
+       AND COALESCE(posted_at, created_at)
+           < NOW() - (:retention_days * INTERVAL '1 day')
+       {after_clause}
+     ORDER BY COALESCE(posted_at, created_at) ASC, id ASC
+     LIMIT :batch_size
+"""
+_EXPIRED_DISCOVERY_EVIDENCE_SQL = """
+    SELECT id, COALESCE(observed_at, created_at) AS retention_age
+      FROM public.discovery_evidence
+     WHERE COALESCE(observed_at, created_at)
+           < NOW() - (:retention_days * INTERVAL '1 day')
+       {after_clause}
+     ORDER BY COALESCE(observed_at, created_at) ASC, id ASC
+     LIMIT :batch_size
+"""
+
+
+def _expired_chunk(
+    conn: Any,
+    query: str,
+    *,
+    age_sql: str,
+    retention_days: int,
+    batch_size: int,
+    after: tuple[Any, str] | None,
+) -> list[tuple[Any, str]]:
+    params: dict[str, Any] = {"retention_days": retention_days, "batch_size": batch_size}
+    after_clause = ""
+    if after is not None:
+        after_clause = (
+            f"AND ({age_sql}, id) > (CAST(:after_age AS timestamptz), CAST(:after_id AS uuid))"
+        )
+        params["after_age"], params["after_id"] = after
+    rows = conn.execute(text(query.format(after_clause=after_clause)), params).mappings()
+    return [(row["retention_age"], str(row["id"])) for row in rows]
+
+
+def _purge_expired_source_posts(
+    conn: Any,
+    *,
+    retention_days: int,
+    batch_size: int,
+    after: tuple[Any, str] | None,
+) -> tuple[int, int, tuple[Any, str] | None, bool]:
+    chunk = _expired_chunk(
+        conn,
+        _EXPIRED_SOURCE_POSTS_SQL,
+        age_sql="COALESCE(posted_at, created_at)",
+        retention_days=retention_days,
+        batch_size=batch_size,
+        after=after,
+    )
+    if not chunk:
+        return 0, 0, after, True
+    ids = [source_post_id for _, source_post_id in chunk]
+    # Remove tenant-visible copies first.  Deleting source_posts alone
+    # would only null the FK and leave the JSON snapshots behind.
+    lead_matches_deleted = conn.execute(
+        text(
+            """
+            DELETE FROM public.lead_matches
+             WHERE source_post_id = ANY(CAST(:ids AS uuid[]))
+            """
+        ),
+        {"ids": ids},
+    ).rowcount
+    source_posts_deleted = conn.execute(
+        text(
+            """
+            DELETE FROM public.source_posts
+             WHERE id = ANY(CAST(:ids AS uuid[]))
+            """
+        ),
+        {"ids": ids},
+    ).rowcount
+    return (
+        max(0, lead_matches_deleted or 0),
+        max(0, source_posts_deleted or 0),
+        chunk[-1],
+        len(chunk) < batch_size,
+    )
+
+
+def _purge_expired_discovery_evidence(
+    conn: Any,
+    *,
+    retention_days: int,
+    batch_size: int,
+    after: tuple[Any, str] | None,
+) -> tuple[int, tuple[Any, str] | None, bool]:
+    chunk = _expired_chunk(
+        conn,
+        _EXPIRED_DISCOVERY_EVIDENCE_SQL,
+        age_sql="COALESCE(observed_at, created_at)",
+        retention_days=retention_days,
+        batch_size=batch_size,
+        after=after,
+    )
+    if not chunk:
+        return 0, after, True
+    deleted = conn.execute(
+        text(
+            """
+            DELETE FROM public.discovery_evidence
+             WHERE id = ANY(CAST(:ids AS uuid[]))
+            """
+        ),
+        {"ids": [evidence_id for _, evidence_id in chunk]},
+    ).rowcount
+    return max(0, deleted or 0), chunk[-1], len(chunk) < batch_size
+
+
+def _purge_expired_embedding_cache(
+    conn: Any,
+    *,
+    retention_days: int,
+    batch_size: int,
+) -> tuple[int, bool]:
+    # Deleted entries leave the index, so the oldest chunk is always first and
+    # no keyset is needed.  A pruned vector is recomputed on its next miss.
+    deleted = conn.execute(
+        text(
+            """
+            DELETE FROM public.embedding_cache AS cache
+             USING (
+                SELECT model, text_sha256
+                  FROM public.embedding_cache
+                 WHERE created_at < NOW() - (:retention_days * INTERVAL '1 day')
+                 ORDER BY created_at ASC
+                 LIMIT :batch_size
+             ) AS expired
+             WHERE cache.model = expired.model
+               AND cache.text_sha256 = expired.text_sha256
+            """
+        ),
+        {"retention_days": retention_days, "batch_size": batch_size},
+    ).rowcount
+    deleted = max(0, deleted or 0)
+    return deleted, deleted < batch_size
+
+
+# One step per transaction: prepare the detached table and a NOT VALID guard
+# on the default partition, validate the guard without blocking writes, then
+# attach without scanning the default partition.
+_SOURCE_POST_PARTITION_ATTACH_STEPS = (
+    """
+    SELECT public.prepare_source_post_partition(
+        :partition_name, :period_start, :period_end
+    ) AS prepared
+    """,
+    "SELECT public.validate_source_post_partition_guard(:partition_name) AS validated",
+    """
+    SELECT public.attach_source_post_partition(
+        :partition_name, :period_start, :period_end
+    ) AS attached
+    """,
+)
+
+
+def _source_post_partition_step(
+    engine: Any,
+    statement: str,
+    params: Mapping[str, Any],
+) -> tuple[bool, Mapping[str, Any] | None]:
+    """Run one partition DDL step in its own transaction.
+
+    Returns ``(False, None)`` when another worker holds the retention lock.
+    ``lock_timeout`` bounds the wait for the step's table locks; an expired
+    wait raises :class:`OperationalError`.
+    """
+
+    with engine.begin() as conn:
+        if not _try_retention_lock(conn):
+            return False, None
+        conn.execute(text(f"SET LOCAL lock_timeout = '{_SOURCE_POSTS_DDL_LOCK_TIMEOUT_MS}ms'"))
+        return True, conn.execute(text(statement), dict(params)).mappings().first()
+
+
+def _maintain_source_post_partitions(
+    engine: Any,
+    *,
+    retention_days: int,
+    deadline: float,
+) -> tuple[int, int, int]:
+    """Attach upcoming partitions, then detach and drop wholly expired ones.
+
+    Every step is idempotent and runs in its own short transaction under the
+    retention lock and ``lock_timeout``; a step that times out is retried by
+    the next run.  Attaching never scans the default partition (see
+    :data:`_SOURCE_POST_PARTITION_ATTACH_STEPS`).  Detaching takes ACCESS
+    EXCLUSIVE on ``source_posts`` for the detach itself (PostgreSQL refuses
+    ``DETACH ... CONCURRENTLY`` while the default partition exists), and a
+    detached table no longer locks the parent when it is dropped.
+
+    Returns ``(partitions_dropped, source_posts_deleted, lead_matches_deleted)``.
+    """
+
+    with engine.begin() as conn:
+        upcoming = [
+            dict(row)
+            for row in conn.execute(
+                text(
+                    """
+                    SELECT partition_name, period_start, period_end
+                      FROM public.missing_source_post_partitions(
+                          :granularity, NOW(), :periods_ahead
+                      )
+                    """
+                ),
+                {
+                    "granularity": source_posts_partition_granularity(),
+                    "periods_ahead": _SOURCE_POSTS_PARTITIONS_AHEAD,
+                },
+            ).mappings()
+        ]
+        expired = [
+            dict(row)
+            for row in conn.execute(
+                text(
+                    """
+                    SELECT partition_name, attached
+                      FROM public.expired_source_post_partitions(
+                          NOW() - (:retention_days * INTERVAL '1 day')
+                      )
+                    """
+                ),
+                {"retention_days": retention_days},
+            ).mappings()
+        ]
+
+    partitions_dropped = 0
+    source_posts_deleted = 0
+    lead_matches_deleted = 0
+    partition_name = ""
+    try:
+        for partition in upcoming:
+            if time.monotonic() >= deadline:
+                break
+            partition_name = str(partition["partition_name"])
+            for statement in _SOURCE_POST_PARTITION_ATTACH_STEPS:
+                locked, _ = _source_post_partition_step(engine, statement, partition)
+                if not locked:
+                    return partitions_dropped, source_posts_deleted, lead_matches_deleted
+
+        for partition in expired:
+            if time.monotonic() >= deadline:
+                break
+            partition_name = str(partition["partition_name"])
+            if partition["attached"]:
+                locked, detached = _source_post_partition_step(
+                    engine,
+                    """
+                    SELECT source_posts_deleted, lead_matches_deleted
+                      FROM public.detach_expired_source_post_partition(:partition_name)
+                    """,
+                    {"partition_name": partition_name},
+                )
+                if not locked:
+                    break
+                if detached is None:
+                    continue
+                source_posts_deleted += int(detached["source_posts_deleted"] or 0)
+                lead_matches_deleted += int(detached["lead_matches_deleted"] or 0)
+            locked, dropped = _source_post_partition_step(
+                engine,
+                "SELECT public.drop_detached_source_post_partition(:partition_name) AS dropped",
+                {"partition_name": partition_name},
+            )
+            if not locked:
+                break
+            partitions_dropped += int(bool(dropped and dropped["dropped"]))
+    except OperationalError as exc:
+        logger.warning(
+            "source_post_partition_maintenance_deferred partition=%s error_type=%s",
+            partition_name,
+            type(exc.orig).__name__,
+        )
+    return partitions_dropped, source_posts_deleted, lead_matches_deleted
+
+
+def _try_retention_lock(conn: Any) -> bool:
+    return bool(
+        conn.execute(
+            text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
+            {"lock_id": _PUBLIC_DATA_RETENTION_LOCK_ID},
+        ).scalar()
+    )
+
+
+def run_public_data_retention(
+    *,
+    batch_size: int | None = None,
+    time_budget_seconds: float | None = None,
+) -> PublicDataMaintenanceResult:
+    """Delete expired raw public content and every tenant lead snapshot of it.
+
+    Rows are deleted in chunks of ``batch_size``, each in its own short
+    transaction under the retention advisory lock, so a large backlog never
+    holds locks or WAL for long and ingestion upserts interleave with the
+    purge.  Shared embedding-cache vectors older than the same window are
+    pruned last, when the optional ``embedding_cache`` table exists.  With
+    partitioned ``source_posts`` wholly expired partitions are detached and
+    dropped first, one per transaction, leaving only undated rows and the partial oldest period to
+    the chunked deletes.  The pass stops taking chunks once
+    ``time_budget_seconds`` is spent and reports ``backlog_remaining``; the
+    next run resumes with the oldest expired row still present.
+    """
 
     retention_days = public_data_retention_days()
     request_retention_days = privacy_request_retention_days()
+    batch_size = max(1, batch_size or public_data_retention_batch_size())
+    if time_budget_seconds is None:
+        time_budget_seconds = public_data_retention_time_budget_seconds()
+    started_at = time.monotonic()
+    deadline = started_at + time_budget_seconds
     engine = _database_engine()
+
+    removal_requests_anonymized = 0
+    partitions_dropped = 0
+    lead_matches_deleted = 0
+    source_posts_deleted = 0
     with engine.begin() as conn:
-        locked = conn.execute(
-            text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
-            {"lock_id": 941_728_311},
-        ).scalar()
-        if not locked:
+        if not _try_retention_lock(conn):
             return PublicDataMaintenanceResult(skipped=True)
-
-        # Remove tenant-visible copies first.  Deleting source_posts alone
-        # would only null the FK and leave the JSON snapshots behind.
-        lead_matches_deleted = conn.execute(
-            text(
-                """
-                WITH expired_source_posts AS (
-                    SELECT id
-                      FROM public.source_posts
-                     WHERE tenant_id IS NULL
-                       AND source_post_id IS NOT NULL
-                       AND COALESCE(posted_at, created_at)
-                           < NOW() - (:retention_days * INTERVAL '1 day')
-                )
-                DELETE FROM public.lead_matches AS lead_match
-                 USING expired_source_posts
-                 WHERE lead_match.source_post_id = expired_source_posts.id
-                """
-            ),
-            {"retention_days": retention_days},
-        ).rowcount
-        source_posts_deleted = conn.execute(
-            text(
-                """
-                DELETE FROM public.source_posts
-                 WHERE tenant_id IS NULL
-                   AND source_post_id IS NOT NULL
-                   AND COALESCE(posted_at, created_at)
-                       < NOW() - (:retention_days * INTERVAL '1 day')
-                """
-            ),
-            {"retention_days": retention_days},
-        ).rowcount
-        discovery_evidence_deleted = conn.execute(
-            text(
-                """
-                DELETE FROM public.discovery_evidence
-                 WHERE COALESCE(observed_at, created_at)
-                       < NOW() - (:retention_days * INTERVAL '1 day')
-                """
-            ),
-            {"retention_days": retention_days},
-        ).rowcount
-        removal_requests_anonymized = 0
+        embedding_cache_present = bool(table_columns(conn, "embedding_cache"))
+        partitioned = source_posts_partitioned(conn)
         if _governance_schema_enforced():
             # Keep the completed suppression identity (source/post/handle/URL)
             # while removing the requester's contact details and free-form
@@ -344,19 +787,93 @@ def run_public_data_retention() -> PublicDataMaintenanceResult:
                 {"request_retention_days": request_retention_days},
             ).rowcount
 
+    if partitioned:
+        (
+            partitions_dropped,
+            source_posts_deleted,
+            lead_matches_deleted,
+        ) = _maintain_source_post_partitions(
+            engine,
+            retention_days=retention_days,
+            deadline=deadline,
+        )
+
+    discovery_evidence_deleted = 0
+    embedding_cache_deleted = 0
+    batches = 0
+    source_posts_done = False
+    discovery_evidence_done = False
+    embedding_cache_done = not embedding_cache_present
+    source_posts_after: tuple[Any, str] | None = None
+    discovery_evidence_after: tuple[Any, str] | None = None
+    while not (source_posts_done and discovery_evidence_done and embedding_cache_done):
+        if time.monotonic() >= deadline:
+            break
+        with engine.begin() as conn:
+            # Another worker holding the lock is already draining the backlog.
+            if not _try_retention_lock(conn):
+                break
+            if not source_posts_done:
+                (
+                    chunk_lead_matches,
+                    chunk_source_posts,
+                    source_posts_after,
+                    source_posts_done,
+                ) = _purge_expired_source_posts(
+                    conn,
+                    retention_days=retention_days,
+                    batch_size=batch_size,
+                    after=source_posts_after,
+                )
+                lead_matches_deleted += chunk_lead_matches
+                source_posts_deleted += chunk_source_posts
+            elif not discovery_evidence_done:
+                (
+                    chunk_discovery_evidence,
+                    discovery_evidence_after,
+                    discovery_evidence_done,
+                ) = _purge_expired_discovery_evidence(
+                    conn,
+                    retention_days=retention_days,
+                    batch_size=batch_size,
+                    after=discovery_evidence_after,
+                )
+                discovery_evidence_deleted += chunk_discovery_evidence
+            else:
+                chunk_embedding_cache, embedding_cache_done = _purge_expired_embedding_cache(
+                    conn,
+                    retention_days=retention_days,
+                    batch_size=batch_size,
+                )
+                embedding_cache_deleted += chunk_embedding_cache
+        batches += 1
+
     result = PublicDataMaintenanceResult(
-        lead_matches_deleted=max(0, lead_matches_deleted or 0),
-        source_posts_deleted=max(0, source_posts_deleted or 0),
-        discovery_evidence_deleted=max(0, discovery_evidence_deleted or 0),
+        lead_matches_deleted=lead_matches_deleted,
+        source_posts_deleted=source_posts_deleted,
+        discovery_evidence_deleted=discovery_evidence_deleted,
+        embedding_cache_deleted=embedding_cache_deleted,
         removal_requests_anonymized=max(0, removal_requests_anonymized or 0),
+        partitions_dropped=partitions_dropped,
+        batches=batches,
+        elapsed_ms=int((time.monotonic() - started_at) * 1000),
+        backlog_remaining=not (
+            source_posts_done and discovery_evidence_done and embedding_cache_done
+        ),
     )
     logger.info(
-        "public_data_retention_completed retention_days=%s request_retention_days=%s lead_matches_deleted=%s source_posts_deleted=%s discovery_evidence_deleted=%s removal_requests_anonymized=%s",
+        "public_data_retention_completed retention_days=%s request_retention_days=%s lead_matches_deleted=%s source_posts_deleted=%s discovery_evidence_deleted=%s embedding_cache_deleted=%s removal_requests_anonymized=%s partitions_dropped=%s batches=%s elapsed_ms=%s rows_per_second=%s backlog_remaining=%s",
         retention_days,
         request_retention_days,
         result.lead_matches_deleted,
         result.source_posts_deleted,
         result.discovery_evidence_deleted,
+        result.embedding_cache_deleted,
         result.removal_requests_anonymized,
+        result.partitions_dropped,
+        result.batches,
+        result.elapsed_ms,
+        result.rows_per_second,
+        result.backlog_remaining,
     )
     return result
@@ -9,10 +9,15 @@ The stored query plan is a tenant-owned report artifact and therefore retains
 the bounded buyer-language phrases.  Per-event rows store only a stable SHA-256
 hash of a phrase.  Event details and completion summaries are scrubbed so they
 remain operational metadata rather than source-post or customer content.
+
+Events are buffered in process and written by a background thread in
+multi-row inserts, so recording one adds no database round trip to discovery
+latency.  The buffer is bounded; events beyond it are counted and dropped.
 """
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
@@ -21,6 +26,7 @@ import re
 import threading
 import time
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any
 from uuid import UUID, uuid4
@@ -28,6 +34,8 @@ from uuid import UUID, uuid4
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
+from api.services.cost_controls import env_float, env_int
+
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +49,20 @@ _MAX_SAFE_DETAIL_ITEMS = 40
 _MAX_SAFE_STRING_CHARS = 240
 _MISSING_SCHEMA_COOLDOWN_SECONDS = 300.0
 _FAILURE_COOLDOWN_SECONDS = 30.0
+DEFAULT_DISCOVERY_EVENT_BATCH_SIZE = 200
+DEFAULT_DISCOVERY_EVENT_BUFFER_MAX_EVENTS = 5_000
+DEFAULT_DISCOVERY_EVENT_FLUSH_SECONDS = 2.0
+_DISCOVERY_EVENT_COLUMNS = (
+    "tenant_id",
+    "run_id",
+    "source",
+    "query_type",
+    "query_hash",
+    "event_key",
+    "phase",
+    "outcome",
+    "details",
+)
 
 _COMPLETION_STATUSES = frozenset(
     {"completed", "partial", "failed", "cancelled", "skipped"}
@@ -532,55 +554,260 @@ def record_discovery_event(
         outcome=normalized_outcome,
         details=safe_details,
     )
-    try:
-        with _database_engine().begin() as conn:
-            conn.execute(
-                text(
-                    """
-                    INSERT INTO public.discovery_run_events (
-                        tenant_id,
-                        run_id,
-                        source,
-                        query_type,
-                        query_hash,
-                        event_key,
-                        phase,
-                        outcome,
-                        details
-                    )
-                    SELECT
-                        :tenant_id,
-                        CAST(:run_id AS uuid),
-                        :source,
-                        :query_type,
-                        :query_hash,
-                        :event_key,
-                        :phase,
-                        :outcome,
-                        CAST(:details AS jsonb)
-                    WHERE EXISTS (
-                        SELECT 1
-                          FROM public.discovery_runs AS run
-                         WHERE run.id = CAST(:run_id AS uuid)
-                           AND run.tenant_id = :tenant_id
-                    )
-                    ON CONFLICT (tenant_id, run_id, event_key) DO NOTHING
-                    """
-                ),
+    discovery_event_buffer.add(
+        {
+            "tenant_id": tenant,
+            "run_id": run,
+            "source": normalized_source,
+            "query_type": normalized_query_type,
+            "query_hash": hashed_query,
+            "event_key": dedupe_key,
+            "phase": normalized_phase,
+            "outcome": normalized_outcome,
+            "details": _json_value(safe_details),
+        }
+    )
+
+
+def _insert_discovery_events(conn: Any, events: Sequence[Mapping[str, str]]) -> None:
+    """Insert a batch of events, each only if its run belongs to its tenant."""
+
+    values_sql: list[str] = []
+    params: dict[str, str] = {}
+    for index, event in enumerate(events):
+        values_sql.append(
+            f"""(
+                :tenant_id_{index},
+                CAST(:run_id_{index} AS uuid),
+                :source_{index},
+                :query_type_{index},
+                :query_hash_{index},
+                :event_key_{index},
+                :phase_{index},
+                :outcome_{index},
+                CAST(:details_{index} AS jsonb)
+            )"""
+        )
+        for column in _DISCOVERY_EVENT_COLUMNS:
+            params[f"{column}_{index}"] = event[column]
+    conn.execute(
+        text(
+            f"""
+            INSERT INTO public.discovery_run_events (
+                tenant_id,
+                run_id,
+                source,
+                query_type,
+                query_hash,
+                event_key,
+                phase,
+                outcome,
+                details
+            )
+            SELECT
+                event.tenant_id,
+                event.run_id,
+                event.source,
+                event.query_type,
+                event.query_hash,
+                event.event_key,
+                event.phase,
+                event.outcome,
+                event.details
+              FROM (VALUES {", ".join(values_sql)}) AS event (
+                  tenant_id,
+                  run_id,
+                  source,
+                  query_type,
+                  query_hash,
+                  event_key,
+                  phase,
+                  outcome,
+                  details
+              )
+             WHERE EXISTS (
+                SELECT 1
+                  FROM public.discovery_runs AS run
+                 WHERE run.id = event.run_id
+                   AND run.tenant_id = event.tenant_id
+             )
+            ON CONFLICT (tenant_id, run_id, event_key) DO NOTHING
+            """
+        ),
+        params,
+    )
+
+
+@dataclass(frozen=True)
+class DiscoveryEventBufferStats:
+    pending: int
+    written: int
+    dropped: int
+
+
+class DiscoveryEventBuffer:
+    """Bounded in-process queue of discovery events with a background flusher.
+
+    The flusher thread starts with the first event in each process and writes
+    whenever ``batch_size`` events are pending or ``flush_seconds`` pass.
+    Events arriving while ``max_events`` are pending, and batches whose write
+    fails, are dropped and counted; telemetry never blocks or fails a job.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int | None = None,
+        max_events: int | None = None,
+        flush_seconds: float | None = None,
+    ) -> None:
+        self._batch_size = batch_size
+        self._max_events = max_events
+        self._flush_seconds = flush_seconds
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._pending: list[dict[str, str]] = []
+        self._thread: threading.Thread | None = None
+        self._owner_pid = os.getpid()
+        self._closed = False
+        self._written = 0
+        self._dropped = 0
+        self._last_drop_warning_at = 0.0
+
+    def _resolved_batch_size(self) -> int:
+        if self._batch_size is not None:
+            return max(1, self._batch_size)
+        return env_int("ARCLI_DISCOVERY_EVENT_BATCH_SIZE", DEFAULT_DISCOVERY_EVENT_BATCH_SIZE)
+
+    def _resolved_max_events(self) -> int:
+        if self._max_events is not None:
+            return max(0, self._max_events)
+        return env_int(
+            "ARCLI_DISCOVERY_EVENT_BUFFER_MAX_EVENTS",
+            DEFAULT_DISCOVERY_EVENT_BUFFER_MAX_EVENTS,
+        )
+
+    def _resolved_flush_seconds(self) -> float:
+        if self._flush_seconds is not None:
+            return max(0.01, self._flush_seconds)
+        return env_float(
+            "ARCLI_DISCOVERY_EVENT_FLUSH_SECONDS",
+            DEFAULT_DISCOVERY_EVENT_FLUSH_SECONDS,
+        )
+
+    def add(self, event: dict[str, str]) -> None:
+        with self._condition:
+            if os.getpid() != self._owner_pid:
+                # A forked worker inherits the parent's queue but not its
+                # thread; those events belong to the parent.
+                self._owner_pid = os.getpid()
+                self._pending = []
+                self._thread = None
+            if len(self._pending) >= self._resolved_max_events():
+                self._dropped += 1
+                self._warn_dropped_locked("buffer_full")
+                return
+            self._pending.append(event)
+            self._ensure_thread_locked()
+            if len(self._pending) >= self._resolved_batch_size():
+                self._condition.notify()
+
+    def flush(self) -> None:
+        """Write every pending event now, in batches of ``batch_size``."""
+
+        with self._flush_lock:
+            with self._condition:
+                events, self._pending = self._pending, []
+            if not events:
+                return
+            # Retried jobs re-record the same event; one row per key suffices.
+            unique_events = list(
                 {
-                    "tenant_id": tenant,
-                    "run_id": run,
-                    "source": normalized_source,
-                    "query_type": normalized_query_type,
-                    "query_hash": hashed_query,
-                    "event_key": dedupe_key,
-                    "phase": normalized_phase,
-                    "outcome": normalized_outcome,
-                    "details": _json_value(safe_details),
-                },
+                    (event["tenant_id"], event["run_id"], event["event_key"]): event
+                    for event in events
+                }.values()
             )
-    except Exception as error:  # Telemetry must not fail the ingestion job.
-        _record_telemetry_failure("record_event", error)
+            batch_size = self._resolved_batch_size()
+            for offset in range(0, len(unique_events), batch_size):
+                batch = unique_events[offset : offset + batch_size]
+                if _in_cooldown():
+                    self._count_dropped(len(unique_events) - offset, "storage_cooldown")
+                    return
+                try:
+                    with _database_engine().begin() as conn:
+                        _insert_discovery_events(conn, batch)
+                except Exception as error:  # Telemetry must not fail the ingestion job.
+                    _record_telemetry_failure("record_event", error)
+                    self._count_dropped(len(batch), "write_failed")
+                    continue
+                with self._condition:
+                    self._written += len(batch)
+
+    def close(self) -> None:
+        """Stop the flusher and write whatever is still pending."""
+
+        with self._condition:
+            self._closed = True
+            thread = self._thread
+            self._condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self._resolved_flush_seconds() + 5)
+        self.flush()
+
+    def stats(self) -> DiscoveryEventBufferStats:
+        with self._condition:
+            return DiscoveryEventBufferStats(
+                pending=len(self._pending),
+                written=self._written,
+                dropped=self._dropped,
+            )
+
+    def _ensure_thread_locked(self) -> None:
+        if self._closed or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="discovery-telemetry-flusher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed and len(self._pending) < self._resolved_batch_size():
+                    self._condition.wait(timeout=self._resolved_flush_seconds())
+                if self._closed:
+                    return
+            self.flush()
+
+    def _count_dropped(self, count: int, reason: str) -> None:
+        with self._condition:
+            self._dropped += count
+            self._warn_dropped_locked(reason)
+
+    def _warn_dropped_locked(self, reason: str) -> None:
+        now = time.monotonic()
+        if now < self._last_drop_warning_at + _FAILURE_COOLDOWN_SECONDS:
+            return
+        self._last_drop_warning_at = now
+        logger.warning(
+            "discovery_telemetry_events_dropped reason=%s dropped_total=%s",
+            reason,
+            self._dropped,
+        )
+
+
+# One buffer per process; ``close`` runs at interpreter exit, including a
+# worker recycle, so queued events are not lost with the process.
+discovery_event_buffer = DiscoveryEventBuffer()
+atexit.register(discovery_event_buffer.close)
+
+
+def flush_discovery_events() -> None:
+    """Write buffered discovery events now; fail-open like every recorder."""
+
+    discovery_event_buffer.flush()
 
 
 def complete_discovery_run(
@@ -591,6 +818,9 @@ def complete_discovery_run(
 ) -> None:
     """Close a run with a sanitized aggregate summary, scoped by tenant ID."""
 
+    # Persist the run's buffered events before it is reported as finished.
+    discovery_event_buffer.flush()
+
     run = _uuid_value(run_id)
     tenant = _tenant_value(tenant_id)
     normalized_status = _normalized_identifier(status)
@@ -643,5 +873,6 @@ __all__ = [
     "complete_discovery_run",
     "create_buyer_language_research_run",
     "create_discovery_run",
+    "flush_discovery_events",
     "record_discovery_event",
 ]
@@ -213,60 +213,61 @@ def run_initial_public_ingestion(
 
     verifier = VerifierService()
     verifier_model = verifier.model
+    lead_match_writer = LeadMatchWriter(engine)
     qualified_count = 0
     with engine.begin() as conn:
         lead_match_columns = _table_columns(conn, "lead_matches")
 
-    for candidate in candidates:
-        post = posts_by_match_id.get(candidate.post_id)
-        if not post:
-            continue
+    # Verdicts already paid for are written even when a later candidate fails.
+    try:
+        for candidate in candidates:
+            post = posts_by_match_id.get(candidate.post_id)
+            if not post:
+                continue
 
-        source_post_id_value = candidate.metadata.get("source_post_id")
-        source_post_id = str(source_post_id_value) if source_post_id_value else None
-        with engine.begin() as conn:
-            verification = _cached_lead_verification(
-                conn,
-                tenant_id=tenant_id,
-                service_profile_id=resolved_profile_id,
-                source_post_id=source_post_id,
-                external_key=post.dedupe_key,
-                profile_embedding_sha256=profile_embedding_sha256,
-                verifier_model=verifier_model,
-                verifier_policy_version=VERIFIER_POLICY_VERSION,
-                columns=lead_match_columns,
-            )
+            source_post_id_value = candidate.metadata.get("source_post_id")
+            source_post_id = str(source_post_id_value) if source_post_id_value else None
+            with engine.begin() as conn:
+                verification = _cached_lead_verification(
+                    conn,
+                    tenant_id=tenant_id,
+                    service_profile_id=resolved_profile_id,
+                    source_post_id=source_post_id,
+                    external_key=post.dedupe_key,
+                    profile_embedding_sha256=profile_embedding_sha256,
+                    verifier_model=verifier_model,
+                    verifier_policy_version=VERIFIER_POLICY_VERSION,
+                    columns=lead_match_columns,
+                )
 
-        if verification:
-            logger.info(
-                "lead_verification_cache_hit tenant_id=%s service_profile_id=%s source_post_id=%s source=%s external_id=%s verifier_model=%s",
-                tenant_id,
-                resolved_profile_id,
-                source_post_id,
-                post.source,
-                post.external_id,
-                verifier_model,
-            )
-        else:
-            verification = verifier.verify(
-                CandidatePost(
-                    post_id=candidate.post_id,
-                    source=candidate.source,
-                    text=candidate.text,
-                    similarity_score=candidate.score,
-                    url=candidate.url,
-                    metadata=candidate.metadata,
-                ),
-                service_profile,
-                tenant_id=tenant_id,
-                service_profile_id=resolved_profile_id,
-            )
-        if _lead_match_status(verification) == "ready_for_review":
-            qualified_count += 1
+            if verification:
+                logger.info(
+                    "lead_verification_cache_hit tenant_id=%s service_profile_id=%s source_post_id=%s source=%s external_id=%s verifier_model=%s",
+                    tenant_id,
+                    resolved_profile_id,
+                    source_post_id,
+                    post.source,
+                    post.external_id,
+                    verifier_model,
+                )
+            else:
+                verification = verifier.verify(
+                    CandidatePost(
+                        post_id=candidate.post_id,
+                        source=candidate.source,
+                        text=candidate.text,
+                        similarity_score=candidate.score,
+                        url=candidate.url,
+                        metadata=candidate.metadata,
+                    ),
+                    service_profile,
+                    tenant_id=tenant_id,
+                    service_profile_id=resolved_profile_id,
+                )
+            if _lead_match_status(verification) == "ready_for_review":
+                qualified_count += 1
 
-        with engine.begin() as conn:
-            _persist_lead_match(
-                conn,
+            lead_match_writer.add(
                 tenant_id=tenant_id,
                 service_profile_id=resolved_profile_id,
                 source_post_id=source_post_id,
@@ -277,8 +278,11 @@ def run_initial_public_ingestion(
                 verifier_model=verifier_model,
                 verifier_policy_version=VERIFIER_POLICY_VERSION,
             )
-
-    verifier.close()
+    finally:
+        try:
+            lead_match_writer.close()
+        finally:
+            verifier.close()
 
     logger.info(
         "social_ingestion_completed tenant_id=%s service_profile_id=%s posts=%s embedded=%s candidates=%s qualified=%s",
@@ -305,10 +309,10 @@ from .legacy_fetch import (
     _table_columns,
 )
 from .legacy_storage import (
+    LeadMatchWriter,
     _cached_lead_verification,
     _cached_source_post_embedding,
     _lead_match_status,
-    _persist_lead_match,
     _persist_source_post_embedding_cache,
     _persist_source_posts,
 )
@@ -154,11 +154,20 @@ def _persist_source_posts(
     tenant_id: str,
     posts: list[SocialPost],
 ) -> dict[str, str]:
+    from api.services.social.data_governance import source_posts_partitioned
+
     columns = _table_columns(conn, "source_posts")
     if not {"id", "tenant_id", "source", "external_id"}.issubset(columns):
         logger.info("source_post_persistence_skipped skip_reason=%s", "table_missing")
         return {}
 
+    # Tenant rows have no posted_at; the partitioned layout's tenant key is
+    # NULLS NOT DISTINCT over it and partial on tenant_id.
+    conflict_target = (
+        "(tenant_id, source, external_id, posted_at) WHERE tenant_id IS NOT NULL"
+        if source_posts_partitioned(conn)
+        else "(tenant_id, source, external_id)"
+    )
     now = datetime.now(timezone.utc).isoformat()
     ids: dict[str, str] = {}
     for post in posts:
@@ -195,7 +204,7 @@ def _persist_source_posts(
                 f"""
                 INSERT INTO public.source_posts ({", ".join(expressions)})
                 VALUES ({", ".join(expressions.values())})
-                ON CONFLICT (tenant_id, source, external_id)
+                ON CONFLICT {conflict_target}
                 {conflict_sql}
                  WHERE public.source_posts.tenant_id = EXCLUDED.tenant_id
                 RETURNING id
@@ -381,8 +390,7 @@ def _lead_match_status(verification: Any) -> str:
 
 
 
-def _persist_lead_match(
-    conn: Connection,
+def _lead_match_payload(
     *,
     tenant_id: str,
     service_profile_id: str | None,
@@ -393,12 +401,8 @@ def _persist_lead_match(
     profile_embedding_sha256: str,
     verifier_model: str,
     verifier_policy_version: str,
-) -> None:
-    columns = _table_columns(conn, "lead_matches")
-    if not {"tenant_id", "match_status"}.issubset(columns):
-        logger.info("lead_match_persistence_skipped skip_reason=%s", "table_missing")
-        return
-
+    columns: dict[str, dict[str, str]],
+) -> dict[str, Any]:
     now = datetime.now(timezone.utc).isoformat()
     verifier_score = float(getattr(verification, "confidence", 0.0) or 0.0)
     # An LLM-verifier pass makes a lead ready for human review. Only the
@@ -444,13 +448,60 @@ def _persist_lead_match(
     }
     if "created_at" in columns:
         payload["created_at"] = now
+    return payload
 
-    existing_id = _existing_lead_match_id(
-        conn,
+
+def _lead_match_upsert_conflict_sql(expressions: dict[str, str]) -> str:
+    """``ON CONFLICT`` clause that never demotes a human-qualified lead."""
+    assignment_parts = [
+        (
+            "match_status = CASE "
+            "WHEN public.lead_matches.match_status = 'qualified' "
+            "THEN 'qualified' ELSE EXCLUDED.match_status END"
+            if column_name == "match_status"
+            else f"{column_name} = EXCLUDED.{column_name}"
+        )
+        for column_name in expressions
+        if column_name
+        not in {"id", "tenant_id", "service_profile_id", "source_post_id", "created_at"}
+    ]
+    if not assignment_parts:
+        return "ON CONFLICT (tenant_id, service_profile_id, source_post_id) DO NOTHING"
+    return f"""ON CONFLICT (tenant_id, service_profile_id, source_post_id)
+                DO UPDATE SET {', '.join(assignment_parts)}
+             WHERE public.lead_matches.tenant_id = EXCLUDED.tenant_id
+               AND public.lead_matches.service_profile_id = EXCLUDED.service_profile_id
+               AND public.lead_matches.source_post_id = EXCLUDED.source_post_id"""
+
+
+def _persist_lead_match(
+    conn: Connection,
+    *,
+    tenant_id: str,
+    service_profile_id: str | None,
+    source_post_id: str | None,
+    post: SocialPost,
+    similarity_score: float,
+    verification: Any,
+    profile_embedding_sha256: str,
+    verifier_model: str,
+    verifier_policy_version: str,
+) -> None:
+    columns = _table_columns(conn, "lead_matches")
+    if not {"tenant_id", "match_status"}.issubset(columns):
+        logger.info("lead_match_persistence_skipped skip_reason=%s", "table_missing")
+        return
+
+    payload = _lead_match_payload(
         tenant_id=tenant_id,
         service_profile_id=service_profile_id,
         source_post_id=source_post_id,
-        external_key=post.dedupe_key,
+        post=post,
+        similarity_score=similarity_score,
+        verification=verification,
+        profile_embedding_sha256=profile_embedding_sha256,
+        verifier_model=verifier_model,
+        verifier_policy_version=verifier_policy_version,
         columns=columns,
     )
     expressions, params = _bind_payload(payload, columns)
@@ -460,46 +511,26 @@ def _persist_lead_match(
         and source_post_id
         and {"tenant_id", "service_profile_id", "source_post_id"}.issubset(columns)
     ):
-        assignment_parts = [
-            (
-                "match_status = CASE "
-                "WHEN public.lead_matches.match_status = 'qualified' "
-                "THEN 'qualified' ELSE EXCLUDED.match_status END"
-                if column_name == "match_status"
-                else f"{column_name} = EXCLUDED.{column_name}"
-            )
-            for column_name in expressions
-            if column_name
-            not in {"id", "tenant_id", "service_profile_id", "source_post_id", "created_at"}
-        ]
-        conflict_sql = (
-            f"DO UPDATE SET {', '.join(assignment_parts)}"
-            if assignment_parts
-            else "DO NOTHING"
-        )
-        where_sql = (
-            """
-             WHERE public.lead_matches.tenant_id = EXCLUDED.tenant_id
-               AND public.lead_matches.service_profile_id = EXCLUDED.service_profile_id
-               AND public.lead_matches.source_post_id = EXCLUDED.source_post_id
-            """
-            if assignment_parts
-            else ""
-        )
         conn.execute(
             text(
                 f"""
                 INSERT INTO public.lead_matches ({", ".join(expressions)})
                 VALUES ({", ".join(expressions.values())})
-                ON CONFLICT (tenant_id, service_profile_id, source_post_id)
-                {conflict_sql}
-                {where_sql}
+                {_lead_match_upsert_conflict_sql(expressions)}
                 """
             ),
             params,
         )
         return
 
+    existing_id = _existing_lead_match_id(
+        conn,
+        tenant_id=tenant_id,
+        service_profile_id=service_profile_id,
+        source_post_id=source_post_id,
+        external_key=post.dedupe_key,
+        columns=columns,
+    )
     if existing_id:
         assignment_parts = [
             (
@@ -537,10 +568,158 @@ def _persist_lead_match(
         params,
     )
 
+
+@dataclass(frozen=True)
+class PendingLeadMatch:
+    """One verified lead match waiting in a :class:`LeadMatchWriter`."""
+
+    tenant_id: str
+    service_profile_id: str | None
+    source_post_id: str | None
+    post: SocialPost
+    similarity_score: float
+    verification: Any
+    profile_embedding_sha256: str
+    verifier_model: str
+    verifier_policy_version: str
+
+    @property
+    def key(self) -> tuple[str, str | None, str]:
+        return (
+            self.tenant_id,
+            self.service_profile_id,
+            self.source_post_id or self.post.dedupe_key,
+        )
+
+    def fields(self) -> dict[str, Any]:
+        return {
+            "tenant_id": self.tenant_id,
+            "service_profile_id": self.service_profile_id,
+            "source_post_id": self.source_post_id,
+            "post": self.post,
+            "similarity_score": self.similarity_score,
+            "verification": self.verification,
+            "profile_embedding_sha256": self.profile_embedding_sha256,
+            "verifier_model": self.verifier_model,
+            "verifier_policy_version": self.verifier_policy_version,
+        }
+
+
+def _persist_lead_matches(
+    conn: Connection,
+    matches: Sequence[PendingLeadMatch],
+) -> None:
+    """Set-based :func:`_persist_lead_match` for distinct lead keys.
+
+    Rows carrying the ``(tenant_id, service_profile_id, source_post_id)``
+    conflict key share one multi-row upsert.  Legacy rows without it keep the
+    per-row lookup-then-write path inside the same transaction.
+    """
+    if not matches:
+        return
+    columns = _table_columns(conn, "lead_matches")
+    if not {"tenant_id", "match_status"}.issubset(columns):
+        logger.info(
+            "lead_match_persistence_skipped skip_reason=%s rows=%s",
+            "table_missing",
+            len(matches),
+        )
+        return
+
+    has_conflict_key = {"tenant_id", "service_profile_id", "source_post_id"}.issubset(columns)
+    upserts: list[PendingLeadMatch] = []
+    for match in matches:
+        if has_conflict_key and match.service_profile_id and match.source_post_id:
+            upserts.append(match)
+        else:
+            _persist_lead_match(conn, **match.fields())
+    if not upserts:
+        return
+
+    column_names: list[str] = []
+    values_sql: list[str] = []
+    params: dict[str, Any] = {}
+    for index, match in enumerate(upserts):
+        expressions, row_params = _bind_payload(
+            _lead_match_payload(**match.fields(), columns=columns),
+            columns,
+        )
+        if not column_names:
+            column_names = list(expressions)
+        row_expressions: list[str] = []
+        for column_name in column_names:
+            param_name = f"p_{column_name}"
+            row_expressions.append(
+                expressions[column_name].replace(f":{param_name}", f":{param_name}_{index}")
+            )
+            params[f"{param_name}_{index}"] = row_params[param_name]
+        values_sql.append(f"({', '.join(row_expressions)})")
+
+    conn.execute(
+        text(
+            f"""
+            INSERT INTO public.lead_matches ({", ".join(column_names)})
+            VALUES {", ".join(values_sql)}
+            {_lead_match_upsert_conflict_sql(dict.fromkeys(column_names, ""))}
+            """
+        ),
+        params,
+    )
+
+
+class LeadMatchWriter:
+    """Buffer a job's verified lead matches and upsert them in bulk.
+
+    Matches are deduplicated on ``(tenant_id, service_profile_id, source
+    post)`` with the latest verdict winning, and written in one transaction
+    per flush.  A flush happens once ``ARCLI_LEAD_MATCH_WRITE_BATCH_SIZE``
+    matches are pending and when the writer is closed, so lead writes scale
+    with batches rather than candidates.
+    """
+
+    def __init__(self, engine: Any | None = None, *, batch_size: int | None = None) -> None:
+        self._engine = engine
+        self._batch_size = max(
+            1,
+            batch_size
+            if batch_size is not None
+            else env_int("ARCLI_LEAD_MATCH_WRITE_BATCH_SIZE", DEFAULT_LEAD_MATCH_WRITE_BATCH_SIZE),
+        )
+        self._pending: dict[tuple[str, str | None, str], PendingLeadMatch] = {}
+        self.written = 0
+
+    def add(self, **fields: Any) -> None:
+        match = PendingLeadMatch(**fields)
+        self._pending.pop(match.key, None)
+        self._pending[match.key] = match
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        if not self._pending:
+            return 0
+        matches = list(self._pending.values())
+        engine = self._engine or _database_engine()
+        with engine.begin() as conn:
+            _persist_lead_matches(conn, matches)
+        self._pending.clear()
+        self.written += len(matches)
+        return len(matches)
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "LeadMatchWriter":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
 # Cross-module helper imports for static analysis and direct module use.
 from .legacy_fetch import _table_columns
 from .models import (
     DEFAULT_DISCOVERY_CANDIDATE_THRESHOLD,
+    DEFAULT_LEAD_MATCH_WRITE_BATCH_SIZE,
     DEFAULT_VERIFIER_QUALIFIED_THRESHOLD,
     SOURCE_POST_EMBEDDING_CACHE_KEY,
     SocialPost,
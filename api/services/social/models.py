@@ -84,11 +84,20 @@ DEFAULT_VERIFIER_QUALIFIED_THRESHOLD = 0.55
 # otherwise vanish while the ready-for-review threshold remains higher.
 DEFAULT_DISCOVERY_CANDIDATE_THRESHOLD = 0.30
 
+# Verified lead matches buffered per job before one multi-row upsert.
+DEFAULT_LEAD_MATCH_WRITE_BATCH_SIZE = 200
+
 
 
 SOURCE_POST_EMBEDDING_CACHE_KEY = "matching_embedding_cache"
 
 
+# ``source_posts.matching_embedding`` from
+# scripts/source_post_embedding_vectors.sql is declared vector(1536). Other
+# sizes cannot be stored there and keep using the JSON metadata cache above.
+SOURCE_POST_EMBEDDING_VECTOR_DIMENSIONS = 1536
+
+
 
 DEFAULT_INITIAL_PUBLIC_SOURCE_QUERY_LIMIT = 6
 
@@ -117,6 +126,10 @@ DEFAULT_INITIAL_PUBLIC_GLOBAL_REMATCH_MAX_CANDIDATES = 15
 
 
 
+DEFAULT_INITIAL_PUBLIC_GLOBAL_REMATCH_NEAREST_LIMIT = 200
+
+
+
 DEFAULT_ADDITIONAL_PUBLIC_SOURCE_QUERY_CACHE_TTL_SECONDS = 900
 
 
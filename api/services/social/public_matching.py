@@ -9,6 +9,8 @@ import os
 import re
 import json
 import hashlib
+import threading
+from collections import OrderedDict
 from uuid import uuid4
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -16,6 +18,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Iterator, Sequence, TypeVar
 from urllib.parse import quote, urlsplit
 
+import numpy as np
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
 
@@ -36,7 +39,14 @@ from api.services.embeddings import (
 from api.services.integrations.hn_connector import SourcePost
 from api.services.integrations.public_source import PublicSourcePost
 from api.services.integrations.x_connector import TwitterSourcePost
-from api.services.matching import PostEmbedding, find_candidate_matches
+from api.services.matching import (
+    PostEmbedding,
+    _similarity_threshold,
+    cheap_filter_rejection_reason,
+    find_candidate_matches,
+    normalized_embedding_vector,
+    similarity_scores,
+)
 from api.services.verifier import (
     CandidatePost,
     ServiceProfile,
@@ -46,6 +56,8 @@ from api.services.verifier import (
 )
 
 _CURRENT_WEBSITE_PROFILE_IDENTITY_VERSION = "website-scoped-v2"
+DEFAULT_ACTIVE_PROFILE_INDEX_MAX_ENTRIES = 4_096
+_ACTIVE_PROFILE_INDEX_MAX_INDEXES = 4
 
 
 def _normalized_website_identity(value: Any) -> str | None:
@@ -171,6 +183,262 @@ def _public_matching_profile_rows(conn: Connection) -> list[dict[str, Any]]:
 
 
 
+@dataclass(frozen=True)
+class ActiveProfileEntry:
+    """Matching-ready state parsed once for one current tenant profile."""
+
+    tenant_id: str
+    service_profile_id: str | None
+    service_profile: ServiceProfile
+    discovery_queries: tuple[DiscoveryQuery, ...]
+    profile_embedding_sha256: str
+    vector: np.ndarray = field(repr=False, compare=False)
+
+
+@dataclass(frozen=True)
+class DiscoveryQueryPostings:
+    """Inverted index from discovery-query tokens to ``(profile, query)`` rows.
+
+    Each row is one discovery query; ``query_entries`` names its profile and
+    ``query_token_counts`` the size of its token set.  Counting a post's
+    tokens through ``postings`` gives every query's overlap at once.
+    """
+
+    postings: dict[str, np.ndarray] = field(repr=False)
+    query_entries: np.ndarray = field(repr=False)
+    query_token_counts: np.ndarray = field(repr=False)
+    # Profiles without typed phrases keep the legacy semantic-only behavior.
+    unguarded_entries: np.ndarray = field(repr=False)
+
+    @classmethod
+    def build(cls, entries: Sequence[ActiveProfileEntry]) -> "DiscoveryQueryPostings":
+        postings: dict[str, list[int]] = {}
+        query_entries: list[int] = []
+        query_token_counts: list[int] = []
+        for position, entry in enumerate(entries):
+            for query in entry.discovery_queries:
+                tokens = _discovery_phrase_tokens(_normalize_space(query.phrase).casefold())
+                if not tokens:
+                    continue
+                query_id = len(query_entries)
+                query_entries.append(position)
+                query_token_counts.append(len(tokens))
+                for token in tokens:
+                    postings.setdefault(token, []).append(query_id)
+        return cls(
+            postings={
+                token: np.asarray(query_ids, dtype=np.intp)
+                for token, query_ids in postings.items()
+            },
+            query_entries=np.asarray(query_entries, dtype=np.intp),
+            query_token_counts=np.asarray(query_token_counts, dtype=np.float64),
+            unguarded_entries=np.fromiter(
+                (not entry.discovery_queries for entry in entries),
+                dtype=bool,
+                count=len(entries),
+            ),
+        )
+
+    def reachable_entries(self, tokens: frozenset[str]) -> np.ndarray:
+        """Mask of profiles with a query whose token overlap can pass the guard."""
+        reachable = self.unguarded_entries.copy()
+        if not self.query_entries.size:
+            return reachable
+        overlap = np.zeros(self.query_entries.shape[0], dtype=np.float64)
+        for token in tokens:
+            query_ids = self.postings.get(token)
+            if query_ids is not None:
+                # A query's token set holds each token once, so ids are unique.
+                overlap[query_ids] += 1
+        required = np.maximum(
+            1.0,
+            np.ceil(self.query_token_counts * _discovery_query_overlap_fraction()),
+        )
+        reachable[self.query_entries[overlap >= required]] = True
+        return reachable
+
+
+@dataclass(frozen=True)
+class ActiveProfileIndex:
+    """Every current profile as a normalized embedding matrix.
+
+    Profiles are grouped by embedding dimension, so a post is scored against
+    all comparable profiles with one matrix-vector product. Only profiles at
+    or above the similarity threshold reach the discovery-context guard and
+    the verifier.  ``discovery`` lets a caller first narrow the fan-out to
+    profiles whose discovery queries share enough tokens with the post.
+    """
+
+    entries: tuple[ActiveProfileEntry, ...]
+    # dimensions -> (entry positions, row-normalized float32 matrix)
+    groups: dict[int, tuple[np.ndarray, np.ndarray]] = field(repr=False)
+    discovery: DiscoveryQueryPostings | None = field(default=None, repr=False)
+
+    def reachable_entries(self, tokens: frozenset[str]) -> np.ndarray | None:
+        """Profiles a post with ``tokens`` can reach, or ``None`` for all."""
+        if self.discovery is None:
+            return None
+        return self.discovery.reachable_entries(tokens)
+
+    def candidates(
+        self,
+        embedding: Sequence[float],
+        threshold: float,
+        *,
+        among: np.ndarray | None = None,
+    ) -> list[tuple[ActiveProfileEntry, float]]:
+        """Return ``(profile, score)`` pairs that pass, in profile order.
+
+        ``among`` is an optional boolean mask over ``entries``; only those
+        profiles are scored.
+        """
+        if not self.entries:
+            return []
+
+        vector = normalized_embedding_vector(embedding)
+        group = self.groups.get(vector.shape[0])
+        mismatched_profiles = len(self.entries) - (len(group[0]) if group else 0)
+        if mismatched_profiles:
+            logger.info(
+                "public_source_profile_match_skipped profiles=%s dimensions=%s skip_reason=%s",
+                mismatched_profiles,
+                vector.shape[0],
+                "embedding_dimension_mismatch",
+            )
+        if group is None:
+            return []
+
+        positions, matrix = group
+        if among is not None:
+            selected = among[positions]
+            if not selected.any():
+                return []
+            positions, matrix = positions[selected], matrix[selected]
+        scores = similarity_scores(matrix, vector)
+        return [
+            (self.entries[int(positions[row])], float(scores[row]))
+            for row in np.flatnonzero(scores >= threshold)
+        ]
+
+
+_active_profile_index_lock = threading.Lock()
+_active_profile_entries: OrderedDict[tuple[str, ...], ActiveProfileEntry] = OrderedDict()
+_active_profile_indexes: OrderedDict[tuple[tuple[str, ...], ...], ActiveProfileIndex] = (
+    OrderedDict()
+)
+
+
+def invalidate_active_profile_index() -> None:
+    """Drop every cached profile entry and matrix in this process."""
+    with _active_profile_index_lock:
+        _active_profile_entries.clear()
+        _active_profile_indexes.clear()
+
+
+def _active_profile_entry(
+    row: dict[str, Any],
+) -> tuple[tuple[str, ...], ActiveProfileEntry] | None:
+    tenant_id = _string_value(row.get("tenant_id"))
+    service_profile_id = _string_value(row.get("id"))
+    profile_embedding = _profile_embedding_from_row(row)
+    if not tenant_id or not profile_embedding:
+        return None
+
+    # The embedding hash changes whenever the profile is re-embedded, and
+    # ``updated_at`` catches edits that have not been re-embedded yet.
+    profile_embedding_sha256 = _embedding_sha256(profile_embedding)
+    key = (
+        tenant_id,
+        service_profile_id or "",
+        profile_embedding_sha256,
+        str(row.get("updated_at") or ""),
+    )
+    with _active_profile_index_lock:
+        entry = _active_profile_entries.get(key)
+        if entry is not None:
+            _active_profile_entries.move_to_end(key)
+            return key, entry
+
+    try:
+        service_profile = _service_profile_from_row(row)
+        vector = normalized_embedding_vector(profile_embedding)
+    except Exception as exc:
+        logger.info(
+            "public_source_profile_match_skipped tenant_id=%s service_profile_id=%s skip_reason=%s error_type=%s",
+            tenant_id,
+            service_profile_id,
+            "invalid_service_profile",
+            exc.__class__.__name__,
+        )
+        return None
+
+    entry = ActiveProfileEntry(
+        tenant_id=tenant_id,
+        service_profile_id=service_profile_id,
+        service_profile=service_profile,
+        discovery_queries=tuple(_profile_discovery_queries(row)),
+        profile_embedding_sha256=profile_embedding_sha256,
+        vector=vector,
+    )
+    max_entries = max(
+        1,
+        env_int(
+            "ARCLI_ACTIVE_PROFILE_INDEX_MAX_ENTRIES",
+            DEFAULT_ACTIVE_PROFILE_INDEX_MAX_ENTRIES,
+        ),
+    )
+    with _active_profile_index_lock:
+        _active_profile_entries[key] = entry
+        while len(_active_profile_entries) > max_entries:
+            _active_profile_entries.popitem(last=False)
+    return key, entry
+
+
+def _active_profile_index(profile_rows: Sequence[dict[str, Any]]) -> ActiveProfileIndex:
+    """Build, or reuse, the array-backed index for current profile rows.
+
+    Parsed profiles are cached by embedding hash, so a stable tenant set only
+    pays for row parsing and hashing; the stacked matrix is reused as long as
+    the same profiles are active.
+    """
+    keyed_entries = [
+        keyed_entry
+        for row in profile_rows
+        if (keyed_entry := _active_profile_entry(row)) is not None
+    ]
+    index_key = tuple(key for key, _ in keyed_entries)
+    with _active_profile_index_lock:
+        index = _active_profile_indexes.get(index_key)
+        if index is not None:
+            _active_profile_indexes.move_to_end(index_key)
+            return index
+
+    entries = tuple(entry for _, entry in keyed_entries)
+    positions_by_dimensions: dict[int, list[int]] = {}
+    for position, entry in enumerate(entries):
+        positions_by_dimensions.setdefault(entry.vector.shape[0], []).append(position)
+    groups = {
+        dimensions: (
+            np.asarray(positions, dtype=np.intp),
+            np.ascontiguousarray(
+                np.stack([entries[position].vector for position in positions])
+            ),
+        )
+        for dimensions, positions in positions_by_dimensions.items()
+    }
+    index = ActiveProfileIndex(
+        entries=entries,
+        groups=groups,
+        discovery=DiscoveryQueryPostings.build(entries),
+    )
+    with _active_profile_index_lock:
+        _active_profile_indexes[index_key] = index
+        while len(_active_profile_indexes) > _ACTIVE_PROFILE_INDEX_MAX_INDEXES:
+            _active_profile_indexes.popitem(last=False)
+    return index
+
+
+
 def _empty_public_rematch_result() -> dict[str, int]:
     return {
         "posts": 0,
@@ -196,11 +464,13 @@ def _source_post_matches_profile_discovery_context(
     """
     if not discovery_queries:
         return True
+    features = post_features(post)
     return any(
         _source_post_is_plausible_for_discovery_query(
             post,
             query.phrase,
             query_type=query.query_type,
+            features=features,
         )
         for query in discovery_queries
     )
@@ -222,6 +492,21 @@ def _initial_public_global_rematch_max_candidates() -> int:
 
 
 
+def _initial_public_global_rematch_nearest_limit() -> int:
+    """Bound how many nearest posts the ANN query returns for one profile."""
+    return max(
+        1,
+        min(
+            1_000,
+            env_int(
+                "ARCLI_INITIAL_PUBLIC_GLOBAL_REMATCH_NEAREST_LIMIT",
+                DEFAULT_INITIAL_PUBLIC_GLOBAL_REMATCH_NEAREST_LIMIT,
+            ),
+        ),
+    )
+
+
+
 def rematch_existing_public_source_posts_for_profile(
     tenant_id: str,
     service_profile_id: str | None,
@@ -231,7 +516,9 @@ def rematch_existing_public_source_posts_for_profile(
     New public posts retain the existing global fan-out behavior.  This path is
     deliberately profile-centric: it restores historical corpus coverage for
     the newly activated customer without reading or writing another tenant's
-    lead-match rows and without generating new post embeddings.
+    lead-match rows and without generating new post embeddings.  Once the
+    typed vector contract is applied, the corpus slice is the posts nearest
+    the profile rather than the newest ones.
     """
     normalized_tenant_id = tenant_id.strip()
     normalized_profile_id = (service_profile_id or "").strip()
@@ -258,10 +545,6 @@ def rematch_existing_public_source_posts_for_profile(
             profile_columns,
         )
         active_website_url = _active_tenant_website_url(conn, normalized_tenant_id)
-        source_rows = _load_recent_embedded_public_source_post_rows(
-            conn,
-            limit=source_limit,
-        )
         lead_match_columns = _table_columns(conn, "lead_matches")
 
     if not profile_row:
@@ -316,6 +599,22 @@ def rematch_existing_public_source_posts_for_profile(
     posts_by_database_id: dict[str, SocialPost] = {}
     cache_misses = 0
     try:
+        with engine.begin() as conn:
+            # With typed vectors the database returns the posts nearest this
+            # profile across the whole retained corpus; otherwise fall back to
+            # the newest-first window of JSON-cached embeddings.
+            source_rows = _load_nearest_embedded_public_source_post_rows(
+                conn,
+                embedding=profile_embedding,
+                embedding_model=embedding_service.model,
+                limit=_initial_public_global_rematch_nearest_limit(),
+            )
+            if source_rows is None:
+                source_rows = _load_recent_embedded_public_source_post_rows(
+                    conn,
+                    limit=source_limit,
+                )
+
         for source_row in source_rows:
             database_post_id = str(source_row.get("id") or "")
             post = _public_source_post_as_social_post(source_row)
@@ -328,13 +627,21 @@ def rematch_existing_public_source_posts_for_profile(
                 continue
 
             embedding_text = normalize_embedding_text(post.matching_text[:32_000])
-            with engine.begin() as conn:
-                embedding_values = _cached_public_source_post_embedding(
-                    conn,
-                    database_post_id=database_post_id,
-                    text_sha256=_sha256_text(embedding_text),
+            text_sha256 = _sha256_text(embedding_text)
+            if "matching_embedding_values" in source_row:
+                embedding_values = _prefetched_public_source_post_embedding(
+                    source_row,
+                    text_sha256=text_sha256,
                     embedding_model=embedding_service.model,
                 )
+            else:
+                with engine.begin() as conn:
+                    embedding_values = _cached_public_source_post_embedding(
+                        conn,
+                        database_post_id=database_post_id,
+                        text_sha256=text_sha256,
+                        embedding_model=embedding_service.model,
+                    )
             if not embedding_values:
                 cache_misses += 1
                 continue
@@ -390,17 +697,20 @@ def rematch_existing_public_source_posts_for_profile(
         return result
 
     verifier = VerifierService()
+    lead_match_writer = LeadMatchWriter(engine)
     profile_embedding_sha256 = _embedding_sha256(profile_embedding)
     ready_for_review_count = 0
     discovery_candidate_count = 0
     try:
+        verifications_by_post_id: dict[str, VerificationResult] = {}
+        uncached_candidate_posts: list[CandidatePost] = []
         for candidate in candidates:
             post = posts_by_database_id.get(candidate.post_id)
             if not post:
                 continue
 
             with engine.begin() as conn:
-                verification = _cached_lead_verification(
+                cached_verification = _cached_lead_verification(
                     conn,
                     tenant_id=normalized_tenant_id,
                     service_profile_id=normalized_profile_id,
@@ -411,20 +721,39 @@ def rematch_existing_public_source_posts_for_profile(
                     verifier_policy_version=VERIFIER_POLICY_VERSION,
                     columns=lead_match_columns,
                 )
-            if not verification:
-                verification = verifier.verify(
-                    CandidatePost(
-                        post_id=candidate.post_id,
-                        source=candidate.source,
-                        text=candidate.text,
-                        similarity_score=candidate.score,
-                        url=candidate.url,
-                        metadata=candidate.metadata,
-                    ),
+            if cached_verification:
+                verifications_by_post_id[candidate.post_id] = cached_verification
+                continue
+            uncached_candidate_posts.append(
+                CandidatePost(
+                    post_id=candidate.post_id,
+                    source=candidate.source,
+                    text=candidate.text,
+                    similarity_score=candidate.score,
+                    url=candidate.url,
+                    metadata=candidate.metadata,
+                )
+            )
+
+        # All uncached candidates share this one profile, so the verifier can
+        # judge several of them per structured-output request.
+        if uncached_candidate_posts:
+            for candidate_post, verification in zip(
+                uncached_candidate_posts,
+                verifier.verify_many(
+                    uncached_candidate_posts,
                     service_profile,
                     tenant_id=normalized_tenant_id,
                     service_profile_id=normalized_profile_id,
-                )
+                ),
+            ):
+                verifications_by_post_id[candidate_post.post_id] = verification
+
+        for candidate in candidates:
+            post = posts_by_database_id.get(candidate.post_id)
+            verification = verifications_by_post_id.get(candidate.post_id)
+            if not post or verification is None:
+                continue
 
             match_status = _lead_match_status(verification)
             if match_status == "ready_for_review":
@@ -432,21 +761,22 @@ def rematch_existing_public_source_posts_for_profile(
             elif match_status == "discovery_candidate":
                 discovery_candidate_count += 1
 
-            with engine.begin() as conn:
-                _persist_lead_match(
-                    conn,
-                    tenant_id=normalized_tenant_id,
-                    service_profile_id=normalized_profile_id,
-                    source_post_id=candidate.post_id,
-                    post=post,
-                    similarity_score=candidate.score,
-                    verification=verification,
-                    profile_embedding_sha256=profile_embedding_sha256,
-                    verifier_model=verifier.model,
-                    verifier_policy_version=VERIFIER_POLICY_VERSION,
-                )
+            lead_match_writer.add(
+                tenant_id=normalized_tenant_id,
+                service_profile_id=normalized_profile_id,
+                source_post_id=candidate.post_id,
+                post=post,
+                similarity_score=candidate.score,
+                verification=verification,
+                profile_embedding_sha256=profile_embedding_sha256,
+                verifier_model=verifier.model,
+                verifier_policy_version=VERIFIER_POLICY_VERSION,
+            )
     finally:
-        verifier.close()
+        try:
+            lead_match_writer.close()
+        finally:
+            verifier.close()
 
     result = {
         "posts": len(source_rows),
@@ -480,11 +810,14 @@ def process_public_source_post_embedding(
     _lead_match_columns: dict[str, dict[str, str]] | None = None,
     _embedding_values_by_database_post_id: dict[str, list[float]] | None = None,
     _embedding_service: EmbeddingService | None = None,
+    _profile_index: ActiveProfileIndex | None = None,
+    _lead_match_writer: LeadMatchWriter | None = None,
 ) -> dict[str, int]:
     """Embed one global post and create tenant-scoped verified lead matches.
 
     The source row remains global.  Only a positive profile match creates a
-    ``lead_matches`` row carrying that profile's tenant ID.
+    ``lead_matches`` row carrying that profile's tenant ID.  A batch passes
+    its own ``_lead_match_writer`` so the whole job shares bulk upserts.
     """
     normalized_source_post_id = source_post_id.strip()
     normalized_source = (source or "").strip() or None
@@ -526,8 +859,16 @@ def process_public_source_post_embedding(
             "discovery_candidates": 0,
         }
 
+    profile_index = (
+        _profile_index
+        if _profile_index is not None
+        else _active_profile_index(profile_rows)
+    )
+    similarity_threshold = _similarity_threshold(None)
     embedding_service = _embedding_service or EmbeddingService()
     owns_embedding_service = _embedding_service is None
+    lead_match_writer = _lead_match_writer or LeadMatchWriter(engine)
+    owns_lead_match_writer = _lead_match_writer is None
     verifier: VerifierService | None = None
     embedded_count = 0
     candidate_count = 0
@@ -599,59 +940,42 @@ def process_public_source_post_embedding(
                     )
             embedded_count += 1
 
-            for profile_row in profile_rows:
-                tenant_id = _string_value(profile_row.get("tenant_id"))
-                service_profile_id = _string_value(profile_row.get("id"))
-                profile_embedding = _profile_embedding_from_row(profile_row)
-                if not tenant_id or not profile_embedding:
-                    continue
+            cheap_rejection_reason = cheap_filter_rejection_reason(embedding_text)
+            if cheap_rejection_reason:
+                logger.debug(
+                    "public_source_post_matching_skipped source_post_id=%s database_post_id=%s skip_reason=%s",
+                    post.external_id,
+                    database_post_id,
+                    cheap_rejection_reason,
+                )
+                continue
 
-                try:
-                    service_profile = _service_profile_from_row(profile_row)
-                except Exception as exc:
-                    logger.info(
-                        "public_source_profile_match_skipped tenant_id=%s service_profile_id=%s source_post_id=%s skip_reason=%s error_type=%s",
-                        tenant_id,
-                        service_profile_id,
-                        database_post_id,
-                        "invalid_service_profile",
-                        exc.__class__.__name__,
-                    )
-                    continue
+            candidate_metadata = _primitive_metadata(
+                {
+                    "source_post_id": database_post_id,
+                    "external_id": post.external_id,
+                    "external_key": post.dedupe_key,
+                    "source": post.source,
+                }
+            )
+            # Only profiles whose discovery queries share enough tokens with
+            # this post are scored and given the full discovery guard.
+            reachable_profiles = profile_index.reachable_entries(post_features(post).tokens)
+            for profile_entry, similarity_score in profile_index.candidates(
+                embedding_values,
+                similarity_threshold,
+                among=reachable_profiles,
+            ):
+                tenant_id = profile_entry.tenant_id
+                service_profile_id = profile_entry.service_profile_id
                 if not _source_post_matches_profile_discovery_context(
                     post,
-                    _profile_discovery_queries(profile_row),
+                    profile_entry.discovery_queries,
                 ):
                     continue
 
-                post_embedding = PostEmbedding(
-                    post_id=database_post_id,
-                    text=embedding_text,
-                    embedding=embedding_values,
-                    source=post.source,
-                    url=post.url,
-                    metadata=_primitive_metadata(
-                        {
-                            "source_post_id": database_post_id,
-                            "external_id": post.external_id,
-                            "external_key": post.dedupe_key,
-                            "source": post.source,
-                        }
-                    ),
-                )
-                candidates = find_candidate_matches(
-                    profile_embedding,
-                    [post_embedding],
-                    tenant_id=tenant_id,
-                    service_profile_id=service_profile_id,
-                    max_candidates=1,
-                )
-                if not candidates:
-                    continue
-
-                candidate = candidates[0]
                 candidate_count += 1
-                profile_embedding_sha256 = _embedding_sha256(profile_embedding)
+                profile_embedding_sha256 = profile_entry.profile_embedding_sha256
                 with engine.begin() as conn:
                     verification = _cached_lead_verification(
                         conn,
@@ -668,14 +992,14 @@ def process_public_source_post_embedding(
                 if not verification:
                     verification = verifier.verify(
                         CandidatePost(
-                            post_id=candidate.post_id,
-                            source=candidate.source,
-                            text=candidate.text,
-                            similarity_score=candidate.score,
-                            url=candidate.url,
-                            metadata=candidate.metadata,
+                            post_id=database_post_id,
+                            source=post.source,
+                            text=embedding_text,
+                            similarity_score=similarity_score,
+                            url=post.url,
+                            metadata=candidate_metadata,
                         ),
-                        service_profile,
+                        profile_entry.service_profile,
                         tenant_id=tenant_id,
                         service_profile_id=service_profile_id,
                     )
@@ -686,24 +1010,26 @@ def process_public_source_post_embedding(
                 elif match_status == "discovery_candidate":
                     discovery_candidate_count += 1
 
-                with engine.begin() as conn:
-                    _persist_lead_match(
-                        conn,
-                        tenant_id=tenant_id,
-                        service_profile_id=service_profile_id,
-                        source_post_id=database_post_id,
-                        post=post,
-                        similarity_score=candidate.score,
-                        verification=verification,
-                        profile_embedding_sha256=profile_embedding_sha256,
-                        verifier_model=verifier.model,
-                        verifier_policy_version=VERIFIER_POLICY_VERSION,
-                    )
+                lead_match_writer.add(
+                    tenant_id=tenant_id,
+                    service_profile_id=service_profile_id,
+                    source_post_id=database_post_id,
+                    post=post,
+                    similarity_score=similarity_score,
+                    verification=verification,
+                    profile_embedding_sha256=profile_embedding_sha256,
+                    verifier_model=verifier.model,
+                    verifier_policy_version=VERIFIER_POLICY_VERSION,
+                )
     finally:
-        if owns_embedding_service:
-            embedding_service.close()
-        if verifier is not None:
-            verifier.close()
+        try:
+            if owns_lead_match_writer:
+                lead_match_writer.close()
+        finally:
+            if owns_embedding_service:
+                embedding_service.close()
+            if verifier is not None:
+                verifier.close()
 
     logger.info(
         "public_source_post_matching_completed source=%s source_post_id=%s posts=%s embedded=%s profiles=%s candidates=%s ready_for_review=%s discovery_candidates=%s",
@@ -766,7 +1092,8 @@ def prewarm_public_source_post_embedding_cache(
     The downstream matching function remains deliberately per post: it keeps
     its idempotent cache, verifier policy, and lead persistence semantics.
     This small preparation step only replaces many one-input embedding calls
-    with one request containing up to the configured batch size.
+    with provider-sized batches, and reads and writes the batch's cache
+    rows with one set-based statement each.
     """
     normalized_refs = _normalized_public_source_post_refs(source_post_refs)
 
@@ -776,72 +1103,89 @@ def prewarm_public_source_post_embedding_cache(
     engine = _database_engine()
     owns_embedding_service = embedding_service is None
     embedding_service = embedding_service or EmbeddingService()
-    missing_embeddings: list[tuple[str, str, str]] = []
     try:
-        for source, source_post_id in normalized_refs:
-            source_rows = (source_rows_by_ref or {}).get((source, source_post_id))
-            if source_rows is None:
-                with engine.begin() as conn:
-                    source_rows = _load_public_source_post_rows(
-                        conn,
-                        source_post_id,
-                        source=source,
+        resolved_rows_by_ref = dict(source_rows_by_ref or {})
+        unloaded_refs = [
+            ref for ref in normalized_refs if resolved_rows_by_ref.get(ref) is None
+        ]
+        if unloaded_refs:
+            with engine.begin() as conn:
+                for source, source_post_id in unloaded_refs:
+                    resolved_rows_by_ref[(source, source_post_id)] = (
+                        _load_public_source_post_rows(
+                            conn,
+                            source_post_id,
+                            source=source,
+                        )
                     )
-            for source_row in source_rows:
+
+        pending: dict[str, tuple[str, str]] = {}
+        for ref in normalized_refs:
+            for source_row in resolved_rows_by_ref.get(ref) or []:
                 database_post_id = str(source_row["id"])
+                if database_post_id in pending:
+                    continue
                 post = _public_source_post_as_social_post(source_row)
                 if not post:
                     continue
                 embedding_text = normalize_embedding_text(post.matching_text[:32_000])
-                text_sha256 = _sha256_text(embedding_text)
-                with engine.begin() as conn:
-                    cached_embedding = _cached_public_source_post_embedding(
-                        conn,
-                        database_post_id=database_post_id,
-                        text_sha256=text_sha256,
-                        embedding_model=embedding_service.model,
-                    )
-                if cached_embedding:
-                    if embedding_values_by_database_post_id is not None:
-                        embedding_values_by_database_post_id[database_post_id] = (
-                            cached_embedding
-                        )
-                    continue
-                missing_embeddings.append(
-                    (database_post_id, text_sha256, embedding_text)
-                )
+                pending[database_post_id] = (_sha256_text(embedding_text), embedding_text)
+
+        if not pending:
+            return 0
 
+        with engine.begin() as conn:
+            cached_embeddings = _cached_public_source_post_embeddings(
+                conn,
+                text_sha256_by_database_post_id={
+                    database_post_id: text_sha256
+                    for database_post_id, (text_sha256, _) in pending.items()
+                },
+                embedding_model=embedding_service.model,
+            )
+        if embedding_values_by_database_post_id is not None:
+            embedding_values_by_database_post_id.update(cached_embeddings)
+
+        missing_embeddings = [
+            (database_post_id, text_sha256, embedding_text)
+            for database_post_id, (text_sha256, embedding_text) in pending.items()
+            if database_post_id not in cached_embeddings
+        ]
         if not missing_embeddings:
             return 0
 
         try:
+            # This helper runs inside sync actors and may be reached from a
+            # running loop, so it must not start one of its own.
             embeddings = embedding_service.embed_many(
                 [item[2] for item in missing_embeddings],
                 source_post_ids=[item[0] for item in missing_embeddings],
                 purpose="public_source_matching",
             )
         except Exception:
-            for database_post_id, _, _ in missing_embeddings:
-                with engine.begin() as conn:
-                    _mark_public_source_post_embedding_failed(
-                        conn,
-                        database_post_id=database_post_id,
-                    )
-            raise
-
-        for (database_post_id, text_sha256, _), embedding in zip(
-            missing_embeddings,
-            embeddings,
-        ):
             with engine.begin() as conn:
-                _persist_public_source_post_embedding_cache(
+                _mark_public_source_post_embeddings_failed(
                     conn,
-                    database_post_id=database_post_id,
-                    text_sha256=text_sha256,
-                    embedding_model=embedding.model,
-                    embedding=embedding.embedding,
+                    database_post_ids=[item[0] for item in missing_embeddings],
                 )
-            if embedding_values_by_database_post_id is not None:
+            raise
+
+        with engine.begin() as conn:
+            _persist_public_source_post_embedding_caches(
+                conn,
+                entries=[
+                    (database_post_id, text_sha256, embedding.model, embedding.embedding)
+                    for (database_post_id, text_sha256, _), embedding in zip(
+                        missing_embeddings,
+                        embeddings,
+                    )
+                ],
+            )
+        if embedding_values_by_database_post_id is not None:
+            for (database_post_id, _, _), embedding in zip(
+                missing_embeddings,
+                embeddings,
+            ):
                 embedding_values_by_database_post_id[database_post_id] = (
                     embedding.embedding
                 )
@@ -904,7 +1248,9 @@ def process_public_source_post_embedding_batch(
             and _string_value(row.get("id")) == normalized_profile_id
         ]
 
+    profile_index = _active_profile_index(profile_rows)
     embedding_service = EmbeddingService()
+    lead_match_writer = LeadMatchWriter(engine)
     embedding_values_by_database_post_id: dict[str, list[float]] = {}
     totals = {
         "posts": 0,
@@ -931,11 +1277,16 @@ def process_public_source_post_embedding_batch(
                     embedding_values_by_database_post_id
                 ),
                 _embedding_service=embedding_service,
+                _profile_index=profile_index,
+                _lead_match_writer=lead_match_writer,
             )
             for key in totals:
                 totals[key] += int(result.get(key, 0))
     finally:
-        embedding_service.close()
+        try:
+            lead_match_writer.close()
+        finally:
+            embedding_service.close()
     return totals
 
 # Cross-module helper imports for static analysis and direct module use.
@@ -944,16 +1295,24 @@ from .legacy_fetch import (
     _table_columns,
 )
 from .legacy_storage import (
+    LeadMatchWriter,
     _cached_lead_verification,
     _lead_match_status,
-    _persist_lead_match,
 )
-from .activation import _source_post_is_plausible_for_discovery_query
+from .activation import (
+    _discovery_phrase_tokens,
+    _discovery_query_overlap_fraction,
+    _source_post_is_plausible_for_discovery_query,
+    post_features,
+)
 from .models import (
     DEFAULT_INITIAL_PUBLIC_GLOBAL_REMATCH_LIMIT,
     DEFAULT_INITIAL_PUBLIC_GLOBAL_REMATCH_MAX_CANDIDATES,
+    DEFAULT_INITIAL_PUBLIC_GLOBAL_REMATCH_NEAREST_LIMIT,
+    DiscoveryQuery,
     SocialPost,
     _embedding_sha256,
+    _normalize_space,
     _profile_discovery_queries,
     _profile_embedding_from_row,
     _service_profile_from_row,
@@ -962,9 +1321,14 @@ from .models import (
 )
 from .public_records import (
     _cached_public_source_post_embedding,
+    _cached_public_source_post_embeddings,
+    _load_nearest_embedded_public_source_post_rows,
     _load_public_source_post_rows,
     _load_recent_embedded_public_source_post_rows,
     _mark_public_source_post_embedding_failed,
+    _mark_public_source_post_embeddings_failed,
     _persist_public_source_post_embedding_cache,
+    _persist_public_source_post_embedding_caches,
+    _prefetched_public_source_post_embedding,
     _public_source_post_as_social_post,
 )
@@ -45,6 +45,32 @@ from api.services.verifier import (
 
 
 
+_PUBLIC_SOURCE_POST_CORPUS_COLUMNS = (
+    "id",
+    "source",
+    "source_post_id",
+    "title",
+    "body",
+    "text",
+    "author_handle",
+    "author",
+    "url",
+    "posted_at",
+    "published_at",
+    "metadata",
+    "embedding_status",
+)
+
+
+def _has_public_source_post_vector_contract(columns: dict[str, dict[str, str]]) -> bool:
+    """Whether scripts/source_post_embedding_vectors.sql has been applied."""
+    vector_column = columns.get("matching_embedding")
+    return (
+        vector_column is not None
+        and vector_column["udt_name"] == "vector"
+        and "matching_embedding_model" in columns
+        and "matching_embedding_text_sha256" in columns
+    )
 
 
 def _load_public_source_post_rows(
@@ -126,6 +152,26 @@ def _load_public_source_post_rows(
     return normalized_rows
 
 
+def _public_corpus_window_filter(conn: Connection) -> tuple[str, dict[str, Any]]:
+    """Bound global corpus reads to the retention window when partitioned.
+
+    With time-partitioned ``source_posts`` a ``posted_at`` lower bound lets
+    the planner skip every older partition and the default (undated) one.
+    Nothing older than the window survives retention, so the bound only
+    removes rows awaiting deletion.
+    """
+    from api.services.social.data_governance import (
+        public_data_retention_days,
+        source_posts_partitioned,
+    )
+
+    if not source_posts_partitioned(conn):
+        return "", {}
+    return (
+        "AND posted_at >= NOW() - (:corpus_window_days * INTERVAL '1 day')",
+        {"corpus_window_days": public_data_retention_days()},
+    )
+
 
 def _load_recent_embedded_public_source_post_rows(
     conn: Connection,
@@ -149,24 +195,12 @@ def _load_recent_embedded_public_source_post_rows(
 
     select_columns = [
         column_name
-        for column_name in (
-            "id",
-            "source",
-            "source_post_id",
-            "title",
-            "body",
-            "text",
-            "author_handle",
-            "author",
-            "url",
-            "posted_at",
-            "published_at",
-            "metadata",
-            "embedding_status",
-        )
+        for column_name in _PUBLIC_SOURCE_POST_CORPUS_COLUMNS
         if column_name in columns
     ]
     order_column = "posted_at" if "posted_at" in columns else "id"
+    window_sql, params = _public_corpus_window_filter(conn)
+    params["limit"] = limit
     rows = conn.execute(
         text(
             f"""
@@ -175,15 +209,105 @@ def _load_recent_embedded_public_source_post_rows(
              WHERE tenant_id IS NULL
                AND source_post_id IS NOT NULL
                AND embedding_status = 'completed'
+               {window_sql}
              ORDER BY {order_column} DESC NULLS LAST, id DESC
              LIMIT :limit
             """
         ),
-        {"limit": limit},
+        params,
+    ).mappings()
+    return [dict(row) for row in rows]
+
+
+def _load_nearest_embedded_public_source_post_rows(
+    conn: Connection,
+    *,
+    embedding: list[float],
+    embedding_model: str,
+    limit: int,
+) -> list[dict[str, Any]] | None:
+    """Load the embedded global posts nearest one profile from the ANN index.
+
+    Each row carries its typed embedding, so callers need no per-row cache
+    lookup or JSON decode. Returns ``None`` when the vector contract is not
+    applied (or the embedding cannot be compared with the column); callers
+    then keep the bounded newest-first corpus window.
+    """
+    columns = _table_columns(conn, "source_posts")
+    required_columns = {"id", "source", "source_post_id", "tenant_id", "embedding_status"}
+    if (
+        not required_columns.issubset(columns)
+        or not _has_public_source_post_vector_contract(columns)
+        or len(embedding) != SOURCE_POST_EMBEDDING_VECTOR_DIMENSIONS
+    ):
+        return None
+
+    select_columns = [
+        column_name
+        for column_name in _PUBLIC_SOURCE_POST_CORPUS_COLUMNS
+        if column_name in columns
+    ]
+    # Filters are applied after the index scan, so widen the HNSW candidate
+    # list (and IVFFlat probes) enough to still return ``limit`` rows.
+    conn.execute(
+        text(
+            """
+            SELECT set_config('hnsw.ef_search', :ef_search, true),
+                   set_config('ivfflat.probes', :ivfflat_probes, true)
+            """
+        ),
+        {
+            "ef_search": str(min(1_000, max(40, limit * 2))),
+            "ivfflat_probes": "10",
+        },
+    )
+    window_sql, params = _public_corpus_window_filter(conn)
+    params.update(
+        {
+            "embedding_model": embedding_model,
+            "probe_embedding": json.dumps(embedding, separators=(",", ":")),
+            "limit": limit,
+        }
+    )
+    rows = conn.execute(
+        text(
+            f"""
+            SELECT {", ".join(select_columns)},
+                   matching_embedding::real[] AS matching_embedding_values,
+                   matching_embedding_model,
+                   matching_embedding_text_sha256
+              FROM public.source_posts
+             WHERE tenant_id IS NULL
+               AND source_post_id IS NOT NULL
+               AND embedding_status = 'completed'
+               AND matching_embedding IS NOT NULL
+               AND matching_embedding_model = :embedding_model
+               {window_sql}
+             ORDER BY matching_embedding <=> :probe_embedding
+             LIMIT :limit
+            """
+        ),
+        params,
     ).mappings()
     return [dict(row) for row in rows]
 
 
+def _prefetched_public_source_post_embedding(
+    row: dict[str, Any],
+    *,
+    text_sha256: str,
+    embedding_model: str,
+) -> list[float] | None:
+    """Return a typed-column embedding selected with the row, if still current."""
+    values = row.get("matching_embedding_values")
+    if (
+        values is None
+        or row.get("matching_embedding_model") != embedding_model
+        or row.get("matching_embedding_text_sha256") != text_sha256
+    ):
+        return None
+    return _embedding_values(list(values))
+
 
 def _public_source_post_as_social_post(row: dict[str, Any]) -> SocialPost | None:
     source = _string_value(row.get("source"))
@@ -212,7 +336,6 @@ def _public_source_post_as_social_post(row: dict[str, Any]) -> SocialPost | None
     )
 
 
-
 def _cached_public_source_post_embedding(
     conn: Connection,
     *,
@@ -221,13 +344,26 @@ def _cached_public_source_post_embedding(
     embedding_model: str,
 ) -> list[float] | None:
     columns = _table_columns(conn, "source_posts")
-    if "metadata" not in columns:
+    has_vector_contract = _has_public_source_post_vector_contract(columns)
+    if not has_vector_contract and "metadata" not in columns:
         return None
 
-    cache = conn.execute(
+    select_parts = []
+    if has_vector_contract:
+        select_parts.extend(
+            [
+                "matching_embedding::real[] AS matching_embedding_values",
+                "matching_embedding_model",
+                "matching_embedding_text_sha256",
+            ]
+        )
+    if "metadata" in columns:
+        select_parts.append("metadata->:cache_key AS legacy_cache")
+
+    row = conn.execute(
         text(
-            """
-            SELECT metadata->:cache_key
+            f"""
+            SELECT {", ".join(select_parts)}
               FROM public.source_posts
              WHERE id = CAST(:database_post_id AS uuid)
                AND tenant_id IS NULL
@@ -238,8 +374,20 @@ def _cached_public_source_post_embedding(
             "database_post_id": database_post_id,
             "cache_key": SOURCE_POST_EMBEDDING_CACHE_KEY,
         },
-    ).scalar_one_or_none()
-    cache_payload = _as_dict(cache)
+    ).mappings().first()
+    if not row:
+        return None
+
+    typed_embedding = _prefetched_public_source_post_embedding(
+        dict(row),
+        text_sha256=text_sha256,
+        embedding_model=embedding_model,
+    )
+    if typed_embedding:
+        return typed_embedding
+
+    # Rows embedded before the vector contract keep their JSON cache.
+    cache_payload = _as_dict(row.get("legacy_cache"))
     if (
         cache_payload.get("model") != embedding_model
         or cache_payload.get("text_sha256") != text_sha256
@@ -248,6 +396,74 @@ def _cached_public_source_post_embedding(
     return _embedding_values(cache_payload.get("embedding"))
 
 
+def _cached_public_source_post_embeddings(
+    conn: Connection,
+    *,
+    text_sha256_by_database_post_id: dict[str, str],
+    embedding_model: str,
+) -> dict[str, list[float]]:
+    """Set-based :func:`_cached_public_source_post_embedding` for one batch.
+
+    One ``id = ANY(:ids)`` query replaces a transaction per row.  Only rows
+    whose cached model and text hash are still current are returned.
+    """
+    if not text_sha256_by_database_post_id:
+        return {}
+
+    columns = _table_columns(conn, "source_posts")
+    has_vector_contract = _has_public_source_post_vector_contract(columns)
+    if not has_vector_contract and "metadata" not in columns:
+        return {}
+
+    select_parts = ["id::text AS database_post_id"]
+    if has_vector_contract:
+        select_parts.extend(
+            [
+                "matching_embedding::real[] AS matching_embedding_values",
+                "matching_embedding_model",
+                "matching_embedding_text_sha256",
+            ]
+        )
+    if "metadata" in columns:
+        select_parts.append("metadata->:cache_key AS legacy_cache")
+
+    rows = conn.execute(
+        text(
+            f"""
+            SELECT {", ".join(select_parts)}
+              FROM public.source_posts
+             WHERE id = ANY(CAST(:database_post_ids AS uuid[]))
+               AND tenant_id IS NULL
+            """
+        ),
+        {
+            "database_post_ids": list(text_sha256_by_database_post_id),
+            "cache_key": SOURCE_POST_EMBEDDING_CACHE_KEY,
+        },
+    ).mappings()
+
+    cached: dict[str, list[float]] = {}
+    for row in rows:
+        database_post_id = str(row["database_post_id"])
+        text_sha256 = text_sha256_by_database_post_id.get(database_post_id)
+        if text_sha256 is None:
+            continue
+        embedding = _prefetched_public_source_post_embedding(
+            dict(row),
+            text_sha256=text_sha256,
+            embedding_model=embedding_model,
+        )
+        if not embedding:
+            cache_payload = _as_dict(row.get("legacy_cache"))
+            if (
+                cache_payload.get("model") == embedding_model
+                and cache_payload.get("text_sha256") == text_sha256
+            ):
+                embedding = _embedding_values(cache_payload.get("embedding"))
+        if embedding:
+            cached[database_post_id] = embedding
+    return cached
+
 
 def _persist_public_source_post_embedding_cache(
     conn: Connection,
@@ -259,28 +475,49 @@ def _persist_public_source_post_embedding_cache(
 ) -> None:
     columns = _table_columns(conn, "source_posts")
     metadata_column = columns.get("metadata")
-    if not metadata_column:
+    use_vector_column = (
+        _has_public_source_post_vector_contract(columns)
+        and len(embedding) == SOURCE_POST_EMBEDDING_VECTOR_DIMENSIONS
+    )
+    if not use_vector_column and not metadata_column:
         return
 
-    metadata_expression = """
-        (
-            COALESCE(metadata::jsonb, '{}'::jsonb)
-            || jsonb_build_object(
-                :cache_key,
-                jsonb_build_object(
-                    'model', :embedding_model,
-                    'text_sha256', :text_sha256,
-                    'embedding', CAST(:embedding AS jsonb),
-                    'dimensions', :dimensions,
-                    'cached_at', CAST(:cached_at AS timestamptz)
+    assignments: list[str] = []
+    if use_vector_column:
+        assignments.extend(
+            [
+                "matching_embedding = :embedding",
+                "matching_embedding_model = :embedding_model",
+                "matching_embedding_text_sha256 = :text_sha256",
+            ]
+        )
+        if metadata_column:
+            # The typed column is now authoritative; drop any JSON copy so
+            # metadata reads stop carrying the full vector.
+            metadata_expression = "(COALESCE(metadata::jsonb, '{}'::jsonb) - :cache_key)"
+            if metadata_column["data_type"] == "json" or metadata_column["udt_name"] == "json":
+                metadata_expression = f"({metadata_expression})::json"
+            assignments.append(f"metadata = {metadata_expression}")
+    else:
+        metadata_expression = """
+            (
+                COALESCE(metadata::jsonb, '{}'::jsonb)
+                || jsonb_build_object(
+                    :cache_key,
+                    jsonb_build_object(
+                        'model', :embedding_model,
+                        'text_sha256', :text_sha256,
+                        'embedding', CAST(:embedding AS jsonb),
+                        'dimensions', :dimensions,
+                        'cached_at', CAST(:cached_at AS timestamptz)
+                    )
                 )
             )
-        )
-    """
-    if metadata_column["data_type"] == "json" or metadata_column["udt_name"] == "json":
-        metadata_expression = f"({metadata_expression})::json"
+        """
+        if metadata_column["data_type"] == "json" or metadata_column["udt_name"] == "json":
+            metadata_expression = f"({metadata_expression})::json"
+        assignments.append(f"metadata = {metadata_expression}")
 
-    assignments = [f"metadata = {metadata_expression}"]
     if "embedding_status" in columns:
         assignments.append("embedding_status = 'completed'")
     if "updated_at" in columns:
@@ -307,6 +544,141 @@ def _persist_public_source_post_embedding_cache(
     )
 
 
+def _persist_public_source_post_embedding_caches(
+    conn: Connection,
+    *,
+    entries: Sequence[tuple[str, str, str, list[float]]],
+) -> None:
+    """Write ``(database_post_id, text_sha256, model, embedding)`` rows at once.
+
+    A single ``UPDATE ... FROM (VALUES ...)`` replaces one transaction per
+    embedding.  Storage follows :func:`_persist_public_source_post_embedding_cache`:
+    1536-value embeddings use the typed vector column when it exists and
+    everything else uses the JSON metadata cache.
+    """
+    latest_by_database_post_id = {entry[0]: entry for entry in entries}
+    if not latest_by_database_post_id:
+        return
+
+    columns = _table_columns(conn, "source_posts")
+    metadata_column = columns.get("metadata")
+    has_vector_contract = _has_public_source_post_vector_contract(columns)
+    vector_entries = [
+        entry
+        for entry in latest_by_database_post_id.values()
+        if has_vector_contract
+        and len(entry[3]) == SOURCE_POST_EMBEDDING_VECTOR_DIMENSIONS
+    ]
+    vector_database_post_ids = {entry[0] for entry in vector_entries}
+    json_entries = [
+        entry
+        for entry in latest_by_database_post_id.values()
+        if entry[0] not in vector_database_post_ids
+    ]
+    if not metadata_column:
+        json_entries = []
+    metadata_is_json = bool(metadata_column) and (
+        metadata_column["data_type"] == "json" or metadata_column["udt_name"] == "json"
+    )
+
+    status_assignments: list[str] = []
+    if "embedding_status" in columns:
+        status_assignments.append("embedding_status = 'completed'")
+    if "updated_at" in columns:
+        status_assignments.append("updated_at = CAST(:cached_at AS timestamptz)")
+    cached_at = datetime.now(timezone.utc).isoformat()
+
+    if vector_entries:
+        vector_column = columns["matching_embedding"]
+        vector_type = (
+            f'"{vector_column["udt_schema"]}"."{vector_column["udt_name"]}"'
+            if vector_column.get("udt_schema")
+            else vector_column["udt_name"]
+        )
+        assignments = [
+            f"matching_embedding = CAST(cache.embedding AS {vector_type})",
+            "matching_embedding_model = cache.embedding_model",
+            "matching_embedding_text_sha256 = cache.text_sha256",
+        ]
+        if metadata_column:
+            metadata_expression = "(COALESCE(post.metadata::jsonb, '{}'::jsonb) - :cache_key)"
+            if metadata_is_json:
+                metadata_expression = f"({metadata_expression})::json"
+            assignments.append(f"metadata = {metadata_expression}")
+        _update_public_source_post_embedding_rows(
+            conn,
+            entries=vector_entries,
+            assignments=[*assignments, *status_assignments],
+            cached_at=cached_at,
+        )
+
+    if json_entries:
+        metadata_expression = """
+            (
+                COALESCE(post.metadata::jsonb, '{}'::jsonb)
+                || jsonb_build_object(
+                    :cache_key,
+                    jsonb_build_object(
+                        'model', cache.embedding_model,
+                        'text_sha256', cache.text_sha256,
+                        'embedding', CAST(cache.embedding AS jsonb),
+                        'dimensions', cache.dimensions,
+                        'cached_at', CAST(:cached_at AS timestamptz)
+                    )
+                )
+            )
+        """
+        if metadata_is_json:
+            metadata_expression = f"({metadata_expression})::json"
+        _update_public_source_post_embedding_rows(
+            conn,
+            entries=json_entries,
+            assignments=[f"metadata = {metadata_expression}", *status_assignments],
+            cached_at=cached_at,
+        )
+
+
+def _update_public_source_post_embedding_rows(
+    conn: Connection,
+    *,
+    entries: Sequence[tuple[str, str, str, list[float]]],
+    assignments: Sequence[str],
+    cached_at: str,
+) -> None:
+    values_sql: list[str] = []
+    params: dict[str, Any] = {
+        "cache_key": SOURCE_POST_EMBEDDING_CACHE_KEY,
+        "cached_at": cached_at,
+    }
+    for index, (database_post_id, text_sha256, embedding_model, embedding) in enumerate(
+        entries
+    ):
+        values_sql.append(
+            f"(CAST(:database_post_id_{index} AS uuid), :text_sha256_{index}, "
+            f":embedding_model_{index}, :embedding_{index}, "
+            f"CAST(:dimensions_{index} AS integer))"
+        )
+        params[f"database_post_id_{index}"] = database_post_id
+        params[f"text_sha256_{index}"] = text_sha256
+        params[f"embedding_model_{index}"] = embedding_model
+        params[f"embedding_{index}"] = json.dumps(embedding, separators=(",", ":"))
+        params[f"dimensions_{index}"] = len(embedding)
+
+    conn.execute(
+        text(
+            f"""
+            UPDATE public.source_posts AS post
+               SET {", ".join(assignments)}
+              FROM (
+                    VALUES {", ".join(values_sql)}
+                   ) AS cache(database_post_id, text_sha256, embedding_model, embedding, dimensions)
+             WHERE post.id = cache.database_post_id
+               AND post.tenant_id IS NULL
+            """
+        ),
+        params,
+    )
+
 
 def _mark_public_source_post_embedding_failed(
     conn: Connection,
@@ -335,10 +707,40 @@ def _mark_public_source_post_embedding_failed(
         params,
     )
 
+
+def _mark_public_source_post_embeddings_failed(
+    conn: Connection,
+    *,
+    database_post_ids: Sequence[str],
+) -> None:
+    """Set-based :func:`_mark_public_source_post_embedding_failed`."""
+    columns = _table_columns(conn, "source_posts")
+    if "embedding_status" not in columns or not database_post_ids:
+        return
+
+    assignments = ["embedding_status = 'failed'"]
+    params: dict[str, Any] = {"database_post_ids": list(database_post_ids)}
+    if "updated_at" in columns:
+        assignments.append("updated_at = CAST(:updated_at AS timestamptz)")
+        params["updated_at"] = datetime.now(timezone.utc).isoformat()
+
+    conn.execute(
+        text(
+            f"""
+            UPDATE public.source_posts
+               SET {", ".join(assignments)}
+             WHERE id = ANY(CAST(:database_post_ids AS uuid[]))
+               AND tenant_id IS NULL
+            """
+        ),
+        params,
+    )
+
 # Cross-module helper imports for static analysis and direct module use.
 from .legacy_fetch import _table_columns
 from .models import (
     SOURCE_POST_EMBEDDING_CACHE_KEY,
+    SOURCE_POST_EMBEDDING_VECTOR_DIMENSIONS,
     SocialPost,
     _embedding_values,
     logger,
@@ -136,11 +136,57 @@ def _upsert_public_source_post_payloads(
     client: Any,
     payloads: list[dict[str, Any]],
 ) -> Any:
+    from api.services.schema_cache import invalidate_table_columns
+    from api.services.social.data_governance import source_posts_partitioned
+
+    try:
+        partitioned = source_posts_partitioned()
+    except RuntimeError:
+        # Supabase-only deployments have no direct database URL; PostgREST
+        # reports a mismatched conflict target below instead.
+        partitioned = False
+    try:
+        return _upsert_public_source_post_payloads_for_layout(
+            client,
+            payloads,
+            partitioned=partitioned,
+        )
+    except Exception as error:
+        # 42P10: no unique index matches the ON CONFLICT target, i.e. the
+        # layout differs from the cached one. Retry with the other layout.
+        if getattr(error, "code", None) != "42P10":
+            raise
+        invalidate_table_columns("source_posts")
+        logger.warning(
+            "public_source_posts_layout_changed partitioned=%s error_code=%s",
+            not partitioned,
+            error.code,
+        )
+        return _upsert_public_source_post_payloads_for_layout(
+            client,
+            payloads,
+            partitioned=not partitioned,
+        )
+
+
+
+def _upsert_public_source_post_payloads_for_layout(
+    client: Any,
+    payloads: list[dict[str, Any]],
+    *,
+    partitioned: bool,
+) -> Any:
+    # Unique keys of the time-partitioned layout must include posted_at.
+    on_conflict = (
+        "source,source_post_id,posted_at"
+        if partitioned
+        else "source,source_post_id"
+    )
     return (
         client.table("source_posts")
         .upsert(
             payloads,
-            on_conflict="source,source_post_id",
+            on_conflict=on_conflict,
             ignore_duplicates=True,
         )
         .execute()
@@ -19,7 +19,12 @@ from urllib.parse import quote
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
 
-from api.services.cost_controls import TenantQuotaGuard, env_float, env_int
+from api.services.cost_controls import (
+    TenantQuotaGuard,
+    env_float,
+    env_int,
+    shared_redis_client,
+)
 from api.services.client_lifecycle import managed_network_client
 from api.services.embeddings import (
     EmbeddingService,
@@ -493,21 +498,10 @@ def claim_additional_public_source_query(
         since_hours_ago=since_hours_ago,
         scope=scope,
     )
-    client: Any | None = None
     try:
-        import redis
-
-        client = redis.Redis.from_url(
-            redis_url,
-            decode_responses=True,
-            max_connections=max(
-                1,
-                env_int("ARCLI_PUBLIC_SOURCE_QUERY_CACHE_REDIS_MAX_CONNECTIONS", 2),
-            ),
-            socket_connect_timeout=2,
-            socket_timeout=2,
-            health_check_interval=30,
-        )
+        client = shared_redis_client.get()
+        if client is None:
+            return True
         claimed = bool(client.set(cache_key, "1", nx=True, ex=ttl_seconds))
         if not claimed:
             logger.info(
@@ -526,20 +520,6 @@ def claim_additional_public_source_query(
             exc.__class__.__name__,
         )
         return True
-    finally:
-        close = getattr(client, "close", None)
-        if callable(close):
-            try:
-                close()
-            except Exception:
-                pass
-        pool = getattr(client, "connection_pool", None)
-        disconnect = getattr(pool, "disconnect", None)
-        if callable(disconnect):
-            try:
-                disconnect()
-            except Exception:
-                pass
 
 
 
@@ -566,21 +546,10 @@ def release_additional_public_source_query(
         since_hours_ago=since_hours_ago,
         scope=scope,
     )
-    client: Any | None = None
     try:
-        import redis
-
-        client = redis.Redis.from_url(
-            redis_url,
-            decode_responses=True,
-            max_connections=max(
-                1,
-                env_int("ARCLI_PUBLIC_SOURCE_QUERY_CACHE_REDIS_MAX_CONNECTIONS", 2),
-            ),
-            socket_connect_timeout=2,
-            socket_timeout=2,
-            health_check_interval=30,
-        )
+        client = shared_redis_client.get()
+        if client is None:
+            return
         client.delete(cache_key)
     except Exception as exc:
         logger.warning(
@@ -588,20 +557,6 @@ def release_additional_public_source_query(
             source,
             exc.__class__.__name__,
         )
-    finally:
-        close = getattr(client, "close", None)
-        if callable(close):
-            try:
-                close()
-            except Exception:
-                pass
-        pool = getattr(client, "connection_pool", None)
-        disconnect = getattr(pool, "disconnect", None)
-        if callable(disconnect):
-            try:
-                disconnect()
-            except Exception:
-                pass
 
 
 
@@ -0,0 +1,144 @@
+"""One compiled scan for the spam and boilerplate phrases used across Arcli.
+
+Matching, the public-source connectors and the website crawler each keep
+their own phrase list and their own comparison rule: the matching prefilter
+and boilerplate stripping look for plain substrings, while the connectors use
+whole-word patterns that allow any whitespace between words.  All phrases
+share one prefix-factored regex built at import, so a multi-KB post or page
+is scanned once no matter how many lists apply, and each hit is checked
+against the rule of every list that contains it.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+SIGNAL_OBVIOUS_SPAM = "obvious_spam"
+SIGNAL_HACKERNEWS_SPAM = "hackernews_spam"
+SIGNAL_X_SPAM = "x_spam"
+SIGNAL_PUBLIC_SOURCE_SPAM = "public_source_spam"
+SIGNAL_BOILERPLATE = "boilerplate"
+
+OBVIOUS_SPAM_MARKERS = (
+    "limited offer",
+    "buy followers",
+    "verified emails",
+    "crypto giveaway",
+    "guaranteed leads",
+)
+HACKERNEWS_SPAM_TERMS = ("buy now", "casino", "crypto giveaway", "viagra")
+X_SPAM_TERMS = ("airdrop", "casino", "crypto giveaway", "free followers", "viagra")
+PUBLIC_SOURCE_SPAM_TERMS = ("buy now", "casino", "crypto giveaway", "free followers", "viagra")
+BOILERPLATE_PHRASES = (
+    "skip to content",
+    "accept cookies",
+    "cookie settings",
+    "privacy policy",
+    "terms of service",
+    "terms & conditions",
+    "all rights reserved",
+    "copyright",
+    "sign in",
+    "log in",
+    "login",
+    "menu",
+    "navigation",
+)
+
+# signal -> (phrases, whole_word).  Whole-word phrases match like
+# ``\bbuy\s+now\b``; the others match like ``"buy now" in text.lower()``.
+_SIGNAL_PHRASES: dict[str, tuple[tuple[str, ...], bool]] = {
+    SIGNAL_OBVIOUS_SPAM: (OBVIOUS_SPAM_MARKERS, False),
+    SIGNAL_HACKERNEWS_SPAM: (HACKERNEWS_SPAM_TERMS, True),
+    SIGNAL_X_SPAM: (X_SPAM_TERMS, True),
+    SIGNAL_PUBLIC_SOURCE_SPAM: (PUBLIC_SOURCE_SPAM_TERMS, True),
+    SIGNAL_BOILERPLATE: (BOILERPLATE_PHRASES, False),
+}
+
+
+@dataclass(frozen=True)
+class _PhraseRule:
+    signal: str
+    whole_word: bool
+
+
+def _phrase_trie_pattern(phrases: list[str]) -> str:
+    """Factor shared prefixes so the engine tests each offset once per branch."""
+    trie: dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for character in phrase:
+            node = node.setdefault(character, {})
+        node[""] = {}
+
+    def expression(node: dict[str, dict]) -> str:
+        branches = [
+            (r"\s+" if character == " " else re.escape(character)) + expression(child)
+            for character, child in sorted(node.items())
+            if character
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return expression(trie)
+
+
+def _build_matcher() -> tuple[re.Pattern[str], dict[str, tuple[_PhraseRule, ...]]]:
+    rules_by_phrase: dict[str, list[_PhraseRule]] = {}
+    for signal, (phrases, whole_word) in _SIGNAL_PHRASES.items():
+        for phrase in phrases:
+            rules_by_phrase.setdefault(phrase, []).append(_PhraseRule(signal, whole_word))
+    # A phrase that prefixes another would be hidden by the greedy trie.
+    for phrase in rules_by_phrase:
+        for other in rules_by_phrase:
+            if other != phrase and other.startswith(phrase):
+                raise ValueError(f"text signal phrase {phrase!r} prefixes {other!r}")
+    pattern = re.compile(_phrase_trie_pattern(sorted(rules_by_phrase)))
+    return pattern, {phrase: tuple(rules) for phrase, rules in rules_by_phrase.items()}
+
+
+_PATTERN, _RULES_BY_PHRASE = _build_matcher()
+
+
+def _is_word_character(character: str) -> bool:
+    return character.isalnum() or character == "_"
+
+
+def _scan(text: str, wanted: str | None = None) -> frozenset[str]:
+    # Lowercasing once is far cheaper than a case-insensitive alternation.
+    lowered = text.lower()
+    found: set[str] = set()
+    match = _PATTERN.search(lowered)
+    while match is not None:
+        start, end = match.span()
+        matched = match.group()
+        phrase = " ".join(matched.split())
+        for rule in _RULES_BY_PHRASE.get(phrase, ()):
+            if rule.signal in found:
+                continue
+            if rule.whole_word:
+                if (start and _is_word_character(lowered[start - 1])) or (
+                    end < len(lowered) and _is_word_character(lowered[end])
+                ):
+                    continue
+            elif matched != phrase:
+                continue
+            found.add(rule.signal)
+            if rule.signal == wanted:
+                return frozenset(found)
+        # Resume inside the hit so overlapping phrases are still reported.
+        match = _PATTERN.search(lowered, start + 1)
+    return frozenset(found)
+
+
+def text_signals(text: str) -> frozenset[str]:
+    """Every ``SIGNAL_*`` whose phrase list occurs in ``text``, in one pass."""
+    return _scan(text)
+
+
+def has_text_signal(text: str, signal: str) -> bool:
+    """Whether ``signal`` occurs in ``text``; stops at its first hit."""
+    return signal in _scan(text, signal)
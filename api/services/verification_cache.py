@@ -0,0 +1,233 @@
+"""Content-addressed cache of LLM verifier verdicts.
+
+A verdict is determined by the candidate's matching text, the Service Profile
+it is judged against, the verifier model and the verifier policy version.  The
+per-row caches in ``lead_matches`` and ``watchlist_matches`` only help when the
+same row is verified again; this cache also serves a re-posted or cross-posted
+item with identical text, and a Watchlist whose profile content equals its
+base Service Profile.
+
+Keys contain only hashes, and the shared values hold no post text: the
+verifier stores its verbatim fields (``evidence_excerpt``, ``urgency_reason``
+and ``competitor_mention``) as character spans into the hashed text and
+rebuilds them from the candidate on a hit.  A post removed on request is no
+longer ingested, so nothing can resolve its spans again.  The verifier's own
+``pain_detected`` and ``suggested_reply`` prose remains, so Redis entries
+never outlive the public-data retention window, whatever the configured TTL.
+The in-process LRU is consulted first, then Redis when ``REDIS_URL`` is
+configured.  Redis failures are logged, open a short cooldown, and are
+treated as misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+from api.services.cost_controls import (
+    env_int,
+    shared_redis_client,
+)
+from api.services.data_retention import public_data_retention_days
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERIFICATION_CACHE_MAX_ENTRIES = 2_048
+DEFAULT_VERIFICATION_CACHE_REDIS_TTL_SECONDS = 7 * 86_400
+VERIFICATION_CACHE_REDIS_PREFIX = "arcli:verification_cache:v2"
+
+_FAILURE_COOLDOWN_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class VerificationCacheKey:
+    text_sha256: str
+    profile_sha256: str
+    model: str
+    policy_version: str
+
+    def redis_key(self) -> str:
+        return ":".join(
+            (
+                VERIFICATION_CACHE_REDIS_PREFIX,
+                self.policy_version,
+                self.model,
+                self.profile_sha256,
+                self.text_sha256,
+            )
+        )
+
+
+@dataclass(frozen=True)
+class VerificationCacheStats:
+    memory_hits: int
+    redis_hits: int
+    misses: int
+    entries: int
+
+
+def canonical_sha256(payload: Any) -> str:
+    """Hash JSON-compatible data independently of key order."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def verification_cache_redis_ttl_seconds() -> int:
+    """Configured Redis TTL, capped at the public-data retention window."""
+    configured = env_int(
+        "ARCLI_VERIFICATION_CACHE_REDIS_TTL_SECONDS",
+        DEFAULT_VERIFICATION_CACHE_REDIS_TTL_SECONDS,
+    )
+    return min(configured, public_data_retention_days() * 86_400)
+
+
+def _cache_enabled() -> bool:
+    value = os.getenv("ARCLI_VERIFICATION_CACHE_ENABLED", "true").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+class VerificationResultCache:
+    """Two-tier ``VerificationCacheKey -> verdict JSON`` cache."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        redis_client: Any | None = None,
+        use_redis: bool = True,
+    ) -> None:
+        self._max_entries = max_entries
+        self._redis_client = redis_client
+        self._use_redis = use_redis
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[VerificationCacheKey, str] = OrderedDict()
+        self._redis_unavailable_until = 0.0
+        self._memory_hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+
+    def _resolved_max_entries(self) -> int:
+        if self._max_entries is not None:
+            return max(0, self._max_entries)
+        return env_int(
+            "ARCLI_VERIFICATION_CACHE_MAX_ENTRIES",
+            DEFAULT_VERIFICATION_CACHE_MAX_ENTRIES,
+        )
+
+    def get_many(self, keys: Sequence[VerificationCacheKey]) -> dict[VerificationCacheKey, str]:
+        wanted = list(dict.fromkeys(keys))
+        if not wanted or not _cache_enabled():
+            return {}
+
+        found: dict[VerificationCacheKey, str] = {}
+        with self._lock:
+            for key in wanted:
+                cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = cached
+            self._memory_hits += len(found)
+
+        missing = [key for key in wanted if key not in found]
+        redis_found = self._redis_get_many(missing) if missing else {}
+        if redis_found:
+            found.update(redis_found)
+            self._remember(redis_found)
+
+        with self._lock:
+            self._redis_hits += len(redis_found)
+            self._misses += len(wanted) - len(found)
+        return found
+
+    def put_many(self, payloads: Mapping[VerificationCacheKey, str]) -> None:
+        if not payloads or not _cache_enabled():
+            return
+        self._remember(payloads)
+        self._redis_put_many(payloads)
+
+    def invalidate(self) -> None:
+        """Forget the in-process tier; Redis entries expire on their own."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> VerificationCacheStats:
+        with self._lock:
+            return VerificationCacheStats(
+                memory_hits=self._memory_hits,
+                redis_hits=self._redis_hits,
+                misses=self._misses,
+                entries=len(self._entries),
+            )
+
+    def _remember(self, payloads: Mapping[VerificationCacheKey, str]) -> None:
+        max_entries = self._resolved_max_entries()
+        if max_entries <= 0:
+            return
+        with self._lock:
+            for key, payload in payloads.items():
+                self._entries[key] = payload
+                self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def _redis_tier_client(self) -> Any | None:
+        if not self._use_redis:
+            return None
+        with self._lock:
+            if time.monotonic() < self._redis_unavailable_until:
+                return None
+        if self._redis_client is not None:
+            return self._redis_client
+        return shared_redis_client.get()
+
+    def _record_redis_failure(self, operation: str, error: Exception) -> None:
+        with self._lock:
+            self._redis_unavailable_until = time.monotonic() + _FAILURE_COOLDOWN_SECONDS
+        logger.warning(
+            "verification_cache_redis_skipped operation=%s error_type=%s retry_after_seconds=%s",
+            operation,
+            type(error).__name__,
+            int(_FAILURE_COOLDOWN_SECONDS),
+        )
+
+    def _redis_get_many(
+        self,
+        keys: list[VerificationCacheKey],
+    ) -> dict[VerificationCacheKey, str]:
+        client = self._redis_tier_client()
+        if client is None:
+            return {}
+        try:
+            values = client.mget([key.redis_key() for key in keys])
+        except Exception as exc:
+            self._record_redis_failure("read", exc)
+            return {}
+        return {
+            key: str(value)
+            for key, value in zip(keys, values or ())
+            if value
+        }
+
+    def _redis_put_many(self, payloads: Mapping[VerificationCacheKey, str]) -> None:
+        client = self._redis_tier_client()
+        if client is None:
+            return
+        ttl_seconds = verification_cache_redis_ttl_seconds()
+        try:
+            pipeline = client.pipeline(transaction=False)
+            for key, payload in payloads.items():
+                pipeline.set(key.redis_key(), payload, ex=ttl_seconds)
+            pipeline.execute()
+        except Exception as exc:
+            self._record_redis_failure("write", exc)
+
+
+# One cache per process; Redis shares verdicts across workers.
+verification_result_cache = VerificationResultCache()
@@ -1,9 +1,11 @@
+import hashlib
+import json
 import logging
 import os
 import re
-from typing import Any, Literal
+from typing import Any, Literal, Mapping, Sequence
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 from tenacity import (
     RetryCallState,
     retry,
@@ -13,12 +15,20 @@ from tenacity import (
 )
 
 from api.services.cost_controls import (
+    QuotaReservation,
     TenantQuotaGuard,
+    UsageDecision,
     env_float,
     env_int,
     provider_rate_limiter,
 )
 from api.services.openai_lifecycle import OpenAIClientOwner
+from api.services.verification_cache import (
+    VerificationCacheKey,
+    VerificationResultCache,
+    canonical_sha256,
+    verification_result_cache,
+)
 from api.services.matching import (
     DEFAULT_SIMILARITY_THRESHOLD,
     REJECTION_INSUFFICIENT_SIMILARITY,
@@ -46,6 +56,8 @@ MetadataValue = str | int | float | bool
 VERIFIER_QUOTA_COUNTER = "llm_verifier"
 VERIFIER_QUOTA_DEFAULT_LIMIT = 1_000
 VERIFIER_QUOTA_DEFAULT_WINDOW_SECONDS = 86_400
+DEFAULT_VERIFIER_BATCH_SIZE = 8
+MAX_VERIFIER_BATCH_SIZE = 20
 # Persist this alongside a verdict. Bump it only when verifier instructions
 # materially change lead eligibility, so cached decisions cannot survive a
 # policy change while preserving normal tenant-scoped cache reuse.
@@ -54,6 +66,8 @@ VERIFIER_POLICY_VERSION = "buyer_outcome_v6_leads_and_potential_buyers"
 # verifier itself is the precision gate; a higher hidden default would make
 # the recall-oriented matching threshold ineffective.
 DEFAULT_VERIFIER_SIMILARITY_THRESHOLD = DEFAULT_SIMILARITY_THRESHOLD
+# Verdict fields quoted from the post; the shared cache stores spans instead.
+_VERBATIM_VERDICT_FIELDS = ("evidence_excerpt", "urgency_reason", "competitor_mention")
 
 
 class ServiceProfile(BaseModel):
@@ -133,6 +147,22 @@ class VerificationResult(BaseModel):
     verifier_executed: bool = Field(default=True)
 
 
+class BatchCandidateVerification(VerificationResult):
+    """One verdict inside a batched verifier response."""
+
+    candidate_id: str = Field(min_length=1)
+
+
+class BatchVerificationResult(BaseModel):
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    results: list[BatchCandidateVerification]
+
+
+class VerifierBatchSchemaError(RuntimeError):
+    """A batched verifier response could not be mapped to its candidates."""
+
+
 def _is_retryable_openai_error(exception: BaseException) -> bool:
     status_code = getattr(exception, "status_code", None)
     if status_code in {408, 409, 429, 500, 502, 503, 504}:
@@ -211,6 +241,16 @@ class VerifierService(OpenAIClientOwner):
         "or a mass-outreach tone."
     )
 
+    BATCH_SYSTEM_PROMPT = (
+        SYSTEM_PROMPT
+        + " Several candidate posts may be provided together. Judge each one "
+        "independently against the Service Profile, exactly as if it were the "
+        "only candidate; never compare candidates or let one verdict influence "
+        "another. Return ONLY a JSON object with `results`: one entry per "
+        "candidate, each containing that candidate's `candidate_id` and all of "
+        "the fields above."
+    )
+
     def __init__(
         self,
         client: Any | None = None,
@@ -218,6 +258,7 @@ class VerifierService(OpenAIClientOwner):
         model: str | None = None,
         timeout_seconds: float = 45.0,
         quota_guard: TenantQuotaGuard | None = None,
+        verification_cache: VerificationResultCache | None = None,
     ) -> None:
         self.client = client
         self._owns_client = False
@@ -225,6 +266,7 @@ class VerifierService(OpenAIClientOwner):
         self.model = model or os.getenv("OPENAI_VERIFIER_MODEL", "gpt-5.4-nano")
         self.timeout_seconds = timeout_seconds
         self.quota_guard = quota_guard or TenantQuotaGuard()
+        self.verification_cache = verification_cache or verification_result_cache
 
     def verify(
         self,
@@ -235,11 +277,263 @@ class VerifierService(OpenAIClientOwner):
         service_profile_id: str | None = None,
         enforce_similarity_gate: bool = True,
     ) -> VerificationResult:
+        resolved_tenant_id, resolved_service_profile_id = self._resolved_scope(
+            candidate_post,
+            tenant_id=tenant_id,
+            service_profile_id=service_profile_id,
+        )
+        skipped = self._similarity_skip(
+            candidate_post,
+            tenant_id=resolved_tenant_id,
+            service_profile_id=resolved_service_profile_id,
+            enforce_similarity_gate=enforce_similarity_gate,
+        )
+        if skipped is not None:
+            return skipped
+
+        cache_key = self._verification_cache_key(candidate_post, service_profile)
+        cached = self._cached_verifications({cache_key: candidate_post.text}).get(cache_key)
+        if cached is not None:
+            logger.debug(
+                "verification_cache_hit tenant_id=%s service_profile_id=%s source_post_id=%s model=%s",
+                resolved_tenant_id,
+                resolved_service_profile_id,
+                candidate_post.post_id,
+                self.model,
+            )
+            return self._finalize_result(
+                cached,
+                candidate_post,
+                tenant_id=resolved_tenant_id,
+                service_profile_id=resolved_service_profile_id,
+            )
+
+        skipped = self._quota_skip(
+            candidate_post,
+            tenant_id=resolved_tenant_id,
+            service_profile_id=resolved_service_profile_id,
+        )
+        if skipped is not None:
+            return skipped
+
+        return self._verify_single(
+            candidate_post,
+            service_profile,
+            tenant_id=resolved_tenant_id,
+            service_profile_id=resolved_service_profile_id,
+            cache_key=cache_key,
+        )
+
+    def verify_many(
+        self,
+        candidate_posts: Sequence[CandidatePost],
+        service_profile: ServiceProfile,
+        *,
+        tenant_id: str | None = None,
+        service_profile_id: str | None = None,
+        enforce_similarity_gate: bool = True,
+    ) -> list[VerificationResult]:
+        """Verify several posts against one profile with batched LLM calls.
+
+        Every candidate passes the same similarity gate, verification cache
+        and per-candidate tenant quota as :meth:`verify`; the quota for all
+        uncached candidates is reserved in one ``reserve_many`` call and
+        refunded for any candidate a failed request never verified.  The
+        remaining candidates are then sent up to ``ARCLI_VERIFIER_BATCH_SIZE``
+        per structured-output request.  A batch whose response cannot be
+        mapped back to its candidates is verified again one candidate at a
+        time, without charging quota twice.  Results keep the input order.
+        """
+        results: list[VerificationResult | None] = [None] * len(candidate_posts)
+        scopes = [
+            self._resolved_scope(
+                candidate_post,
+                tenant_id=tenant_id,
+                service_profile_id=service_profile_id,
+            )
+            for candidate_post in candidate_posts
+        ]
+        gated: list[int] = []
+        for index, candidate_post in enumerate(candidate_posts):
+            skipped = self._similarity_skip(
+                candidate_post,
+                tenant_id=scopes[index][0],
+                service_profile_id=scopes[index][1],
+                enforce_similarity_gate=enforce_similarity_gate,
+            )
+            if skipped is not None:
+                results[index] = skipped
+            else:
+                gated.append(index)
+
+        cache_keys = {
+            index: self._verification_cache_key(candidate_posts[index], service_profile)
+            for index in gated
+        }
+        cached = self._cached_verifications(
+            {cache_keys[index]: candidate_posts[index].text for index in gated}
+        )
+        uncached: list[tuple[int, str, str]] = []
+        for index in gated:
+            resolved_tenant_id, resolved_service_profile_id = scopes[index]
+            cached_result = cached.get(cache_keys[index])
+            if cached_result is not None:
+                results[index] = self._finalize_result(
+                    cached_result,
+                    candidate_posts[index],
+                    tenant_id=resolved_tenant_id,
+                    service_profile_id=resolved_service_profile_id,
+                )
+            else:
+                uncached.append((index, resolved_tenant_id, resolved_service_profile_id))
+
+        pending, reservations = self._reserve_verifications(candidate_posts, uncached, results)
+        try:
+            self._verify_pending(
+                candidate_posts,
+                service_profile,
+                pending,
+                results,
+                cache_keys,
+            )
+        except Exception:
+            unverified: dict[str, int] = {}
+            for index, resolved_tenant_id, _ in pending:
+                if results[index] is None:
+                    unverified[resolved_tenant_id] = unverified.get(resolved_tenant_id, 0) + 1
+            for resolved_tenant_id, units in unverified.items():
+                self.quota_guard.refund(reservations[resolved_tenant_id], units)
+            raise
+
+        return [result for result in results if result is not None]
+
+    def _reserve_verifications(
+        self,
+        candidate_posts: Sequence[CandidatePost],
+        uncached: list[tuple[int, str, str]],
+        results: list[VerificationResult | None],
+    ) -> tuple[list[tuple[int, str, str]], dict[str, QuotaReservation]]:
+        """Charge every uncached candidate with one reservation per tenant.
+
+        Candidates are granted in input order, matching what one
+        ``check_and_increment`` per candidate allowed before.
+        """
+        by_tenant: dict[str, list[tuple[int, str, str]]] = {}
+        for entry in uncached:
+            by_tenant.setdefault(entry[1], []).append(entry)
+
+        granted_indexes: set[int] = set()
+        reservations: dict[str, QuotaReservation] = {}
+        for resolved_tenant_id, entries in by_tenant.items():
+            quota = self.quota_guard.reserve_many(
+                tenant_id=resolved_tenant_id,
+                counter_name=VERIFIER_QUOTA_COUNTER,
+                limit=env_int("ARCLI_AI_DAILY_VERIFIER_LIMIT", VERIFIER_QUOTA_DEFAULT_LIMIT),
+                window_seconds=env_int(
+                    "ARCLI_AI_DAILY_VERIFIER_WINDOW_SECONDS",
+                    VERIFIER_QUOTA_DEFAULT_WINDOW_SECONDS,
+                ),
+                units=len(entries),
+            )
+            reservations[resolved_tenant_id] = quota
+            for position, (index, _, resolved_service_profile_id) in enumerate(entries):
+                if position < quota.granted:
+                    granted_indexes.add(index)
+                else:
+                    results[index] = self._quota_rejection(
+                        candidate_posts[index],
+                        quota,
+                        service_profile_id=resolved_service_profile_id,
+                    )
+        pending = [entry for entry in uncached if entry[0] in granted_indexes]
+        return pending, reservations
+
+    def _verify_pending(
+        self,
+        candidate_posts: Sequence[CandidatePost],
+        service_profile: ServiceProfile,
+        pending: list[tuple[int, str, str]],
+        results: list[VerificationResult | None],
+        cache_keys: dict[int, VerificationCacheKey],
+    ) -> None:
+        batch_size = min(
+            MAX_VERIFIER_BATCH_SIZE,
+            env_int("ARCLI_VERIFIER_BATCH_SIZE", DEFAULT_VERIFIER_BATCH_SIZE),
+        )
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            batch_posts = [candidate_posts[index] for index, _, _ in batch]
+            _, batch_tenant_id, batch_service_profile_id = batch[0]
+            batch_results: list[VerificationResult] | None = None
+            if len(batch) > 1:
+                try:
+                    batch_results = self._verify_batch_with_openai(
+                        batch_posts,
+                        service_profile,
+                        tenant_id=batch_tenant_id,
+                        service_profile_id=batch_service_profile_id,
+                    )
+                except VerifierBatchSchemaError as exc:
+                    logger.warning(
+                        "llm_verifier_batch_fallback tenant_id=%s service_profile_id=%s candidates=%s model=%s error=%s",
+                        batch_tenant_id,
+                        batch_service_profile_id,
+                        len(batch),
+                        self.model,
+                        exc,
+                    )
+                except Exception as exc:
+                    logger.exception(
+                        "llm_verifier_batch_failed tenant_id=%s service_profile_id=%s candidates=%s model=%s error_type=%s error=%s",
+                        batch_tenant_id,
+                        batch_service_profile_id,
+                        len(batch),
+                        self.model,
+                        exc.__class__.__name__,
+                        exc,
+                    )
+                    raise
+
+            for position, (index, resolved_tenant_id, resolved_service_profile_id) in enumerate(
+                batch
+            ):
+                if batch_results is None:
+                    results[index] = self._verify_single(
+                        candidate_posts[index],
+                        service_profile,
+                        tenant_id=resolved_tenant_id,
+                        service_profile_id=resolved_service_profile_id,
+                        cache_key=cache_keys[index],
+                    )
+                else:
+                    self._remember_verification(
+                        cache_keys[index],
+                        batch_results[position],
+                        candidate_posts[index].text,
+                    )
+                    results[index] = self._finalize_result(
+                        batch_results[position],
+                        candidate_posts[index],
+                        tenant_id=resolved_tenant_id,
+                        service_profile_id=resolved_service_profile_id,
+                    )
+
+    @staticmethod
+    def _resolved_scope(
+        candidate_post: CandidatePost,
+        *,
+        tenant_id: str | None,
+        service_profile_id: str | None,
+    ) -> tuple[str, str]:
         resolved_tenant_id = tenant_id or str(candidate_post.metadata.get("tenant_id", "unknown"))
         resolved_service_profile_id = service_profile_id or str(
             candidate_post.metadata.get("service_profile_id", "unknown")
         )
-        threshold = env_float(
+        return resolved_tenant_id, resolved_service_profile_id
+
+    @staticmethod
+    def _similarity_threshold() -> float:
+        return env_float(
             "ARCLI_VERIFIER_MIN_SIMILARITY_THRESHOLD",
             env_float(
                 "ARCLI_MATCHING_SIMILARITY_THRESHOLD",
@@ -247,29 +541,48 @@ class VerifierService(OpenAIClientOwner):
             ),
         )
 
-        if enforce_similarity_gate and candidate_post.similarity_score < threshold:
-            result = VerificationResult(
-                match=False,
-                decision_label="not_a_match",
-                confidence=0.0,
-                pain_detected="",
-                why_this_matches="Rejected before LLM verification because similarity was below threshold.",
-                rejection_reason=REJECTION_INSUFFICIENT_SIMILARITY,
-                verifier_executed=False,
-            )
-            logger.info(
-                "llm_verifier_skipped tenant_id=%s service_profile_id=%s source_post_id=%s similarity_score=%.3f threshold=%.3f rejection_reason=%s",
-                resolved_tenant_id,
-                resolved_service_profile_id,
-                candidate_post.post_id,
-                candidate_post.similarity_score,
-                threshold,
-                result.rejection_reason,
-            )
-            return result
+    def _similarity_skip(
+        self,
+        candidate_post: CandidatePost,
+        *,
+        tenant_id: str,
+        service_profile_id: str,
+        enforce_similarity_gate: bool,
+    ) -> VerificationResult | None:
+        threshold = self._similarity_threshold()
+        if not enforce_similarity_gate or candidate_post.similarity_score >= threshold:
+            return None
 
+        result = VerificationResult(
+            match=False,
+            decision_label="not_a_match",
+            confidence=0.0,
+            pain_detected="",
+            why_this_matches="Rejected before LLM verification because similarity was below threshold.",
+            rejection_reason=REJECTION_INSUFFICIENT_SIMILARITY,
+            verifier_executed=False,
+        )
+        logger.info(
+            "llm_verifier_skipped tenant_id=%s service_profile_id=%s source_post_id=%s similarity_score=%.3f threshold=%.3f rejection_reason=%s",
+            tenant_id,
+            service_profile_id,
+            candidate_post.post_id,
+            candidate_post.similarity_score,
+            threshold,
+            result.rejection_reason,
+        )
+        return result
+
+    def _quota_skip(
+        self,
+        candidate_post: CandidatePost,
+        *,
+        tenant_id: str,
+        service_profile_id: str,
+    ) -> VerificationResult | None:
+        """Charge one verifier call, or return the quota rejection."""
         quota = self.quota_guard.check_and_increment(
-            tenant_id=resolved_tenant_id,
+            tenant_id=tenant_id,
             counter_name=VERIFIER_QUOTA_COUNTER,
             limit=env_int("ARCLI_AI_DAILY_VERIFIER_LIMIT", VERIFIER_QUOTA_DEFAULT_LIMIT),
             window_seconds=env_int(
@@ -277,41 +590,132 @@ class VerifierService(OpenAIClientOwner):
                 VERIFIER_QUOTA_DEFAULT_WINDOW_SECONDS,
             ),
         )
-        if not quota.allowed:
-            result = VerificationResult(
-                match=False,
-                decision_label="not_a_match",
-                confidence=0.0,
-                pain_detected="",
-                why_this_matches="Rejected before LLM verification because tenant quota was exceeded.",
-                rejection_reason=quota.rejection_reason,
-                verifier_executed=False,
-            )
-            logger.warning(
-                "llm_verifier_skipped tenant_id=%s service_profile_id=%s source_post_id=%s similarity_score=%.3f threshold=%.3f rejection_reason=%s current_count=%s limit=%s",
-                quota.tenant_id,
-                resolved_service_profile_id,
-                candidate_post.post_id,
-                candidate_post.similarity_score,
-                threshold,
-                result.rejection_reason,
-                quota.current_count,
-                quota.limit,
-            )
-            return result
+        if quota.allowed:
+            return None
+        return self._quota_rejection(candidate_post, quota, service_profile_id=service_profile_id)
+
+    def _quota_rejection(
+        self,
+        candidate_post: CandidatePost,
+        quota: UsageDecision | QuotaReservation,
+        *,
+        service_profile_id: str,
+    ) -> VerificationResult:
+        result = VerificationResult(
+            match=False,
+            decision_label="not_a_match",
+            confidence=0.0,
+            pain_detected="",
+            why_this_matches="Rejected before LLM verification because tenant quota was exceeded.",
+            rejection_reason=quota.rejection_reason,
+            verifier_executed=False,
+        )
+        logger.warning(
+            "llm_verifier_skipped tenant_id=%s service_profile_id=%s source_post_id=%s similarity_score=%.3f threshold=%.3f rejection_reason=%s current_count=%s limit=%s",
+            quota.tenant_id,
+            service_profile_id,
+            candidate_post.post_id,
+            candidate_post.similarity_score,
+            self._similarity_threshold(),
+            result.rejection_reason,
+            quota.current_count,
+            quota.limit,
+        )
+        return result
 
+    def _verification_cache_key(
+        self,
+        candidate_post: CandidatePost,
+        service_profile: ServiceProfile,
+    ) -> VerificationCacheKey:
+        return VerificationCacheKey(
+            text_sha256=hashlib.sha256(candidate_post.text.encode("utf-8")).hexdigest(),
+            profile_sha256=canonical_sha256(service_profile.model_dump(mode="json")),
+            model=self.model,
+            policy_version=VERIFIER_POLICY_VERSION,
+        )
+
+    def _cached_verifications(
+        self,
+        source_texts: Mapping[VerificationCacheKey, str],
+    ) -> dict[VerificationCacheKey, VerificationResult]:
+        cached: dict[VerificationCacheKey, VerificationResult] = {}
+        for key, payload in self.verification_cache.get_many(list(source_texts)).items():
+            try:
+                cached[key] = self._verdict_from_cache_payload(payload, source_texts[key])
+            except (ValidationError, ValueError, TypeError, KeyError):
+                logger.info("verification_cache_entry_ignored reason=%s", "invalid_payload")
+        return cached
+
+    def _remember_verification(
+        self,
+        key: VerificationCacheKey,
+        result: VerificationResult,
+        source_text: str,
+    ) -> None:
+        self.verification_cache.put_many(
+            {key: self._verdict_cache_payload(result, source_text)}
+        )
+
+    @classmethod
+    def _verdict_cache_payload(cls, result: VerificationResult, source_text: str) -> str:
+        """Serialize a verdict for the shared cache without any post text.
+
+        Verbatim fields become ``[start, end]`` spans into the normalized
+        source text; a field that cannot be located is dropped, as
+        :meth:`_sanitize_source_evidence` would drop it anyway.
+        """
+
+        normalized_source = cls._normalize_evidence(source_text)
+        verdict = result.model_dump(mode="json")
+        spans: dict[str, list[int]] = {}
+        for field_name in _VERBATIM_VERDICT_FIELDS:
+            excerpt = cls._normalize_evidence(verdict[field_name])
+            verdict[field_name] = ""
+            if not excerpt:
+                continue
+            start = normalized_source.find(excerpt)
+            if start < 0 and len(normalized_source.casefold()) == len(normalized_source):
+                start = normalized_source.casefold().find(excerpt.casefold())
+            if start >= 0:
+                spans[field_name] = [start, start + len(excerpt)]
+        return json.dumps(
+            {"verdict": verdict, "source_spans": spans},
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def _verdict_from_cache_payload(cls, payload: str, source_text: str) -> VerificationResult:
+        cached = json.loads(payload)
+        verdict = dict(cached["verdict"])
+        normalized_source = cls._normalize_evidence(source_text)
+        for field_name, (start, end) in cached.get("source_spans", {}).items():
+            if field_name in _VERBATIM_VERDICT_FIELDS:
+                verdict[field_name] = normalized_source[int(start) : int(end)]
+        return VerificationResult.model_validate(verdict)
+
+    def _verify_single(
+        self,
+        candidate_post: CandidatePost,
+        service_profile: ServiceProfile,
+        *,
+        tenant_id: str,
+        service_profile_id: str,
+        cache_key: VerificationCacheKey | None = None,
+    ) -> VerificationResult:
         try:
             result = self._verify_with_openai(
                 candidate_post,
                 service_profile,
-                tenant_id=resolved_tenant_id,
-                service_profile_id=resolved_service_profile_id,
+                tenant_id=tenant_id,
+                service_profile_id=service_profile_id,
             )
         except Exception as exc:
             logger.exception(
                 "llm_verifier_failed tenant_id=%s service_profile_id=%s source_post_id=%s model=%s similarity_score=%.3f error_type=%s error=%s",
-                resolved_tenant_id,
-                resolved_service_profile_id,
+                tenant_id,
+                service_profile_id,
                 candidate_post.post_id,
                 self.model,
                 candidate_post.similarity_score,
@@ -319,6 +723,23 @@ class VerifierService(OpenAIClientOwner):
                 exc,
             )
             raise
+        if cache_key is not None:
+            self._remember_verification(cache_key, result, candidate_post.text)
+        return self._finalize_result(
+            result,
+            candidate_post,
+            tenant_id=tenant_id,
+            service_profile_id=service_profile_id,
+        )
+
+    def _finalize_result(
+        self,
+        result: VerificationResult,
+        candidate_post: CandidatePost,
+        *,
+        tenant_id: str,
+        service_profile_id: str,
+    ) -> VerificationResult:
         if not result.match and not result.rejection_reason:
             result = result.model_copy(
                 update={"rejection_reason": f"llm_{result.decision_label}"}
@@ -328,8 +749,8 @@ class VerifierService(OpenAIClientOwner):
 
         logger.info(
             "candidate_verified tenant_id=%s service_profile_id=%s source_post_id=%s decision_label=%s match=%s confidence=%.3f similarity_score=%.3f rejection_reason=%s verifier_executed=%s",
-            resolved_tenant_id,
-            resolved_service_profile_id,
+            tenant_id,
+            service_profile_id,
             candidate_post.post_id,
             result.decision_label,
             result.match,
@@ -486,6 +907,89 @@ class VerifierService(OpenAIClientOwner):
         )
         raise RuntimeError("OpenAI verifier returned no structured parsed payload.")
 
+    @retry(
+        retry=retry_if_exception(_is_retryable_openai_error),
+        wait=wait_exponential_jitter(initial=1, max=20),
+        stop=stop_after_attempt(4),
+        before_sleep=_log_retry,
+        reraise=True,
+    )
+    def _verify_batch_with_openai(
+        self,
+        candidate_posts: Sequence[CandidatePost],
+        service_profile: ServiceProfile,
+        *,
+        tenant_id: str,
+        service_profile_id: str,
+    ) -> list[VerificationResult]:
+        """Return one raw verdict per candidate, in candidate order."""
+        client = self._get_client()
+        provider_rate_limiter.wait_for_slot(
+            provider="openai-chat",
+            limit=env_int("ARCLI_OPENAI_CHAT_REQUESTS_PER_MINUTE", 500),
+        )
+        try:
+            parse_completion = client.beta.chat.completions.parse
+        except AttributeError as exc:
+            raise RuntimeError(
+                "OpenAI client does not support structured verifier parsing."
+            ) from exc
+
+        completion = parse_completion(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": self.BATCH_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": self._build_batch_user_prompt(
+                        candidate_posts,
+                        service_profile,
+                    ),
+                },
+            ],
+            response_format=BatchVerificationResult,
+            temperature=0.0,
+            timeout=self.timeout_seconds,
+        )
+
+        message = completion.choices[0].message
+        refusal = getattr(message, "refusal", None)
+        if refusal:
+            raise VerifierBatchSchemaError(f"OpenAI refused batch verification: {refusal}")
+
+        parsed = getattr(message, "parsed", None)
+        try:
+            if not isinstance(parsed, BatchVerificationResult):
+                parsed = BatchVerificationResult.model_validate(parsed)
+        except ValidationError as exc:
+            raise VerifierBatchSchemaError(
+                "OpenAI batch verifier returned an invalid structured payload."
+            ) from exc
+
+        verdicts = {item.candidate_id: item for item in parsed.results}
+        expected_ids = [
+            self._batch_candidate_id(position) for position in range(len(candidate_posts))
+        ]
+        if len(parsed.results) != len(expected_ids) or set(verdicts) != set(expected_ids):
+            logger.error(
+                "openai_verifier_batch_mismatch tenant_id=%s service_profile_id=%s model=%s expected=%s returned=%s",
+                tenant_id,
+                service_profile_id,
+                self.model,
+                len(expected_ids),
+                len(parsed.results),
+            )
+            raise VerifierBatchSchemaError(
+                "OpenAI batch verifier did not return exactly one verdict per candidate."
+            )
+
+        return [
+            VerificationResult.model_validate(
+                verdicts[candidate_id].model_dump(exclude={"candidate_id"})
+            )
+            for candidate_id in expected_ids
+        ]
+
     def _build_client(self) -> Any:
         try:
             from openai import OpenAI
@@ -498,27 +1002,55 @@ class VerifierService(OpenAIClientOwner):
         kwargs = {"api_key": self.api_key} if self.api_key else {}
         return OpenAI(**kwargs)
 
+    USER_PROMPT_GUIDANCE = (
+        "Use a practical lead-quality standard. The similarity score is "
+        "only a cheap prefilter and must not be treated as proof of fit.\n\n"
+        "Read the matching brief's buyer-language fields before judging the "
+        "candidate. In particular, search_terms describe the buyer's desired "
+        "outcome, not required vendor vocabulary. Treat target audience, problem "
+        "solved, pain points, triggers, urgency, search terms, and exclusions as "
+        "weighted relevance signals, not a checklist. A candidate may be an adjacent "
+        "buyer if it shows one credible problem, investigation, workflow frustration, "
+        "or request the service could plausibly address. Prefer a cautious `weak_match` "
+        "when the post has one real, relevant buyer situation. Do not require an exact target "
+        "audience, every profile field, company size, budget, or explicit intent to buy; "
+        "reserve rejection for no plausible fit, clear bad-fit content, spam, or generic "
+        "educational content without a buyer situation.\n\n"
+    )
+
     def _build_user_prompt(
         self,
         candidate_post: CandidatePost,
         service_profile: ServiceProfile,
     ) -> str:
         return (
-            "Use a practical lead-quality standard. The similarity score is "
-            "only a cheap prefilter and must not be treated as proof of fit.\n\n"
-            "Read the matching brief's buyer-language fields before judging the "
-            "candidate. In particular, search_terms describe the buyer's desired "
-            "outcome, not required vendor vocabulary. Treat target audience, problem "
-            "solved, pain points, triggers, urgency, search terms, and exclusions as "
-            "weighted relevance signals, not a checklist. A candidate may be an adjacent "
-            "buyer if it shows one credible problem, investigation, workflow frustration, "
-            "or request the service could plausibly address. Prefer a cautious `weak_match` "
-            "when the post has one real, relevant buyer situation. Do not require an exact target "
-            "audience, every profile field, company size, budget, or explicit intent to buy; "
-            "reserve rejection for no plausible fit, clear bad-fit content, spam, or generic "
-            "educational content without a buyer situation.\n\n"
+            f"{self.USER_PROMPT_GUIDANCE}"
             "Service Profile JSON:\n"
             f"{service_profile.model_dump_json(indent=2)}\n\n"
             "Candidate Post JSON:\n"
             f"{candidate_post.model_dump_json(indent=2)}"
         )
+
+    @staticmethod
+    def _batch_candidate_id(position: int) -> str:
+        return f"candidate-{position + 1}"
+
+    def _build_batch_user_prompt(
+        self,
+        candidate_posts: Sequence[CandidatePost],
+        service_profile: ServiceProfile,
+    ) -> str:
+        candidates = [
+            {
+                "candidate_id": self._batch_candidate_id(position),
+                **candidate_post.model_dump(mode="json"),
+            }
+            for position, candidate_post in enumerate(candidate_posts)
+        ]
+        return (
+            f"{self.USER_PROMPT_GUIDANCE}"
+            "Service Profile JSON:\n"
+            f"{service_profile.model_dump_json(indent=2)}\n\n"
+            "Candidate Posts JSON (judge each independently):\n"
+            f"{json.dumps(candidates, indent=2)}"
+        )
@@ -12,10 +12,13 @@ import json
 import logging
 import hashlib
 import os
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Sequence
 
+import numpy as np
 from sqlalchemy import text
 
 from api.services.cost_controls import TenantQuotaGuard, env_int
@@ -27,7 +30,13 @@ from api.services.embeddings import (
     _service_profile_columns,
     normalize_embedding_text,
 )
-from api.services.matching import PostEmbedding, find_candidate_matches
+from api.services.matching import (
+    _similarity_threshold,
+    cheap_filter_rejection_reason,
+    normalized_embedding_matrix,
+    normalized_embedding_vector,
+    similarity_scores,
+)
 from api.services.social.legacy_fetch import _primitive_metadata
 from api.services.social.legacy_storage import _lead_match_status
 from api.services.social.models import (
@@ -63,6 +72,12 @@ DEFAULT_WATCHLIST_SOURCES = (
     "stackexchange",
     "github",
 )
+DEFAULT_WATCHLIST_GLOBAL_MATCH_LIMIT = 5_000
+# Watchlist edits change the configuration fingerprint, which each process
+# re-reads at most once per interval rather than once per post; the TTL
+# bounds how long an edited base Service Profile can go unnoticed.
+DEFAULT_WATCHLIST_INDEX_TTL_SECONDS = 300
+DEFAULT_WATCHLIST_FINGERPRINT_INTERVAL_SECONDS = 30
 
 
 class WatchlistAlreadyQueuedError(RuntimeError):
@@ -264,6 +279,44 @@ def _load_active_watchlist_rows(conn: Any, *, limit: int) -> list[dict[str, Any]
     return [dict(row) for row in rows]
 
 
+def _active_watchlist_fingerprint(conn: Any) -> tuple[Any, ...]:
+    """Change marker for the configuration of the active set.
+
+    Only the columns a ``WatchlistContext`` is built from are digested.
+    ``updated_at`` also moves on every scan-status write and on re-embedding,
+    so it would discard the index on each scan.  The digest reads every
+    active brief, so callers go through :meth:`_WatchlistIndexCache.fingerprint`,
+    which runs it at most once per ``ARCLI_WATCHLIST_FINGERPRINT_INTERVAL_SECONDS``.
+    Base Service Profile edits are picked up by ``ARCLI_WATCHLIST_INDEX_TTL_SECONDS``.
+    """
+    row = conn.execute(
+        text(
+            """
+            SELECT COUNT(*) AS active_count,
+                   md5(COALESCE(string_agg(
+                       concat_ws(
+                           '|',
+                           id::text,
+                           tenant_id,
+                           service_profile_id::text,
+                           target_buyer,
+                           problem_to_solve,
+                           include_terms::text,
+                           exclude_terms::text,
+                           source_preferences::text
+                       ),
+                       E'\n' ORDER BY id
+                   ), '')) AS config_digest
+              FROM public.watchlists
+             WHERE is_active = TRUE
+            """
+        )
+    ).mappings().first()
+    if not row:
+        return (0, None)
+    return (int(row.get("active_count") or 0), row.get("config_digest"))
+
+
 def _update_watchlist_status(
     tenant_id: str,
     watchlist_id: str,
@@ -385,18 +438,23 @@ def _contexts_for_rows(rows: Iterable[dict[str, Any]]) -> list[WatchlistContext]
     embedding_service = EmbeddingService()
     try:
         engine = _database_engine()
+        # Many Watchlists narrow the same website profile; load each once.
+        profile_rows: dict[tuple[str, str], dict[str, Any] | None] = {}
         for row in rows:
             tenant_id = _space(row.get("tenant_id"), max_chars=80)
             service_profile_id = _space(row.get("service_profile_id"), max_chars=80)
             if not tenant_id or not service_profile_id:
                 continue
-            with engine.begin() as conn:
-                profile_row = _load_service_profile(
-                    conn,
-                    tenant_id,
-                    service_profile_id,
-                    _service_profile_columns(conn),
-                )
+            profile_key = (tenant_id, service_profile_id)
+            if profile_key not in profile_rows:
+                with engine.begin() as conn:
+                    profile_rows[profile_key] = _load_service_profile(
+                        conn,
+                        tenant_id,
+                        service_profile_id,
+                        _service_profile_columns(conn),
+                    )
+            profile_row = profile_rows[profile_key]
             if not profile_row:
                 continue
             try:
@@ -421,81 +479,333 @@ def _contexts_for_rows(rows: Iterable[dict[str, Any]]) -> list[WatchlistContext]
     return contexts
 
 
+def _normalized_post_source(source: str) -> str:
+    normalized = _space(source, max_chars=32).casefold()
+    return "x" if normalized == "twitter" else normalized
+
+
 def _source_is_selected(post: SocialPost, context: WatchlistContext) -> bool:
-    source = _space(post.source, max_chars=32).casefold()
-    if source == "twitter":
-        source = "x"
-    return source in context.source_preferences
+    return _normalized_post_source(post.source) in context.source_preferences
+
+
+@dataclass(frozen=True)
+class WatchlistIndex:
+    """Active Watchlists prepared to score one post in a single product.
+
+    Embeddings are stacked into one row-normalized matrix per dimension, and
+    each source keeps a boolean selection mask over the same rows.  Scores,
+    the recall threshold and the cheap filter are exactly those of
+    :func:`find_candidate_matches` with one post and ``max_candidates=1``.
+    """
+
+    contexts: tuple[WatchlistContext, ...]
+    rows_by_dimension: dict[int, tuple[np.ndarray, np.ndarray]]
+    source_masks: dict[str, np.ndarray]
+    fingerprint: tuple[Any, ...] = ()
+    built_at: float = 0.0
+
+    @classmethod
+    def build(
+        cls,
+        contexts: Sequence[WatchlistContext],
+        *,
+        fingerprint: tuple[Any, ...] = (),
+    ) -> "WatchlistIndex":
+        positions_by_dimension: dict[int, list[int]] = {}
+        for position, context in enumerate(contexts):
+            if context.embedding:
+                positions_by_dimension.setdefault(len(context.embedding), []).append(position)
+        rows_by_dimension = {
+            dimension: (
+                np.asarray(positions, dtype=np.intp),
+                normalized_embedding_matrix([contexts[position].embedding for position in positions]),
+            )
+            for dimension, positions in positions_by_dimension.items()
+        }
+        source_masks = {
+            source: np.fromiter(
+                (source in context.source_preferences for context in contexts),
+                dtype=bool,
+                count=len(contexts),
+            )
+            for source in WATCHLIST_SOURCES
+        }
+        return cls(
+            contexts=tuple(contexts),
+            rows_by_dimension=rows_by_dimension,
+            source_masks=source_masks,
+            fingerprint=fingerprint,
+            built_at=time.monotonic(),
+        )
+
+    def candidates_for_post(
+        self,
+        *,
+        source_post_id: str,
+        post: SocialPost,
+        post_embedding: Sequence[float],
+    ) -> list[tuple[WatchlistContext, CandidatePost]]:
+        """Return each selected Watchlist whose similarity clears the threshold."""
+        source_mask = self.source_masks.get(_normalized_post_source(post.source))
+        rows = self.rows_by_dimension.get(len(post_embedding))
+        if source_mask is None or rows is None or not source_mask.any():
+            return []
+        matching_text = normalize_embedding_text(post.matching_text[:32_000])
+        if cheap_filter_rejection_reason(matching_text):
+            return []
+
+        positions, matrix = rows
+        selected = source_mask[positions]
+        if not selected.any():
+            return []
+        scores = similarity_scores(
+            matrix[selected],
+            normalized_embedding_vector(post_embedding),
+        )
+        threshold = _similarity_threshold(None)
+        candidates: list[tuple[WatchlistContext, CandidatePost]] = []
+        for position, score in zip(positions[selected], scores):
+            if float(score) < threshold:
+                continue
+            context = self.contexts[int(position)]
+            candidates.append(
+                (
+                    context,
+                    CandidatePost(
+                        post_id=source_post_id,
+                        source=post.source,
+                        text=matching_text,
+                        similarity_score=float(score),
+                        url=post.url,
+                        metadata=_primitive_metadata(
+                            {
+                                "source_post_id": source_post_id,
+                                "external_id": post.external_id,
+                                "external_key": post.dedupe_key,
+                                "source": post.source,
+                                "watchlist_id": context.id,
+                            }
+                        ),
+                    ),
+                )
+            )
+        return candidates
+
+
+class _WatchlistIndexCache:
+    """Process-wide active Watchlist index, rebuilt only when it goes stale.
+
+    One thread rebuilds at a time; while it does, other threads keep using
+    the previous index rather than starting rebuilds of their own.  The
+    configuration fingerprint is cached too, so posts between two checks do
+    no work that grows with the number of Watchlists.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._index: WatchlistIndex | None = None
+        self._fingerprint: tuple[Any, ...] | None = None
+        self._fingerprint_checked_at = 0.0
+
+    def fingerprint(self, load: Callable[[], tuple[Any, ...]]) -> tuple[Any, ...]:
+        """The active set's change marker, re-read at most once per interval."""
+        interval_seconds = env_int(
+            "ARCLI_WATCHLIST_FINGERPRINT_INTERVAL_SECONDS",
+            DEFAULT_WATCHLIST_FINGERPRINT_INTERVAL_SECONDS,
+        )
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._fingerprint is not None
+                and now - self._fingerprint_checked_at < interval_seconds
+            ):
+                return self._fingerprint
+        fingerprint = load()
+        with self._lock:
+            self._fingerprint = fingerprint
+            self._fingerprint_checked_at = now
+        return fingerprint
+
+    def current(self, fingerprint: tuple[Any, ...]) -> WatchlistIndex | None:
+        ttl_seconds = env_int(
+            "ARCLI_WATCHLIST_INDEX_TTL_SECONDS",
+            DEFAULT_WATCHLIST_INDEX_TTL_SECONDS,
+        )
+        with self._lock:
+            index = self._index
+        if (
+            index is None
+            or index.fingerprint != fingerprint
+            or time.monotonic() - index.built_at > ttl_seconds
+        ):
+            return None
+        return index
+
+    def get_or_rebuild(
+        self,
+        fingerprint: tuple[Any, ...],
+        build: Callable[[], WatchlistIndex],
+    ) -> WatchlistIndex:
+        index = self.current(fingerprint)
+        if index is not None:
+            return index
+        with self._lock:
+            stale = self._index
+        # Only the first build in a process makes callers wait for it.
+        if not self._build_lock.acquire(blocking=stale is None) and stale is not None:
+            return stale
+        try:
+            index = self.current(fingerprint)
+            if index is not None:
+                return index
+            return self.store(build())
+        finally:
+            self._build_lock.release()
+
+    def store(self, index: WatchlistIndex) -> WatchlistIndex:
+        with self._lock:
+            self._index = index
+            # A build reads the fingerprint last, so it is the freshest one.
+            if index.fingerprint:
+                self._fingerprint = index.fingerprint
+                self._fingerprint_checked_at = time.monotonic()
+        return index
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._index = None
+            self._fingerprint = None
+
+
+active_watchlist_index = _WatchlistIndexCache()
+
+
+def _build_active_watchlist_index() -> WatchlistIndex:
+    engine = _database_engine()
+    with engine.begin() as conn:
+        watchlists = _load_active_watchlist_rows(
+            conn,
+            limit=max(
+                1,
+                env_int("ARCLI_WATCHLIST_GLOBAL_MATCH_LIMIT", DEFAULT_WATCHLIST_GLOBAL_MATCH_LIMIT),
+            ),
+        )
+    contexts = _contexts_for_rows(watchlists)
+    # Taken after the build, so anything the build itself wrote is already
+    # reflected and the next post does not start another rebuild.
+    with engine.begin() as conn:
+        fingerprint = _active_watchlist_fingerprint(conn)
+    logger.info(
+        "watchlist_index_rebuilt watchlists=%s contexts=%s",
+        len(watchlists),
+        len(contexts),
+    )
+    return WatchlistIndex.build(contexts, fingerprint=fingerprint)
+
+
+def _active_watchlist_index(fingerprint: tuple[Any, ...]) -> WatchlistIndex:
+    return active_watchlist_index.get_or_rebuild(fingerprint, _build_active_watchlist_index)
 
 
-def _cached_watchlist_verification(
+def _cached_watchlist_verifications(
     conn: Any,
     *,
-    context: WatchlistContext,
+    contexts: Sequence[WatchlistContext],
     source_post_id: str,
     external_key: str,
     verifier_model: str,
-) -> VerificationResult | None:
-    row = conn.execute(
+) -> dict[str, VerificationResult]:
+    """Reusable verdicts for one post, keyed by Watchlist id.
+
+    One ``watchlist_id = ANY(:ids)`` query replaces a transaction per
+    Watchlist.  A verdict is reused only while the post, Watchlist brief,
+    verifier model and policy version are unchanged.
+    """
+    contexts_by_id = {context.id: context for context in contexts}
+    if not contexts_by_id:
+        return {}
+    rows = conn.execute(
         text(
             """
-            SELECT metadata, verification
+            SELECT DISTINCT ON (watchlist_id)
+                   watchlist_id::text AS watchlist_id, tenant_id, metadata, verification
               FROM public.watchlist_matches
-             WHERE tenant_id = :tenant_id
-               AND watchlist_id = CAST(:watchlist_id AS uuid)
+             WHERE watchlist_id = ANY(CAST(:watchlist_ids AS uuid[]))
                AND source_post_id = CAST(:source_post_id AS uuid)
-             ORDER BY updated_at DESC NULLS LAST
-             LIMIT 1
+             ORDER BY watchlist_id, updated_at DESC NULLS LAST
             """
         ),
         {
-            "tenant_id": context.tenant_id,
-            "watchlist_id": context.id,
+            "watchlist_ids": list(contexts_by_id),
             "source_post_id": source_post_id,
         },
-    ).mappings().first()
-    if not row:
-        return None
-    metadata = _as_dict(row.get("metadata"))
-    if (
-        metadata.get("external_key") != external_key
-        or metadata.get("profile_embedding_sha256") != context.embedding_sha256
-        or metadata.get("verifier_model") != verifier_model
-        or metadata.get("verifier_policy_version") != VERIFIER_POLICY_VERSION
-    ):
-        return None
-    try:
-        return VerificationResult.model_validate(_as_dict(row.get("verification")))
-    except Exception:
-        return None
+    ).mappings()
 
+    cached: dict[str, VerificationResult] = {}
+    for row in rows:
+        context = contexts_by_id.get(str(row.get("watchlist_id")))
+        if context is None or str(row.get("tenant_id")) != context.tenant_id:
+            continue
+        metadata = _as_dict(row.get("metadata"))
+        if (
+            metadata.get("external_key") != external_key
+            or metadata.get("profile_embedding_sha256") != context.embedding_sha256
+            or metadata.get("verifier_model") != verifier_model
+            or metadata.get("verifier_policy_version") != VERIFIER_POLICY_VERSION
+        ):
+            continue
+        try:
+            cached[context.id] = VerificationResult.model_validate(_as_dict(row.get("verification")))
+        except Exception:
+            continue
+    return cached
 
-def _persist_watchlist_match(
+
+def _persist_watchlist_matches(
     conn: Any,
     *,
-    context: WatchlistContext,
     source_post_id: str,
     post: SocialPost,
-    similarity_score: float,
-    verification: VerificationResult,
+    matches: Sequence[tuple[WatchlistContext, float, VerificationResult]],
     verifier_model: str,
 ) -> None:
+    """Upsert every verified ``(Watchlist, similarity, verdict)`` for one post.
+
+    All rows go out as one multi-row ``INSERT ... ON CONFLICT``; each
+    Watchlist appears at most once, so no row is updated twice.
+    """
+    if not matches:
+        return
     now = datetime.now(timezone.utc).isoformat()
-    verification_payload = verification.model_dump()
-    payload = {
-        "tenant_id": context.tenant_id,
-        "watchlist_id": context.id,
-        "service_profile_id": context.service_profile_id,
+    source_post = json.dumps(post.to_source_post_json())
+    params: dict[str, Any] = {
         "source_post_id": source_post_id,
-        "match_status": _lead_match_status(verification),
-        "verifier_score": float(verification.confidence or 0.0),
-        "similarity_score": similarity_score,
-        "pain_detected": verification.pain_detected,
-        "match_reason": verification.why_this_matches,
-        "suggested_reply": verification.suggested_reply,
-        "verification": json.dumps(verification_payload),
-        "source_post": json.dumps(post.to_source_post_json()),
-        "metadata": json.dumps(
+        "source_post": source_post,
+        "now": now,
+    }
+    values_sql: list[str] = []
+    for index, (context, similarity_score, verification) in enumerate(matches):
+        values_sql.append(
+            f"(:tenant_id_{index}, CAST(:watchlist_id_{index} AS uuid), "
+            f"CAST(:service_profile_id_{index} AS uuid), CAST(:source_post_id AS uuid), "
+            f":match_status_{index}, :verifier_score_{index}, :similarity_score_{index}, "
+            f":pain_detected_{index}, :match_reason_{index}, :suggested_reply_{index}, "
+            f"CAST(:verification_{index} AS jsonb), CAST(:source_post AS jsonb), "
+            f"CAST(:metadata_{index} AS jsonb), CAST(:now AS timestamptz), "
+            "CAST(:now AS timestamptz), CAST(:now AS timestamptz))"
+        )
+        params[f"tenant_id_{index}"] = context.tenant_id
+        params[f"watchlist_id_{index}"] = context.id
+        params[f"service_profile_id_{index}"] = context.service_profile_id
+        params[f"match_status_{index}"] = _lead_match_status(verification)
+        params[f"verifier_score_{index}"] = float(verification.confidence or 0.0)
+        params[f"similarity_score_{index}"] = similarity_score
+        params[f"pain_detected_{index}"] = verification.pain_detected
+        params[f"match_reason_{index}"] = verification.why_this_matches
+        params[f"suggested_reply_{index}"] = verification.suggested_reply
+        params[f"verification_{index}"] = json.dumps(verification.model_dump())
+        params[f"metadata_{index}"] = json.dumps(
             {
                 **(post.metadata or {}),
                 "source": post.source,
@@ -506,27 +816,16 @@ def _persist_watchlist_match(
                 "verifier_model": verifier_model,
                 "verifier_policy_version": VERIFIER_POLICY_VERSION,
             }
-        ),
-        "matched_at": now,
-        "verified_at": now,
-        "updated_at": now,
-    }
+        )
     conn.execute(
         text(
-            """
+            f"""
             INSERT INTO public.watchlist_matches (
                 tenant_id, watchlist_id, service_profile_id, source_post_id,
                 match_status, verifier_score, similarity_score, pain_detected,
                 match_reason, suggested_reply, verification, source_post,
                 metadata, matched_at, verified_at, updated_at
-            ) VALUES (
-                :tenant_id, CAST(:watchlist_id AS uuid), CAST(:service_profile_id AS uuid),
-                CAST(:source_post_id AS uuid), :match_status, :verifier_score,
-                :similarity_score, :pain_detected, :match_reason, :suggested_reply,
-                CAST(:verification AS jsonb), CAST(:source_post AS jsonb),
-                CAST(:metadata AS jsonb), CAST(:matched_at AS timestamptz),
-                CAST(:verified_at AS timestamptz), CAST(:updated_at AS timestamptz)
-            )
+            ) VALUES {", ".join(values_sql)}
             ON CONFLICT (tenant_id, watchlist_id, source_post_id)
                 WHERE source_post_id IS NOT NULL
             DO UPDATE SET
@@ -544,7 +843,7 @@ def _persist_watchlist_match(
                 updated_at = EXCLUDED.updated_at
             """
         ),
-        payload,
+        params,
     )
 
 
@@ -553,85 +852,52 @@ def _match_post_to_contexts(
     source_post_id: str,
     post: SocialPost,
     post_embedding: list[float],
-    contexts: Iterable[WatchlistContext],
+    index: WatchlistIndex,
 ) -> dict[str, int]:
     result = {"candidates": 0, "ready_for_review": 0, "discovery_candidates": 0}
-    verifier: VerifierService | None = None
+    candidates = index.candidates_for_post(
+        source_post_id=source_post_id,
+        post=post,
+        post_embedding=post_embedding,
+    )
+    if not candidates:
+        return result
+    result["candidates"] = len(candidates)
     engine = _database_engine()
+    verifier = VerifierService()
     try:
-        for context in contexts:
-            if not _source_is_selected(post, context):
-                continue
-            candidate = find_candidate_matches(
-                context.embedding,
-                [
-                    PostEmbedding(
-                        post_id=source_post_id,
-                        text=normalize_embedding_text(post.matching_text[:32_000]),
-                        embedding=post_embedding,
-                        source=post.source,
-                        url=post.url,
-                        metadata=_primitive_metadata(
-                            {
-                                "source_post_id": source_post_id,
-                                "external_id": post.external_id,
-                                "external_key": post.dedupe_key,
-                                "source": post.source,
-                                "watchlist_id": context.id,
-                            }
-                        ),
-                    )
-                ],
+        with engine.begin() as conn:
+            cached = _cached_watchlist_verifications(
+                conn,
+                contexts=[context for context, _ in candidates],
+                source_post_id=source_post_id,
+                external_key=post.dedupe_key,
+                verifier_model=verifier.model,
+            )
+        matches: list[tuple[WatchlistContext, float, VerificationResult]] = []
+        for context, candidate in candidates:
+            verification = cached.get(context.id) or verifier.verify(
+                candidate,
+                context.profile,
                 tenant_id=context.tenant_id,
                 service_profile_id=context.service_profile_id,
-                max_candidates=1,
             )
-            if not candidate:
-                continue
-            result["candidates"] += 1
-            if verifier is None:
-                verifier = VerifierService()
-            with engine.begin() as conn:
-                verification = _cached_watchlist_verification(
-                    conn,
-                    context=context,
-                    source_post_id=source_post_id,
-                    external_key=post.dedupe_key,
-                    verifier_model=verifier.model,
-                )
-            if not verification:
-                match = candidate[0]
-                verification = verifier.verify(
-                    CandidatePost(
-                        post_id=match.post_id,
-                        source=match.source,
-                        text=match.text,
-                        similarity_score=match.score,
-                        url=match.url,
-                        metadata=match.metadata,
-                    ),
-                    context.profile,
-                    tenant_id=context.tenant_id,
-                    service_profile_id=context.service_profile_id,
-                )
             status = _lead_match_status(verification)
             if status == "ready_for_review":
                 result["ready_for_review"] += 1
             elif status == "discovery_candidate":
                 result["discovery_candidates"] += 1
-            with engine.begin() as conn:
-                _persist_watchlist_match(
-                    conn,
-                    context=context,
-                    source_post_id=source_post_id,
-                    post=post,
-                    similarity_score=candidate[0].score,
-                    verification=verification,
-                    verifier_model=verifier.model,
-                )
+            matches.append((context, candidate.similarity_score, verification))
+        with engine.begin() as conn:
+            _persist_watchlist_matches(
+                conn,
+                source_post_id=source_post_id,
+                post=post,
+                matches=matches,
+                verifier_model=verifier.model,
+            )
     finally:
-        if verifier is not None:
-            verifier.close()
+        verifier.close()
     return result
 
 
@@ -648,9 +914,10 @@ def process_active_watchlists_for_public_source_post(
     try:
         with engine.begin() as conn:
             rows = _load_public_source_post_rows(conn, normalized_id, source=source)
-            watchlists = _load_active_watchlist_rows(
-                conn,
-                limit=max(1, env_int("ARCLI_WATCHLIST_GLOBAL_MATCH_LIMIT", 100)),
+            fingerprint = (
+                active_watchlist_index.fingerprint(lambda: _active_watchlist_fingerprint(conn))
+                if rows
+                else (0, None)
             )
     except Exception as exc:
         # The schema is additive. Existing source matching must continue while
@@ -661,11 +928,13 @@ def process_active_watchlists_for_public_source_post(
             exc.__class__.__name__,
         )
         return {"posts": 0, "watchlists": 0, "candidates": 0, "ready_for_review": 0, "discovery_candidates": 0}
-    if not rows or not watchlists:
-        return {"posts": len(rows), "watchlists": len(watchlists), "candidates": 0, "ready_for_review": 0, "discovery_candidates": 0}
+    if not rows or not fingerprint[0]:
+        return {"posts": len(rows), "watchlists": fingerprint[0], "candidates": 0, "ready_for_review": 0, "discovery_candidates": 0}
+    # Outside the rollout guard: a failed rebuild is an error for the caller
+    # to log, not an empty Watchlist set.
+    index = _active_watchlist_index(fingerprint)
 
-    contexts = _contexts_for_rows(watchlists)
-    result = {"posts": len(rows), "watchlists": len(contexts), "candidates": 0, "ready_for_review": 0, "discovery_candidates": 0}
+    result = {"posts": len(rows), "watchlists": len(index.contexts), "candidates": 0, "ready_for_review": 0, "discovery_candidates": 0}
     embedding_service = EmbeddingService()
     try:
         for row in rows:
@@ -690,7 +959,7 @@ def process_active_watchlists_for_public_source_post(
                 source_post_id=database_post_id,
                 post=post,
                 post_embedding=cached_embedding,
-                contexts=contexts,
+                index=index,
             )
             for key in ("candidates", "ready_for_review", "discovery_candidates"):
                 result[key] += matched[key]
@@ -726,6 +995,7 @@ def rematch_existing_public_source_posts_for_watchlist(
     if not contexts:
         return {"posts": len(rows), "embedded": 0, "candidates": 0, "ready_for_review": 0, "discovery_candidates": 0}
     context = contexts[0]
+    index = WatchlistIndex.build(contexts)
     result = {"posts": len(rows), "embedded": 0, "candidates": 0, "ready_for_review": 0, "discovery_candidates": 0}
     embedding_service = EmbeddingService()
     try:
@@ -750,7 +1020,7 @@ def rematch_existing_public_source_posts_for_watchlist(
                 source_post_id=database_post_id,
                 post=post,
                 post_embedding=cached_embedding,
-                contexts=[context],
+                index=index,
             )
             for key in ("candidates", "ready_for_review", "discovery_candidates"):
                 result[key] += matched[key]
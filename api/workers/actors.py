@@ -192,10 +192,16 @@ def _job_finished(
 
 
 def _close_actor_openai_clients() -> None:
-    """Close SDK transports even when an actor exits through a retry path."""
+    """Close SDK transports even when an actor exits through a retry path.
+
+    Buffered discovery telemetry is flushed here too, so a job's events are
+    written before it finishes rather than on the next background tick.
+    """
     from api.services.openai_lifecycle import close_current_thread_openai_clients
+    from api.services.social.discovery_telemetry import flush_discovery_events
 
     close_current_thread_openai_clients()
+    flush_discovery_events()
 
 
 def _claim_initial_x_fallback(x_fallback_group_id: str | None) -> bool:
@@ -1663,6 +1669,7 @@ def ingest_x_job(
     max_retries=2,
     min_backoff=60_000,
     max_backoff=900_000,
+    time_limit=_int_env("ARCLI_PUBLIC_DATA_RETENTION_JOB_TIME_LIMIT_MS", 300_000, minimum=1),
 )
 def purge_expired_public_data_job() -> None:
     """Apply the public-source retention policy outside customer job latency."""
@@ -1686,7 +1693,12 @@ def purge_expired_public_data_job() -> None:
         lead_matches_deleted=result.lead_matches_deleted,
         source_posts_deleted=result.source_posts_deleted,
         discovery_evidence_deleted=result.discovery_evidence_deleted,
+        embedding_cache_deleted=result.embedding_cache_deleted,
         removal_requests_anonymized=result.removal_requests_anonymized,
+        partitions_dropped=result.partitions_dropped,
+        batches=result.batches,
+        rows_per_second=result.rows_per_second,
+        backlog_remaining=result.backlog_remaining,
     )
 
 
@@ -0,0 +1,39 @@
+-- Content-addressed embedding cache shared by every worker.
+--
+-- Apply after crawl_pipeline_reliability.sql. An embedding depends only on the
+-- model and the normalized input text, so workers key this table by
+-- (model, text_sha256) and reuse one vector for every tenant, profile,
+-- watchlist, and public post that embeds identical text. The table stores no
+-- text and no tenant identifiers; it is readable only by the service role.
+--
+-- Workers detect the table at runtime and keep embedding without it.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.embedding_cache (
+    model TEXT NOT NULL,
+    text_sha256 TEXT NOT NULL,
+    embedding JSONB NOT NULL,
+    dimensions INTEGER NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (model, text_sha256),
+    CONSTRAINT embedding_cache_text_sha256_format CHECK (text_sha256 ~ '^[0-9a-f]{64}$'),
+    CONSTRAINT embedding_cache_embedding_array CHECK (
+        jsonb_typeof(embedding) = 'array'
+        AND jsonb_array_length(embedding) = dimensions
+        AND dimensions > 0
+    )
+);
+
+-- Serves the public-data retention job, which prunes vectors older than the
+-- public-data retention window in chunks; a pruned vector is recomputed on
+-- its next miss.
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_created_at
+    ON public.embedding_cache (created_at);
+
+ALTER TABLE public.embedding_cache ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON TABLE public.embedding_cache FROM anon, authenticated;
+
+NOTIFY pgrst, 'reload schema';
+
+COMMIT;
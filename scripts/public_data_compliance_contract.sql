@@ -52,6 +52,10 @@ CREATE INDEX IF NOT EXISTS idx_public_data_removal_requests_pending
 CREATE INDEX IF NOT EXISTS idx_public_data_removal_requests_suppression
     ON public.public_data_removal_requests(source, source_post_id, author_handle)
     WHERE status = 'completed';
+-- Serves the ingestion worker's incremental suppression-index refresh.
+CREATE INDEX IF NOT EXISTS idx_public_data_removal_requests_completed_updated
+    ON public.public_data_removal_requests(updated_at ASC)
+    WHERE status = 'completed';
 CREATE INDEX IF NOT EXISTS idx_public_data_removal_requests_fingerprint_created
     ON public.public_data_removal_requests(requester_fingerprint, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_source_posts_public_retention
@@ -59,6 +63,12 @@ CREATE INDEX IF NOT EXISTS idx_source_posts_public_retention
     WHERE tenant_id IS NULL AND source_post_id IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_discovery_evidence_retention
     ON public.discovery_evidence(observed_at ASC, created_at ASC);
+-- Keyset order for the worker's chunked retention purge.
+CREATE INDEX IF NOT EXISTS idx_source_posts_public_retention_keyset
+    ON public.source_posts((COALESCE(posted_at, created_at)) ASC, id ASC)
+    WHERE tenant_id IS NULL AND source_post_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_discovery_evidence_retention_keyset
+    ON public.discovery_evidence((COALESCE(observed_at, created_at)) ASC, id ASC);
 
 CREATE OR REPLACE FUNCTION public.set_public_data_removal_request_updated_at()
 RETURNS TRIGGER
@@ -0,0 +1,83 @@
+-- Typed embedding storage for the global public-source corpus.
+--
+-- Apply after hn_source_posts_global_contract.sql and
+-- crawl_pipeline_reliability.sql (which enables pgvector). Public posts
+-- previously kept their matching embedding as a JSON array inside
+-- source_posts.metadata->'matching_embedding_cache'. This contract adds a
+-- typed vector column plus an approximate-nearest-neighbour index, so the
+-- worker can ask the database for the posts nearest a profile instead of
+-- decoding a bounded, newest-first window of JSON arrays in Python.
+--
+-- Workers detect the column at runtime. Until this script is applied they keep
+-- using the JSON cache, and rows embedded before it are backfilled below.
+
+BEGIN;
+
+ALTER TABLE public.source_posts
+    ADD COLUMN IF NOT EXISTS matching_embedding_model TEXT,
+    ADD COLUMN IF NOT EXISTS matching_embedding_text_sha256 TEXT;
+
+DO $$
+DECLARE
+    vector_type regtype;
+BEGIN
+    vector_type := COALESCE(
+        to_regtype('extensions.vector'),
+        to_regtype('public.vector'),
+        to_regtype('vector')
+    );
+
+    IF vector_type IS NULL THEN
+        RAISE NOTICE 'pgvector type was not found; source_posts.matching_embedding was skipped. The JSON metadata cache remains in use.';
+        RETURN;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1
+          FROM information_schema.columns
+         WHERE table_schema = 'public'
+           AND table_name = 'source_posts'
+           AND column_name = 'matching_embedding'
+    ) THEN
+        EXECUTE format(
+            'ALTER TABLE public.source_posts ADD COLUMN matching_embedding %s(1536)',
+            vector_type
+        );
+    END IF;
+
+    -- Move existing JSON caches into the typed column once. Only 1536-value
+    -- arrays fit the column; anything else keeps its JSON cache.
+    EXECUTE format($backfill$
+        UPDATE public.source_posts
+           SET matching_embedding = CAST(metadata::jsonb->'matching_embedding_cache'->>'embedding' AS %s),
+               matching_embedding_model = metadata::jsonb->'matching_embedding_cache'->>'model',
+               matching_embedding_text_sha256 = metadata::jsonb->'matching_embedding_cache'->>'text_sha256'
+         WHERE tenant_id IS NULL
+           AND matching_embedding IS NULL
+           AND jsonb_typeof(metadata::jsonb->'matching_embedding_cache'->'embedding') = 'array'
+           AND jsonb_array_length(metadata::jsonb->'matching_embedding_cache'->'embedding') = 1536
+    $backfill$, vector_type);
+
+    -- HNSW needs pgvector 0.5+. Older installations fall back to IVFFlat,
+    -- which still avoids a sequential scan for nearest-post rematches.
+    IF EXISTS (SELECT 1 FROM pg_am WHERE amname = 'hnsw') THEN
+        EXECUTE '
+            CREATE INDEX IF NOT EXISTS idx_source_posts_public_matching_embedding
+                ON public.source_posts
+             USING hnsw (matching_embedding vector_cosine_ops)
+             WHERE tenant_id IS NULL AND matching_embedding IS NOT NULL
+        ';
+    ELSE
+        EXECUTE '
+            CREATE INDEX IF NOT EXISTS idx_source_posts_public_matching_embedding
+                ON public.source_posts
+             USING ivfflat (matching_embedding vector_cosine_ops)
+              WITH (lists = 100)
+             WHERE tenant_id IS NULL AND matching_embedding IS NOT NULL
+        ';
+    END IF;
+END $$;
+
+NOTIFY pgrst, 'reload schema';
+
+COMMIT;
@@ -0,0 +1,613 @@
+-- Time-partitioned storage for the global public-source corpus.
+--
+-- Apply after hn_source_posts_global_contract.sql,
+-- source_post_embedding_vectors.sql, public_data_compliance_contract.sql and
+-- watchlists_contract.sql, on PostgreSQL 15+ (NULLS NOT DISTINCT), with the
+-- ingestion workers paused and a backup taken. It rebuilds
+-- public.source_posts as a table partitioned by RANGE (posted_at):
+--
+-- * global rows land in one partition per UTC day (or week), so retention
+--   drops a whole expired partition instead of deleting it row by row, and
+--   corpus reads bounded by posted_at only visit the newest partitions;
+-- * tenant-scoped legacy rows and undated rows have no posted_at and live in
+--   the default partition, which keeps the row-by-row retention path.
+--
+-- A partitioned table cannot have a primary or unique key on id alone, so
+-- the foreign keys from lead_matches and watchlist_matches are replaced by a
+-- statement trigger that keeps their ON DELETE SET NULL behaviour, and each
+-- partition gets its own unique index on id (ids come from
+-- gen_random_uuid(), so per-partition uniqueness is the guard that remains).
+--
+-- Unique keys must include the partition key, so (source, source_post_id)
+-- becomes (source, source_post_id, posted_at) and tenant keys gain posted_at
+-- too. That pair is no longer globally unique: deduplication relies on a
+-- post's posted_at never changing, which holds for the connectors' creation
+-- timestamps; a post re-ingested with a different posted_at is stored twice.
+-- Workers detect the layout from pg_partitioned_table (cached for
+-- ARCLI_SCHEMA_CACHE_TTL_SECONDS) and switch their ON CONFLICT targets, so
+-- resume ingestion once that TTL has passed after this script commits, or
+-- restart the workers.
+--
+-- From then on the retention job maintains partitions, one step per short
+-- transaction under a lock_timeout. Two steps take ACCESS EXCLUSIVE locks,
+-- each only for a catalog change:
+--
+-- * attaching a new period: ATTACH would otherwise scan the whole default
+--   partition (every tenant and undated row) under ACCESS EXCLUSIVE. Instead
+--   the period's table is filled while detached, and a NOT VALID CHECK on
+--   source_posts_undated excluding the period is added (brief ACCESS
+--   EXCLUSIVE on source_posts_undated), then validated in its own
+--   transaction (SHARE UPDATE EXCLUSIVE, so reads and writes continue), so
+--   the ATTACH proves the default partition clean without scanning it.
+--   Until the ATTACH commits, a row dated inside that future period is
+--   rejected by the CHECK; partitions are created several periods ahead, so
+--   only mis-dated posts can hit this.
+-- * detaching an expired period: PostgreSQL refuses DETACH PARTITION ...
+--   CONCURRENTLY while a default partition exists, so the detach holds
+--   ACCESS EXCLUSIVE on public.source_posts for the detach itself. The DROP
+--   runs after the table is detached and no longer locks the parent.
+
+BEGIN;
+
+-- Range bounds of every attached period partition.
+CREATE OR REPLACE FUNCTION public.source_post_partition_bounds()
+RETURNS TABLE (
+    relname TEXT,
+    lower_bound TIMESTAMPTZ,
+    upper_bound TIMESTAMPTZ
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public, pg_temp
+AS $$
+    SELECT bounds.relname, bounds.lower_bound, bounds.upper_bound
+      FROM (
+          SELECT child.relname::TEXT AS relname,
+                 (regexp_match(
+                     pg_get_expr(child.relpartbound, child.oid),
+                     'FROM \(''([^'']+)''\)'
+                 ))[1]::timestamptz AS lower_bound,
+                 (regexp_match(
+                     pg_get_expr(child.relpartbound, child.oid),
+                     'TO \(''([^'']+)''\)'
+                 ))[1]::timestamptz AS upper_bound
+            FROM pg_inherits
+            JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+           WHERE pg_inherits.inhparent = 'public.source_posts'::regclass
+      ) AS bounds
+     WHERE bounds.upper_bound IS NOT NULL;
+$$;
+
+-- Periods from p_from through p_periods_ahead periods past NOW() that no
+-- attached partition overlaps yet. Where a partition of the other
+-- granularity covers part of a period, rows outside every range keep using
+-- the default partition.
+CREATE OR REPLACE FUNCTION public.missing_source_post_partitions(
+    p_granularity TEXT DEFAULT 'day',
+    p_from TIMESTAMPTZ DEFAULT NOW(),
+    p_periods_ahead INTEGER DEFAULT 7
+)
+RETURNS TABLE (
+    partition_name TEXT,
+    period_start TIMESTAMPTZ,
+    period_end TIMESTAMPTZ
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY INVOKER
+SET search_path = public, pg_temp
+AS $$
+DECLARE
+    step INTERVAL;
+    last_start TIMESTAMPTZ;
+BEGIN
+    IF p_granularity NOT IN ('day', 'week') THEN
+        RAISE EXCEPTION 'unsupported source_posts partition granularity %', p_granularity
+            USING ERRCODE = '22023';
+    END IF;
+    step := CASE p_granularity WHEN 'week' THEN INTERVAL '7 days' ELSE INTERVAL '1 day' END;
+    period_start := date_trunc(p_granularity, p_from, 'UTC');
+    last_start := date_trunc(p_granularity, NOW(), 'UTC') + step * GREATEST(p_periods_ahead, 0);
+
+    WHILE period_start <= last_start LOOP
+        period_end := period_start + step;
+        partition_name := 'source_posts_p' || to_char(period_start AT TIME ZONE 'UTC', 'YYYYMMDD');
+        IF NOT EXISTS (
+            SELECT 1
+              FROM public.source_post_partition_bounds() AS bounds
+             WHERE bounds.lower_bound < period_end
+               AND bounds.upper_bound > period_start
+        ) THEN
+            RETURN NEXT;
+        END IF;
+        period_start := period_end;
+    END LOOP;
+END;
+$$;
+
+-- Creates a period's table while detached, moves rows that arrived before
+-- it existed out of the default partition, and adds a NOT VALID CHECK to
+-- source_posts_undated that excludes the period. Safe to repeat.
+CREATE OR REPLACE FUNCTION public.prepare_source_post_partition(
+    p_partition_name TEXT,
+    p_period_start TIMESTAMPTZ,
+    p_period_end TIMESTAMPTZ
+)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public, pg_temp
+AS $$
+DECLARE
+    guard_name TEXT := 'source_posts_undated_excludes_' || substr(p_partition_name, 14);
+BEGIN
+    IF p_partition_name !~ '^source_posts_p[0-9]{8}$' THEN
+        RAISE EXCEPTION 'invalid source_posts partition name %', p_partition_name
+            USING ERRCODE = '22023';
+    END IF;
+    IF to_regclass('public.' || quote_ident(p_partition_name)) IS NULL THEN
+        EXECUTE format(
+            'CREATE TABLE public.%I (LIKE public.source_posts INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+            p_partition_name
+        );
+        -- Reads go through the parent's policies; a partition table itself
+        -- stays closed to API roles that default grants reach.
+        EXECUTE format('ALTER TABLE public.%I ENABLE ROW LEVEL SECURITY', p_partition_name);
+        EXECUTE format('REVOKE ALL ON TABLE public.%I FROM PUBLIC', p_partition_name);
+        EXECUTE format(
+            'CREATE UNIQUE INDEX %I ON public.%I (id)',
+            p_partition_name || '_id_key',
+            p_partition_name
+        );
+    END IF;
+    -- Lets ATTACH skip scanning the new table as well.
+    EXECUTE format(
+        'ALTER TABLE public.%I DROP CONSTRAINT IF EXISTS %I',
+        p_partition_name,
+        p_partition_name || '_bounds'
+    );
+    EXECUTE format(
+        'ALTER TABLE public.%I ADD CONSTRAINT %I
+             CHECK (posted_at IS NOT NULL AND posted_at >= %L AND posted_at < %L)',
+        p_partition_name,
+        p_partition_name || '_bounds',
+        p_period_start,
+        p_period_end
+    );
+    EXECUTE format(
+        'WITH moved AS (
+             DELETE FROM public.source_posts_undated
+              WHERE posted_at >= $1 AND posted_at < $2
+             RETURNING *
+         )
+         INSERT INTO public.%I SELECT * FROM moved',
+        p_partition_name
+    ) USING p_period_start, p_period_end;
+    EXECUTE format('ALTER TABLE public.source_posts_undated DROP CONSTRAINT IF EXISTS %I', guard_name);
+    EXECUTE format(
+        'ALTER TABLE public.source_posts_undated ADD CONSTRAINT %I
+             CHECK (posted_at IS NULL OR posted_at < %L OR posted_at >= %L) NOT VALID',
+        guard_name,
+        p_period_start,
+        p_period_end
+    );
+END;
+$$;
+
+-- Validates a prepared period's guard on the default partition. The scan
+-- holds SHARE UPDATE EXCLUSIVE, which blocks neither reads nor writes, so
+-- run it in its own transaction.
+CREATE OR REPLACE FUNCTION public.validate_source_post_partition_guard(
+    p_partition_name TEXT
+)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public, pg_temp
+AS $$
+BEGIN
+    EXECUTE format(
+        'ALTER TABLE public.source_posts_undated VALIDATE CONSTRAINT %I',
+        'source_posts_undated_excludes_' || substr(p_partition_name, 14)
+    );
+END;
+$$;
+
+-- Attaches a prepared period. The validated guard proves the default
+-- partition holds none of its rows, so neither table is scanned; the guards
+-- are then redundant with the partition bounds and dropped. Returns false
+-- when the table is already attached.
+CREATE OR REPLACE FUNCTION public.attach_source_post_partition(
+    p_partition_name TEXT,
+    p_period_start TIMESTAMPTZ,
+    p_period_end TIMESTAMPTZ
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public, pg_temp
+AS $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+          FROM public.source_post_partition_bounds() AS bounds
+         WHERE bounds.relname = p_partition_name
+    ) THEN
+        RETURN FALSE;
+    END IF;
+    EXECUTE format(
+        'ALTER TABLE public.source_posts ATTACH PARTITION public.%I FOR VALUES FROM (%L) TO (%L)',
+        p_partition_name,
+        p_period_start,
+        p_period_end
+    );
+    EXECUTE format(
+        'ALTER TABLE public.source_posts_undated DROP CONSTRAINT IF EXISTS %I',
+        'source_posts_undated_excludes_' || substr(p_partition_name, 14)
+    );
+    EXECUTE format(
+        'ALTER TABLE public.%I DROP CONSTRAINT IF EXISTS %I',
+        p_partition_name,
+        p_partition_name || '_bounds'
+    );
+    RETURN TRUE;
+END;
+$$;
+
+-- All three steps in the caller's transaction; used by the one-time
+-- conversion below, where public.source_posts is locked anyway.
+CREATE OR REPLACE FUNCTION public.ensure_source_post_partitions(
+    p_granularity TEXT DEFAULT 'day',
+    p_from TIMESTAMPTZ DEFAULT NOW(),
+    p_periods_ahead INTEGER DEFAULT 7
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public, pg_temp
+AS $$
+DECLARE
+    missing RECORD;
+    created INTEGER := 0;
+BEGIN
+    FOR missing IN
+        SELECT *
+          FROM public.missing_source_post_partitions(p_granularity, p_from, p_periods_ahead)
+    LOOP
+        PERFORM public.prepare_source_post_partition(
+            missing.partition_name,
+            missing.period_start,
+            missing.period_end
+        );
+        PERFORM public.validate_source_post_partition_guard(missing.partition_name);
+        PERFORM public.attach_source_post_partition(
+            missing.partition_name,
+            missing.period_start,
+            missing.period_end
+        );
+        created := created + 1;
+    END LOOP;
+    RETURN created;
+END;
+$$;
+
+DROP FUNCTION IF EXISTS public.drop_expired_source_post_partitions(TIMESTAMPTZ);
+
+-- Lists range partitions whose upper bound is at or before the cutoff and
+-- that hold no tenant rows (those are left to the row-by-row retention
+-- pass), plus expired partitions already detached by an interrupted run.
+CREATE OR REPLACE FUNCTION public.expired_source_post_partitions(
+    p_cutoff TIMESTAMPTZ
+)
+RETURNS TABLE (
+    partition_name TEXT,
+    attached BOOLEAN
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY INVOKER
+SET search_path = public, pg_temp
+AS $$
+DECLARE
+    expired RECORD;
+    has_tenant_rows BOOLEAN;
+BEGIN
+    FOR expired IN
+        SELECT bounds.relname
+          FROM public.source_post_partition_bounds() AS bounds
+         WHERE bounds.upper_bound <= p_cutoff
+         ORDER BY bounds.upper_bound ASC
+    LOOP
+        EXECUTE format(
+            'SELECT EXISTS (SELECT 1 FROM public.%I WHERE tenant_id IS NOT NULL)',
+            expired.relname
+        ) INTO has_tenant_rows;
+        CONTINUE WHEN has_tenant_rows;
+        partition_name := expired.relname;
+        attached := TRUE;
+        RETURN NEXT;
+    END LOOP;
+
+    -- A week partition ends at most seven days after the date in its name.
+    RETURN QUERY
+        SELECT detached.relname::TEXT, FALSE
+          FROM pg_class AS detached
+         WHERE detached.relnamespace = 'public'::regnamespace
+           AND detached.relkind = 'r'
+           AND NOT detached.relispartition
+           AND detached.relname ~ '^source_posts_p[0-9]{8}$'
+           AND to_date(substr(detached.relname, 15), 'YYYYMMDD') + 7 <= p_cutoff::date
+         ORDER BY detached.relname;
+END;
+$$;
+
+-- Removes the tenant lead snapshots of one expired partition's posts and
+-- detaches it. Returns no row when the table is no longer an attached
+-- partition or has gained tenant rows. Run it in its own transaction with a
+-- lock_timeout: DETACH takes ACCESS EXCLUSIVE on public.source_posts.
+CREATE OR REPLACE FUNCTION public.detach_expired_source_post_partition(
+    p_partition_name TEXT
+)
+RETURNS TABLE (
+    source_posts_deleted BIGINT,
+    lead_matches_deleted BIGINT
+)
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public, pg_temp
+AS $$
+DECLARE
+    has_tenant_rows BOOLEAN;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+          FROM pg_inherits
+          JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+         WHERE pg_inherits.inhparent = 'public.source_posts'::regclass
+           AND child.relname = p_partition_name
+           AND child.relname ~ '^source_posts_p[0-9]{8}$'
+    ) THEN
+        RETURN;
+    END IF;
+    EXECUTE format(
+        'SELECT EXISTS (SELECT 1 FROM public.%I WHERE tenant_id IS NOT NULL)',
+        p_partition_name
+    ) INTO has_tenant_rows;
+    IF has_tenant_rows THEN
+        RETURN;
+    END IF;
+
+    EXECUTE format(
+        'DELETE FROM public.lead_matches WHERE source_post_id IN (SELECT id FROM public.%I)',
+        p_partition_name
+    );
+    GET DIAGNOSTICS lead_matches_deleted = ROW_COUNT;
+    -- Detaching and dropping a partition fires no delete trigger.
+    IF to_regclass('public.watchlist_matches') IS NOT NULL THEN
+        EXECUTE format(
+            'UPDATE public.watchlist_matches SET source_post_id = NULL
+              WHERE source_post_id IN (SELECT id FROM public.%I)',
+            p_partition_name
+        );
+    END IF;
+    EXECUTE format('SELECT count(*) FROM public.%I', p_partition_name)
+        INTO source_posts_deleted;
+    EXECUTE format('ALTER TABLE public.source_posts DETACH PARTITION public.%I', p_partition_name);
+    RETURN NEXT;
+END;
+$$;
+
+-- Drops an expired partition after it has been detached; refuses anything
+-- that is still attached or is not a source_posts period table.
+CREATE OR REPLACE FUNCTION public.drop_detached_source_post_partition(
+    p_partition_name TEXT
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public, pg_temp
+AS $$
+BEGIN
+    IF p_partition_name !~ '^source_posts_p[0-9]{8}$' OR NOT EXISTS (
+        SELECT 1
+          FROM pg_class
+         WHERE relnamespace = 'public'::regnamespace
+           AND relname = p_partition_name
+           AND relkind = 'r'
+           AND NOT relispartition
+    ) THEN
+        RETURN FALSE;
+    END IF;
+    EXECUTE format('DROP TABLE public.%I', p_partition_name);
+    RETURN TRUE;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.source_posts_clear_match_references()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public, pg_temp
+AS $$
+BEGIN
+    UPDATE public.lead_matches
+       SET source_post_id = NULL
+     WHERE source_post_id IN (SELECT id FROM removed_source_posts);
+    IF to_regclass('public.watchlist_matches') IS NOT NULL THEN
+        UPDATE public.watchlist_matches
+           SET source_post_id = NULL
+         WHERE source_post_id IN (SELECT id FROM removed_source_posts);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    foreign_key RECORD;
+    index_definition RECORD;
+    table_policy RECORD;
+    table_grant RECORD;
+    row_security BOOLEAN;
+    force_row_security BOOLEAN;
+    oldest_posted_at TIMESTAMPTZ;
+BEGIN
+    IF EXISTS (
+        SELECT 1
+          FROM pg_partitioned_table
+         WHERE partrelid = 'public.source_posts'::regclass
+    ) THEN
+        RAISE NOTICE 'public.source_posts is already partitioned.';
+        RETURN;
+    END IF;
+
+    LOCK TABLE public.source_posts IN ACCESS EXCLUSIVE MODE;
+
+    -- Capture what LIKE does not copy before the original is renamed.
+    CREATE TEMP TABLE source_posts_index_definitions ON COMMIT DROP AS
+        SELECT pg_get_indexdef(indexrelid) AS definition
+          FROM pg_index
+         WHERE indrelid = 'public.source_posts'::regclass
+           AND NOT indisunique
+           AND NOT indisprimary;
+    CREATE TEMP TABLE source_posts_policies ON COMMIT DROP AS
+        SELECT policyname, permissive, roles, cmd, qual, with_check
+          FROM pg_policies
+         WHERE schemaname = 'public'
+           AND tablename = 'source_posts';
+    CREATE TEMP TABLE source_posts_grants ON COMMIT DROP AS
+        SELECT DISTINCT grantee, privilege_type
+          FROM information_schema.role_table_grants
+         WHERE table_schema = 'public'
+           AND table_name = 'source_posts'
+           AND grantee <> current_user;
+    SELECT relrowsecurity, relforcerowsecurity
+      INTO row_security, force_row_security
+      FROM pg_class
+     WHERE oid = 'public.source_posts'::regclass;
+
+    FOR foreign_key IN
+        SELECT conrelid::regclass AS table_name, conname
+          FROM pg_constraint
+         WHERE contype = 'f'
+           AND confrelid = 'public.source_posts'::regclass
+    LOOP
+        EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', foreign_key.table_name, foreign_key.conname);
+    END LOOP;
+
+    ALTER TABLE public.source_posts RENAME TO source_posts_unpartitioned;
+    CREATE TABLE public.source_posts (
+        LIKE public.source_posts_unpartitioned
+            INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED
+            INCLUDING STORAGE INCLUDING COMMENTS
+    ) PARTITION BY RANGE (posted_at);
+    ALTER TABLE public.source_posts
+        ADD CONSTRAINT source_posts_tenant_id_fkey
+        FOREIGN KEY (tenant_id) REFERENCES public.tenants(tenant_id) ON DELETE CASCADE;
+    CREATE TABLE public.source_posts_undated PARTITION OF public.source_posts DEFAULT;
+    ALTER TABLE public.source_posts_undated ENABLE ROW LEVEL SECURITY;
+    REVOKE ALL ON TABLE public.source_posts_undated FROM PUBLIC;
+
+    -- Older rows are past every allowed retention window; they go to the
+    -- default partition and the next retention pass deletes them.
+    SELECT GREATEST(MIN(posted_at), NOW() - INTERVAL '90 days')
+      INTO oldest_posted_at
+      FROM public.source_posts_unpartitioned
+     WHERE posted_at IS NOT NULL;
+    PERFORM public.ensure_source_post_partitions('day', COALESCE(oldest_posted_at, NOW()), 7);
+
+    INSERT INTO public.source_posts SELECT * FROM public.source_posts_unpartitioned;
+    DROP TABLE public.source_posts_unpartitioned;
+
+    CREATE UNIQUE INDEX uq_source_posts_source_source_post_id
+        ON public.source_posts(source, source_post_id, posted_at);
+    CREATE UNIQUE INDEX uq_source_posts_tenant_source_external
+        ON public.source_posts(tenant_id, source, external_id, posted_at) NULLS NOT DISTINCT
+        WHERE tenant_id IS NOT NULL;
+    CREATE INDEX idx_source_posts_id
+        ON public.source_posts(id);
+    FOR index_definition IN SELECT definition FROM source_posts_index_definitions LOOP
+        EXECUTE index_definition.definition;
+    END LOOP;
+
+    IF row_security THEN
+        ALTER TABLE public.source_posts ENABLE ROW LEVEL SECURITY;
+    END IF;
+    IF force_row_security THEN
+        ALTER TABLE public.source_posts FORCE ROW LEVEL SECURITY;
+    END IF;
+    FOR table_policy IN SELECT * FROM source_posts_policies LOOP
+        EXECUTE format(
+            'CREATE POLICY %I ON public.source_posts AS %s FOR %s TO %s%s%s',
+            table_policy.policyname,
+            table_policy.permissive,
+            table_policy.cmd,
+            (
+                SELECT string_agg(
+                    CASE WHEN role_name = 'public' THEN 'PUBLIC' ELSE quote_ident(role_name) END,
+                    ', '
+                )
+                  FROM unnest(table_policy.roles) AS role_name
+            ),
+            COALESCE(' USING (' || table_policy.qual || ')', ''),
+            COALESCE(' WITH CHECK (' || table_policy.with_check || ')', '')
+        );
+    END LOOP;
+    FOR table_grant IN SELECT * FROM source_posts_grants LOOP
+        EXECUTE format(
+            'GRANT %s ON TABLE public.source_posts TO %s',
+            table_grant.privilege_type,
+            CASE WHEN table_grant.grantee = 'PUBLIC' THEN 'PUBLIC' ELSE quote_ident(table_grant.grantee) END
+        );
+    END LOOP;
+
+    CREATE TRIGGER source_posts_clear_match_references
+        AFTER DELETE ON public.source_posts
+        REFERENCING OLD TABLE AS removed_source_posts
+        FOR EACH STATEMENT EXECUTE FUNCTION public.source_posts_clear_match_references();
+END $$;
+
+-- Per-partition guard on id, also for layouts converted before partitions
+-- created their own.
+DO $$
+DECLARE
+    source_posts_partition RECORD;
+BEGIN
+    FOR source_posts_partition IN
+        SELECT child.relname
+          FROM pg_inherits
+          JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+         WHERE pg_inherits.inhparent = 'public.source_posts'::regclass
+    LOOP
+        EXECUTE format(
+            'CREATE UNIQUE INDEX IF NOT EXISTS %I ON public.%I (id)',
+            source_posts_partition.relname || '_id_key',
+            source_posts_partition.relname
+        );
+    END LOOP;
+END $$;
+
+REVOKE ALL ON FUNCTION public.source_post_partition_bounds() FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.missing_source_post_partitions(TEXT, TIMESTAMPTZ, INTEGER) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.prepare_source_post_partition(TEXT, TIMESTAMPTZ, TIMESTAMPTZ) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.validate_source_post_partition_guard(TEXT) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.attach_source_post_partition(TEXT, TIMESTAMPTZ, TIMESTAMPTZ) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.ensure_source_post_partitions(TEXT, TIMESTAMPTZ, INTEGER) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.expired_source_post_partitions(TIMESTAMPTZ) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.detach_expired_source_post_partition(TEXT) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.drop_detached_source_post_partition(TEXT) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.source_posts_clear_match_references() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.source_post_partition_bounds() TO service_role;
+GRANT EXECUTE ON FUNCTION public.missing_source_post_partitions(TEXT, TIMESTAMPTZ, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION public.prepare_source_post_partition(TEXT, TIMESTAMPTZ, TIMESTAMPTZ) TO service_role;
+GRANT EXECUTE ON FUNCTION public.validate_source_post_partition_guard(TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION public.attach_source_post_partition(TEXT, TIMESTAMPTZ, TIMESTAMPTZ) TO service_role;
+GRANT EXECUTE ON FUNCTION public.ensure_source_post_partitions(TEXT, TIMESTAMPTZ, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION public.expired_source_post_partitions(TIMESTAMPTZ) TO service_role;
+GRANT EXECUTE ON FUNCTION public.detach_expired_source_post_partition(TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION public.drop_detached_source_post_partition(TEXT) TO service_role;
+
+NOTIFY pgrst, 'reload schema';
+
+COMMIT;
@@ -206,6 +206,26 @@ def close_dramatiq_broker(broker: Any) -> None:
                 disconnect_pool()
 
 
+def close_shared_redis_client() -> None:
+    """Report and release the process-wide control-path Redis pool."""
+    from api.services.cost_controls import shared_redis_client
+
+    stats = shared_redis_client.stats()
+    logger.info(
+        "shared_redis_pool_closed configured=%s max_connections=%s "
+        "created_connections=%s in_use_connections=%s idle_connections=%s "
+        "clients_created=%s script_loads=%s",
+        stats.configured,
+        stats.max_connections,
+        stats.created_connections,
+        stats.in_use_connections,
+        stats.idle_connections,
+        stats.clients_created,
+        stats.script_loads,
+    )
+    shared_redis_client.reset()
+
+
 def register_signal_handlers(
     state: WorkerState,
     *,
@@ -326,7 +346,10 @@ def run_embedded_dramatiq_worker(state: WorkerState) -> int:
         try:
             worker.stop(timeout=worker_shutdown_timeout_ms)
         finally:
-            close_dramatiq_broker(broker)
+            try:
+                close_dramatiq_broker(broker)
+            finally:
+                close_shared_redis_client()
 
     if recycle:
         logger.info("embedded_dramatiq_worker_recycled exit_code=%s", WORKER_RECYCLE_EXIT_CODE)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import pytest
+
+from api.services import embeddings
+from api.services.embedding_cache import ContentEmbeddingCache
+
+
+@pytest.fixture(autouse=True)
+def _isolated_content_embedding_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The process-wide cache would otherwise serve one test's vectors to the
+    # next and hide the provider calls it asserts on.
+    monkeypatch.setattr(
+        embeddings,
+        "content_embedding_cache",
+        ContentEmbeddingCache(use_redis=False, use_database=False),
+    )
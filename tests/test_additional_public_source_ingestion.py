@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import call, patch
 
+from api.services.cost_controls import shared_redis_client
 from api.services.integrations.public_source import PublicSourcePost
 from api.services.social_ingestion import (
     AdditionalPublicSourceIngestionResult,
@@ -177,11 +178,13 @@ class AdditionalPublicSourceServiceTests(unittest.TestCase):
 
         client = FakeClient()
 
-        class FakeRedis:
-            @staticmethod
-            def from_url(*_args, **_kwargs):
-                return client
+        fake_redis = types.SimpleNamespace(
+            BlockingConnectionPool=SimpleNamespace(from_url=lambda *_args, **_kwargs: None),
+            Redis=lambda **_kwargs: client,
+        )
 
+        shared_redis_client.reset()
+        self.addCleanup(shared_redis_client.reset)
         with (
             patch.dict(
                 os.environ,
@@ -191,7 +194,7 @@ class AdditionalPublicSourceServiceTests(unittest.TestCase):
                 },
                 clear=True,
             ),
-            patch.dict(sys.modules, {"redis": types.SimpleNamespace(Redis=FakeRedis)}),
+            patch.dict(sys.modules, {"redis": fake_redis}),
         ):
             claimed = claim_additional_public_source_query(
                 source="bluesky",
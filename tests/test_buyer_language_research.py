@@ -91,6 +91,52 @@ def test_research_evidence_is_direct_source_language_not_a_lead_inference() -> N
     assert item.source_url == "https://news.ycombinator.com/item?id=42"
 
 
+def test_research_overlap_picks_the_earliest_best_sentence_from_one_row_pass() -> None:
+    row = {
+        "source": "reddit",
+        "source_post_id": "r1",
+        "body": (
+            "Onboarding is slow. "
+            "Our onboarding tasks keep slipping! "
+            "We keep chasing onboarding tasks by hand. "
+            "Chasing onboarding tasks manually again."
+        ),
+    }
+    split_calls = 0
+    original_split = research.re.split
+
+    def counting_split(*args, **kwargs):
+        nonlocal split_calls
+        split_calls += 1
+        return original_split(*args, **kwargs)
+
+    queries = [
+        DiscoveryQuery("manual_workflow_frustration", "manually chasing onboarding tasks"),
+        DiscoveryQuery("buyer_pain", "chasing onboarding tasks every week"),
+    ]
+    with patch.object(research.re, "split", counting_split):
+        evidence = research.build_buyer_language_evidence(
+            tenant_id=TENANT_ID,
+            service_profile_id=PROFILE_ID,
+            queries=queries,
+            source_rows=[row],
+            negative_keywords=[],
+        )
+
+    # Sentences are split once per row however many queries fall back to overlap.
+    assert split_calls == 1
+    assert [item.query_type for item in evidence] == ["buyer_pain", "manual_workflow_frustration"]
+    by_type = {item.query_type: item for item in evidence}
+    manual = by_type["manual_workflow_frustration"]
+    assert manual.evidence_excerpt == "Chasing onboarding tasks manually again."
+    assert manual.metadata["matched_token_count"] == 4
+    # Ties keep the earliest sentence with the largest overlap.
+    pain = by_type["buyer_pain"]
+    assert pain.evidence_excerpt == "We keep chasing onboarding tasks by hand."
+    assert pain.metadata["match_method"] == "token_overlap"
+    assert pain.metadata["matched_token_count"] == 3
+
+
 def test_research_persistence_writes_accepted_evidence_only_to_isolated_table(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import os
 from unittest.mock import patch
 
-from api.services.cost_controls import ProviderRateLimiter
+from api.services.cost_controls import (
+    ProviderRateLimiter,
+    SharedAsyncRedisClient,
+    SharedRedisClient,
+    TenantQuotaGuard,
+)
 
 
 class FakeRedis:
@@ -19,6 +26,41 @@ class FakeRedis:
         return True
 
 
+class NoScriptError(Exception):
+    pass
+
+
+class FakeScriptRedis(FakeRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.scripts: set[str] = set()
+        self.script_bodies_sent = 0
+
+    def evalsha(self, sha: str, numkeys: int, *args: object) -> list[int]:
+        if sha not in self.scripts:
+            raise NoScriptError("NOSCRIPT No matching script.")
+        return [1, 0, 0]
+
+    def eval(self, script: str, numkeys: int, *args: object) -> list[int]:
+        import hashlib
+
+        self.script_bodies_sent += 1
+        self.scripts.add(hashlib.sha1(script.encode("utf-8")).hexdigest())
+        return [1, 0, 0]
+
+
+class FakeAsyncPacingRedis:
+    def __init__(self) -> None:
+        self.calls: list[tuple[object, ...]] = []
+
+    async def evalsha(self, *args: object) -> list[int]:
+        self.calls.append(args)
+        return [1, 0, 0]
+
+    async def eval(self, *args: object) -> list[int]:
+        raise AssertionError("the cached script should be used")
+
+
 class FakePacingRedis:
     def __init__(self) -> None:
         self.calls: list[tuple[object, ...]] = []
@@ -113,3 +155,215 @@ def test_paced_reservation_uses_one_atomic_redis_operation() -> None:
     assert reservation.queued_requests == 1
     assert len(redis.calls) == 1
     assert redis.calls[0][1:3] == (1, "arcli:pace:openai-chat")
+
+
+def test_control_paths_share_one_client_and_send_the_script_once() -> None:
+    redis = FakeScriptRedis()
+    shared = SharedRedisClient()
+
+    with (
+        patch.dict(os.environ, {"REDIS_URL": "redis://control.test/0"}),
+        patch("api.services.cost_controls.shared_redis_client", shared),
+        patch(
+            "api.services.cost_controls._redis_client_from_env",
+            return_value=redis,
+        ) as create_client,
+    ):
+        limiter = ProviderRateLimiter()
+        for _ in range(3):
+            limiter.reserve_paced_slot(provider="openai-chat", limit=20, window_seconds=60)
+        TenantQuotaGuard().check_and_increment(
+            tenant_id="tenant-a",
+            counter_name="verifier",
+            limit=5,
+            window_seconds=60,
+        )
+
+    create_client.assert_called_once()
+    assert redis.script_bodies_sent == 1
+    assert list(redis.values.values()) == [1]
+    stats = shared.stats()
+    assert (stats.configured, stats.clients_created, stats.script_loads) == (True, 1, 1)
+
+
+def test_shared_client_is_rebuilt_when_redis_url_changes() -> None:
+    first, second = FakeRedis(), FakeRedis()
+    shared = SharedRedisClient()
+
+    with patch(
+        "api.services.cost_controls._redis_client_from_env",
+        side_effect=[first, second],
+    ):
+        with patch.dict(os.environ, {"REDIS_URL": "redis://one.test/0"}):
+            assert shared.get() is first
+            assert shared.get() is first
+        with patch.dict(os.environ, {"REDIS_URL": "redis://two.test/0"}):
+            assert shared.get() is second
+        with patch.dict(os.environ, {"REDIS_URL": ""}):
+            assert shared.get() is None
+
+    assert shared.stats().clients_created == 2
+
+
+class FakeAsyncRedis:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def test_each_job_loop_closes_its_async_client_when_the_job_ends() -> None:
+    first, second = FakeAsyncRedis(), FakeAsyncRedis()
+    shared = SharedAsyncRedisClient()
+
+    async def job() -> object:
+        client = shared.get()
+        assert shared.get() is client
+        return client
+
+    with (
+        patch(
+            "api.services.cost_controls._async_redis_client_from_env",
+            side_effect=[first, second],
+        ),
+        patch.dict(os.environ, {"REDIS_URL": "redis://one.test/0"}),
+    ):
+        assert asyncio.run(shared.scoped(job())) is first
+        assert first.closed
+        assert asyncio.run(shared.scoped(job())) is second
+
+    assert second.closed
+    assert len(shared._clients) == 0
+
+
+def test_async_pacing_awaits_redis_instead_of_blocking_the_loop() -> None:
+    redis = FakeAsyncPacingRedis()
+    limiter = ProviderRateLimiter(
+        redis_client=FakePacingRedis(),  # type: ignore[arg-type]
+        async_redis_client=redis,
+    )
+
+    async def pace_concurrently() -> None:
+        await asyncio.gather(
+            *(
+                limiter.wait_for_slot_async(provider="hn-algolia", limit=60)
+                for _ in range(3)
+            )
+        )
+
+    asyncio.run(pace_concurrently())
+
+    assert len(redis.calls) == 3
+    assert redis.calls[0][1:3] == (1, "arcli:pace:hn-algolia")
+
+
+def test_async_pacing_falls_back_to_the_local_queue_without_redis() -> None:
+    limiter = ProviderRateLimiter()
+    provider = "test-async-local-provider"
+
+    async def reserve_twice() -> list[float]:
+        with patch("api.services.cost_controls.time.monotonic", return_value=100.0):
+            return [
+                (await limiter.reserve_paced_slot_async(provider=provider, limit=2)).wait_seconds
+                for _ in range(2)
+            ]
+
+    with patch.dict(os.environ, {"REDIS_URL": ""}):
+        first, second = asyncio.run(reserve_twice())
+
+    assert first == 0
+    assert 30 < second < 30.01
+
+
+def test_reserve_many_grants_what_fits_and_refunds_unused_units() -> None:
+    guard = TenantQuotaGuard()
+    arguments = {
+        "tenant_id": "tenant-bulk",
+        "counter_name": "embedding",
+        "limit": 5,
+        "window_seconds": 3_600,
+    }
+
+    with patch.dict(os.environ, {"REDIS_URL": ""}):
+        first = guard.reserve_many(**arguments, units=3)
+        partial = guard.reserve_many(**arguments, units=4)
+        guard.refund(first, 2)
+        single = guard.check_and_increment(**arguments)
+
+    assert (first.allowed, first.granted, first.current_count) == (True, 3, 3)
+    assert (partial.allowed, partial.granted, partial.current_count) == (False, 2, 5)
+    assert partial.rejection_reason == "tenant_quota_exceeded"
+    # The refund made room in the same window that single checks draw from.
+    assert (single.allowed, single.current_count) == (True, 4)
+
+
+def test_reserve_many_is_one_redis_script_call() -> None:
+    class FakeQuotaRedis:
+        def __init__(self) -> None:
+            self.calls: list[tuple[object, ...]] = []
+
+        def eval(self, script: str, numkeys: int, *args: object) -> list[int]:
+            self.calls.append(args)
+            return [256, 256]
+
+    redis = FakeQuotaRedis()
+    reservation = TenantQuotaGuard(redis_client=redis).reserve_many(  # type: ignore[arg-type]
+        tenant_id="tenant-a",
+        counter_name="embedding",
+        limit=20_000,
+        window_seconds=86_400,
+        units=256,
+    )
+
+    assert reservation.allowed is True
+    assert len(redis.calls) == 1
+    assert redis.calls[0][1:] == (20_000, 256, 86_400)
+
+
+def test_slot_lease_spends_one_reservation_locally_and_returns_the_tail() -> None:
+    limiter = ProviderRateLimiter()
+    provider = "test-leased-provider"
+    sleeps: list[float] = []
+
+    with (
+        patch.dict(os.environ, {"REDIS_URL": ""}),
+        patch("api.services.cost_controls.time.monotonic", return_value=100.0),
+        patch("api.services.cost_controls.time.sleep", side_effect=sleeps.append),
+    ):
+        with limiter.lease(provider=provider, limit=2, size=4) as lease:
+            lease.wait_for_slot(provider=provider, limit=2)
+        # The block was capped at the provider limit; its unused slot went back.
+        after_close = limiter.reserve_paced_slot(provider=provider, limit=2)
+
+    assert sleeps == []
+    assert 30 < after_close.wait_seconds < 30.01
+
+
+def test_slot_lease_uses_one_redis_call_per_block() -> None:
+    class FakeLeaseRedis:
+        def __init__(self) -> None:
+            self.calls: list[tuple[object, ...]] = []
+
+        def eval(self, script: str, numkeys: int, *args: object) -> list[int]:
+            self.calls.append(args)
+            if "TIME" in script:
+                return [0, 1_000_000, 1_000_003]
+            return [1]
+
+    redis = FakeLeaseRedis()
+    limiter = ProviderRateLimiter(redis_client=redis)  # type: ignore[arg-type]
+
+    with (
+        patch("api.services.cost_controls.time.monotonic", return_value=100.0),
+        patch("api.services.cost_controls.time.sleep"),
+    ):
+        lease = limiter.lease(provider="hn-algolia", limit=60_000, size=3)
+        lease.wait_for_slot()
+        lease.wait_for_slot()
+        lease.close()
+
+    lease_call, release_call = redis.calls
+    assert lease_call == ("arcli:pace:hn-algolia", 1, 60_000, 3)
+    # Two of three one-millisecond slots were spent; the third is handed back.
+    assert release_call == ("arcli:pace:hn-algolia", 1_000_003, 1_000_002)
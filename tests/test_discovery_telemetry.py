@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from uuid import UUID
@@ -50,6 +51,23 @@ def _telemetry_state(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("ARCLI_DISCOVERY_TELEMETRY_ENABLED", raising=False)
     monkeypatch.setattr(discovery_telemetry, "_telemetry_unavailable_until", 0.0)
     monkeypatch.setattr(discovery_telemetry, "_telemetry_last_warning_at", 0.0)
+    monkeypatch.setattr(
+        discovery_telemetry,
+        "discovery_event_buffer",
+        discovery_telemetry.DiscoveryEventBuffer(flush_seconds=60.0),
+    )
+
+
+def _record_event(phase: str) -> None:
+    discovery_telemetry.record_discovery_event(
+        "e7b9e545-7778-4808-a470-6375d7a9b759",
+        TENANT_ID,
+        "reddit",
+        "buyer_pain",
+        "need more customers",
+        phase,
+        "returned",
+    )
 
 
 def test_create_discovery_run_scopes_profile_and_keeps_bounded_tenant_query_plan(
@@ -131,13 +149,15 @@ def test_discovery_event_hashes_query_and_scrubs_raw_content(
             "error_type": "TimeoutError",
         },
     )
+    assert connection.calls == []
+    discovery_telemetry.flush_discovery_events()
 
     statement, params = connection.calls[0]
-    assert "run.tenant_id = :tenant_id" in statement
-    assert "query" not in params
-    assert params["query_hash"] == hashlib.sha256(query.casefold().encode("utf-8")).hexdigest()
-    assert len(str(params["event_key"])) == 64
-    details = json.loads(str(params["details"]))
+    assert "run.tenant_id = event.tenant_id" in statement
+    assert "query_0" not in params
+    assert params["query_hash_0"] == hashlib.sha256(query.casefold().encode("utf-8")).hexdigest()
+    assert len(str(params["event_key_0"])) == 64
+    details = json.loads(str(params["details_0"]))
     assert details["candidate_count"] == 4
     assert details["query"] == "[redacted]"
     assert details["title"] == "[redacted]"
@@ -145,6 +165,60 @@ def test_discovery_event_hashes_query_and_scrubs_raw_content(
     assert "How can I get more customers" not in str(params)
 
 
+def test_buffered_events_flush_in_batches_and_count_drops(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connection = _Connection()
+    monkeypatch.setattr(discovery_telemetry, "_database_engine", lambda: _Engine(connection))
+    buffer = discovery_telemetry.DiscoveryEventBuffer(batch_size=10, max_events=3, flush_seconds=60.0)
+    monkeypatch.setattr(discovery_telemetry, "discovery_event_buffer", buffer)
+
+    for phase in ("search", "score", "score", "verify"):
+        _record_event(phase)
+    buffer.close()
+
+    # A repeated event is written once; the event past the bound is dropped.
+    assert [len(params) // 9 for _, params in connection.calls] == [2]
+    assert buffer.stats() == discovery_telemetry.DiscoveryEventBufferStats(
+        pending=0, written=2, dropped=1
+    )
+
+
+def test_flusher_thread_writes_a_full_batch_without_an_explicit_flush(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connection = _Connection()
+    monkeypatch.setattr(discovery_telemetry, "_database_engine", lambda: _Engine(connection))
+    buffer = discovery_telemetry.DiscoveryEventBuffer(batch_size=2, flush_seconds=60.0)
+    monkeypatch.setattr(discovery_telemetry, "discovery_event_buffer", buffer)
+
+    _record_event("search")
+    _record_event("score")
+    deadline = time.monotonic() + 5
+    while buffer.stats().written < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    buffer.close()
+
+    assert buffer.stats().written == 2
+    assert len(connection.calls) == 1
+
+
+def test_failed_batch_is_dropped_and_opens_the_short_circuit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connection = _Connection(error=RuntimeError("connection refused"))
+    monkeypatch.setattr(discovery_telemetry, "_database_engine", lambda: _Engine(connection))
+
+    _record_event("search")
+    discovery_telemetry.flush_discovery_events()
+    _record_event("score")
+
+    assert discovery_telemetry.discovery_event_buffer.stats() == (
+        discovery_telemetry.DiscoveryEventBufferStats(pending=0, written=0, dropped=1)
+    )
+    assert discovery_telemetry._telemetry_unavailable_until > 0
+
+
 def test_completion_is_tenant_scoped_and_sanitizes_summary(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
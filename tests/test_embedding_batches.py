@@ -11,6 +11,22 @@ from api.services.embeddings import (
 )
 
 
+def _quota_guard() -> MagicMock:
+    return MagicMock(
+        reserve_many=MagicMock(
+            side_effect=lambda **kwargs: SimpleNamespace(
+                allowed=True,
+                tenant_id="tenant-a",
+                rejection_reason=None,
+                requested=kwargs["units"],
+                granted=kwargs["units"],
+                current_count=kwargs["units"],
+                limit=20_000,
+                window_seconds=86_400,
+            )
+        )
+    )
+
 def test_embed_many_uses_one_provider_call_and_preserves_input_order() -> None:
     client = SimpleNamespace(
         embeddings=SimpleNamespace(
@@ -24,18 +40,7 @@ def test_embed_many_uses_one_provider_call_and_preserves_input_order() -> None:
             )
         )
     )
-    quota_guard = MagicMock(
-        check_and_increment=MagicMock(
-            side_effect=lambda **_kwargs: SimpleNamespace(
-                allowed=True,
-                tenant_id="tenant-a",
-                rejection_reason=None,
-                current_count=1,
-                limit=20_000,
-                window_seconds=86_400,
-            )
-        )
-    )
+    quota_guard = _quota_guard()
     service = EmbeddingService(client=client, quota_guard=quota_guard)
 
     results = service.embed_many(
@@ -50,7 +55,8 @@ def test_embed_many_uses_one_provider_call_and_preserves_input_order() -> None:
         "second post",
     ]
     assert [result.embedding for result in results] == [[1.0, 0.0], [0.0, 1.0]]
-    assert quota_guard.check_and_increment.call_count == 2
+    quota_guard.reserve_many.assert_called_once()
+    assert quota_guard.reserve_many.call_args.kwargs["units"] == 2
 
 
 def test_embed_many_rejects_mismatched_source_post_ids() -> None:
@@ -85,18 +91,7 @@ def test_embedding_text_is_truncated_by_tokens_before_requesting_the_provider()
             )
         )
     )
-    quota_guard = MagicMock(
-        check_and_increment=MagicMock(
-            return_value=SimpleNamespace(
-                allowed=True,
-                tenant_id="tenant-a",
-                rejection_reason=None,
-                current_count=1,
-                limit=20_000,
-                window_seconds=86_400,
-            )
-        )
-    )
+    quota_guard = _quota_guard()
 
     with patch(
         "api.services.embeddings._embedding_tokenizer",
@@ -123,3 +118,190 @@ def test_embedding_text_has_a_safe_utf8_fallback_without_a_tokenizer() -> None:
         MAX_EMBEDDING_INPUT_TOKENS - EMBEDDING_INPUT_TOKEN_SAFETY_MARGIN
     )
     assert bounded.encode("utf-8").decode("utf-8") == bounded
+
+
+def test_token_budget_batches_bound_inputs_and_tokens_in_order() -> None:
+    from api.services.embeddings import _token_budget_batches
+
+    assert _token_budget_batches([5, 5, 5, 20, 1, 1], max_inputs=2, max_tokens=12) == [
+        [0, 1],
+        [2],
+        [3],
+        [4, 5],
+    ]
+
+
+def test_embed_many_runs_token_bounded_batches_concurrently() -> None:
+    import threading
+    import time
+
+    from api.services.embedding_cache import ContentEmbeddingCache
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak_in_flight = 0
+
+    def create(*, model: str, input: list[str], timeout: float) -> SimpleNamespace:
+        nonlocal in_flight, peak_in_flight
+        with lock:
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(index=index, embedding=[float(len(text)), 1.0])
+                for index, text in enumerate(input)
+            ]
+        )
+
+    client = SimpleNamespace(embeddings=SimpleNamespace(create=MagicMock(side_effect=create)))
+    quota_guard = _quota_guard()
+    service = EmbeddingService(
+        client=client,
+        quota_guard=quota_guard,
+        embedding_cache=ContentEmbeddingCache(use_redis=False, use_database=False),
+    )
+    texts = ["a" * 4, "b" * 4, "c" * 9, "d" * 2, "e" * 2, "f" * 2]
+
+    with (
+        patch.dict(
+            "os.environ",
+            {
+                "ARCLI_OPENAI_EMBEDDING_BATCH_SIZE": "3",
+                "ARCLI_OPENAI_EMBEDDING_BATCH_MAX_TOKENS": "10",
+                "ARCLI_OPENAI_EMBEDDING_REQUESTS_PER_MINUTE": "60000",
+                "ARCLI_OPENAI_EMBEDDING_MAX_IN_FLIGHT": "2",
+            },
+        ),
+        patch("api.services.embeddings._embedding_tokenizer", return_value=None),
+    ):
+        results = service.embed_many(texts)
+
+    batches = [call.kwargs["input"] for call in client.embeddings.create.call_args_list]
+    assert sorted(batches) == sorted([["aaaa", "bbbb"], ["ccccccccc"], ["dd", "ee", "ff"]])
+    assert peak_in_flight == 2
+    assert [result.embedding[0] for result in results] == [4.0, 4.0, 9.0, 2.0, 2.0, 2.0]
+
+
+def test_embed_many_refunds_only_the_failed_batch_after_the_others_settle() -> None:
+    import time
+
+    import pytest
+
+    from api.services.embedding_cache import ContentEmbeddingCache
+
+    def create(*, model: str, input: list[str], timeout: float) -> SimpleNamespace:
+        if input == ["ccccccccc"]:
+            raise RuntimeError("provider unavailable")
+        time.sleep(0.05)
+        return SimpleNamespace(
+            data=[SimpleNamespace(index=index, embedding=[1.0, 0.0]) for index in range(len(input))]
+        )
+
+    client = SimpleNamespace(embeddings=SimpleNamespace(create=MagicMock(side_effect=create)))
+    quota_guard = _quota_guard()
+    service = EmbeddingService(
+        client=client,
+        quota_guard=quota_guard,
+        embedding_cache=ContentEmbeddingCache(use_redis=False, use_database=False),
+    )
+
+    with (
+        patch.dict(
+            "os.environ",
+            {
+                "ARCLI_OPENAI_EMBEDDING_BATCH_SIZE": "3",
+                "ARCLI_OPENAI_EMBEDDING_BATCH_MAX_TOKENS": "10",
+                "ARCLI_OPENAI_EMBEDDING_REQUESTS_PER_MINUTE": "60000",
+                "ARCLI_OPENAI_EMBEDDING_MAX_IN_FLIGHT": "3",
+            },
+        ),
+        patch("api.services.embeddings._embedding_tokenizer", return_value=None),
+        pytest.raises(RuntimeError, match="provider unavailable"),
+    ):
+        service.embed_many(
+            ["a" * 4, "b" * 4, "c" * 9, "d" * 2, "e" * 2, "f" * 2],
+            tenant_id="tenant-a",
+        )
+
+    quota_guard.refund.assert_called_once()
+    assert quota_guard.refund.call_args.args[1] == 1
+
+
+def test_normalization_is_memoized_with_its_token_count() -> None:
+    from api.services.embeddings import (
+        clear_normalized_embedding_inputs,
+        normalized_embedding_input,
+    )
+
+    class CountingTokenizer:
+        calls = 0
+
+        def encode(self, value: str, **_kwargs: object) -> list[str]:
+            CountingTokenizer.calls += 1
+            return list(value)
+
+        def decode(self, tokens: list[str]) -> str:
+            return "".join(tokens)
+
+    original = "~" * (MAX_EMBEDDING_INPUT_TOKENS + 10)
+    clear_normalized_embedding_inputs()
+    with patch(
+        "api.services.embeddings._embedding_tokenizer",
+        return_value=CountingTokenizer(),
+    ):
+        first = normalized_embedding_input(original)
+        again = normalized_embedding_input(original)
+        # Request validation re-normalizes the already bounded text.
+        bounded = normalize_embedding_text(first.text)
+    clear_normalized_embedding_inputs()
+
+    expected_tokens = MAX_EMBEDDING_INPUT_TOKENS - EMBEDDING_INPUT_TOKEN_SAFETY_MARGIN
+    assert first is again
+    assert first.token_count == expected_tokens
+    assert bounded == first.text
+    # One encode for the original and one to count the bounded text.
+    assert CountingTokenizer.calls == 2
+    assert normalized_embedding_input("short").token_count == 5
+
+
+def test_embed_many_packs_provider_requests_by_token_budget() -> None:
+    from api.services.embedding_cache import ContentEmbeddingCache
+
+    client = SimpleNamespace(
+        embeddings=SimpleNamespace(
+            create=MagicMock(
+                side_effect=lambda **kwargs: SimpleNamespace(
+                    data=[
+                        SimpleNamespace(index=index, embedding=[1.0, 0.0])
+                        for index, _ in enumerate(kwargs["input"])
+                    ]
+                )
+            )
+        )
+    )
+    quota_guard = _quota_guard()
+    service = EmbeddingService(
+        client=client,
+        quota_guard=quota_guard,
+        embedding_cache=ContentEmbeddingCache(use_redis=False, use_database=False),
+    )
+
+    with patch.dict(
+        "os.environ",
+        {
+            "ARCLI_OPENAI_EMBEDDING_BATCH_SIZE": "100",
+            "ARCLI_OPENAI_EMBEDDING_BATCH_MAX_TOKENS": "12",
+            "ARCLI_OPENAI_EMBEDDING_REQUESTS_PER_MINUTE": "60000",
+        },
+    ):
+        service.embed_many(["alpha", "bravo", "charlie", "delta", "echo-echo"])
+
+    # Batches are dispatched concurrently, so only their packing is fixed.
+    assert sorted(call.kwargs["input"] for call in client.embeddings.create.call_args_list) == [
+        ["alpha", "bravo"],
+        ["charlie", "delta"],
+        ["echo-echo"],
+    ]
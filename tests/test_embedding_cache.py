@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from api.services.embedding_cache import ContentEmbeddingCache, embedding_text_sha256
+from api.services.embeddings import EMBEDDING_MODEL, EmbeddingService
+
+
+def _quota_guard() -> MagicMock:
+    return MagicMock(
+        reserve_many=MagicMock(
+            side_effect=lambda **kwargs: SimpleNamespace(
+                allowed=True,
+                tenant_id="tenant-a",
+                rejection_reason=None,
+                requested=kwargs["units"],
+                granted=kwargs["units"],
+                current_count=kwargs["units"],
+                limit=20_000,
+                window_seconds=86_400,
+            )
+        ),
+        check_and_increment=MagicMock(),
+    )
+
+
+def _client(*embeddings: list[float]) -> SimpleNamespace:
+    return SimpleNamespace(
+        embeddings=SimpleNamespace(
+            create=MagicMock(
+                return_value=SimpleNamespace(
+                    data=[
+                        SimpleNamespace(index=index, embedding=embedding)
+                        for index, embedding in enumerate(embeddings)
+                    ]
+                )
+            )
+        )
+    )
+
+
+class FakePipeline:
+    def __init__(self, store: dict[str, str]) -> None:
+        self.store = store
+        self.pending: list[tuple[str, str]] = []
+
+    def set(self, key: str, value: str, ex: int) -> None:
+        self.pending.append((key, value))
+
+    def execute(self) -> None:
+        self.store.update(self.pending)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool) -> FakePipeline:
+        return FakePipeline(self.store)
+
+
+def test_embed_many_sends_each_uncached_text_once_and_reuses_it_later() -> None:
+    cache = ContentEmbeddingCache(use_redis=False, use_database=False)
+    client = _client([1.0, 0.0], [0.0, 1.0])
+    quota_guard = _quota_guard()
+    service = EmbeddingService(client=client, quota_guard=quota_guard, embedding_cache=cache)
+
+    first = service.embed_many(["repost", "other", "repost"], tenant_id="tenant-a")
+
+    assert client.embeddings.create.call_args.kwargs["input"] == ["repost", "other"]
+    assert [result.embedding for result in first] == [[1.0, 0.0], [0.0, 1.0], [1.0, 0.0]]
+    assert quota_guard.reserve_many.call_args.kwargs["units"] == 2
+
+    # Another tenant embedding the same text spends no quota or provider call.
+    repeated = service.embed_text("repost", tenant_id="tenant-b")
+
+    assert repeated.embedding == [1.0, 0.0]
+    client.embeddings.create.assert_called_once()
+    quota_guard.reserve_many.assert_called_once()
+    quota_guard.check_and_increment.assert_not_called()
+    assert cache.stats().memory_hits == 1
+
+
+def test_redis_tier_fills_the_lru_and_eviction_is_bounded() -> None:
+    redis = FakeRedis()
+    writer = ContentEmbeddingCache(redis_client=redis, use_database=False)
+    writer.put_many(EMBEDDING_MODEL, {"a" * 64: [0.5, 0.5], "b" * 64: [1.0, 0.0]})
+
+    reader = ContentEmbeddingCache(max_entries=1, redis_client=redis, use_database=False)
+    found = reader.get_many(EMBEDDING_MODEL, ["a" * 64, "b" * 64, "c" * 64])
+
+    assert found == {"a" * 64: [0.5, 0.5], "b" * 64: [1.0, 0.0]}
+    stats = reader.stats()
+    assert (stats.redis_hits, stats.misses, stats.entries) == (2, 1, 1)
+    assert reader.get_many("another-model", ["a" * 64]) == {}
+
+
+def test_shared_tier_failures_are_misses_with_a_cooldown() -> None:
+    redis = MagicMock(mget=MagicMock(side_effect=ConnectionError("down")))
+    cache = ContentEmbeddingCache(redis_client=redis, use_database=False)
+    text_sha256 = embedding_text_sha256("post body")
+
+    assert cache.get_many(EMBEDDING_MODEL, [text_sha256]) == {}
+    assert cache.get_many(EMBEDDING_MODEL, [text_sha256]) == {}
+
+    redis.mget.assert_called_once()
+    assert cache.stats().misses == 2
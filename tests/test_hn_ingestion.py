@@ -109,6 +109,40 @@ class HackerNewsIngestionTests(unittest.TestCase):
             )
         )
 
+    def test_profile_guard_scans_a_post_once_for_all_discovery_queries(self) -> None:
+        from api.services.social import activation, public_matching
+        from api.services.social.models import DiscoveryQuery, SocialPost
+
+        post = SocialPost(
+            source="hackernews",
+            external_id="features-1",
+            title="Ask HN: replacing our invoicing setup",
+            text="We need billing software; reconciliation is manual and takes forever.",
+        )
+        queries = [
+            DiscoveryQuery(phrase=phrase, query_type="recommendation_request")
+            for phrase in (
+                "payroll software for contractors",
+                "crm for agencies",
+                "recurring billing software",
+            )
+        ]
+
+        with unittest.mock.patch.object(
+            activation,
+            "_BUYER_REQUEST_CONTEXT_PATTERN",
+            wraps=activation._BUYER_REQUEST_CONTEXT_PATTERN,
+        ) as request_pattern:
+            for _ in range(2):
+                self.assertTrue(
+                    public_matching._source_post_matches_profile_discovery_context(post, queries)
+                )
+            self.assertEqual(request_pattern.search.call_count, 1)
+
+        features = activation.post_features(post)
+        self.assertIn("billing", features.tokens)
+        self.assertTrue(features.has_first_person_context)
+
     def test_buyer_paraphrase_uses_recall_guard_before_verification(self) -> None:
         import api.services.social_ingestion as ingestion_module
 
@@ -0,0 +1,106 @@
+"""Regression coverage for the vectorized embedding-similarity prefilter."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from api.services.matching import (
+    MatchRejection,
+    PostEmbedding,
+    cosine_similarity,
+    find_candidate_matches,
+    normalized_embedding_matrix,
+    top_k_indices,
+)
+
+_TEXT = "We need a recurring billing tool for our SaaS this quarter."
+
+
+def _post(post_id: str, embedding: list[float], text: str = _TEXT) -> PostEmbedding:
+    return PostEmbedding(
+        post_id=post_id,
+        source="hackernews",
+        text=text,
+        embedding=embedding,
+    )
+
+
+def test_batch_scores_match_the_scalar_cosine_similarity() -> None:
+    rng = np.random.default_rng(7)
+    profile = rng.normal(size=64).tolist()
+    posts = [_post(f"post-{index}", rng.normal(size=64).tolist()) for index in range(40)]
+
+    with patch.dict(os.environ, {}, clear=True):
+        candidates = find_candidate_matches(
+            profile,
+            posts,
+            threshold=0.0,
+            max_candidates=40,
+            tenant_id="tenant-a",
+        )
+
+    expected = {
+        post.post_id: cosine_similarity(profile, post.embedding)
+        for post in posts
+        if cosine_similarity(profile, post.embedding) >= 0.0
+    }
+    assert {candidate.post_id for candidate in candidates} == set(expected)
+    for candidate in candidates:
+        assert candidate.score == pytest.approx(expected[candidate.post_id], abs=1e-6)
+    assert [candidate.score for candidate in candidates] == sorted(
+        (candidate.score for candidate in candidates),
+        reverse=True,
+    )
+
+
+def test_rejections_keep_input_order_and_top_k_keeps_stable_ties() -> None:
+    rejections: list[MatchRejection] = []
+    posts = [
+        _post("tie-1", [1.0, 0.0]),
+        _post("spam", [1.0, 0.0], text="Crypto giveaway for everyone who replies here today."),
+        _post("far", [0.0, 1.0]),
+        _post("tie-2", [2.0, 0.0]),
+        _post("tie-3", [3.0, 0.0]),
+    ]
+
+    with patch.dict(os.environ, {}, clear=True):
+        candidates = find_candidate_matches(
+            [1.0, 0.0],
+            posts,
+            tenant_id="tenant-a",
+            service_profile_id="profile-a",
+            max_candidates=2,
+            on_rejected=rejections.append,
+        )
+
+    assert [candidate.post_id for candidate in candidates] == ["tie-1", "tie-2"]
+    assert [candidate.score for candidate in candidates] == [1.0, 1.0]
+    assert [
+        (rejection.source_post_id, rejection.rejection_stage)
+        for rejection in rejections
+    ] == [("spam", "cheap_filter"), ("far", "embedding_similarity")]
+    assert rejections[1].similarity_score == 0.0
+
+
+def test_dimension_mismatch_is_still_rejected() -> None:
+    with pytest.raises(ValueError, match="dimensions must match"):
+        find_candidate_matches([1.0, 0.0, 0.0], [_post("post-1", [1.0, 0.0])])
+
+
+def test_top_k_indices_breaks_ties_by_position() -> None:
+    scores = np.asarray([0.5, 0.9, 0.5, 0.9, 0.1], dtype=np.float32)
+
+    assert top_k_indices(scores, 3).tolist() == [1, 3, 0]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 0, 2, 4]
+
+
+def test_normalized_matrix_is_contiguous_float32_with_zero_rows_kept() -> None:
+    matrix = normalized_embedding_matrix([[3.0, 4.0], [0.0, 0.0]])
+
+    assert matrix.dtype == np.float32
+    assert matrix.flags["C_CONTIGUOUS"]
+    assert matrix.tolist() == [[pytest.approx(0.6), pytest.approx(0.8)], [0.0, 0.0]]
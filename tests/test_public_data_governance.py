@@ -99,6 +99,71 @@ class PublicPostPreparationTests(unittest.TestCase):
         ):
             self.assertEqual(data_governance.filter_approved_removals([post]), [])
 
+    def test_suppression_index_loads_once_then_reads_only_changed_requests(self) -> None:
+        post = _post()
+        other = post.model_copy(
+            update={
+                "source_post_id": "at://did:plc:bob/app.bsky.feed.post/two",
+                "author_handle": "bob.bsky.social",
+                "url": "https://bsky.app/profile/bob.bsky.social/post/two",
+            }
+        )
+        stamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        batches = [
+            [
+                {
+                    "source": "bluesky",
+                    "source_post_id": None,
+                    "author_handle": "ALICE.bsky.social",
+                    "source_url": None,
+                    "updated_at": stamp,
+                }
+            ],
+            [],
+            [
+                {
+                    "source": "bluesky",
+                    "source_post_id": other.source_post_id,
+                    "author_handle": None,
+                    "source_url": None,
+                    "updated_at": stamp.replace(hour=1),
+                }
+            ],
+        ]
+        calls: list[tuple[str, dict[str, object]]] = []
+
+        class FakeConnection:
+            def execute(self, statement, params):
+                calls.append((str(statement), params))
+                return SimpleNamespace(mappings=lambda: batches[len(calls) - 1])
+
+        class FakeConnect:
+            def __enter__(self):
+                return FakeConnection()
+
+            def __exit__(self, *_args):
+                return False
+
+        index = data_governance.RemovalSuppressionIndex()
+        with (
+            patch.dict(os.environ, {"ARCLI_PUBLIC_DATA_GOVERNANCE_ENFORCEMENT": "true"}, clear=True),
+            patch.object(
+                data_governance,
+                "_database_engine",
+                return_value=SimpleNamespace(connect=FakeConnect),
+            ),
+            patch.object(data_governance, "removal_suppression_index", index),
+        ):
+            self.assertEqual(data_governance.filter_approved_removals([post, other]), [other])
+            self.assertEqual(data_governance.filter_approved_removals([post, other]), [other])
+            self.assertEqual(data_governance.filter_approved_removals([post, other]), [])
+
+        self.assertNotIn("updated_at >=", calls[0][0])
+        self.assertEqual(calls[1][1]["since"], stamp)
+        self.assertEqual(calls[2][1]["since"], stamp)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.version, 2)
+
     def test_storage_boundary_excludes_sensitive_content_without_a_database_call(self) -> None:
         from api.services.social import public_storage
 
@@ -120,71 +185,320 @@ class PublicPostPreparationTests(unittest.TestCase):
         self.assertEqual(inserted_ids, [])
 
 
-class PublicDataRetentionTests(unittest.TestCase):
-    def test_retention_deletes_lead_snapshots_before_global_source_rows(self) -> None:
-        calls: list[str] = []
-
-        class FakeConnection:
-            def execute(self, statement, _params):
-                query = str(statement)
-                calls.append(query)
-                if "pg_try_advisory_xact_lock" in query:
-                    return SimpleNamespace(scalar=lambda: True)
-                if "DELETE FROM public.lead_matches" in query:
-                    return SimpleNamespace(rowcount=3)
-                if "DELETE FROM public.source_posts" in query:
-                    return SimpleNamespace(rowcount=2)
-                if "DELETE FROM public.discovery_evidence" in query:
-                    return SimpleNamespace(rowcount=4)
-                raise AssertionError(query)
+class _FakeRetentionDatabase:
+    """Serves expired-row chunks and records one entry per transaction."""
+
+    def __init__(
+        self,
+        *,
+        source_posts: int,
+        discovery_evidence: int,
+        embedding_cache: int | None = None,
+        locked: bool = True,
+        partitions: list[dict[str, object]] | None = None,
+        upcoming: list[str] | None = None,
+        detach_error: Exception | None = None,
+    ) -> None:
+        stamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.expired = {
+            "public.source_posts": [
+                {"id": f"00000000-0000-0000-0000-{index:012d}", "retention_age": stamp}
+                for index in range(source_posts)
+            ],
+            "public.discovery_evidence": [
+                {"id": f"10000000-0000-0000-0000-{index:012d}", "retention_age": stamp}
+                for index in range(discovery_evidence)
+            ],
+        }
+        # None models a deployment without the optional embedding cache table.
+        self.embedding_cache = embedding_cache
+        self.locked = locked
+        # None models the unpartitioned layout.
+        self.partitions = partitions
+        self.upcoming = list(upcoming or [])
+        self.attach_steps: list[tuple[str, str]] = []
+        self.detach_error = detach_error
+        self.transactions: list[list[tuple[str, dict[str, object]]]] = []
+
+    def execute(self, statement, params=None):
+        query = str(statement)
+        self.transactions[-1].append((query, params or {}))
+        if "pg_try_advisory_xact_lock" in query:
+            return SimpleNamespace(scalar=lambda: self.locked)
+        if "information_schema.columns" in query:
+            columns = [] if self.embedding_cache is None else [{"column_name": "model"}]
+            return SimpleNamespace(
+                mappings=lambda: [
+                    {**row, "data_type": "text", "udt_name": "text", "udt_schema": "pg_catalog"}
+                    for row in columns
+                ]
+            )
+        if "DELETE FROM public.embedding_cache" in query:
+            deleted = min(self.embedding_cache or 0, params["batch_size"])
+            self.embedding_cache = (self.embedding_cache or 0) - deleted
+            return SimpleNamespace(rowcount=deleted)
+        if "pg_partitioned_table" in query:
+            return SimpleNamespace(scalar=lambda: self.partitions is not None)
+        if "SET LOCAL lock_timeout" in query:
+            return SimpleNamespace(scalar=lambda: None)
+        if "missing_source_post_partitions" in query:
+            upcoming = [
+                {"partition_name": name, "period_start": name, "period_end": name}
+                for name in self.upcoming
+            ]
+            return SimpleNamespace(mappings=lambda: upcoming)
+        for step in ("prepare_source_post_partition", "validate_source_post_partition_guard"):
+            if step in query:
+                self.attach_steps.append((step, params["partition_name"]))
+                return SimpleNamespace(mappings=lambda: SimpleNamespace(first=lambda: {step: None}))
+        if "attach_source_post_partition" in query:
+            self.attach_steps.append(("attach_source_post_partition", params["partition_name"]))
+            self.upcoming.remove(params["partition_name"])
+            return SimpleNamespace(mappings=lambda: SimpleNamespace(first=lambda: {"attached": True}))
+        if "expired_source_post_partitions" in query:
+            expired = [
+                {"partition_name": partition["name"], "attached": partition["attached"]}
+                for partition in self.partitions or []
+            ]
+            return SimpleNamespace(mappings=lambda: expired)
+        if "detach_expired_source_post_partition" in query:
+            if self.detach_error is not None:
+                raise self.detach_error
+            partition = next(item for item in self.partitions or [] if item["name"] == params["partition_name"])
+            partition["attached"] = False
+            detached = {"source_posts_deleted": 40, "lead_matches_deleted": 7}
+            return SimpleNamespace(mappings=lambda: SimpleNamespace(first=lambda: detached))
+        if "drop_detached_source_post_partition" in query:
+            partition = next(item for item in self.partitions or [] if item["name"] == params["partition_name"])
+            assert not partition["attached"], "attached partitions must be detached before the drop"
+            self.partitions = [item for item in self.partitions or [] if item is not partition]
+            return SimpleNamespace(mappings=lambda: SimpleNamespace(first=lambda: {"dropped": True}))
+        if query.lstrip().startswith("SELECT id"):
+            table = next(name for name in self.expired if f"FROM {name}" in query)
+            rows = self.expired[table]
+            if "after_id" in params:
+                rows = [row for row in rows if row["id"] > params["after_id"]]
+            return SimpleNamespace(mappings=lambda: rows[: params["batch_size"]])
+        if "DELETE FROM public.lead_matches" in query:
+            return SimpleNamespace(rowcount=2 * len(params["ids"]))
+        for table, rows in self.expired.items():
+            if f"DELETE FROM {table}" in query:
+                self.expired[table] = [row for row in rows if row["id"] not in params["ids"]]
+                return SimpleNamespace(rowcount=len(params["ids"]))
+        raise AssertionError(query)
+
+    def begin(self):
+        database = self
 
         class FakeBegin:
             def __enter__(self):
-                return FakeConnection()
+                database.transactions.append([])
+                return database
 
             def __exit__(self, *_args):
                 return False
 
-        class FakeEngine:
-            def begin(self):
-                return FakeBegin()
+        return FakeBegin()
 
-        with patch.object(data_governance, "_database_engine", return_value=FakeEngine()):
-            result = data_governance.run_public_data_retention()
 
-        self.assertEqual(result.lead_matches_deleted, 3)
-        self.assertEqual(result.source_posts_deleted, 2)
-        self.assertEqual(result.discovery_evidence_deleted, 4)
+class PublicDataRetentionTests(unittest.TestCase):
+    def test_retention_deletes_in_committed_chunks_lead_snapshots_first(self) -> None:
+        database = _FakeRetentionDatabase(source_posts=5, discovery_evidence=2)
+
+        with patch.object(data_governance, "_database_engine", return_value=database):
+            result = data_governance.run_public_data_retention(batch_size=2, time_budget_seconds=60)
+
+        self.assertEqual(result.source_posts_deleted, 5)
+        self.assertEqual(result.lead_matches_deleted, 10)
+        self.assertEqual(result.discovery_evidence_deleted, 2)
+        self.assertFalse(result.backlog_remaining)
+        self.assertEqual(result.batches, 5)
+        self.assertEqual(len(database.transactions), 1 + result.batches)
+        for transaction in database.transactions:
+            self.assertIn("pg_try_advisory_xact_lock", transaction[0][0])
+        chunk = [query for query, _params in database.transactions[1]]
         self.assertLess(
-            next(index for index, query in enumerate(calls) if "DELETE FROM public.lead_matches" in query),
-            next(index for index, query in enumerate(calls) if "DELETE FROM public.source_posts" in query),
+            next(index for index, query in enumerate(chunk) if "DELETE FROM public.lead_matches" in query),
+            next(index for index, query in enumerate(chunk) if "DELETE FROM public.source_posts" in query),
+        )
+        # Later chunks continue after the last row of the previous one.
+        self.assertEqual(
+            database.transactions[2][1][1]["after_id"],
+            "00000000-0000-0000-0000-000000000001",
         )
 
-    def test_retention_skips_when_another_worker_holds_the_lock(self) -> None:
-        class FakeConnection:
-            def execute(self, statement, _params):
-                self.assertIn("pg_try_advisory_xact_lock", str(statement))
-                return SimpleNamespace(scalar=lambda: False)
+    def test_retention_prunes_expired_embedding_cache_vectors_last(self) -> None:
+        database = _FakeRetentionDatabase(source_posts=1, discovery_evidence=0, embedding_cache=3)
 
-            def assertIn(self, member, container):
-                if member not in container:
-                    raise AssertionError(f"{member!r} not found")
+        with patch.object(data_governance, "_database_engine", return_value=database):
+            result = data_governance.run_public_data_retention(batch_size=2, time_budget_seconds=60)
 
-        class FakeBegin:
-            def __enter__(self):
-                return FakeConnection()
+        self.assertEqual(result.embedding_cache_deleted, 3)
+        self.assertEqual(database.embedding_cache, 0)
+        self.assertFalse(result.backlog_remaining)
+        last_chunk = [query for query, _params in database.transactions[-1]]
+        self.assertIn("DELETE FROM public.embedding_cache", last_chunk[1])
+        self.assertEqual(result.rows_deleted, 1 + 2 + 3)
 
-            def __exit__(self, *_args):
-                return False
+    def test_retention_stops_at_the_time_budget_and_resumes_next_run(self) -> None:
+        database = _FakeRetentionDatabase(source_posts=3, discovery_evidence=1)
 
-        class FakeEngine:
-            def begin(self):
-                return FakeBegin()
+        with (
+            patch.object(data_governance, "_database_engine", return_value=database),
+            patch.object(data_governance.time, "monotonic", side_effect=[0.0, 0.0, 5.0, 5.0]),
+        ):
+            first = data_governance.run_public_data_retention(batch_size=2, time_budget_seconds=1)
+
+        self.assertTrue(first.backlog_remaining)
+        self.assertEqual((first.batches, first.source_posts_deleted), (1, 2))
+
+        with patch.object(data_governance, "_database_engine", return_value=database):
+            second = data_governance.run_public_data_retention(batch_size=2, time_budget_seconds=60)
+
+        self.assertFalse(second.backlog_remaining)
+        self.assertEqual((second.source_posts_deleted, second.discovery_evidence_deleted), (1, 1))
+
+    def test_partitioned_retention_drops_expired_partitions_before_chunking(self) -> None:
+        database = _FakeRetentionDatabase(
+            source_posts=1,
+            discovery_evidence=0,
+            partitions=[
+                {"name": "source_posts_p20260101", "attached": True},
+                # Left detached by an interrupted run.
+                {"name": "source_posts_p20251225", "attached": False},
+            ],
+            upcoming=["source_posts_p20260301"],
+        )
+
+        with patch.object(data_governance, "_database_engine", return_value=database):
+            result = data_governance.run_public_data_retention(batch_size=10, time_budget_seconds=60)
+
+        queries = [[query for query, _ in transaction] for transaction in database.transactions]
+        listing, prepare, validate, attach, detach, drop_first, drop_second = queries[1:8]
+        self.assertIn("missing_source_post_partitions", listing[0])
+        self.assertEqual(database.transactions[1][0][1]["granularity"], "day")
+        self.assertIn("expired_source_post_partitions", listing[1])
+        # Preparing, validating and attaching a new period are separate
+        # transactions, so the guard is validated without blocking writes.
+        self.assertEqual(
+            database.attach_steps,
+            [
+                ("prepare_source_post_partition", "source_posts_p20260301"),
+                ("validate_source_post_partition_guard", "source_posts_p20260301"),
+                ("attach_source_post_partition", "source_posts_p20260301"),
+            ],
+        )
+        for step in (prepare, validate, attach, detach, drop_first, drop_second):
+            self.assertIn("pg_try_advisory_xact_lock", step[0])
+            self.assertIn("SET LOCAL lock_timeout", step[1])
+            self.assertEqual(len(step), 3)
+        self.assertIn("detach_expired_source_post_partition", detach[2])
+        for drop in (drop_first, drop_second):
+            self.assertIn("drop_detached_source_post_partition", drop[2])
+        self.assertEqual(database.upcoming, [])
+        self.assertEqual(database.partitions, [])
+        self.assertEqual(result.partitions_dropped, 2)
+        # The undated row left in the default partition is still purged.
+        self.assertEqual((result.source_posts_deleted, result.lead_matches_deleted), (41, 9))
+
+    def test_contended_partition_detach_is_deferred_to_the_next_run(self) -> None:
+        from sqlalchemy.exc import OperationalError
+
+        database = _FakeRetentionDatabase(
+            source_posts=1,
+            discovery_evidence=0,
+            partitions=[{"name": "source_posts_p20260101", "attached": True}],
+            detach_error=OperationalError("DETACH", {}, Exception("lock timeout")),
+        )
+
+        with patch.object(data_governance, "_database_engine", return_value=database):
+            result = data_governance.run_public_data_retention(batch_size=10, time_budget_seconds=60)
+
+        self.assertEqual(result.partitions_dropped, 0)
+        self.assertEqual(database.partitions, [{"name": "source_posts_p20260101", "attached": True}])
+        self.assertEqual((result.source_posts_deleted, result.lead_matches_deleted), (1, 2))
+        self.assertFalse(result.backlog_remaining)
+
+    def test_retention_skips_when_another_worker_holds_the_lock(self) -> None:
+        database = _FakeRetentionDatabase(source_posts=1, discovery_evidence=0, locked=False)
 
-        with patch.object(data_governance, "_database_engine", return_value=FakeEngine()):
+        with patch.object(data_governance, "_database_engine", return_value=database):
             result = data_governance.run_public_data_retention()
 
         self.assertTrue(result.skipped)
+        self.assertEqual(len(database.transactions), 1)
+
+
+class PartitionedSourcePostLayoutTests(unittest.TestCase):
+    def test_writers_and_corpus_reads_follow_the_partitioned_keys(self) -> None:
+        from api.services.social import public_records, public_storage
+
+        statements: list[tuple[str, dict[str, object]]] = []
+
+        class FakeConnection:
+            def execute(self, statement, params):
+                statements.append((str(statement), params))
+                return SimpleNamespace(mappings=lambda: [])
+
+        table = SimpleNamespace(
+            upsert=lambda *_args, **kwargs: SimpleNamespace(
+                execute=lambda: SimpleNamespace(data=[], on_conflict=kwargs["on_conflict"])
+            )
+        )
+        client = SimpleNamespace(table=lambda _name: table)
+        columns = {
+            name: {}
+            for name in ("id", "source", "source_post_id", "tenant_id", "metadata", "embedding_status", "posted_at")
+        }
+
+        for partitioned, on_conflict in ((False, "source,source_post_id"), (True, "source,source_post_id,posted_at")):
+            statements.clear()
+            with (
+                patch.dict(os.environ, {"ARCLI_PUBLIC_DATA_RETENTION_DAYS": "14"}, clear=True),
+                patch.object(data_governance, "_database_engine", return_value=object()),
+                patch.object(data_governance, "table_is_partitioned", return_value=partitioned),
+                patch.object(public_records, "_table_columns", return_value=columns),
+            ):
+                response = public_storage._upsert_public_source_post_payloads(client, [{}])
+                public_records._load_recent_embedded_public_source_post_rows(FakeConnection(), limit=5)
+
+            self.assertEqual(response.on_conflict, on_conflict)
+            query, params = statements[0]
+            if partitioned:
+                self.assertIn("posted_at >= NOW()", query)
+                self.assertEqual(params, {"corpus_window_days": 14, "limit": 5})
+            else:
+                self.assertNotIn("posted_at >=", query)
+                self.assertEqual(params, {"limit": 5})
+
+    def test_public_upsert_retries_with_the_other_layout_when_the_cached_one_is_stale(self) -> None:
+        from api.services.social import public_storage
+
+        class ConflictTargetMismatch(Exception):
+            code = "42P10"
+
+        targets: list[str] = []
+
+        def upsert(*_args, on_conflict, **_kwargs):
+            targets.append(on_conflict)
+
+            def execute():
+                if on_conflict == "source,source_post_id":
+                    raise ConflictTargetMismatch("no unique or exclusion constraint matching the ON CONFLICT")
+                return SimpleNamespace(data=[])
+
+            return SimpleNamespace(execute=execute)
+
+        client = SimpleNamespace(table=lambda _name: SimpleNamespace(upsert=upsert))
+        with (
+            patch.object(data_governance, "_database_engine", return_value=object()),
+            patch.object(data_governance, "table_is_partitioned", return_value=False),
+            patch("api.services.schema_cache.invalidate_table_columns") as invalidate,
+        ):
+            public_storage._upsert_public_source_post_payloads(client, [{}])
+
+        self.assertEqual(targets, ["source,source_post_id", "source,source_post_id,posted_at"])
+        invalidate.assert_called_once_with("source_posts")
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import unittest
 from contextlib import nullcontext
@@ -9,6 +10,8 @@ from types import SimpleNamespace
 from unittest.mock import patch
 from uuid import UUID
 
+import numpy as np
+
 from api.services.verifier import VERIFIER_POLICY_VERSION, VerificationResult
 
 
@@ -189,8 +192,8 @@ class PublicSourceMatchingTests(unittest.TestCase):
             def close(self) -> None:
                 return None
 
-        def record_lead_match(*_args, **kwargs):
-            persisted.append(kwargs)
+        def record_lead_matches(_conn, matches):
+            persisted.extend(match.fields() for match in matches)
 
         with (
             patch.object(ingestion, "_database_engine", return_value=FakeEngine()),
@@ -212,7 +215,7 @@ class PublicSourceMatchingTests(unittest.TestCase):
             ),
             patch.object(ingestion, "_persist_public_source_post_embedding_cache"),
             patch.object(ingestion, "_cached_lead_verification", return_value=None),
-            patch.object(ingestion, "_persist_lead_match", side_effect=record_lead_match),
+            patch.object(ingestion, "_persist_lead_matches", side_effect=record_lead_matches),
             patch.object(ingestion, "EmbeddingService", FakeEmbeddingService),
             patch.object(ingestion, "VerifierService", FakeVerifier),
         ):
@@ -234,6 +237,93 @@ class PublicSourceMatchingTests(unittest.TestCase):
             VERIFIER_POLICY_VERSION,
         )
 
+    def test_active_profile_index_scores_all_profiles_and_reuses_parsed_rows(self) -> None:
+        from api.services.social import public_matching
+
+        def profile_row(profile_id: str, embedding: list[float]) -> dict[str, object]:
+            return {
+                "id": profile_id,
+                "tenant_id": f"tenant-{profile_id}",
+                "company_name": "Billing Co",
+                "one_liner": "Recurring billing software",
+                "profile_embedding": embedding,
+                "updated_at": "2026-01-01T00:00:00+00:00",
+            }
+
+        rows = [
+            profile_row("close", [1.0, 0.0]),
+            profile_row("far", [0.0, 1.0]),
+            profile_row("other-model", [1.0, 0.0, 0.0]),
+            profile_row("near", [0.8, 0.6]),
+        ]
+        public_matching.invalidate_active_profile_index()
+        with patch.object(
+            public_matching,
+            "_service_profile_from_row",
+            wraps=public_matching._service_profile_from_row,
+        ) as parse_profile:
+            index = public_matching._active_profile_index(rows)
+            reused = public_matching._active_profile_index(rows)
+
+        self.assertIs(reused, index)
+        self.assertEqual(parse_profile.call_count, 4)
+        matches = index.candidates([1.0, 0.0], 0.5)
+        self.assertEqual(
+            [(entry.service_profile_id, round(score, 6)) for entry, score in matches],
+            [("close", 1.0), ("near", 0.8)],
+        )
+        self.assertEqual(index.candidates([1.0, 0.0, 0.0, 0.0], 0.0), [])
+
+    def test_discovery_postings_fan_a_post_out_only_to_reachable_profiles(self) -> None:
+        from api.services.social import public_matching
+        from api.services.social.activation import post_features
+        from api.services.social.models import DiscoveryQuery, SocialPost
+
+        def entry(profile_id: str, *phrases: str) -> public_matching.ActiveProfileEntry:
+            return public_matching.ActiveProfileEntry(
+                tenant_id=f"tenant-{profile_id}",
+                service_profile_id=profile_id,
+                service_profile=SimpleNamespace(),
+                discovery_queries=tuple(
+                    DiscoveryQuery(query_type="problem_statement", phrase=phrase)
+                    for phrase in phrases
+                ),
+                profile_embedding_sha256=profile_id,
+                vector=np.asarray([1.0, 0.0], dtype=np.float32),
+            )
+
+        entries = (
+            entry("billing", "payroll for contractors", "recurring billing software"),
+            entry("hiring", "applicant tracking for small teams"),
+            entry("legacy"),
+        )
+        index = public_matching.ActiveProfileIndex(
+            entries=entries,
+            groups={2: (np.arange(3, dtype=np.intp), np.stack([item.vector for item in entries]))},
+            discovery=public_matching.DiscoveryQueryPostings.build(entries),
+        )
+        post = SocialPost(
+            source="hackernews",
+            external_id="postings-1",
+            title="Our billing is a mess",
+            text="We need software for recurring invoices.",
+        )
+
+        with patch.dict(os.environ, {}, clear=True):
+            reachable = index.reachable_entries(post_features(post).tokens)
+            matches = index.candidates([1.0, 0.0], 0.5, among=reachable)
+
+        self.assertEqual(reachable.tolist(), [True, False, True])
+        self.assertEqual([item.service_profile_id for item, _ in matches], ["billing", "legacy"])
+        for item, expected in zip(entries, reachable.tolist()):
+            self.assertEqual(
+                public_matching._source_post_matches_profile_discovery_context(
+                    post,
+                    item.discovery_queries,
+                ),
+                expected,
+            )
+
     def test_initial_batch_matches_only_the_profile_that_requested_it(self) -> None:
         import api.services.social_ingestion as ingestion
 
@@ -345,11 +435,14 @@ class PublicSourceMatchingTests(unittest.TestCase):
                     suggested_reply="Here is how we handle recurring billing.",
                 )
 
+            def verify_many(self, candidate_posts, *_args, **_kwargs):
+                return [self.verify() for _ in candidate_posts]
+
             def close(self) -> None:
                 return None
 
-        def record_lead_match(*_args, **kwargs):
-            persisted.append(kwargs)
+        def record_lead_matches(_conn, matches):
+            persisted.extend(match.fields() for match in matches)
 
         with (
             patch.object(ingestion, "_database_engine", return_value=FakeEngine()),
@@ -373,7 +466,7 @@ class PublicSourceMatchingTests(unittest.TestCase):
                 return_value=[1.0, 0.0],
             ),
             patch.object(ingestion, "_cached_lead_verification", return_value=None),
-            patch.object(ingestion, "_persist_lead_match", side_effect=record_lead_match),
+            patch.object(ingestion, "_persist_lead_matches", side_effect=record_lead_matches),
             patch.object(ingestion, "EmbeddingService", FakeEmbeddingService),
             patch.object(ingestion, "VerifierService", FakeVerifier),
         ):
@@ -401,6 +494,255 @@ class PublicSourceMatchingTests(unittest.TestCase):
             VERIFIER_POLICY_VERSION,
         )
 
+    def test_typed_vector_contract_stores_embeddings_outside_json_metadata(self) -> None:
+        from api.services.social import public_records
+
+        class FakeConnection:
+            def __init__(self) -> None:
+                self.statements: list[tuple[str, dict[str, object]]] = []
+
+            def execute(self, statement, params):
+                self.statements.append((str(statement), params))
+
+        vector_columns = {
+            "id": {"data_type": "uuid", "udt_name": "uuid"},
+            "metadata": {"data_type": "jsonb", "udt_name": "jsonb"},
+            "matching_embedding": {"data_type": "USER-DEFINED", "udt_name": "vector"},
+            "matching_embedding_model": {"data_type": "text", "udt_name": "text"},
+            "matching_embedding_text_sha256": {"data_type": "text", "udt_name": "text"},
+        }
+        connection = FakeConnection()
+        with patch.object(public_records, "_table_columns", return_value=vector_columns):
+            public_records._persist_public_source_post_embedding_cache(
+                connection,
+                database_post_id="post-1",
+                text_sha256="text-hash",
+                embedding_model="test-embedding-model",
+                embedding=[0.5] * 1536,
+            )
+            public_records._persist_public_source_post_embedding_cache(
+                connection,
+                database_post_id="post-2",
+                text_sha256="text-hash",
+                embedding_model="test-embedding-model",
+                embedding=[0.5, 0.5],
+            )
+
+        typed_sql, _ = connection.statements[0]
+        self.assertIn("matching_embedding = :embedding", typed_sql)
+        self.assertIn("- :cache_key", typed_sql)
+        self.assertNotIn("jsonb_build_object", typed_sql)
+        # Embeddings that do not fit vector(1536) keep the JSON cache.
+        fallback_sql, _ = connection.statements[1]
+        self.assertNotIn("matching_embedding =", fallback_sql)
+        self.assertIn("jsonb_build_object", fallback_sql)
+
+        prefetched = {
+            "matching_embedding_values": [1.0, 0.0],
+            "matching_embedding_model": "test-embedding-model",
+            "matching_embedding_text_sha256": "text-hash",
+        }
+        self.assertEqual(
+            public_records._prefetched_public_source_post_embedding(
+                prefetched,
+                text_sha256="text-hash",
+                embedding_model="test-embedding-model",
+            ),
+            [1.0, 0.0],
+        )
+        self.assertIsNone(
+            public_records._prefetched_public_source_post_embedding(
+                prefetched,
+                text_sha256="edited-text-hash",
+                embedding_model="test-embedding-model",
+            )
+        )
+
+    def test_prewarm_reads_and_writes_embedding_caches_once_per_batch(self) -> None:
+        import api.services.social_ingestion as ingestion
+        from api.services.social import public_records
+
+        source_rows = [
+            {
+                "id": f"00000000-0000-0000-0000-00000000004{index}",
+                "source": "hackernews",
+                "source_post_id": f"hn-4{index}",
+                "body": f"Which recurring billing platform fits team {index}?",
+                "metadata": {},
+            }
+            for index in range(3)
+        ]
+        embedded_texts: list[list[str]] = []
+
+        class FakeEngine:
+            def begin(self):
+                return nullcontext(object())
+
+        class FakeEmbeddingService:
+            model = "test-embedding-model"
+
+            def embed_many(self, texts, **_kwargs):
+                embedded_texts.append(list(texts))
+                return [
+                    SimpleNamespace(model=self.model, embedding=[float(index), 1.0])
+                    for index, _ in enumerate(texts)
+                ]
+
+            def close(self) -> None:
+                return None
+
+        embedding_values: dict[str, list[float]] = {}
+        with (
+            patch.object(ingestion, "_database_engine", return_value=FakeEngine()),
+            patch.object(
+                ingestion,
+                "_cached_public_source_post_embeddings",
+                return_value={source_rows[0]["id"]: [1.0, 0.0]},
+            ) as cached,
+            patch.object(ingestion, "_persist_public_source_post_embedding_caches") as persist,
+        ):
+            async def prewarm_from_a_running_loop() -> int:
+                return ingestion.prewarm_public_source_post_embedding_cache(
+                    [("hackernews", "hn-40"), ("hackernews", "hn-41")],
+                    source_rows_by_ref={
+                        ("hackernews", "hn-40"): source_rows[:2],
+                        ("hackernews", "hn-41"): [source_rows[1], source_rows[2]],
+                    },
+                    embedding_service=FakeEmbeddingService(),
+                    embedding_values_by_database_post_id=embedding_values,
+                )
+
+            # Async callers may reach the helper; it must not start its own loop.
+            embedded = asyncio.run(prewarm_from_a_running_loop())
+
+        self.assertEqual(embedded, 2)
+        cached.assert_called_once()
+        self.assertEqual(
+            list(cached.call_args.kwargs["text_sha256_by_database_post_id"]),
+            [row["id"] for row in source_rows],
+        )
+        self.assertEqual(len(embedded_texts), 1)
+        self.assertEqual(len(embedded_texts[0]), 2)
+        persist.assert_called_once()
+        self.assertEqual(
+            [entry[0] for entry in persist.call_args.kwargs["entries"]],
+            [source_rows[1]["id"], source_rows[2]["id"]],
+        )
+        self.assertEqual(embedding_values[source_rows[0]["id"]], [1.0, 0.0])
+        self.assertEqual(embedding_values[source_rows[2]["id"]], [1.0, 1.0])
+
+        class FakeConnection:
+            def __init__(self) -> None:
+                self.statements: list[tuple[str, dict[str, object]]] = []
+
+            def execute(self, statement, params):
+                self.statements.append((str(statement), params))
+
+        vector_columns = {
+            "id": {"data_type": "uuid", "udt_name": "uuid"},
+            "metadata": {"data_type": "jsonb", "udt_name": "jsonb"},
+            "matching_embedding": {
+                "data_type": "USER-DEFINED",
+                "udt_name": "vector",
+                "udt_schema": "extensions",
+            },
+            "matching_embedding_model": {"data_type": "text", "udt_name": "text"},
+            "matching_embedding_text_sha256": {"data_type": "text", "udt_name": "text"},
+        }
+        connection = FakeConnection()
+        with patch.object(public_records, "_table_columns", return_value=vector_columns):
+            public_records._persist_public_source_post_embedding_caches(
+                connection,
+                entries=[
+                    ("post-1", "hash-1", "test-embedding-model", [0.5] * 1536),
+                    ("post-2", "hash-2", "test-embedding-model", [0.5] * 1536),
+                    ("post-3", "hash-3", "test-embedding-model", [0.5, 0.5]),
+                ],
+            )
+
+        self.assertEqual(len(connection.statements), 2)
+        typed_sql, typed_params = connection.statements[0]
+        self.assertIn('CAST(cache.embedding AS "extensions"."vector")', typed_sql)
+        self.assertIn("FROM (", typed_sql)
+        self.assertEqual(typed_params["database_post_id_1"], "post-2")
+        fallback_sql, fallback_params = connection.statements[1]
+        self.assertIn("jsonb_build_object", fallback_sql)
+        self.assertEqual(fallback_params["database_post_id_0"], "post-3")
+
+    def test_rematch_uses_nearest_rows_without_per_row_cache_reads(self) -> None:
+        import api.services.social_ingestion as ingestion
+        from api.services.embeddings import normalize_embedding_text
+
+        source_row = {
+            "id": "00000000-0000-0000-0000-000000000031",
+            "source": "hackernews",
+            "source_post_id": "hn-31",
+            "body": "What recurring billing platform should we switch to?",
+            "metadata": {},
+        }
+        source_row.update(
+            {
+                "matching_embedding_values": [1.0, 0.0],
+                "matching_embedding_model": "test-embedding-model",
+                "matching_embedding_text_sha256": ingestion._sha256_text(
+                    normalize_embedding_text(source_row["body"])
+                ),
+            }
+        )
+        profile_row = {
+            "id": "profile-1",
+            "tenant_id": "tenant-a",
+            "company_name": "Billing Co",
+            "one_liner": "Recurring billing software",
+            "profile_embedding": [1.0, 0.0],
+            "website_url": "https://billing.example/",
+            "profile_json": {
+                "service_profile_identity_version": "website-scoped-v2",
+                "website_url": "https://billing.example/",
+            },
+        }
+
+        class FakeEngine:
+            def begin(self):
+                return nullcontext(object())
+
+        class FakeEmbeddingService:
+            model = "test-embedding-model"
+
+            def close(self) -> None:
+                return None
+
+        with (
+            patch.object(ingestion, "_database_engine", return_value=FakeEngine()),
+            patch.object(ingestion, "_service_profile_columns", return_value={}),
+            patch.object(ingestion, "_load_service_profile", return_value=profile_row),
+            patch.object(
+                ingestion,
+                "_active_tenant_website_url",
+                return_value="https://billing.example/",
+            ),
+            patch.object(
+                ingestion,
+                "_load_nearest_embedded_public_source_post_rows",
+                return_value=[source_row],
+            ) as nearest,
+            patch.object(ingestion, "_load_recent_embedded_public_source_post_rows") as recent,
+            patch.object(ingestion, "_cached_public_source_post_embedding") as cached,
+            patch.object(ingestion, "_table_columns", return_value={}),
+            patch.object(ingestion, "find_candidate_matches", return_value=[]) as matcher,
+            patch.object(ingestion, "EmbeddingService", FakeEmbeddingService),
+        ):
+            result = ingestion.rematch_existing_public_source_posts_for_profile(
+                "tenant-a",
+                "profile-1",
+            )
+
+        self.assertEqual(nearest.call_args.kwargs["embedding"], [1.0, 0.0])
+        recent.assert_not_called()
+        cached.assert_not_called()
+        self.assertEqual(result["embedded"], 1)
+        self.assertEqual(matcher.call_args.args[1][0].embedding, [1.0, 0.0])
+
     def test_cached_verdict_requires_the_current_verifier_policy_version(self) -> None:
         from api.services.social.legacy_storage import _cached_lead_verification
 
@@ -457,6 +799,74 @@ class PublicSourceMatchingTests(unittest.TestCase):
         self.assertIsNone(cached_result("buyer_outcome_v1"))
         self.assertIsNotNone(cached_result(VERIFIER_POLICY_VERSION))
 
+    def test_lead_match_writer_dedupes_and_flushes_one_multi_row_upsert(self) -> None:
+        from api.services.social import legacy_storage
+        from api.services.social.models import SocialPost
+
+        verdict = VerificationResult(
+            match=True,
+            decision_label="strong_match",
+            confidence=0.9,
+            pain_detected="Manual billing work",
+            why_this_matches="The post asks for recurring billing software.",
+        )
+        columns = {
+            name: {"data_type": data_type, "udt_name": data_type}
+            for name, data_type in (
+                ("tenant_id", "text"),
+                ("service_profile_id", "uuid"),
+                ("source_post_id", "uuid"),
+                ("match_status", "text"),
+                ("similarity_score", "double precision"),
+                ("metadata", "jsonb"),
+            )
+        }
+        statements: list[tuple[str, dict[str, object]]] = []
+        transactions: list[int] = []
+
+        class FakeConnection:
+            def execute(self, statement: object, params: dict[str, object]) -> None:
+                statements.append((str(statement), params))
+
+        class FakeEngine:
+            def begin(self):
+                transactions.append(1)
+                return nullcontext(FakeConnection())
+
+        def add(writer: object, post_id: str, score: float) -> None:
+            writer.add(
+                tenant_id="tenant-a",
+                service_profile_id="00000000-0000-0000-0000-000000000002",
+                source_post_id=post_id,
+                post=SocialPost(source="hackernews", external_id=post_id, title="", text="Need billing"),
+                similarity_score=score,
+                verification=verdict,
+                profile_embedding_sha256="profile-hash",
+                verifier_model="test-model",
+                verifier_policy_version=VERIFIER_POLICY_VERSION,
+            )
+
+        with patch.object(legacy_storage, "_table_columns", return_value=columns):
+            with legacy_storage.LeadMatchWriter(FakeEngine(), batch_size=3) as writer:
+                add(writer, "00000000-0000-0000-0000-000000000011", 0.4)
+                add(writer, "00000000-0000-0000-0000-000000000012", 0.5)
+                # The re-verified first post replaces its pending row.
+                add(writer, "00000000-0000-0000-0000-000000000011", 0.6)
+                self.assertEqual(transactions, [])
+                add(writer, "00000000-0000-0000-0000-000000000013", 0.7)
+                self.assertEqual(len(transactions), 1)
+                add(writer, "00000000-0000-0000-0000-000000000014", 0.8)
+
+        self.assertEqual(len(transactions), 2)
+        self.assertEqual(writer.written, 4)
+        sql, params = statements[0]
+        self.assertEqual(sql.count("CAST(:p_metadata_"), 3)
+        self.assertIn("THEN 'qualified' ELSE EXCLUDED.match_status", sql)
+        self.assertEqual(
+            [params[f"p_similarity_score_{index}"] for index in range(3)],
+            [0.5, 0.6, 0.7],
+        )
+
     def test_rematch_candidate_limit_is_bounded_before_verification(self) -> None:
         import api.services.social_ingestion as ingestion
 
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from api.services.schema_cache import SchemaColumnCache
+
+
+class FakeResult:
+    def __init__(self, rows: list[dict[str, str]]) -> None:
+        self.rows = rows
+
+    def mappings(self) -> list[dict[str, str]]:
+        return self.rows
+
+
+class FakeEngine:
+    pass
+
+
+class FakeConnection:
+    def __init__(self, engine: object | None) -> None:
+        if engine is not None:
+            self.engine = engine
+        self.queries = 0
+
+    def execute(self, _statement: object, params: dict[str, str]) -> FakeResult:
+        self.queries += 1
+        return FakeResult(
+            [
+                {
+                    "column_name": f"{params['table_name']}_id",
+                    "data_type": "uuid",
+                    "udt_name": "uuid",
+                    "udt_schema": "pg_catalog",
+                }
+            ]
+        )
+
+
+def test_columns_are_cached_per_engine_and_table_until_invalidated() -> None:
+    cache = SchemaColumnCache(ttl_seconds=60)
+    engine = FakeEngine()
+    other_engine = FakeEngine()
+    conn = FakeConnection(engine)
+
+    first = cache.columns(conn, "source_posts")
+    second = cache.columns(conn, "source_posts")
+    cache.columns(conn, "lead_matches")
+    cache.columns(FakeConnection(other_engine), "source_posts")
+
+    assert first == second == {
+        "source_posts_id": {"data_type": "uuid", "udt_name": "uuid", "udt_schema": "pg_catalog"}
+    }
+    assert conn.queries == 2
+    assert (cache.stats().hits, cache.stats().misses, cache.stats().entries) == (1, 3, 3)
+
+    cache.invalidate("source_posts")
+    cache.columns(conn, "source_posts")
+    cache.columns(conn, "lead_matches")
+
+    assert conn.queries == 3
+
+
+def test_expired_entries_and_engineless_connections_query_the_catalog() -> None:
+    cache = SchemaColumnCache(ttl_seconds=30)
+    conn = FakeConnection(FakeEngine())
+
+    with patch("api.services.schema_cache.time.monotonic", return_value=100.0):
+        cache.columns(conn, "service_profiles")
+    with patch("api.services.schema_cache.time.monotonic", return_value=131.0):
+        cache.columns(conn, "service_profiles")
+
+    engineless = FakeConnection(None)
+    cache.columns(engineless, "service_profiles")
+    cache.columns(engineless, "service_profiles")
+
+    assert conn.queries == 2
+    assert engineless.queries == 2
+
+
+def test_partitioned_layout_is_cached_with_the_columns_and_invalidated_together() -> None:
+    cache = SchemaColumnCache(ttl_seconds=60)
+    conn = FakeConnection(FakeEngine())
+    layouts: list[bool] = [False, True]
+
+    def execute(_statement: object, params: dict[str, str]) -> object:
+        conn.queries += 1
+        assert params == {"table_name": "source_posts"}
+        partitioned = layouts.pop(0)
+        return type("Result", (), {"scalar": lambda _self: partitioned})()
+
+    conn.execute = execute  # type: ignore[method-assign]
+
+    assert cache.is_partitioned(conn, "source_posts") is False
+    assert cache.is_partitioned(conn, "source_posts") is False
+    assert conn.queries == 1
+
+    cache.invalidate("source_posts")
+
+    assert cache.is_partitioned(conn, "source_posts") is True
+    assert conn.queries == 2
+
+
+def test_engines_that_cannot_be_weakly_referenced_are_queried_uncached() -> None:
+    cache = SchemaColumnCache(ttl_seconds=60)
+    conn = FakeConnection(("not", "weakly", "referenceable"))
+
+    cache.columns(conn, "source_posts")
+    cache.columns(conn, "source_posts")
+
+    assert conn.queries == 2
+    assert cache.stats().entries == 0
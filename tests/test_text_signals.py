@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import re
+
+from api.services.matching import REJECTION_SPAM_SIGNAL, cheap_filter_rejection_reason
+from api.services.text_signals import (
+    BOILERPLATE_PHRASES,
+    OBVIOUS_SPAM_MARKERS,
+    SIGNAL_BOILERPLATE,
+    SIGNAL_HACKERNEWS_SPAM,
+    SIGNAL_OBVIOUS_SPAM,
+    SIGNAL_PUBLIC_SOURCE_SPAM,
+    SIGNAL_X_SPAM,
+    has_text_signal,
+    text_signals,
+)
+
+# The per-list scans the shared matcher replaced.
+LEGACY_SCANS = {
+    SIGNAL_OBVIOUS_SPAM: lambda value: any(marker in value.lower() for marker in OBVIOUS_SPAM_MARKERS),
+    SIGNAL_HACKERNEWS_SPAM: re.compile(
+        r"\b(?:buy\s+now|casino|crypto\s+giveaway|viagra)\b", re.IGNORECASE
+    ).search,
+    SIGNAL_X_SPAM: re.compile(
+        r"\b(?:airdrop|casino|crypto\s+giveaway|free\s+followers|viagra)\b", re.IGNORECASE
+    ).search,
+    SIGNAL_PUBLIC_SOURCE_SPAM: re.compile(
+        r"\b(?:buy\s+now|casino|crypto\s+giveaway|free\s+followers|viagra)\b", re.IGNORECASE
+    ).search,
+    SIGNAL_BOILERPLATE: lambda value: any(phrase in value.lower() for phrase in BOILERPLATE_PHRASES),
+}
+
+
+def test_one_scan_reports_the_same_signals_as_each_legacy_list() -> None:
+    samples = [
+        "We need a billing tool that handles invoices this week.",
+        "Crypto  Giveaway today",
+        "crypto giveaway",
+        "casinos are not spam but casino is",
+        "BUY\nNOW while the limited offer lasts",
+        "buy nowhere",
+        "free followers_",
+        "Accept cookies | Cookie settings",
+        "loginmenu",
+        "Terms & Conditions",
+        "terms  &  conditions",
+    ]
+
+    for sample in samples:
+        expected = {signal for signal, scan in LEGACY_SCANS.items() if scan(sample)}
+        assert text_signals(sample) == expected, sample
+        for signal in LEGACY_SCANS:
+            assert has_text_signal(sample, signal) is (signal in expected), (sample, signal)
+
+
+def test_each_list_applies_its_own_rule_to_a_shared_phrase() -> None:
+    # Mid-word, "crypto giveaway" is still an obvious-spam substring but not a
+    # whole-word connector hit.
+    assert text_signals("xcrypto giveaway") == {SIGNAL_OBVIOUS_SPAM}
+    assert text_signals("airdrop casino") == {
+        SIGNAL_HACKERNEWS_SPAM,
+        SIGNAL_X_SPAM,
+        SIGNAL_PUBLIC_SOURCE_SPAM,
+    }
+    assert cheap_filter_rejection_reason("please read: guaranteed leads for your shop") == (
+        REJECTION_SPAM_SIGNAL
+    )
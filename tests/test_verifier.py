@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+from api.services.verification_cache import VerificationCacheKey, VerificationResultCache
 from api.services.verifier import (
+    BatchCandidateVerification,
+    BatchVerificationResult,
     CandidatePost,
     ServiceProfile,
     VerificationResult,
@@ -170,3 +173,272 @@ def test_verifier_clears_positive_evidence_for_a_rejected_post() -> None:
     assert sanitized.evidence_excerpt == ""
     assert sanitized.purchase_stage is None
     assert sanitized.competitor_mention == ""
+
+
+def _batch_profile() -> ServiceProfile:
+    return ServiceProfile(
+        company_name="Billing Co",
+        one_liner="Automated recurring billing for SaaS teams.",
+        target_audience=["SaaS finance teams"],
+        core_problem_solved="Failed payments and manual invoice follow-up.",
+        key_value_propositions=["Automated dunning workflows"],
+        ideal_customer_pain_points=["Chasing overdue invoices"],
+    )
+
+
+def _batch_client(parsed: object) -> SimpleNamespace:
+    parse = MagicMock(
+        return_value=SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(refusal=None, parsed=parsed))]
+        )
+    )
+    return SimpleNamespace(
+        beta=SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(parse=parse)))
+    )
+
+
+class CountingQuotaGuard:
+    def __init__(self, limit: int = 100) -> None:
+        self.limit = limit
+        self.charged = 0
+        self.refunded = 0
+
+    def check_and_increment(self, **_kwargs: object) -> SimpleNamespace:
+        self.charged += 1
+        return SimpleNamespace(allowed=self.charged <= self.limit, tenant_id="tenant-a")
+
+    def reserve_many(self, *, units: int, **_kwargs: object) -> SimpleNamespace:
+        granted = max(0, min(units, self.limit - self.charged))
+        self.charged += granted
+        return SimpleNamespace(
+            allowed=granted == units,
+            tenant_id="tenant-a",
+            requested=units,
+            granted=granted,
+            current_count=self.charged,
+            limit=self.limit,
+            rejection_reason=None if granted == units else "tenant_quota_exceeded",
+        )
+
+    def refund(self, reservation: SimpleNamespace, units: int) -> None:
+        self.refunded += units
+        self.charged -= units
+
+
+def test_verify_many_scores_candidates_in_one_request_with_quota_per_candidate() -> None:
+    candidates = [
+        CandidatePost(post_id="post-1", text="Invoices keep piling up for us.", similarity_score=0.8),
+        CandidatePost(post_id="post-2", text="Unrelated launch announcement.", similarity_score=0.8),
+        CandidatePost(post_id="post-3", text="Below the similarity gate.", similarity_score=-0.5),
+    ]
+    parsed = BatchVerificationResult(
+        results=[
+            BatchCandidateVerification(
+                candidate_id="candidate-2",
+                match=False,
+                decision_label="not_a_match",
+                confidence=0.9,
+                pain_detected="",
+                why_this_matches="Announcement.",
+            ),
+            BatchCandidateVerification(
+                candidate_id="candidate-1",
+                match=True,
+                decision_label="strong_match",
+                confidence=0.8,
+                pain_detected="Overdue invoices",
+                why_this_matches="Direct billing pain.",
+                evidence_excerpt="Invoices keep piling up",
+            ),
+        ]
+    )
+    client = _batch_client(parsed)
+    quota_guard = CountingQuotaGuard()
+    verifier = VerifierService(
+        client=client,
+        quota_guard=quota_guard,
+        verification_cache=VerificationResultCache(use_redis=False),
+    )
+
+    with patch.dict("os.environ", {}, clear=True):
+        results = verifier.verify_many(candidates, _batch_profile(), tenant_id="tenant-a")
+
+    client.beta.chat.completions.parse.assert_called_once()
+    assert [result.decision_label for result in results] == [
+        "strong_match",
+        "not_a_match",
+        "not_a_match",
+    ]
+    assert results[0].evidence_excerpt == "Invoices keep piling up"
+    assert results[1].rejection_reason == "llm_not_a_match"
+    assert results[2].verifier_executed is False
+    assert quota_guard.charged == 2
+
+
+def test_verify_many_falls_back_to_single_calls_without_recharging_quota() -> None:
+    candidates = [
+        CandidatePost(post_id=f"post-{index}", text="Invoices keep piling up.", similarity_score=0.8)
+        for index in range(2)
+    ]
+    incomplete = BatchVerificationResult(
+        results=[
+            BatchCandidateVerification(
+                candidate_id="candidate-1",
+                match=True,
+                decision_label="weak_match",
+                confidence=0.4,
+                pain_detected="Invoices",
+                why_this_matches="Billing pain.",
+            )
+        ]
+    )
+    single = VerificationResult(
+        match=True,
+        decision_label="weak_match",
+        confidence=0.4,
+        pain_detected="Invoices",
+        why_this_matches="Billing pain.",
+    )
+    quota_guard = CountingQuotaGuard()
+    verifier = VerifierService(
+        client=_batch_client(incomplete),
+        quota_guard=quota_guard,
+        verification_cache=VerificationResultCache(use_redis=False),
+    )
+
+    with (
+        patch.dict("os.environ", {}, clear=True),
+        patch.object(verifier, "_verify_with_openai", return_value=single) as verify_single,
+    ):
+        results = verifier.verify_many(candidates, _batch_profile(), tenant_id="tenant-a")
+
+    assert verify_single.call_count == 2
+    assert [result.decision_label for result in results] == ["weak_match", "weak_match"]
+    assert quota_guard.charged == 2
+
+
+def test_identical_text_and_profile_reuse_one_verdict_across_posts_and_tenants() -> None:
+    cache = VerificationResultCache(use_redis=False)
+    quota_guard = CountingQuotaGuard()
+    verifier = VerifierService(
+        client=object(),
+        quota_guard=quota_guard,
+        verification_cache=cache,
+    )
+    verdict = VerificationResult(
+        match=True,
+        decision_label="strong_match",
+        confidence=0.8,
+        pain_detected="Overdue invoices",
+        why_this_matches="Direct billing pain.",
+    )
+    text = "Our invoices keep piling up every month."
+
+    with (
+        patch.dict("os.environ", {}, clear=True),
+        patch.object(verifier, "_verify_with_openai", return_value=verdict) as verify_single,
+    ):
+        first = verifier.verify(
+            CandidatePost(post_id="hn-1", source="hackernews", text=text, similarity_score=0.8),
+            _batch_profile(),
+            tenant_id="tenant-a",
+        )
+        # A cross-post of the same text for another tenant with identical
+        # profile content needs neither quota nor a second LLM call.
+        reposted = verifier.verify_many(
+            [CandidatePost(post_id="x-9", source="twitter", text=text, similarity_score=0.7)],
+            _batch_profile(),
+            tenant_id="tenant-b",
+        )
+        edited_profile = _batch_profile().model_copy(update={"one_liner": "Dunning for SaaS."})
+        verifier.verify(
+            CandidatePost(post_id="hn-1", source="hackernews", text=text, similarity_score=0.8),
+            edited_profile,
+            tenant_id="tenant-a",
+        )
+
+    assert first.decision_label == reposted[0].decision_label == "strong_match"
+    assert verify_single.call_count == 2
+    assert quota_guard.charged == 2
+    assert cache.stats().memory_hits == 1
+
+
+def test_verify_many_refunds_quota_a_failed_batch_never_used() -> None:
+    candidates = [
+        CandidatePost(post_id=f"post-{index}", text=f"Distinct pain {index}.", similarity_score=0.8)
+        for index in range(3)
+    ]
+    parse = MagicMock(side_effect=RuntimeError("provider down"))
+    client = SimpleNamespace(
+        beta=SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(parse=parse)))
+    )
+    quota_guard = CountingQuotaGuard(limit=2)
+    verifier = VerifierService(
+        client=client,
+        quota_guard=quota_guard,
+        verification_cache=VerificationResultCache(use_redis=False),
+    )
+
+    with patch.dict("os.environ", {}, clear=True):
+        try:
+            verifier.verify_many(candidates, _batch_profile(), tenant_id="tenant-a")
+        except RuntimeError as exc:
+            assert str(exc) == "provider down"
+        else:
+            raise AssertionError("expected the provider failure to propagate")
+
+    # Two units were granted for the batch and both came back.
+    assert quota_guard.refunded == 2
+    assert quota_guard.charged == 0
+
+
+def test_redis_verdicts_never_outlive_the_public_data_retention_window(monkeypatch) -> None:
+    monkeypatch.setenv("ARCLI_VERIFICATION_CACHE_REDIS_TTL_SECONDS", str(365 * 86_400))
+    monkeypatch.setenv("ARCLI_PUBLIC_DATA_RETENTION_DAYS", "10")
+    redis = MagicMock()
+    cache = VerificationResultCache(redis_client=redis)
+    key = VerificationCacheKey(
+        text_sha256="a" * 64,
+        profile_sha256="b" * 64,
+        model="test-model",
+        policy_version="v1",
+    )
+
+    cache.put_many({key: '{"evidence_excerpt": "verbatim post text"}'})
+
+    pipeline = redis.pipeline.return_value
+    assert pipeline.set.call_args.kwargs["ex"] == 10 * 86_400
+
+
+def test_cached_verdicts_hold_spans_not_post_text_and_rebuild_excerpts_on_a_hit() -> None:
+    cache = VerificationResultCache(use_redis=False)
+    verifier = VerifierService(
+        client=object(),
+        quota_guard=CountingQuotaGuard(),
+        verification_cache=cache,
+    )
+    verdict = VerificationResult(
+        match=True,
+        decision_label="strong_match",
+        confidence=0.8,
+        pain_detected="Overdue invoices",
+        why_this_matches="Direct billing pain.",
+        evidence_excerpt="invoices keep   piling up",
+        competitor_mention="Stripe",
+    )
+    text = "Our invoices keep piling up every month and Stripe does not help."
+    candidate = CandidatePost(post_id="hn-1", source="hackernews", text=text, similarity_score=0.8)
+
+    with (
+        patch.dict("os.environ", {}, clear=True),
+        patch.object(verifier, "_verify_with_openai", return_value=verdict) as verify_single,
+    ):
+        first = verifier.verify(candidate, _batch_profile(), tenant_id="tenant-a")
+        again = verifier.verify(candidate, _batch_profile(), tenant_id="tenant-b")
+
+    key = verifier._verification_cache_key(candidate, _batch_profile())
+    payload = cache.get_many([key])[key]
+    assert "piling" not in payload and "Stripe" not in payload
+    assert verify_single.call_count == 1
+    assert first.evidence_excerpt == again.evidence_excerpt == "invoices keep piling up"
+    assert again.competitor_mention == "Stripe"
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import json
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from api.services.matching import PostEmbedding, find_candidate_matches
-from api.services.verifier import ServiceProfile
+from api.services.social.models import SocialPost
+from api.services.verifier import VERIFIER_POLICY_VERSION, ServiceProfile, VerificationResult
+from api.services import watchlist_matching
 from api.services.watchlist_matching import (
     DEFAULT_WATCHLIST_SOURCES,
+    WatchlistContext,
+    WatchlistIndex,
     build_watchlist_discovery_queries,
     build_watchlist_profile,
     normalize_watchlist_sources,
@@ -105,6 +113,221 @@ def test_recall_prefilter_admits_a_plausible_paraphrase_below_the_old_floor() ->
     assert candidates[0].score == 0.25
 
 
+def test_watchlist_index_scores_every_active_watchlist_like_the_per_context_prefilter() -> None:
+    embeddings = [[1.0, 0.0], [0.0, 1.0], [0.6, 0.8], [0.9, 0.1], [1.0, 0.0, 0.0]]
+    contexts = [
+        WatchlistContext(
+            id=f"watchlist-{position}",
+            tenant_id="tenant-a",
+            service_profile_id="profile-a",
+            profile=_base_profile(),
+            queries=(),
+            # The fourth Watchlist opted out of Hacker News.
+            source_preferences=frozenset({"github"} if position == 3 else DEFAULT_WATCHLIST_SOURCES),
+            embedding=embedding,
+            embedding_sha256=f"sha-{position}",
+        )
+        for position, embedding in enumerate(embeddings)
+    ]
+    post = SocialPost(
+        source="hackernews",
+        external_id="42",
+        title="Looking for help",
+        text="We are trying to solve a real customer problem and need help this week.",
+    )
+    post_embedding = [0.8, 0.6]
+
+    with patch.dict(os.environ, {}, clear=True):
+        candidates = WatchlistIndex.build(contexts).candidates_for_post(
+            source_post_id="post-1",
+            post=post,
+            post_embedding=post_embedding,
+        )
+        expected = {
+            context.id: find_candidate_matches(
+                context.embedding,
+                [PostEmbedding(post_id="post-1", text=post.matching_text, embedding=post_embedding)],
+                max_candidates=1,
+            )[0].score
+            for context in contexts[:3]
+        }
+
+    assert [context.id for context, _ in candidates] == ["watchlist-0", "watchlist-1", "watchlist-2"]
+    assert {context.id: candidate.similarity_score for context, candidate in candidates} == expected
+    assert [candidate.metadata["watchlist_id"] for _, candidate in candidates] == list(expected)
+
+
+def test_index_fingerprint_ignores_scan_status_and_embedding_writes() -> None:
+    statements: list[str] = []
+
+    class FakeConnection:
+        def execute(self, statement):
+            statements.append(str(statement))
+            return SimpleNamespace(
+                mappings=lambda: SimpleNamespace(
+                    first=lambda: {"active_count": 2, "config_digest": "digest"}
+                )
+            )
+
+    assert watchlist_matching._active_watchlist_fingerprint(FakeConnection()) == (2, "digest")
+    assert "updated_at" not in statements[0]
+    assert "scan_status" not in statements[0]
+    assert "target_buyer" in statements[0]
+
+
+def test_one_thread_rebuilds_the_index_while_others_keep_the_stale_one() -> None:
+    cache = watchlist_matching._WatchlistIndexCache()
+    stale = cache.store(WatchlistIndex.build([], fingerprint=(1, "old")))
+    build_started, release_build = threading.Event(), threading.Event()
+    builds: list[str] = []
+
+    def slow_build() -> WatchlistIndex:
+        builds.append("slow")
+        build_started.set()
+        release_build.wait(timeout=5)
+        return WatchlistIndex.build([], fingerprint=(1, "new"))
+
+    builder = threading.Thread(target=cache.get_or_rebuild, args=((1, "new"), slow_build))
+    builder.start()
+    assert build_started.wait(timeout=5)
+
+    served = cache.get_or_rebuild((1, "new"), lambda: builds.append("second") or stale)
+    release_build.set()
+    builder.join(timeout=5)
+
+    assert served is stale
+    assert builds == ["slow"]
+    assert cache.current((1, "new")) is not None
+
+
+def test_fingerprint_is_read_once_per_interval_and_refreshed_by_a_rebuild() -> None:
+    cache = watchlist_matching._WatchlistIndexCache()
+    reads: list[tuple[int, str]] = []
+    clock = [100.0]
+
+    def load() -> tuple[int, str]:
+        reads.append((len(reads) + 1, "digest"))
+        return reads[-1]
+
+    with (
+        patch.dict(os.environ, {"ARCLI_WATCHLIST_FINGERPRINT_INTERVAL_SECONDS": "30"}, clear=True),
+        patch.object(watchlist_matching.time, "monotonic", side_effect=lambda: clock[0]),
+    ):
+        assert cache.fingerprint(load) == (1, "digest")
+        clock[0] = 110.0
+        assert cache.fingerprint(load) == (1, "digest")
+        clock[0] = 131.0
+        assert cache.fingerprint(load) == (2, "digest")
+        clock[0] = 140.0
+        cache.store(WatchlistIndex.build([], fingerprint=(3, "rebuilt")))
+        clock[0] = 145.0
+        assert cache.fingerprint(load) == (3, "rebuilt")
+
+    assert len(reads) == 2
+
+
+def test_index_rebuild_failure_is_raised_rather_than_reported_as_no_watchlists() -> None:
+    @contextmanager
+    def begin():
+        yield object()
+
+    with (
+        patch.object(watchlist_matching, "_database_engine", return_value=SimpleNamespace(begin=begin)),
+        patch.object(watchlist_matching, "_load_public_source_post_rows", return_value=[{"id": "post-1"}]),
+        patch.object(watchlist_matching, "_active_watchlist_fingerprint", return_value=(2, "digest")),
+        patch.object(watchlist_matching, "active_watchlist_index", watchlist_matching._WatchlistIndexCache()),
+        patch.object(
+            watchlist_matching,
+            "_build_active_watchlist_index",
+            side_effect=RuntimeError("embedding provider down"),
+        ),
+    ):
+        try:
+            watchlist_matching.process_active_watchlists_for_public_source_post("post-1")
+        except RuntimeError as exc:
+            assert str(exc) == "embedding provider down"
+        else:
+            raise AssertionError("expected the rebuild failure to propagate")
+
+
+def test_post_matching_many_watchlists_uses_one_lookup_and_one_upsert() -> None:
+    contexts = [
+        WatchlistContext(
+            id=f"00000000-0000-0000-0000-00000000000{position}",
+            tenant_id="tenant-a",
+            service_profile_id="profile-a",
+            profile=_base_profile(),
+            queries=(),
+            source_preferences=frozenset(DEFAULT_WATCHLIST_SOURCES),
+            embedding=[1.0, 0.0],
+            embedding_sha256=f"sha-{position}",
+        )
+        for position in range(3)
+    ]
+    post = SocialPost(
+        source="hackernews",
+        external_id="42",
+        title="Looking for help",
+        text="We are trying to solve a real customer problem and need help this week.",
+    )
+    verdict = VerificationResult(
+        match=False,
+        decision_label="not_a_match",
+        confidence=0.1,
+        pain_detected="",
+        why_this_matches="",
+    )
+    # Only the first Watchlist already has a current verdict for this post.
+    cached_row = {
+        "watchlist_id": contexts[0].id,
+        "tenant_id": "tenant-a",
+        "metadata": {
+            "external_key": post.dedupe_key,
+            "profile_embedding_sha256": "sha-0",
+            "verifier_model": "verifier-model",
+            "verifier_policy_version": VERIFIER_POLICY_VERSION,
+        },
+        "verification": verdict.model_dump(),
+    }
+    statements: list[tuple[str, dict]] = []
+
+    def execute(statement, params):
+        statements.append((str(statement), params))
+        rows = [cached_row] if "DISTINCT ON" in str(statement) else []
+        return SimpleNamespace(mappings=lambda: rows)
+
+    transactions: list[int] = []
+
+    @contextmanager
+    def begin():
+        transactions.append(1)
+        yield SimpleNamespace(execute=execute)
+
+    verifier = MagicMock(model="verifier-model")
+    verifier.verify.return_value = verdict
+    with (
+        patch.dict(os.environ, {}, clear=True),
+        patch.object(watchlist_matching, "_database_engine", return_value=SimpleNamespace(begin=begin)),
+        patch.object(watchlist_matching, "VerifierService", return_value=verifier),
+    ):
+        result = watchlist_matching._match_post_to_contexts(
+            source_post_id="11111111-1111-1111-1111-111111111111",
+            post=post,
+            post_embedding=[1.0, 0.0],
+            index=WatchlistIndex.build(contexts),
+        )
+
+    assert result == {"candidates": 3, "ready_for_review": 0, "discovery_candidates": 0}
+    assert len(transactions) == 2
+    assert statements[0][1]["watchlist_ids"] == [context.id for context in contexts]
+    assert verifier.verify.call_count == 2
+    insert_sql, insert_params = statements[1]
+    assert insert_sql.count("CAST(:watchlist_id_") == 3
+    assert [json.loads(insert_params[f"metadata_{index}"])["watchlist_id"] for index in range(3)] == [
+        context.id for context in contexts
+    ]
+
+
 def test_watchlist_contract_keeps_browser_writes_away_from_derived_match_state() -> None:
     contract = (
         Path(__file__).resolve().parents[1] / "scripts" / "watchlists_contract.sql"
@@ -7,6 +7,7 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
+from api.services.cost_controls import shared_redis_client
 from scripts import start_worker
 
 
@@ -269,6 +270,8 @@ raise SystemExit(','.join(sorted(blocked)) or 0)
             patch("dramatiq.get_broker", return_value=broker),
             patch("dramatiq.Worker", return_value=worker),
             patch("dramatiq.__version__", "2.2.0"),
+            patch.object(shared_redis_client, "reset") as reset_shared_redis,
+            patch.object(start_worker.logger, "info") as log_info,
         ):
             return_code = start_worker.run_embedded_dramatiq_worker(state)
 
@@ -277,6 +280,11 @@ raise SystemExit(','.join(sorted(blocked)) or 0)
         self.assertEqual(worker.stopped_with, 230_000)
         self.assertTrue(broker.client_closed)
         self.assertTrue(broker.pool_disconnected)
+        # The shared control-path pool is reported and closed with the broker.
+        reset_shared_redis.assert_called_once_with()
+        self.assertTrue(
+            any(call.args[0].startswith("shared_redis_pool_closed") for call in log_info.call_args_list)
+        )
 
     def test_memory_growth_requires_two_consecutive_samples(self) -> None:
         first_reason, first_samples = start_worker.memory_recycle_reason(